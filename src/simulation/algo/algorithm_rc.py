@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from common.domain import Scenario
+from .events import ConfigRotationCompleted, ConfigRotationStarted, EventBus, RotationBlocked
 from .state import AlgoState
 
 LOGGER = logging.getLogger("algo-service.rc")
@@ -31,9 +32,10 @@ class AlgorithmRC:
     Follows pseudocode from algo_pseudokod.md exactly.
     """
     
-    def __init__(self, config: RCConfig, state: AlgoState):
+    def __init__(self, config: RCConfig, state: AlgoState, event_bus: Optional[EventBus] = None):
         self.config = config
         self.state = state
+        self.event_bus = event_bus  # Optional - decisions are published here
         
         # Local state tracking
         self._time_in_primary = 0.0
@@ -81,6 +83,11 @@ class AlgorithmRC:
                     f"✅ RC: Configuration rotation complete: now in {self.state.current_config} "
                     f"(balance P/L={balance_str}, duration={self.config.rotation_duration_s}s)"
                 )
+                if self.event_bus is not None:
+                    self.event_bus.publish(ConfigRotationCompleted(
+                        sim_time=self.state.simulation_time,
+                        config=self.state.current_config,
+                    ))
             else:
                 # Still rotating
                 remaining = self.state.config_rotation_end_time - self.state.simulation_time
@@ -114,7 +121,9 @@ class AlgorithmRC:
                 return self._execute_configuration_change("Primary")
             # Log why rotation is not possible periodically
             if self.state.simulation_time % 600 == 0:  # Every 10 minutes
-                LOGGER.debug(f"RC: Rotation not possible (scenario={self.state.current_scenario.name}, mode={self.state.mode})")
+                LOGGER.debug(
+                    "RC: Rotation not possible (scenario=%s, mode=%s)", self.state.current_scenario.name, self.state.mode
+                )
             return False, f"Rotation not possible (scenario={self.state.current_scenario.name})"
         
         # Step 2: Check if rotation period has elapsed
@@ -129,8 +138,8 @@ class AlgorithmRC:
             hours_elapsed = int(time_since / 3600)
             if hours_elapsed > 0 and time_since % 3600 < 60:
                 LOGGER.info(
-                    f"RC: In {self.state.current_config} config for {hours_elapsed:.0f}h "
-                    f"(rotation in {remaining_s/3600:.0f}h)"
+                    "RC: In %s config for %dh (rotation in %.0fh)",
+                    self.state.current_config, hours_elapsed, remaining_s / 3600,
                 )
             return False, (
                 f"Rotation period not elapsed "
@@ -141,8 +150,8 @@ class AlgorithmRC:
         new_config = "Limited" if self.state.current_config == "Primary" else "Primary"
         
         LOGGER.info(
-            f"RC: Rotation period elapsed, preparing to rotate: {self.state.current_config} → {new_config} "
-            f"(sim_time={self.state.simulation_time:.1f}s, {self.state.simulation_time/3600:.1f}h)"
+            "RC: Rotation period elapsed, preparing to rotate: %s → %s (sim_time=%.1fs, %.1fh)",
+            self.state.current_config, new_config, self.state.simulation_time, self.state.simulation_time / 3600,
         )
         
         # Check coordination with RN
@@ -153,9 +162,16 @@ class AlgorithmRC:
                 self._blocked_count += 1
                 remaining = self.state.heater_rotation_end_time - self.state.simulation_time
                 LOGGER.info(
-                    f"⏸️  RC: Configuration rotation BLOCKED - RN heater rotation in progress "
-                    f"(remaining={remaining:.0f}s, sim_time={self.state.simulation_time:.1f}s)"
+                    "⏸️  RC: Configuration rotation BLOCKED - RN heater rotation in progress "
+                    "(remaining=%.0fs, sim_time=%.1fs)",
+                    remaining, self.state.simulation_time,
                 )
+                if self.event_bus is not None:
+                    self.event_bus.publish(RotationBlocked(
+                        sim_time=self.state.simulation_time,
+                        algorithm="rc",
+                        reason="rn_rotation_in_progress",
+                    ))
                 return False, "RC rotation deferred - RN heater rotation in progress"
             else:
                 # Rotation finished but flag not cleared yet
@@ -309,6 +325,15 @@ class AlgorithmRC:
         # Increment rotation counter
         self._rotation_count += 1
         
+        if self.event_bus is not None:
+            self.event_bus.publish(ConfigRotationStarted(
+                sim_time=self.state.simulation_time,
+                old_config=old_config,
+                new_config=target_config,
+                scenario=self.state.current_scenario,
+                end_time=self.state.config_rotation_end_time,
+            ))
+        
         LOGGER.info(
             f"🔄 RC: Configuration rotation in progress: {old_config} → {target_config} "
             f"(duration={self.config.rotation_duration_s}s, will complete at t={self.state.config_rotation_end_time:.1f}s)"
@@ -376,3 +401,26 @@ class AlgorithmRC:
         
         return max(0.0, time_remaining)
 
+    
+    def to_snapshot(self) -> dict:
+        """Serializable (JSON) copy of RC private trackers."""
+        return {
+            "time_in_primary": self._time_in_primary,
+            "time_in_limited": self._time_in_limited,
+            "last_update_time": self._last_update_time,
+            "rotation_count": self._rotation_count,
+            "blocked_count": self._blocked_count,
+            "previous_scenario": self._previous_scenario.name if self._previous_scenario else None,
+            "blocked_by_reason": dict(self._blocked_by_reason),
+        }
+    
+    def restore_snapshot(self, data: dict) -> None:
+        """Restore trackers written by to_snapshot()."""
+        self._time_in_primary = data["time_in_primary"]
+        self._time_in_limited = data["time_in_limited"]
+        self._last_update_time = data["last_update_time"]
+        self._rotation_count = data["rotation_count"]
+        self._blocked_count = data["blocked_count"]
+        previous = data["previous_scenario"]
+        self._previous_scenario = Scenario[previous] if previous else None
+        self._blocked_by_reason.update(data["blocked_by_reason"])
@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Optional
 
 from common.domain import Heater, Line, Scenario
+from .events import EventBus, HeaterRotationCompleted, HeaterRotationStarted, RotationBlocked
 from .state import AlgoState
 
 LOGGER = logging.getLogger("algo-service.rn")
@@ -51,10 +52,17 @@ class AlgorithmRN:
     Follows pseudocode from algo_pseudokod.md exactly.
     """
     
-    def __init__(self, config: RNConfig, state: AlgoState, algorithm_rc=None):
+    def __init__(
+        self,
+        config: RNConfig,
+        state: AlgoState,
+        algorithm_rc=None,
+        event_bus: Optional[EventBus] = None,
+    ):
         self.config = config
         self.state = state
         self.algorithm_rc = algorithm_rc  # Reference to RC for coordination
+        self.event_bus = event_bus  # Optional - decisions are published here
         
         # Track time for each heater (8 heaters total: N1-N4 in Line 1, N5-N8 in Line 2)
         self._heater_tracking: dict[Heater, HeaterTracking] = {
@@ -119,7 +127,9 @@ class AlgorithmRN:
             if self.state.simulation_time >= self.state.heater_rotation_end_time:
                 # Rotation complete!
                 self.state.heater_rotation_in_progress = False
-                LOGGER.info(f"✅ RN: Heater rotation complete (duration={self.config.rotation_duration_s}s)")
+                LOGGER.info("✅ RN: Heater rotation complete (duration=%ss)", self.config.rotation_duration_s)
+                if self.event_bus is not None:
+                    self.event_bus.publish(HeaterRotationCompleted(sim_time=self.state.simulation_time))
             else:
                 # Still rotating
                 remaining = self.state.heater_rotation_end_time - self.state.simulation_time
@@ -129,8 +139,8 @@ class AlgorithmRN:
         # This must be handled BEFORE scenario transitions to ensure correct heater states
         if self._previous_config != self.state.current_config:
             LOGGER.info(
-                f"RN: Configuration change detected: {self._previous_config} → {self.state.current_config}, "
-                f"syncing heater states for scenario {self.state.current_scenario.name}"
+                "RN: Configuration change detected: %s → %s, syncing heater states for scenario %s",
+                self._previous_config, self.state.current_config, self.state.current_scenario.name,
             )
             self._sync_heater_states_with_scenario()
             
@@ -150,8 +160,8 @@ class AlgorithmRN:
             if should_sync:
                 # Major transition: full sync needed
                 LOGGER.info(
-                    f"RN: Major scenario transition {self._previous_scenario.name} → {self.state.current_scenario.name}, "
-                    f"syncing heater states"
+                    "RN: Major scenario transition %s → %s, syncing heater states",
+                    self._previous_scenario.name, self.state.current_scenario.name,
                 )
                 self._sync_heater_states_with_scenario()
                 
@@ -163,8 +173,8 @@ class AlgorithmRN:
             else:
                 # Minor transition within S1-S4 or S5-S8: adjust heater count intelligently
                 LOGGER.debug(
-                    f"RN: Minor scenario transition {self._previous_scenario.name} → {self.state.current_scenario.name}, "
-                    f"adjusting heater count"
+                    "RN: Minor scenario transition %s → %s, adjusting heater count",
+                    self._previous_scenario.name, self.state.current_scenario.name,
                 )
                 self._adjust_heater_count()
         
@@ -176,16 +186,14 @@ class AlgorithmRN:
             # STEP 0: Check if line is active
             is_active = self._is_line_active(line)
             
-            # Log line status in S5-S8 for visibility
+            # Log line status in S5-S8 for visibility (heater lists only built when INFO is enabled)
             if self.state.current_scenario in [Scenario.S5, Scenario.S6, Scenario.S7, Scenario.S8]:
-                if int(self.state.simulation_time % 3600) < 60:  # Every simulated hour
-                    active_heaters = self._get_active_heaters_for_line(line)
-                    healthy_heaters = self._get_healthy_heaters_for_line(line)
+                if int(self.state.simulation_time % 3600) < 60 and LOGGER.isEnabledFor(logging.INFO):  # Every simulated hour
                     LOGGER.info(
-                        f"RN: {line.name} in {self.state.current_scenario.name}: "
-                        f"active={is_active}, "
-                        f"active_heaters={len(active_heaters)}, "
-                        f"healthy_heaters={len(healthy_heaters)}"
+                        "RN: %s in %s: active=%s, active_heaters=%d, healthy_heaters=%d",
+                        line.name, self.state.current_scenario.name, is_active,
+                        len(self._get_active_heaters_for_line(line)),
+                        len(self._get_healthy_heaters_for_line(line)),
                     )
             
             if not is_active:
@@ -200,7 +208,7 @@ class AlgorithmRN:
                 # Rotation not ready yet (period not elapsed, no heaters, etc.)
                 # Don't count this - it's not a collision, just not ready
                 if int(self.state.simulation_time % 3600) < 60:  # Log periodically
-                    LOGGER.debug(f"RN: {line.name} rotation not ready - {reason_text}")
+                    LOGGER.debug("RN: %s rotation not ready - %s", line.name, reason_text)
                 continue
             
             # Rotation IS ready! Now check RC coordination
@@ -212,9 +220,10 @@ class AlgorithmRN:
                     self._blocked_count += 1
                     remaining = self.state.config_rotation_end_time - self.state.simulation_time
                     LOGGER.info(
-                        f"⚠️  RN: {line.name} rotation COLLISION - RC rotation in progress "
-                        f"(remaining={remaining:.0f}s, sim_time={self.state.simulation_time:.1f}s)"
+                        "⚠️  RN: %s rotation COLLISION - RC rotation in progress (remaining=%.0fs, sim_time=%.1fs)",
+                        line.name, remaining, self.state.simulation_time,
                     )
+                    self._publish_blocked("rc_rotation_in_progress", line)
                     continue
                 else:
                     # Rotation finished but flag not cleared yet
@@ -228,9 +237,11 @@ class AlgorithmRN:
                     self._blocked_by_reason["too_soon_after_rc"] += 1
                     self._blocked_count += 1
                     LOGGER.info(
-                        f"⏸️  RN: {line.name} rotation COORDINATION - waiting {self.config.min_time_since_config_change_s/60:.0f}min AFTER RC "
-                        f"({time_since_config_change:.0f}s / {self.config.min_time_since_config_change_s}s)"
+                        "⏸️  RN: %s rotation COORDINATION - waiting %.0fmin AFTER RC (%.0fs / %ss)",
+                        line.name, self.config.min_time_since_config_change_s / 60,
+                        time_since_config_change, self.config.min_time_since_config_change_s,
                     )
+                    self._publish_blocked("too_soon_after_rc", line)
                     continue
                 
                 # Check time UNTIL next RC rotation (if algorithm_rc available)
@@ -241,29 +252,30 @@ class AlgorithmRN:
                         self._blocked_by_reason["too_close_before_rc"] += 1
                         self._blocked_count += 1
                         LOGGER.info(
-                            f"⏸️  RN: {line.name} rotation COORDINATION - next RC rotation in {time_until_next_rc/60:.0f}min, "
-                            f"need {self.config.min_time_since_config_change_s/60:.0f}min gap BEFORE RC"
+                            "⏸️  RN: %s rotation COORDINATION - next RC rotation in %.0fmin, need %.0fmin gap BEFORE RC",
+                            line.name, time_until_next_rc / 60, self.config.min_time_since_config_change_s / 60,
                         )
+                        self._publish_blocked("too_close_before_rc", line)
                         continue
             
             # STEP 3: Select heaters to swap
             heater_off, heater_on, delta_time = self._select_heaters_for_rotation(line)
             
             if heater_off is None or heater_on is None:
-                LOGGER.debug(f"RN: {line.name} no suitable heaters for rotation")
+                LOGGER.debug("RN: %s no suitable heaters for rotation", line.name)
                 continue
             
             if delta_time < self.config.min_delta_time_s:
                 LOGGER.debug(
-                    f"RN: {line.name} time delta too small "
-                    f"({delta_time:.0f}s < {self.config.min_delta_time_s}s)"
+                    "RN: %s time delta too small (%.0fs < %ss)",
+                    line.name, delta_time, self.config.min_delta_time_s,
                 )
                 continue
             
             # STEP 4: Execute rotation
             LOGGER.info(
-                f"RN: Rotation ready for {line.name}, will rotate {heater_off.name} → {heater_on.name} "
-                f"(delta={delta_time:.0f}s, sim_time={self.state.simulation_time:.1f}s)"
+                "RN: Rotation ready for %s, will rotate %s → %s (delta=%.0fs, sim_time=%.1fs)",
+                line.name, heater_off.name, heater_on.name, delta_time, self.state.simulation_time,
             )
             return self._execute_rotation(line, heater_off, heater_on)
         
@@ -852,6 +864,15 @@ class AlgorithmRN:
         # Increment rotation counter
         self._rotation_count += 1
         
+        if self.event_bus is not None:
+            self.event_bus.publish(HeaterRotationStarted(
+                sim_time=self.state.simulation_time,
+                line=line,
+                heater_off=heater_off,
+                heater_on=heater_on,
+                end_time=self.state.heater_rotation_end_time,
+            ))
+        
         LOGGER.info(
             f"🔄 RN: Heater rotation in progress in {line.name}: {heater_off.name} → {heater_on.name} "
             f"(duration={self.config.rotation_duration_s}s, will complete at t={self.state.heater_rotation_end_time:.1f}s)"
@@ -862,6 +883,16 @@ class AlgorithmRN:
         
         return True, f"Heater rotated in {line.name}: {heater_off.name} → {heater_on.name}"
     
+    def _publish_blocked(self, reason: str, line: Line) -> None:
+        """Publish RC/RN coordination block for a line that was ready to rotate."""
+        if self.event_bus is not None:
+            self.event_bus.publish(RotationBlocked(
+                sim_time=self.state.simulation_time,
+                algorithm="rn",
+                reason=reason,
+                line=line,
+            ))
+    
     def get_heater_operating_time(self, heater: Heater) -> float:
         """Get total operating time for a heater."""
         return self._heater_tracking[heater].operating_time_s
@@ -915,3 +946,45 @@ class AlgorithmRN:
         
         return result
 
+    
+    def to_snapshot(self) -> dict:
+        """Serializable (JSON) copy of RN private trackers."""
+        return {
+            "heater_tracking": {
+                heater.name: {
+                    "operating_time_s": tracking.operating_time_s,
+                    "idle_time_s": tracking.idle_time_s,
+                    "first_activation_timestamp": tracking.first_activation_timestamp,
+                    "state": tracking.state.value,
+                }
+                for heater, tracking in self._heater_tracking.items()
+            },
+            "last_rotation_per_line": {line.name: t for line, t in self._last_rotation_per_line.items()},
+            "last_rotation_global": self._last_rotation_global,
+            "last_update_time": self._last_update_time,
+            "rotation_count": self._rotation_count,
+            "blocked_count": self._blocked_count,
+            "blocked_by_reason": dict(self._blocked_by_reason),
+            "previous_scenario": self._previous_scenario.name if self._previous_scenario else None,
+            "previous_config": self._previous_config,
+        }
+    
+    def restore_snapshot(self, data: dict) -> None:
+        """Restore trackers written by to_snapshot()."""
+        for name, tracking in data["heater_tracking"].items():
+            self._heater_tracking[Heater[name]] = HeaterTracking(
+                operating_time_s=tracking["operating_time_s"],
+                idle_time_s=tracking["idle_time_s"],
+                first_activation_timestamp=tracking["first_activation_timestamp"],
+                state=HeaterState(tracking["state"]),
+            )
+        for name, time_s in data["last_rotation_per_line"].items():
+            self._last_rotation_per_line[Line[name]] = time_s
+        self._last_rotation_global = data["last_rotation_global"]
+        self._last_update_time = data["last_update_time"]
+        self._rotation_count = data["rotation_count"]
+        self._blocked_count = data["blocked_count"]
+        self._blocked_by_reason.update(data["blocked_by_reason"])
+        previous = data["previous_scenario"]
+        self._previous_scenario = Scenario[previous] if previous else None
+        self._previous_config = data["previous_config"]
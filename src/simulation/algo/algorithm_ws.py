@@ -4,8 +4,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from common.domain import Scenario
+from .events import EventBus, ScenarioChanged
+from .filters import (
+    ExponentialSmoothingFilter,
+    FilterStage,
+    RunningMedianFilter,
+    SpikeRejectionFilter,
+    TemperatureFilterPipeline,
+)
 from .state import AlgoState
 
 LOGGER = logging.getLogger("algo-service.ws")
@@ -17,8 +26,13 @@ class WSConfig:
     temp_monitoring_cycle_s: int = 10
     scenario_stabilization_time_s: int = 60
     hysteresis_delta_c: float = 1.0
-    filter_averaging: int = 3
+    filter_averaging: int = 3               # [samples] moving average window (FILTR_UŚREDNIANIA)
     sensor_failure_timeout_s: int = 300
+    # Optional extra filter stages (0 = disabled)
+    filter_median_window: int = 0           # [samples] running median before averaging
+    filter_ema_alpha: float = 0.0           # (0, 1] exponential smoothing after averaging
+    filter_max_rate_c_per_min: float = 0.0  # [°C/min] spike rejection threshold
+    filter_spike_max_rejections: int = 3    # consecutive rejections before accepting new level
 
 
 class AlgorithmWS:
@@ -29,9 +43,14 @@ class AlgorithmWS:
     Follows pseudocode from algo_pseudokod.md exactly.
     """
     
-    def __init__(self, config: WSConfig, state: AlgoState):
+    def __init__(self, config: WSConfig, state: AlgoState, event_bus: Optional[EventBus] = None):
         self.config = config
         self.state = state
+        self.event_bus = event_bus  # Optional - decisions are published here
+        
+        # Temperature filter pipeline - moving average stage is the global T_zewn buffer
+        self.state.resize_temperature_buffer(config.filter_averaging)
+        self.filter = self._build_filter()
         
         # Track time spent in each scenario (for statistics)
         self._scenario_time_s: dict[Scenario, float] = {
@@ -70,8 +89,8 @@ class AlgorithmWS:
         self.state.last_valid_reading = t_zewn_raw
         self.state.timestamp_last_reading = self.state.simulation_time
         
-        # Add to buffer and get moving average
-        t_zewn = self.state.add_temperature_reading(t_zewn_raw, self.config.filter_averaging)
+        # Run filter pipeline (spike rejection → median → moving average → smoothing)
+        t_zewn = self.filter.process(t_zewn_raw, self.state.simulation_time)
         
         # Step 2: Determine required scenario
         required_scenario = self._determine_scenario(t_zewn)
@@ -92,6 +111,21 @@ class AlgorithmWS:
         # Step 5: Execute scenario change
         return self._change_scenario(required_scenario, t_zewn)
     
+    def _build_filter(self) -> TemperatureFilterPipeline:
+        """Compose filter stages enabled in config around the moving average buffer."""
+        stages: list[FilterStage] = []
+        if self.config.filter_max_rate_c_per_min > 0:
+            stages.append(SpikeRejectionFilter(
+                max_rate_c_per_s=self.config.filter_max_rate_c_per_min / 60.0,
+                max_rejections=self.config.filter_spike_max_rejections,
+            ))
+        if self.config.filter_median_window > 1:
+            stages.append(RunningMedianFilter(self.config.filter_median_window))
+        stages.append(self.state.t_zewn_buffer)
+        if self.config.filter_ema_alpha > 0:
+            stages.append(ExponentialSmoothingFilter(self.config.filter_ema_alpha))
+        return TemperatureFilterPipeline(stages)
+    
     def _validate_temperature(self, t_zewn: float) -> bool:
         """Validate temperature reading is within reasonable range."""
         if t_zewn is None:
@@ -210,22 +244,32 @@ class AlgorithmWS:
         old_scenario = self.state.current_scenario
         
         LOGGER.info(
-            f"Scenario change: {old_scenario.name} → {new_scenario.name} "
-            f"(T_zewn={t_zewn:.1f}°C, sim_time={self.state.simulation_time:.1f}s)"
+            "Scenario change: %s → %s (T_zewn=%.1f°C, sim_time=%.1fs)",
+            old_scenario.name, new_scenario.name, t_zewn, self.state.simulation_time,
         )
         
         # Track scenario changes for metrics
         self._total_scenario_changes += 1
         
         # Track structural changes (S4↔S5, S8↔S1)
-        if self._is_structural_change(old_scenario, new_scenario):
+        structural = self._is_structural_change(old_scenario, new_scenario)
+        if structural:
             self._structural_changes += 1
-            LOGGER.info(f"Structural change detected: {old_scenario.name} → {new_scenario.name}")
+            LOGGER.info("Structural change detected: %s → %s", old_scenario.name, new_scenario.name)
         
         # Update state
         self.state.current_scenario = new_scenario
         self.state.timestamp_last_scenario_change = self.state.simulation_time
         
+        if self.event_bus is not None:
+            self.event_bus.publish(ScenarioChanged(
+                sim_time=self.state.simulation_time,
+                old_scenario=old_scenario,
+                new_scenario=new_scenario,
+                temperature_c=t_zewn,
+                structural=structural,
+            ))
+        
         return True, f"Scenario changed: {old_scenario.name} → {new_scenario.name} (T={t_zewn:.1f}°C)"
     
     def _is_structural_change(self, old: Scenario, new: Scenario) -> bool:
@@ -315,3 +359,22 @@ class AlgorithmWS:
         """Get total number of structural changes (single-line ↔ dual-line)."""
         return self._structural_changes
 
+    
+    def to_snapshot(self) -> dict:
+        """Serializable (JSON) copy of WS private trackers and filter history."""
+        return {
+            "scenario_time_s": {scenario.name: t for scenario, t in self._scenario_time_s.items()},
+            "last_time_update": self._last_time_update,
+            "total_scenario_changes": self._total_scenario_changes,
+            "structural_changes": self._structural_changes,
+            "filter": self.filter.to_snapshot(),
+        }
+    
+    def restore_snapshot(self, data: dict) -> None:
+        """Restore trackers written by to_snapshot()."""
+        for name, time_s in data["scenario_time_s"].items():
+            self._scenario_time_s[Scenario[name]] = time_s
+        self._last_time_update = data["last_time_update"]
+        self._total_scenario_changes = data["total_scenario_changes"]
+        self._structural_changes = data["structural_changes"]
+        self.filter.restore_snapshot(data["filter"])
@@ -0,0 +1,117 @@
+"""Checkpoint and restore of full controller state (AlgoState + WS/RC/RN trackers)."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .algorithm_rc import AlgorithmRC
+from .algorithm_rn import AlgorithmRN
+from .algorithm_ws import AlgorithmWS
+from .state import AlgoState
+
+LOGGER = logging.getLogger("algo-service.checkpoint")
+
+# Bump when the snapshot layout changes incompatibly
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(RuntimeError):
+    """Raised when a checkpoint file is missing, corrupt or has an unsupported version."""
+
+
+def capture_checkpoint(
+    state: AlgoState,
+    algorithm_ws: AlgorithmWS,
+    algorithm_rc: AlgorithmRC,
+    algorithm_rn: AlgorithmRN,
+) -> dict[str, Any]:
+    """
+    Collect controller memory into a JSON-serializable dict.
+
+    Args:
+        state: Global algorithm state
+        algorithm_ws: WS instance (scenario time trackers, filter history)
+        algorithm_rc: RC instance (config time trackers, block statistics)
+        algorithm_rn: RN instance (heater tracking, last rotations)
+
+    Returns:
+        Versioned checkpoint document
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "simulation_time": state.simulation_time,
+        "state": state.to_snapshot(),
+        "ws": algorithm_ws.to_snapshot(),
+        "rc": algorithm_rc.to_snapshot(),
+        "rn": algorithm_rn.to_snapshot(),
+    }
+
+
+def restore_checkpoint(
+    data: dict[str, Any],
+    state: AlgoState,
+    algorithm_ws: AlgorithmWS,
+    algorithm_rc: AlgorithmRC,
+    algorithm_rn: AlgorithmRN,
+) -> None:
+    """Load a checkpoint document (from capture_checkpoint) into live objects."""
+    version = data.get("version")
+    if version != CHECKPOINT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version {version} (expected {CHECKPOINT_VERSION})")
+    try:
+        state.restore_snapshot(data["state"])
+        algorithm_ws.restore_snapshot(data["ws"])
+        algorithm_rc.restore_snapshot(data["rc"])
+        algorithm_rn.restore_snapshot(data["rn"])
+    except (KeyError, ValueError) as exc:
+        raise CheckpointError(f"Invalid checkpoint: {exc!r}") from exc
+
+
+def write_checkpoint(path: str | Path, data: dict[str, Any]) -> int:
+    """
+    Atomically write checkpoint as gzip-compressed JSON.
+
+    Data goes to a temporary file in the target directory which then replaces
+    the target (os.replace), so a crash mid-write never leaves a torn file.
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = gzip.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), compresslevel=6)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return len(payload)
+
+
+def read_checkpoint(path: str | Path) -> dict[str, Any]:
+    """Read checkpoint written by write_checkpoint()."""
+    path = Path(path)
+    if not path.exists():
+        raise CheckpointError(f"Checkpoint file not found: {path}")
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError) as exc:
+        raise CheckpointError(f"Corrupt checkpoint {path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise CheckpointError(f"Corrupt checkpoint {path}: expected JSON object")
+    return data
@@ -0,0 +1,198 @@
+"""In-process event bus for algorithm decisions."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from common.domain import Heater, Line, Scenario
+
+LOGGER = logging.getLogger("algo-service.events")
+
+
+# ═══════════════════════════════════════════════════════════════
+# EVENT TYPES (emitted by WS, RC, RN)
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True, slots=True)
+class AlgoEvent:
+    """Base class for all algorithm events. Subscribe to it to receive every event."""
+    sim_time: float  # Simulation time when the decision was taken [s]
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioChanged(AlgoEvent):
+    """WS switched the active scenario."""
+    old_scenario: Scenario
+    new_scenario: Scenario
+    temperature_c: float  # Filtered temperature that triggered the change
+    structural: bool  # Single-line ↔ dual-line transition
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigRotationStarted(AlgoEvent):
+    """RC started a configuration change (RC lock acquired)."""
+    old_config: str
+    new_config: str
+    scenario: Scenario
+    end_time: float  # When the RC lock will be released [s]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigRotationCompleted(AlgoEvent):
+    """RC configuration change finished (RC lock released)."""
+    config: str
+
+
+@dataclass(frozen=True, slots=True)
+class HeaterRotationStarted(AlgoEvent):
+    """RN swapped two heaters within a line (RN lock acquired)."""
+    line: Line
+    heater_off: Heater
+    heater_on: Heater
+    end_time: float  # When the RN lock will be released [s]
+
+
+@dataclass(frozen=True, slots=True)
+class HeaterRotationCompleted(AlgoEvent):
+    """RN heater rotation finished (RN lock released)."""
+
+
+@dataclass(frozen=True, slots=True)
+class RotationBlocked(AlgoEvent):
+    """A rotation that was otherwise due got blocked by RC/RN coordination."""
+    algorithm: str  # "rc" or "rn"
+    reason: str  # Key of the algorithm's _blocked_by_reason dict
+    line: Optional[Line] = None
+
+
+E = TypeVar("E", bound=AlgoEvent)
+Handler = Callable[[E], None]
+
+
+class EventBus:
+    """
+    Lightweight publish/subscribe bus.
+
+    Synchronous handlers run on the publisher's thread (the control loop), so they
+    must be cheap - e.g. counters and display buffers.
+
+    Asynchronous handlers are fed from a bounded queue by a single background
+    worker, so expensive consumers (file recorders, exporters, dashboards) never
+    delay heating decisions. If the queue is full the event is dropped for the
+    async consumers and counted in dropped_events.
+
+    Handlers subscribed to a base class (e.g. AlgoEvent) receive all subclasses.
+    """
+
+    def __init__(self, async_queue_size: int = 10000):
+        self._sync_handlers: dict[type, list[Callable]] = defaultdict(list)
+        self._async_handlers: dict[type, list[Callable]] = defaultdict(list)
+
+        # Resolved handler lists per concrete event type (MRO walk done once)
+        self._dispatch_cache: dict[type, tuple[tuple[Callable, ...], tuple[Callable, ...]]] = {}
+
+        self._async_queue_size = async_queue_size
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._dropped_events = 0
+        self._closed = False
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of events dropped because the async queue was full."""
+        return self._dropped_events
+
+    def subscribe(self, event_type: type[E], handler: Handler, *, asynchronous: bool = False) -> None:
+        """
+        Register handler for event_type (and its subclasses).
+
+        Args:
+            event_type: Event class to listen for (AlgoEvent = everything)
+            handler: Callable taking the event
+            asynchronous: Run handler on the background worker instead of the publisher thread
+        """
+        with self._lock:
+            if asynchronous:
+                self._async_handlers[event_type].append(handler)
+                self._ensure_worker()
+            else:
+                self._sync_handlers[event_type].append(handler)
+            self._dispatch_cache.clear()
+
+    def unsubscribe(self, event_type: type[E], handler: Handler) -> None:
+        """Remove a previously registered handler (no-op if not registered)."""
+        with self._lock:
+            for registry in (self._sync_handlers, self._async_handlers):
+                handlers = registry.get(event_type)
+                if handlers and handler in handlers:
+                    handlers.remove(handler)
+            self._dispatch_cache.clear()
+
+    def publish(self, event: AlgoEvent) -> None:
+        """Dispatch event to all matching handlers."""
+        handlers = self._dispatch_cache.get(type(event))
+        if handlers is None:
+            handlers = self._resolve(type(event))
+        sync_handlers, async_handlers = handlers
+
+        for handler in sync_handlers:
+            try:
+                handler(event)
+            except Exception:
+                LOGGER.exception("Event handler %r failed for %s", handler, type(event).__name__)
+
+        if async_handlers and self._queue is not None:
+            try:
+                self._queue.put_nowait((async_handlers, event))
+            except queue.Full:
+                self._dropped_events += 1
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the async queue and stop the worker."""
+        with self._lock:
+            self._closed = True
+            worker, event_queue = self._worker, self._queue
+        if worker is None or event_queue is None:
+            return
+        event_queue.put(None)  # Sentinel - blocks until there is room
+        worker.join(timeout=timeout)
+        if worker.is_alive():
+            LOGGER.warning("Event bus worker did not stop within %.1fs", timeout)
+
+    def _resolve(self, event_type: type) -> tuple[tuple[Callable, ...], tuple[Callable, ...]]:
+        with self._lock:
+            sync_handlers: list[Callable] = []
+            async_handlers: list[Callable] = []
+            for base in event_type.__mro__:
+                sync_handlers.extend(self._sync_handlers.get(base, ()))
+                async_handlers.extend(self._async_handlers.get(base, ()))
+            resolved = (tuple(sync_handlers), tuple(async_handlers))
+            self._dispatch_cache[event_type] = resolved
+            return resolved
+
+    def _ensure_worker(self) -> None:
+        """Start background worker on first async subscription (caller holds lock)."""
+        if self._worker is not None or self._closed:
+            return
+        self._queue = queue.Queue(maxsize=self._async_queue_size)
+        self._worker = threading.Thread(target=self._run_worker, name="algo-event-bus", daemon=True)
+        self._worker.start()
+
+    def _run_worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            handlers, event = item
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception:
+                    LOGGER.exception("Async event handler %r failed for %s", handler, type(event).__name__)
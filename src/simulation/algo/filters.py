@@ -0,0 +1,280 @@
+"""Streaming temperature filters for Algorithm WS input."""
+
+from __future__ import annotations
+
+import bisect
+from typing import Iterator, Optional, Protocol, Sequence
+
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer of floats.
+
+    Storage is preallocated once; append is O(1) and returns the value that was
+    overwritten (None while the buffer is still filling up).
+    """
+
+    __slots__ = ("_data", "_capacity", "_next", "_size")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be >= 1")
+        self._data = [0.0] * capacity
+        self._capacity = capacity
+        self._next = 0  # Index of the slot written by the next append
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def is_full(self) -> bool:
+        return self._size == self._capacity
+
+    def append(self, value: float) -> Optional[float]:
+        """Store value, returning the evicted (oldest) value if the buffer was full."""
+        evicted = self._data[self._next] if self._size == self._capacity else None
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+        return evicted
+
+    def newest(self) -> float:
+        if self._size == 0:
+            raise IndexError("RingBuffer is empty")
+        return self._data[self._next - 1]
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate from oldest to newest."""
+        start = (self._next - self._size) % self._capacity
+        for i in range(self._size):
+            yield self._data[(start + i) % self._capacity]
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+
+class FilterStage(Protocol):
+    """Single stage of the temperature filter pipeline."""
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        """Consume one reading and return the filtered value."""
+
+    def reset(self) -> None:
+        """Forget all history."""
+
+    def to_snapshot(self) -> dict:
+        """Serializable (JSON) copy of the stage's history."""
+
+    def restore_snapshot(self, data: dict) -> None:
+        """Reload history written by to_snapshot()."""
+
+
+class MovingAverageFilter:
+    """
+    Simple moving average over the last `window` readings.
+
+    Keeps a running sum so each reading costs O(1) regardless of window size.
+    The sum is recomputed from the buffer once per full wrap to stop
+    floating-point drift from accumulating (amortized O(1)).
+    """
+
+    __slots__ = ("_buffer", "_sum", "_since_resync")
+
+    def __init__(self, window: int = 3):
+        self._buffer = RingBuffer(window)
+        self._sum = 0.0
+        self._since_resync = 0
+
+    @property
+    def window(self) -> int:
+        return self._buffer.capacity
+
+    def values(self) -> list[float]:
+        """Buffered readings, oldest first."""
+        return list(self._buffer)
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        evicted = self._buffer.append(value)
+        self._sum += value
+        if evicted is not None:
+            self._sum -= evicted
+            self._since_resync += 1
+            if self._since_resync >= self._buffer.capacity:
+                self._sum = sum(self._buffer)
+                self._since_resync = 0
+        return self._sum / len(self._buffer)
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._sum = 0.0
+        self._since_resync = 0
+
+    def to_snapshot(self) -> dict:
+        return {"values": self.values()}
+
+    def restore_snapshot(self, data: dict) -> None:
+        self.reset()
+        for value in data["values"][-self.window:]:
+            self.process(value)
+
+
+class ExponentialSmoothingFilter:
+    """Exponential moving average: y = alpha * x + (1 - alpha) * y_prev."""
+
+    __slots__ = ("alpha", "_value")
+
+    def __init__(self, alpha: float):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("Smoothing alpha must be in (0, 1]")
+        self.alpha = alpha
+        self._value: Optional[float] = None
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        if self._value is None:
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value
+
+    def reset(self) -> None:
+        self._value = None
+
+    def to_snapshot(self) -> dict:
+        return {"value": self._value}
+
+    def restore_snapshot(self, data: dict) -> None:
+        self._value = data["value"]
+
+
+class RunningMedianFilter:
+    """
+    Median of the last `window` readings.
+
+    A sorted copy of the window is maintained with bisect, so the median is
+    read in O(1) and each update costs one binary search plus a short memmove.
+    """
+
+    __slots__ = ("_buffer", "_sorted")
+
+    def __init__(self, window: int = 5):
+        self._buffer = RingBuffer(window)
+        self._sorted: list[float] = []
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        evicted = self._buffer.append(value)
+        if evicted is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, evicted)]
+        bisect.insort(self._sorted, value)
+
+        n = len(self._sorted)
+        mid = n // 2
+        if n % 2:
+            return self._sorted[mid]
+        return (self._sorted[mid - 1] + self._sorted[mid]) / 2.0
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._sorted.clear()
+
+    def to_snapshot(self) -> dict:
+        return {"values": list(self._buffer)}
+
+    def restore_snapshot(self, data: dict) -> None:
+        self.reset()
+        for value in data["values"][-self._buffer.capacity:]:
+            self.process(value)
+
+
+class SpikeRejectionFilter:
+    """
+    Rate-of-change limiter.
+
+    A reading that moves faster than max_rate_c_per_s away from the last
+    accepted reading is treated as a spike and replaced by the last accepted
+    value. After max_rejections consecutive rejections the new level is
+    accepted, so genuine step changes only get delayed, never ignored.
+    """
+
+    __slots__ = ("max_rate_c_per_s", "max_rejections", "_last_value", "_last_time", "_rejections")
+
+    def __init__(self, max_rate_c_per_s: float, max_rejections: int = 3):
+        if max_rate_c_per_s <= 0:
+            raise ValueError("max_rate_c_per_s must be positive")
+        self.max_rate_c_per_s = max_rate_c_per_s
+        self.max_rejections = max_rejections
+        self._last_value: Optional[float] = None
+        self._last_time = 0.0
+        self._rejections = 0
+
+    @property
+    def rejections(self) -> int:
+        """Number of consecutive readings currently being rejected."""
+        return self._rejections
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        if self._last_value is not None:
+            dt = sim_time - self._last_time
+            if dt > 0 and abs(value - self._last_value) / dt > self.max_rate_c_per_s:
+                if self._rejections < self.max_rejections:
+                    self._rejections += 1
+                    return self._last_value
+
+        self._rejections = 0
+        self._last_value = value
+        self._last_time = sim_time
+        return value
+
+    def reset(self) -> None:
+        self._last_value = None
+        self._last_time = 0.0
+        self._rejections = 0
+
+    def to_snapshot(self) -> dict:
+        return {"last_value": self._last_value, "last_time": self._last_time, "rejections": self._rejections}
+
+    def restore_snapshot(self, data: dict) -> None:
+        self._last_value = data["last_value"]
+        self._last_time = data["last_time"]
+        self._rejections = data["rejections"]
+
+
+class TemperatureFilterPipeline:
+    """Chain of filter stages; each stage feeds the next."""
+
+    def __init__(self, stages: Sequence[FilterStage]):
+        self.stages = list(stages)
+        self.last_output: Optional[float] = None
+
+    def process(self, value: float, sim_time: float = 0.0) -> float:
+        for stage in self.stages:
+            value = stage.process(value, sim_time)
+        self.last_output = value
+        return value
+
+    def reset(self) -> None:
+        for stage in self.stages:
+            stage.reset()
+        self.last_output = None
+
+    def to_snapshot(self) -> dict:
+        return {
+            "stages": [[type(stage).__name__, stage.to_snapshot()] for stage in self.stages],
+            "last_output": self.last_output,
+        }
+
+    def restore_snapshot(self, data: dict) -> None:
+        """Restore stage history; stages are matched by position and type."""
+        stages = data["stages"]
+        if [name for name, _ in stages] != [type(stage).__name__ for stage in self.stages]:
+            # Filter configuration changed since the snapshot - start filters fresh
+            self.reset()
+            return
+        for stage, (_, stage_data) in zip(self.stages, stages):
+            stage.restore_snapshot(stage_data)
+        self.last_output = data["last_output"]
@@ -0,0 +1,123 @@
+"""
+Controller invariants checked after every simulation tick.
+
+Property-based runs (run_property_scenarios.py) feed random weather through
+the algorithms and call InvariantChecker.check() after each WS cycle:
+    - lock_overlap:     RC configuration rotation and RN heater rotation never run at once
+    - heater_count:     number of ACTIVE heaters matches the scenario (S0: 0 ... S8: 8)
+    - heater_line:      S1-S4 heat on the configuration's line only (Primary: C1, Limited: C2),
+                        S5-S8 run all of C1 plus the rest from C2
+    - primary_config:   S5-S8 always run in the Primary configuration
+
+RC and RN react to a new scenario at their own loop cycle, so the scenario
+dependent invariants are checked only once the scenario has lasted settle_s.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from common.domain import Heater, Line, Scenario
+
+from .algorithm_rn import AlgorithmRN, HeaterState
+from .metrics import HEATER_LINE
+from .state import AlgoState
+
+# Active heaters required by each scenario
+SCENARIO_HEATERS: dict[Scenario, int] = {scenario: scenario.value for scenario in Scenario}
+
+# Both lines in parallel - Primary configuration by definition
+PRIMARY_ONLY = (Scenario.S5, Scenario.S6, Scenario.S7, Scenario.S8)
+
+# Line heating alone in S1-S4, per configuration
+CONFIG_LINE = {"Primary": Line.C1, "Limited": Line.C2}
+
+INVARIANTS = ("lock_overlap", "heater_count", "heater_line", "primary_config")
+
+
+@dataclass
+class Violation:
+    """One broken invariant at one simulation tick."""
+
+    invariant: str
+    sim_time: float
+    scenario: str
+    config: str
+    message: str
+
+    @property
+    def sim_day(self) -> float:
+        return self.sim_time / 86400
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class InvariantChecker:
+    """Checks controller state against the invariants after each tick."""
+
+    def __init__(self, state: AlgoState, algorithm_rn: AlgorithmRN, settle_s: float = 60.0):
+        """
+        Args:
+            state: Shared algorithm state
+            algorithm_rn: Owner of the heater states
+            settle_s: [s sim] Time after a scenario change before heater and
+                configuration invariants apply (normally the RC/RN loop cycle)
+        """
+        self.state = state
+        self.algorithm_rn = algorithm_rn
+        self.settle_s = settle_s
+        self.checks = 0
+
+    def active_heaters(self) -> list[Heater]:
+        return [h for h in Heater if self.algorithm_rn.get_heater_state(h) == HeaterState.ACTIVE]
+
+    def check(self) -> list[Violation]:
+        """
+        Check all invariants at the current simulation time.
+
+        Returns:
+            Broken invariants (empty when the controller state is valid)
+        """
+        self.checks += 1
+        state = self.state
+        now = state.simulation_time
+        violations: list[Violation] = []
+
+        def fail(invariant: str, message: str) -> None:
+            violations.append(Violation(invariant, now, state.current_scenario.name, state.current_config, message))
+
+        rc_locked = state.config_change_in_progress and now < state.config_rotation_end_time
+        rn_locked = state.heater_rotation_in_progress and now < state.heater_rotation_end_time
+        if rc_locked and rn_locked:
+            fail(
+                "lock_overlap",
+                f"RC rotation (until {state.config_rotation_end_time:.0f}s) overlaps "
+                f"RN rotation (until {state.heater_rotation_end_time:.0f}s)",
+            )
+
+        if state.time_since_scenario_change() < self.settle_s:
+            return violations
+
+        scenario = state.current_scenario
+        active = self.active_heaters()
+        expected = SCENARIO_HEATERS[scenario]
+        if len(active) != expected:
+            fail("heater_count", f"{len(active)} active heaters, {scenario.name} requires {expected}")
+
+        per_line = {line: sum(HEATER_LINE[h] is line for h in active) for line in Line}
+        if scenario in PRIMARY_ONLY:
+            if state.current_config != "Primary":
+                fail("primary_config", f"{scenario.name} running in {state.current_config} configuration")
+            if per_line[Line.C1] != 4:
+                fail("heater_line", f"{per_line[Line.C1]}/4 heaters of C1 active in {scenario.name}")
+        elif scenario != Scenario.S0:
+            idle_line = Line.C2 if CONFIG_LINE.get(state.current_config) is Line.C1 else Line.C1
+            if per_line[idle_line]:
+                fail(
+                    "heater_line",
+                    f"{per_line[idle_line]} heaters of {idle_line.name} active in "
+                    f"{scenario.name}/{state.current_config}",
+                )
+        return violations
@@ -0,0 +1,484 @@
+"""Append-only binary journal of algorithm decisions with indexed sim-time replay."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import re
+import struct
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from common.domain import Heater, Line, Scenario
+from .events import (
+    AlgoEvent,
+    ConfigRotationCompleted,
+    ConfigRotationStarted,
+    EventBus,
+    HeaterRotationCompleted,
+    HeaterRotationStarted,
+    RotationBlocked,
+    ScenarioChanged,
+)
+from .recorder import LOCK_RC, LOCK_RN
+
+LOGGER = logging.getLogger("algo-service.journal")
+
+# ═══════════════════════════════════════════════════════════════
+# ON-DISK FORMAT
+# ═══════════════════════════════════════════════════════════════
+#
+# <directory>/segment-000001.jrn    active/raw segment: header + fixed-size records
+# <directory>/segment-000001.jrnz   compressed segment: header + zlib blocks + block table
+# <directory>/index.bin             sparse index: one entry per block of records
+# <directory>/runs.bin              run boundaries: index entry number where each run starts
+#
+# Records are never split across blocks, so one index lookup plus one block
+# read (and one zlib.decompress for compressed segments) locates any sim time.
+# Sim time is non-decreasing within a run only - every run (including resumed
+# ones) starts a new segment and is searched separately by the reader.
+
+MAGIC = b"BJRN"
+VERSION = 1
+
+# magic, version, record size, block records, flags (bit 0 = compressed)
+_HEADER = struct.Struct("<4sHHIH")
+_HEADER_SIZE = 16
+_COMPRESSED = 1
+
+# sim_time, kind, a, b, c, reason, flags, locks, spare, value
+RECORD = struct.Struct("<dBBBBBBBBd")
+
+# Index entry: first sim_time of the block, segment number, block number in segment
+_INDEX_ENTRY = struct.Struct("<dII")
+
+# Run boundary: number of the first index entry written by a run
+_RUN_ENTRY = struct.Struct("<I")
+
+# Block table entry of a compressed segment: file offset, compressed length, record count
+_BLOCK_ENTRY = struct.Struct("<QII")
+_FOOTER = struct.Struct("<QI")  # block table offset, block count
+
+_SEGMENT_NAME = re.compile(r"segment-(\d{6})\.jrnz?$")
+
+# Record kinds
+SCENARIO_CHANGED = 1
+CONFIG_ROTATION_STARTED = 2
+CONFIG_ROTATION_COMPLETED = 3
+HEATER_ROTATION_STARTED = 4
+HEATER_ROTATION_COMPLETED = 5
+ROTATION_BLOCKED = 6
+
+# Bits of the record "flags" byte
+FLAG_STRUCTURAL = 1 << 0  # ScenarioChanged.structural
+
+# Codes of the small-integer fields (index in the tuple; 255 = none)
+NONE_CODE = 255
+CONFIGS = ("Primary", "Limited")
+LINES = tuple(Line)
+HEATERS = tuple(Heater)
+ALGORITHMS = ("rc", "rn")
+BLOCK_REASONS = (
+    # RC
+    "rn_rotation_in_progress",
+    "scenario_not_suitable",
+    "mode_not_auto",
+    "period_not_elapsed",
+    # RN
+    "rc_rotation_in_progress",
+    "too_soon_after_rc",
+    "too_close_before_rc",
+    "global_spacing_not_met",
+    "no_suitable_heaters",
+    "line_not_active",
+)
+
+
+class JournalRecord(NamedTuple):
+    """One decoded journal record."""
+    sim_time: float
+    event: AlgoEvent
+    locks: int  # LOCK_RC / LOCK_RN bits held after the event
+
+
+def _code(values: tuple, value) -> int:
+    try:
+        return values.index(value)
+    except ValueError:
+        return NONE_CODE
+
+
+def _value(values: tuple, code: int):
+    return values[code] if code < len(values) else None
+
+
+def encode_event(event: AlgoEvent, locks: int) -> Optional[bytes]:
+    """Pack an event into one fixed-size record (None for event types not journaled)."""
+    kind = a = b = c = reason = flags = 0
+    value = 0.0
+    if isinstance(event, ScenarioChanged):
+        kind, a, b, value = SCENARIO_CHANGED, event.old_scenario.value, event.new_scenario.value, event.temperature_c
+        flags = FLAG_STRUCTURAL if event.structural else 0
+    elif isinstance(event, ConfigRotationStarted):
+        kind, value = CONFIG_ROTATION_STARTED, event.end_time
+        a, b, c = _code(CONFIGS, event.old_config), _code(CONFIGS, event.new_config), event.scenario.value
+    elif isinstance(event, ConfigRotationCompleted):
+        kind, a = CONFIG_ROTATION_COMPLETED, _code(CONFIGS, event.config)
+    elif isinstance(event, HeaterRotationStarted):
+        kind, value = HEATER_ROTATION_STARTED, event.end_time
+        a, b, c = _code(LINES, event.line), _code(HEATERS, event.heater_off), _code(HEATERS, event.heater_on)
+    elif isinstance(event, HeaterRotationCompleted):
+        kind = HEATER_ROTATION_COMPLETED
+    elif isinstance(event, RotationBlocked):
+        kind, a, b = ROTATION_BLOCKED, _code(ALGORITHMS, event.algorithm), _code(LINES, event.line)
+        reason = _code(BLOCK_REASONS, event.reason)
+    else:
+        return None
+    return RECORD.pack(event.sim_time, kind, a, b, c, reason, flags, locks, 0, value)
+
+
+def decode_record(data: bytes, offset: int = 0) -> JournalRecord:
+    """Unpack one record back into its event."""
+    sim_time, kind, a, b, c, reason, flags, locks, _, value = RECORD.unpack_from(data, offset)
+    if kind == SCENARIO_CHANGED:
+        event = ScenarioChanged(sim_time, Scenario(a), Scenario(b), value, bool(flags & FLAG_STRUCTURAL))
+    elif kind == CONFIG_ROTATION_STARTED:
+        event = ConfigRotationStarted(sim_time, _value(CONFIGS, a), _value(CONFIGS, b), Scenario(c), value)
+    elif kind == CONFIG_ROTATION_COMPLETED:
+        event = ConfigRotationCompleted(sim_time, _value(CONFIGS, a))
+    elif kind == HEATER_ROTATION_STARTED:
+        event = HeaterRotationStarted(sim_time, _value(LINES, a), _value(HEATERS, b), _value(HEATERS, c), value)
+    elif kind == HEATER_ROTATION_COMPLETED:
+        event = HeaterRotationCompleted(sim_time)
+    elif kind == ROTATION_BLOCKED:
+        event = RotationBlocked(
+            sim_time, _value(ALGORITHMS, a), _value(BLOCK_REASONS, reason) or "unknown", _value(LINES, b)
+        )
+    else:
+        raise ValueError(f"Unknown journal record kind {kind} at sim_time={sim_time}")
+    return JournalRecord(sim_time, event, locks)
+
+
+def _segment_path(directory: Path, number: int, compressed: bool = False) -> Path:
+    return directory / f"segment-{number:06d}.jrn{'z' if compressed else ''}"
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _existing_segments(directory: Path) -> list[int]:
+    numbers = set()
+    for path in directory.glob("segment-*.jrn*"):
+        match = _SEGMENT_NAME.match(path.name)
+        if match:
+            numbers.add(int(match.group(1)))
+    return sorted(numbers)
+
+
+# ═══════════════════════════════════════════════════════════════
+# WRITER
+# ═══════════════════════════════════════════════════════════════
+
+class EventJournal:
+    """
+    Appends algorithm events to fixed-size binary records in rotating segments.
+
+    Subscribed synchronously to the event bus, so no event is lost to a full
+    async queue; append() only packs the record into the block buffer and the
+    files are written once per completed block. A segment holds
+    segment_records records; when it is full a new segment is started and the
+    finished one is compressed block by block on a background thread. The
+    sparse index gets one entry per block_records records (first sim time of
+    the block).
+
+    Records are buffered per block and written when the block is complete or
+    on flush()/close(), so a crash loses at most the last partial block.
+    Reopening an existing directory continues in a new segment and records a
+    new run boundary, so sim time may restart from 0; raw segments left by a
+    crashed run are compressed then.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_records: int = 65536,
+        block_records: int = 1024,
+        compress: bool = True,
+        max_segments: int = 0,
+    ):
+        if block_records < 1 or segment_records < block_records or segment_records % block_records:
+            raise ValueError("segment_records must be a positive multiple of block_records")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.block_records = block_records
+        self.compress = compress
+        self.max_segments = max_segments  # 0 = keep all segments
+
+        self._lock = threading.Lock()
+        self._locks = 0  # LOCK_RC / LOCK_RN bits derived from the event stream
+        self._block = bytearray()
+        self._segment_number = (_existing_segments(self.directory) or [0])[-1]
+        self._segment_file: Optional[BinaryIO] = None
+        self._segment_count = 0  # Records in the active segment
+        self._index_file = (self.directory / "index.bin").open("ab")
+        self._index_entries = self._index_file.tell() // _INDEX_ENTRY.size
+        self._index_file.truncate(self._index_entries * _INDEX_ENTRY.size)  # Drop a torn entry of a crashed run
+        self._run_started = False  # Boundary is written with the run's first index entry
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: list[Future] = []
+        self.records_written = 0
+        if compress:
+            for number in _existing_segments(self.directory):
+                if _segment_path(self.directory, number).exists():
+                    self._submit_compression(number)  # Left raw by a crashed run
+
+    def attach(self, event_bus: EventBus) -> None:
+        """Journal every algorithm event published on the bus (sync consumer - never dropped)."""
+        event_bus.subscribe(AlgoEvent, self.append)
+
+    def append(self, event: AlgoEvent) -> None:
+        """Append one event (events of other types are ignored)."""
+        if isinstance(event, ConfigRotationStarted):
+            self._locks |= LOCK_RC
+        elif isinstance(event, ConfigRotationCompleted):
+            self._locks &= ~LOCK_RC
+        elif isinstance(event, HeaterRotationStarted):
+            self._locks |= LOCK_RN
+        elif isinstance(event, HeaterRotationCompleted):
+            self._locks &= ~LOCK_RN
+        record = encode_event(event, self._locks)
+        if record is None:
+            return
+        with self._lock:
+            if self._segment_file is None or self._segment_count == self.segment_records:
+                self._start_segment()
+            if self._segment_count % self.block_records == 0:
+                # First record of a block - one sparse index entry
+                if not self._run_started:
+                    self._mark_run_start()
+                self._index_file.write(_INDEX_ENTRY.pack(
+                    event.sim_time, self._segment_number, self._segment_count // self.block_records
+                ))
+                self._index_entries += 1
+            self._block += record
+            self._segment_count += 1
+            self.records_written += 1
+            if self._segment_count % self.block_records == 0:
+                self._write_block()
+
+    def flush(self) -> None:
+        """Write buffered records (readers see everything appended so far)."""
+        with self._lock:
+            self._write_block()
+
+    def close(self) -> None:
+        """Flush, close the active segment and wait for background compression."""
+        with self._lock:
+            self._write_block()
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+            self._index_file.close()
+        for future in self._pending:
+            future.result()
+        if self._compressor is not None:
+            self._compressor.shutdown()
+
+    # ═══════════════════════════════════════════════════════════════
+    # SEGMENTS (caller holds _lock)
+    # ═══════════════════════════════════════════════════════════════
+
+    def _mark_run_start(self) -> None:
+        with (self.directory / "runs.bin").open("ab") as handle:
+            handle.write(_RUN_ENTRY.pack(self._index_entries))
+        self._run_started = True
+
+    def _write_block(self) -> None:
+        if self._block and self._segment_file is not None:
+            self._segment_file.write(self._block)
+            self._segment_file.flush()
+            self._index_file.flush()
+            self._block.clear()
+
+    def _start_segment(self) -> None:
+        if self._segment_file is not None:
+            self._write_block()
+            self._segment_file.close()
+            if self.compress:
+                self._submit_compression(self._segment_number)
+        self._segment_number += 1
+        self._segment_count = 0
+        self._segment_file = _segment_path(self.directory, self._segment_number).open("wb")
+        self._segment_file.write(_HEADER.pack(MAGIC, VERSION, RECORD.size, self.block_records, 0).ljust(_HEADER_SIZE, b"\0"))
+        self._apply_retention()
+
+    def _submit_compression(self, number: int) -> None:
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal-compress")
+        self._pending = [future for future in self._pending if not future.done()]
+        self._pending.append(self._compressor.submit(self._compress_segment, number))
+
+    def _apply_retention(self) -> None:
+        if not self.max_segments:
+            return
+        removed = _existing_segments(self.directory)[:-self.max_segments]
+        for number in removed:
+            for compressed in (False, True):
+                _segment_path(self.directory, number, compressed).unlink(missing_ok=True)
+            LOGGER.info(f"Journal retention: removed segment {number}")
+        if removed:
+            self._trim_index(removed[-1])
+
+    def _trim_index(self, last_removed: int) -> None:
+        """Drop index entries of removed segments (a prefix) and shift run boundaries to match."""
+        index_path = self.directory / "index.bin"
+        self._index_file.close()
+        data = index_path.read_bytes()
+        dropped = 0
+        while dropped < self._index_entries and \
+                _INDEX_ENTRY.unpack_from(data, dropped * _INDEX_ENTRY.size)[1] <= last_removed:
+            dropped += 1
+        _replace_file(index_path, data[dropped * _INDEX_ENTRY.size:])
+        self._index_file = index_path.open("ab")
+        self._index_entries -= dropped
+
+        runs_path = self.directory / "runs.bin"
+        if dropped and runs_path.exists():
+            data = runs_path.read_bytes()
+            starts: list[int] = []
+            for offset in range(0, len(data) - len(data) % _RUN_ENTRY.size, _RUN_ENTRY.size):
+                start = max(0, _RUN_ENTRY.unpack_from(data, offset)[0] - dropped)
+                if not starts or start > starts[-1]:
+                    starts.append(start)
+            _replace_file(runs_path, b"".join(_RUN_ENTRY.pack(start) for start in starts))
+
+    def _compress_segment(self, number: int) -> None:
+        """Rewrite a finished segment as independently compressed blocks (background thread)."""
+        source = _segment_path(self.directory, number)
+        target = _segment_path(self.directory, number, compressed=True)
+        if not source.exists():
+            return  # Removed by retention meanwhile
+        data = source.read_bytes()
+        _, _, record_size, block_records, _ = _HEADER.unpack_from(data)
+        block_size = record_size * block_records
+        table = []
+        tmp = target.with_suffix(".tmp")
+        with tmp.open("wb") as handle:
+            handle.write(_HEADER.pack(MAGIC, VERSION, record_size, block_records, _COMPRESSED).ljust(_HEADER_SIZE, b"\0"))
+            for start in range(_HEADER_SIZE, len(data), block_size):
+                raw = data[start:start + block_size]
+                compressed = zlib.compress(raw, 6)
+                table.append(_BLOCK_ENTRY.pack(handle.tell(), len(compressed), len(raw) // record_size))
+                handle.write(compressed)
+            table_offset = handle.tell()
+            handle.write(b"".join(table))
+            handle.write(_FOOTER.pack(table_offset, len(table)))
+        os.replace(tmp, target)
+        source.unlink(missing_ok=True)
+        LOGGER.debug(f"Journal segment {number} compressed: {len(data)} → {target.stat().st_size} bytes")
+
+
+# ═══════════════════════════════════════════════════════════════
+# READER
+# ═══════════════════════════════════════════════════════════════
+
+class JournalReader:
+    """
+    Locates and replays a sim-time window of a journal directory.
+
+    The sparse index points at the block containing the window start; only
+    blocks from there until the window end are read (and decompressed).
+    Sim time is only non-decreasing within one run, so each run recorded in
+    runs.bin is searched separately and runs are returned in append order.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        entries = []
+        index_path = self.directory / "index.bin"
+        if index_path.exists():
+            data = index_path.read_bytes()
+            usable = len(data) - len(data) % _INDEX_ENTRY.size  # Ignore a torn last entry
+            entries = [_INDEX_ENTRY.unpack_from(data, offset) for offset in range(0, usable, _INDEX_ENTRY.size)]
+        self._index: list[tuple[float, int, int]] = entries  # (first sim_time, segment, block) in append order
+        self._index_times = [entry[0] for entry in entries]
+
+        # (first, end) index entry range of each run
+        starts = {0}
+        runs_path = self.directory / "runs.bin"
+        if runs_path.exists():
+            data = runs_path.read_bytes()
+            usable = len(data) - len(data) % _RUN_ENTRY.size
+            starts.update(_RUN_ENTRY.unpack_from(data, offset)[0] for offset in range(0, usable, _RUN_ENTRY.size))
+        bounds = sorted(start for start in starts if start < len(entries)) + [len(entries)]
+        self.runs: list[tuple[int, int]] = list(zip(bounds, bounds[1:]))
+
+    def records(self, start: float = float("-inf"), end: float = float("inf")) -> Iterator[JournalRecord]:
+        """Records with start <= sim_time <= end, run by run in journal order."""
+        for first, last in self.runs:
+            yield from self._run_records(first, last, start, end)
+
+    def _run_records(self, first: int, last: int, start: float, end: float) -> Iterator[JournalRecord]:
+        position = max(first, bisect.bisect_right(self._index_times, start, first, last) - 1)
+        for first_time, segment, block in self._index[position:last]:
+            if first_time > end:
+                return
+            block_data = self._read_block(segment, block)
+            if block_data is None:
+                continue
+            data, count = block_data
+            for i in range(count):
+                record = decode_record(data, i * RECORD.size)
+                if record.sim_time > end:
+                    return
+                if record.sim_time >= start:
+                    yield record
+
+    def events(self, start: float = float("-inf"), end: float = float("inf")) -> Iterator[AlgoEvent]:
+        for record in self.records(start, end):
+            yield record.event
+
+    def replay(self, event_bus: EventBus, start: float = float("-inf"), end: float = float("inf")) -> int:
+        """
+        Publish the window's events on event_bus (e.g. to rebuild metrics or a display).
+
+        Returns:
+            Number of events published
+        """
+        count = 0
+        for event in self.events(start, end):
+            event_bus.publish(event)
+            count += 1
+        return count
+
+    def _read_block(self, segment: int, block: int) -> Optional[tuple[bytes, int]]:
+        """(record bytes, record count) of one block, None when it does not exist (anymore)."""
+        try:
+            # Raw first: an open handle stays readable even if compression replaces the file meanwhile
+            with _segment_path(self.directory, segment).open("rb") as handle:
+                _, _, record_size, block_records, _ = _HEADER.unpack(handle.read(_HEADER.size))
+                handle.seek(_HEADER_SIZE + block * block_records * record_size)
+                data = handle.read(block_records * record_size)
+                return data, len(data) // record_size
+        except FileNotFoundError:
+            pass
+        try:
+            with _segment_path(self.directory, segment, compressed=True).open("rb") as handle:
+                handle.seek(-_FOOTER.size, os.SEEK_END)
+                table_offset, block_count = _FOOTER.unpack(handle.read(_FOOTER.size))
+                if block >= block_count:
+                    return None
+                handle.seek(table_offset + block * _BLOCK_ENTRY.size)
+                offset, length, count = _BLOCK_ENTRY.unpack(handle.read(_BLOCK_ENTRY.size))
+                handle.seek(offset)
+                return zlib.decompress(handle.read(length)), count
+        except FileNotFoundError:
+            return None  # Segment removed by retention
@@ -0,0 +1,122 @@
+"""Simulation lag tracking - is the configured acceleration actually achieved?"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+LOGGER = logging.getLogger("algo-service.lag")
+
+
+@dataclass(frozen=True, slots=True)
+class LagSample:
+    """Lag figures for one weather poll."""
+    gap_s: float  # [s sim] weather sim time minus sim time already processed by algo
+    skipped_steps: int  # WS cycles that passed between two polls without their own reading
+
+
+class LagTracker:
+    """
+    Tracks achieved acceleration and sim-time gaps from successive weather polls.
+
+    Achieved acceleration is measured over windows of window_real_s real seconds
+    (sim seconds processed / real seconds elapsed). Threshold violations are
+    reported once when they start, not on every poll.
+    """
+
+    def __init__(
+        self,
+        configured_acceleration: float,
+        step_s: float,
+        window_real_s: float = 5.0,
+        warn_acceleration_ratio: float = 0.9,
+        warn_gap_s: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.configured_acceleration = configured_acceleration
+        self.step_s = step_s
+        self.window_real_s = window_real_s
+        self.warn_acceleration_ratio = warn_acceleration_ratio
+        self.warn_gap_s = warn_gap_s
+        self._clock = clock
+
+        self._processed_sim_time: Optional[float] = None
+        self._window_start: Optional[tuple[float, float]] = None  # (real, sim)
+        self._run_start: Optional[tuple[float, float]] = None  # (real, sim) of the first poll
+        self._last_poll: Optional[tuple[float, float]] = None
+
+        self.achieved_acceleration: Optional[float] = None
+        self.last_gap_s = 0.0
+        self.max_gap_s = 0.0
+        self.skipped_steps_total = 0
+        self._acceleration_warning_active = False
+        self._gap_warning_active = False
+
+    @property
+    def acceleration_ratio(self) -> Optional[float]:
+        """Achieved / configured acceleration (1.0 = keeping up)."""
+        if self.achieved_acceleration is None:
+            return None
+        return self.achieved_acceleration / self.configured_acceleration
+
+    @property
+    def overall_acceleration(self) -> Optional[float]:
+        """Achieved acceleration from the first to the last poll (whole run)."""
+        if self._run_start is None or self._last_poll[0] <= self._run_start[0]:
+            return None
+        return (self._last_poll[1] - self._run_start[1]) / (self._last_poll[0] - self._run_start[0])
+
+    def observe(self, sim_time: float) -> LagSample:
+        """
+        Record a poll that returned weather simulation time sim_time.
+
+        Call before the snapshot is processed.
+        """
+        now_real = self._clock()
+        previous = self._processed_sim_time
+        self._processed_sim_time = sim_time
+        self._last_poll = (now_real, sim_time)
+
+        if previous is None:
+            self._window_start = self._run_start = (now_real, sim_time)
+            return LagSample(gap_s=0.0, skipped_steps=0)
+
+        gap_s = max(0.0, sim_time - previous)
+        skipped = max(0, int(gap_s // self.step_s) - 1)
+        self.last_gap_s = gap_s
+        self.max_gap_s = max(self.max_gap_s, gap_s)
+        self.skipped_steps_total += skipped
+
+        start_real, start_sim = self._window_start
+        elapsed_real = now_real - start_real
+        if elapsed_real >= self.window_real_s:
+            self.achieved_acceleration = (sim_time - start_sim) / elapsed_real
+            self._window_start = (now_real, sim_time)
+
+        return LagSample(gap_s=gap_s, skipped_steps=skipped)
+
+    def check_thresholds(self) -> list[str]:
+        """Warnings for thresholds crossed since the last check (empty when nothing new)."""
+        warnings = []
+
+        ratio = self.acceleration_ratio
+        slow = ratio is not None and ratio < self.warn_acceleration_ratio
+        if slow and not self._acceleration_warning_active:
+            warnings.append(
+                f"Achieved acceleration {self.achieved_acceleration:.0f}x is {ratio:.0%} of "
+                f"configured {self.configured_acceleration:.0f}x "
+                f"(threshold {self.warn_acceleration_ratio:.0%})"
+            )
+        self._acceleration_warning_active = slow
+
+        behind = self.last_gap_s > self.warn_gap_s
+        if behind and not self._gap_warning_active:
+            warnings.append(
+                f"Algo is {self.last_gap_s:.0f}s sim behind weather service "
+                f"(threshold {self.warn_gap_s:.0f}s)"
+            )
+        self._gap_warning_active = behind
+
+        return warnings
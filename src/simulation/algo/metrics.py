@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping, Optional
 
 from opentelemetry.metrics import CallbackOptions, Observation
 
-from common.domain import Scenario
+from common.domain import Heater, Line, Scenario
 from common.telemetry import TelemetryManager
+from .lag import LagSample, LagTracker
 from .state import AlgoState
 
 if TYPE_CHECKING:
@@ -17,6 +19,19 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger("algo-service.metrics")
 
+Attributes = Mapping[str, str]
+
+CONFIGS = ("Primary", "Limited")
+
+# Heaters N1-N4 belong to line C1, N5-N8 to line C2
+HEATER_LINE: dict[Heater, Line] = {
+    heater: Line.C1 if heater in (Heater.N1, Heater.N2, Heater.N3, Heater.N4) else Line.C2
+    for heater in Heater
+}
+
+# HeaterState value → numeric gauge value
+HEATER_STATE_VALUE = {"idle": 0, "active": 1, "faulty": 2}
+
 
 @dataclass
 class AlgoMetrics:
@@ -31,9 +46,13 @@ class AlgoMetrics:
     default_dimensions: dict[str, str]
     state: AlgoState
     algorithm_rn: AlgorithmRN
+    flush_interval_s: float = 300.0  # [s sim] how often accumulated time deltas go to OTel counters
+    lag_tracker: Optional[LagTracker] = None  # Enables loop lag / achieved acceleration metrics
+    pacing_stats: Optional[Callable[[], dict[str, float]]] = None  # AlgoService.pacing_stats
     
     def __post_init__(self) -> None:
         meter = self.telemetry.meter("bogdanka.algo")
+        self._build_attribute_sets()
         
         # ═══════════════════════════════════════════════════════════════
         # WS METRICS (Scenario Selection)
@@ -75,6 +94,12 @@ class AlgoMetrics:
             description="Count of scenario transitions",
         )
         
+        # Structural transitions - single-line ↔ dual-line (counter)
+        self._structural_changes_counter = meter.create_counter(
+            f"{self.metrics_prefix}.ws.structural_changes",
+            description="Count of structural scenario transitions (line configuration changes)",
+        )
+        
         # ═══════════════════════════════════════════════════════════════
         # RC METRICS (Configuration Rotation)
         # ═══════════════════════════════════════════════════════════════
@@ -131,6 +156,14 @@ class AlgoMetrics:
             unit="s",
         )
         
+        # Heater idle time (observable gauge per heater)
+        self._heater_idle_time_gauge = meter.create_observable_gauge(
+            f"{self.metrics_prefix}.rn.heater_idle_time_s",
+            callbacks=[self._observe_heater_idle_time],
+            description="Heater idle time in seconds",
+            unit="s",
+        )
+        
         # Heater state (observable gauge per heater: 0=idle, 1=active, 2=faulty)
         self._heater_state_gauge = meter.create_observable_gauge(
             f"{self.metrics_prefix}.rn.heater_state",
@@ -153,6 +186,58 @@ class AlgoMetrics:
             unit="s",
         )
         
+        # ═══════════════════════════════════════════════════════════════
+        # LOOP METRICS (Simulation lag / achieved acceleration)
+        # ═══════════════════════════════════════════════════════════════
+        
+        if self.lag_tracker is not None:
+            # Achieved sim-seconds per real second (gauge)
+            meter.create_observable_gauge(
+                f"{self.metrics_prefix}.loop.achieved_acceleration",
+                callbacks=[self._observe_achieved_acceleration],
+                description="Simulation seconds processed per real second",
+            )
+            
+            # Achieved / configured acceleration (gauge, 1.0 = keeping up)
+            meter.create_observable_gauge(
+                f"{self.metrics_prefix}.loop.acceleration_ratio",
+                callbacks=[self._observe_acceleration_ratio],
+                description="Achieved acceleration divided by configured acceleration",
+            )
+            
+            # Weather sim time minus algo-processed sim time, per poll (histogram)
+            self._processing_gap_histogram = meter.create_histogram(
+                f"{self.metrics_prefix}.loop.processing_gap_s",
+                description="Simulation time between weather clock and last processed time at each poll",
+                unit="s",
+            )
+            
+            # WS steps that got no reading of their own (counter + per-poll histogram)
+            self._skipped_steps_counter = meter.create_counter(
+                f"{self.metrics_prefix}.loop.skipped_steps",
+                description="Simulation steps skipped between weather polls",
+            )
+            self._skipped_steps_histogram = meter.create_histogram(
+                f"{self.metrics_prefix}.loop.skipped_steps_per_poll",
+                description="Simulation steps skipped between two consecutive polls",
+            )
+        
+        if self.pacing_stats is not None:
+            # Real-time deadlines the loop missed (counter)
+            meter.create_observable_counter(
+                f"{self.metrics_prefix}.loop.missed_deadlines",
+                callbacks=[self._observe_missed_deadlines],
+                description="Loop iterations that finished after their real-time deadline",
+            )
+            
+            # Current real-time lag behind the deadline schedule (gauge)
+            meter.create_observable_gauge(
+                f"{self.metrics_prefix}.loop.deadline_lag_s",
+                callbacks=[self._observe_deadline_lag],
+                description="Current real-time lag behind the poll schedule",
+                unit="s",
+            )
+        
         # Track line operating time (internal)
         self._line_operating_time: dict[str, float] = {"C1": 0.0, "C2": 0.0}
         
@@ -161,207 +246,291 @@ class AlgoMetrics:
         self._last_update_scenario = Scenario.S0
         self._last_update_config = "Primary"
         
+        # Time deltas accumulated locally between flushes (keyed by pre-built attribute set)
+        self._pending_scenario_time: dict[Scenario, float] = dict.fromkeys(Scenario, 0.0)
+        self._pending_config_time: dict[str, float] = dict.fromkeys(CONFIGS, 0.0)
+        self._last_flush_time = 0.0
+        
+        # Totals already pushed to the OTel counters (steady-state extrapolation needs the sums)
+        self._flushed_scenario_time: dict[Scenario, float] = dict.fromkeys(Scenario, 0.0)
+        self._flushed_config_time: dict[str, float] = dict.fromkeys(CONFIGS, 0.0)
+        
         LOGGER.info(f"Algo metrics initialized with prefix: {self.metrics_prefix}")
     
+    def _build_attribute_sets(self) -> None:
+        """
+        Pre-build read-only attribute sets for every dimension combination.
+        
+        Counters and observable callbacks reuse these objects instead of merging
+        default_dimensions into a fresh dict on every call.
+        """
+        def frozen(**extra: str) -> Attributes:
+            return MappingProxyType({**self.default_dimensions, **extra})
+        
+        self._base_attrs = frozen()
+        self._scenario_attrs = {scenario: frozen(scenario=scenario.name) for scenario in Scenario}
+        self._config_attrs = {config: frozen(config=config) for config in CONFIGS}
+        self._line_attrs = {line.name: frozen(line=line.name) for line in Line}
+        self._heater_attrs = {
+            heater: frozen(heater=heater.name, line=HEATER_LINE[heater].name) for heater in Heater
+        }
+        self._scenario_change_attrs = {
+            (old, new): frozen(from_scenario=old.name, to_scenario=new.name)
+            for old in Scenario for new in Scenario
+        }
+        self._config_change_attrs = {
+            (old, new): frozen(from_config=old, to_config=new)
+            for old in CONFIGS for new in CONFIGS
+        }
+        self._heater_rotation_attrs = {
+            (HEATER_LINE[off].name, off.name, on.name): frozen(
+                line=HEATER_LINE[off].name, heater_off=off.name, heater_on=on.name,
+            )
+            for off in Heater for on in Heater if HEATER_LINE[off] == HEATER_LINE[on]
+        }
+    
+    def _config_attributes(self, config: str) -> Attributes:
+        """Attribute set for config name (built on first use for unexpected names)."""
+        attrs = self._config_attrs.get(config)
+        if attrs is None:
+            attrs = self._config_attrs[config] = MappingProxyType({**self.default_dimensions, "config": config})
+        return attrs
+    
     def _observe_current_scenario(self, options: CallbackOptions):
         """Callback for current scenario gauge."""
-        yield Observation(
-            self.state.current_scenario.value,
-            {**self.default_dimensions}
-        )
+        yield Observation(self.state.current_scenario.value, self._base_attrs)
     
     def _observe_external_temp(self, options: CallbackOptions):
         """Callback for external temperature gauge."""
         # Use last valid reading if we have one
         temp = self.state.last_valid_reading if self.state.last_valid_reading else 0.0
-        yield Observation(temp, {**self.default_dimensions})
+        yield Observation(temp, self._base_attrs)
     
     def _observe_simulation_time(self, options: CallbackOptions):
         """Callback for simulation time gauge."""
-        yield Observation(
-            self.state.simulation_time,
-            {**self.default_dimensions}
-        )
+        yield Observation(self.state.simulation_time, self._base_attrs)
     
     def _observe_current_config(self, options: CallbackOptions):
         """Callback for current configuration gauge."""
         # 0 = Primary, 1 = Limited
         value = 0 if self.state.current_config == "Primary" else 1
-        yield Observation(value, {**self.default_dimensions})
+        yield Observation(value, self._base_attrs)
     
     def _observe_heater_operating_time(self, options: CallbackOptions):
         """Callback for heater operating time gauge."""
-        from common.domain import Heater
         for heater in Heater:
             op_time = self.algorithm_rn.get_heater_operating_time(heater)
-            # Determine line based on heater name (N1-N4 = C1, N5-N8 = C2)
-            line = "C1" if heater.name in ["N1", "N2", "N3", "N4"] else "C2"
-            yield Observation(
-                op_time,
-                {
-                    **self.default_dimensions,
-                    "heater": heater.name,
-                    "line": line,
-                }
-            )
+            yield Observation(op_time, self._heater_attrs[heater])
+    
+    def _observe_heater_idle_time(self, options: CallbackOptions):
+        """Callback for heater idle time gauge."""
+        for heater in Heater:
+            yield Observation(self.algorithm_rn.get_heater_idle_time(heater), self._heater_attrs[heater])
     
     def _observe_heater_state(self, options: CallbackOptions):
         """Callback for heater state gauge."""
-        from common.domain import Heater
         for heater in Heater:
             state = self.algorithm_rn.get_heater_state(heater)
             # Map HeaterState enum to numeric: IDLE=0, ACTIVE=1, FAULTY=2
-            state_value = 0 if state.value == "idle" else (1 if state.value == "active" else 2)
-            # Determine line based on heater name (N1-N4 = C1, N5-N8 = C2)
-            line = "C1" if heater.name in ["N1", "N2", "N3", "N4"] else "C2"
-            yield Observation(
-                state_value,
-                {
-                    **self.default_dimensions,
-                    "heater": heater.name,
-                    "line": line,
-                }
-            )
+            yield Observation(HEATER_STATE_VALUE[state.value], self._heater_attrs[heater])
     
     def _observe_active_heaters_count(self, options: CallbackOptions):
         """Callback for active heaters count gauge."""
-        from common.domain import Heater
+        # Count active heaters per line in one pass
+        active_per_line = {"C1": 0, "C2": 0}
+        for heater in Heater:
+            if self.algorithm_rn.get_heater_state(heater).value == "active":
+                active_per_line[HEATER_LINE[heater].name] += 1
         
-        # Count total active heaters
-        active_count = sum(
-            1 for heater in Heater 
-            if self.algorithm_rn.get_heater_state(heater).value == "active"
-        )
-        yield Observation(active_count, {**self.default_dimensions})
+        yield Observation(active_per_line["C1"] + active_per_line["C2"], self._base_attrs)
         
         # Also provide per-line counts
-        c1_active = sum(
-            1 for heater in Heater 
-            if heater.name in ["N1", "N2", "N3", "N4"] 
-            and self.algorithm_rn.get_heater_state(heater).value == "active"
-        )
-        yield Observation(c1_active, {**self.default_dimensions, "line": "C1"})
-        
-        c2_active = sum(
-            1 for heater in Heater 
-            if heater.name in ["N5", "N6", "N7", "N8"] 
-            and self.algorithm_rn.get_heater_state(heater).value == "active"
-        )
-        yield Observation(c2_active, {**self.default_dimensions, "line": "C2"})
+        yield Observation(active_per_line["C1"], self._line_attrs["C1"])
+        yield Observation(active_per_line["C2"], self._line_attrs["C2"])
     
     def _observe_line_operating_time(self, options: CallbackOptions):
         """Callback for line operating time gauge."""
         for line_name in ["C1", "C2"]:
-            yield Observation(
-                self._line_operating_time[line_name],
-                {
-                    **self.default_dimensions,
-                    "line": line_name,
-                }
-            )
+            yield Observation(self._line_operating_time[line_name], self._line_attrs[line_name])
+    
+    def _observe_achieved_acceleration(self, options: CallbackOptions):
+        """Callback for achieved acceleration gauge."""
+        if self.lag_tracker.achieved_acceleration is not None:
+            yield Observation(self.lag_tracker.achieved_acceleration, self._base_attrs)
+    
+    def _observe_acceleration_ratio(self, options: CallbackOptions):
+        """Callback for achieved/configured acceleration gauge."""
+        ratio = self.lag_tracker.acceleration_ratio
+        if ratio is not None:
+            yield Observation(ratio, self._base_attrs)
+    
+    def _observe_missed_deadlines(self, options: CallbackOptions):
+        """Callback for missed deadlines counter."""
+        yield Observation(self.pacing_stats()["missed_deadlines"], self._base_attrs)
+    
+    def _observe_deadline_lag(self, options: CallbackOptions):
+        """Callback for deadline lag gauge."""
+        yield Observation(self.pacing_stats()["current_lag_s"], self._base_attrs)
+    
+    def record_lag_sample(self, sample: LagSample) -> None:
+        """Record lag figures of one weather poll."""
+        self._processing_gap_histogram.record(sample.gap_s, self._base_attrs)
+        self._skipped_steps_histogram.record(sample.skipped_steps, self._base_attrs)
+        if sample.skipped_steps:
+            self._skipped_steps_counter.add(sample.skipped_steps, self._base_attrs)
     
     def update(self) -> None:
         """
         Update counters based on current state.
         
         Should be called every simulation step to increment time counters.
+        Time deltas are accumulated locally and flushed to the OTel counters
+        every flush_interval_s of simulation time.
         """
         # Calculate time delta since last update
         if self._last_update_time == 0.0:
             self._last_update_time = self.state.simulation_time
             self._last_update_scenario = self.state.current_scenario
+            self._last_flush_time = self.state.simulation_time
             return
         
         time_delta = self.state.simulation_time - self._last_update_time
         
         if time_delta > 0:
-            # Increment scenario time counter
-            self._scenario_time_counter.add(
-                time_delta,
-                {
-                    **self.default_dimensions,
-                    "scenario": self.state.current_scenario.name,
-                }
-            )
-            
-            # Increment configuration time counter
-            self._config_time_counter.add(
-                time_delta,
-                {
-                    **self.default_dimensions,
-                    "config": self.state.current_config,
-                }
-            )
+            # Accumulate scenario and configuration time
+            self._pending_scenario_time[self.state.current_scenario] += time_delta
+            config = self.state.current_config
+            if config in self._pending_config_time:
+                self._pending_config_time[config] += time_delta
+            else:
+                self._pending_config_time[config] = time_delta
             
             # Increment line operating time (internal tracking for gauge)
-            from common.domain import Line
-            for line in [Line.C1, Line.C2]:
+            for line in (Line.C1, Line.C2):
                 if self.algorithm_rn.is_line_operating(line):
-                    line_name = line.name
-                    self._line_operating_time[line_name] += time_delta
+                    self._line_operating_time[line.name] += time_delta
             
             self._last_update_time = self.state.simulation_time
-            self._last_update_config = self.state.current_config
+            self._last_update_config = config
+        
+        if self.state.simulation_time - self._last_flush_time >= self.flush_interval_s:
+            self.flush()
     
-    def record_scenario_change(self, from_scenario: Scenario, to_scenario: Scenario) -> None:
+    def flush(self) -> None:
+        """Push accumulated time deltas to the OTel counters."""
+        for scenario, pending in self._pending_scenario_time.items():
+            if pending > 0:
+                self._scenario_time_counter.add(pending, self._scenario_attrs[scenario])
+                self._flushed_scenario_time[scenario] += pending
+                self._pending_scenario_time[scenario] = 0.0
+        
+        for config, pending in self._pending_config_time.items():
+            if pending > 0:
+                self._config_time_counter.add(pending, self._config_attributes(config))
+                self._flushed_config_time[config] = self._flushed_config_time.get(config, 0.0) + pending
+                self._pending_config_time[config] = 0.0
+        
+        self._last_flush_time = self.state.simulation_time
+    
+    def to_snapshot(self) -> dict:
+        """Time totals accumulated so far (flushed + pending), keyed by name."""
+        configs = set(self._pending_config_time) | set(self._flushed_config_time)
+        return {
+            "scenario_time_s": {
+                scenario.name: self._flushed_scenario_time[scenario] + self._pending_scenario_time[scenario]
+                for scenario in Scenario
+            },
+            "config_time_s": {
+                config: self._flushed_config_time.get(config, 0.0) + self._pending_config_time.get(config, 0.0)
+                for config in configs
+            },
+            "line_operating_time_s": dict(self._line_operating_time),
+        }
+    
+    def skip_ahead(self, span_s: float, totals: dict, events: Mapping[tuple, int]) -> None:
+        """
+        Jump over span_s of extrapolated simulation time.
+        
+        Args:
+            span_s: Skipped simulation time [s]
+            totals: Time totals at the end of the span (same layout as to_snapshot())
+            events: Decisions the span would have published, keyed like
+                ("scenario", from, to, structural), ("config", from, to),
+                ("heater", line, heater_off, heater_on)
+        """
+        current = self.to_snapshot()
+        for scenario in Scenario:
+            self._pending_scenario_time[scenario] += (
+                totals["scenario_time_s"][scenario.name] - current["scenario_time_s"][scenario.name]
+            )
+        for config, total in totals["config_time_s"].items():
+            self._pending_config_time[config] = (
+                self._pending_config_time.get(config, 0.0) + total - current["config_time_s"].get(config, 0.0)
+            )
+        self._line_operating_time.update(totals["line_operating_time_s"])
+        self._last_update_time += span_s
+        self._last_flush_time += span_s
+        
+        for (kind, *names), count in events.items():
+            if kind == "scenario":
+                from_name, to_name, structural = names
+                attrs = self._scenario_change_attrs[(Scenario[from_name], Scenario[to_name])]
+                self._scenario_changes_counter.add(count, attrs)
+                if structural:
+                    self._structural_changes_counter.add(count, attrs)
+            elif kind == "config":
+                self._rotation_counter.add(count, self._config_change_attrs[tuple(names)])
+            elif kind == "heater":
+                self._heater_rotation_counter.add(count, self._heater_rotation_attrs[tuple(names)])
+    
+    def shutdown(self) -> None:
+        """Final flush - call before telemetry shutdown so no accumulated time is lost."""
+        self.flush()
+    
+    def record_scenario_change(
+        self, from_scenario: Scenario, to_scenario: Scenario, structural: bool = False
+    ) -> None:
         """Record a scenario transition."""
-        self._scenario_changes_counter.add(
-            1,
-            {
-                **self.default_dimensions,
-                "from_scenario": from_scenario.name,
-                "to_scenario": to_scenario.name,
-            }
-        )
+        attrs = self._scenario_change_attrs[(from_scenario, to_scenario)]
+        self._scenario_changes_counter.add(1, attrs)
+        if structural:
+            self._structural_changes_counter.add(1, attrs)
         LOGGER.info(
-            f"Scenario change recorded: {from_scenario.name} → {to_scenario.name} "
-            f"(sim_time={self.state.simulation_time:.1f}s)"
+            "Scenario change recorded: %s → %s (sim_time=%.1fs)",
+            from_scenario.name, to_scenario.name, self.state.simulation_time,
         )
     
     def record_config_change(self, from_config: str, to_config: str, duration_s: float = 0.0) -> None:
         """Record a configuration rotation."""
-        self._rotation_counter.add(
-            1,
-            {
-                **self.default_dimensions,
-                "from_config": from_config,
-                "to_config": to_config,
-            }
-        )
+        attrs = self._config_change_attrs.get((from_config, to_config))
+        if attrs is None:
+            attrs = MappingProxyType({**self.default_dimensions, "from_config": from_config, "to_config": to_config})
+        self._rotation_counter.add(1, attrs)
         
         if duration_s > 0:
-            self._rotation_duration_histogram.record(
-                duration_s,
-                {**self.default_dimensions}
-            )
+            self._rotation_duration_histogram.record(duration_s, self._base_attrs)
         
         LOGGER.info(
-            f"Config change recorded: {from_config} → {to_config} "
-            f"(duration={duration_s:.1f}s, sim_time={self.state.simulation_time:.1f}s)"
+            "Config change recorded: %s → %s (duration=%.1fs, sim_time=%.1fs)",
+            from_config, to_config, duration_s, self.state.simulation_time,
         )
     
     def record_heater_rotation(
         self, line: str, heater_off: str, heater_on: str, duration_s: float = 0.0
     ) -> None:
         """Record a heater rotation."""
-        self._heater_rotation_counter.add(
-            1,
-            {
-                **self.default_dimensions,
-                "line": line,
-                "heater_off": heater_off,
-                "heater_on": heater_on,
-            }
-        )
+        attrs = self._heater_rotation_attrs.get((line, heater_off, heater_on))
+        if attrs is None:
+            attrs = MappingProxyType({
+                **self.default_dimensions, "line": line, "heater_off": heater_off, "heater_on": heater_on,
+            })
+        self._heater_rotation_counter.add(1, attrs)
         
         if duration_s > 0:
-            self._heater_rotation_duration_histogram.record(
-                duration_s,
-                {**self.default_dimensions, "line": line}
-            )
+            self._heater_rotation_duration_histogram.record(duration_s, self._line_attrs[line])
         
         LOGGER.info(
-            f"Heater rotation recorded: {line} {heater_off} → {heater_on} "
-            f"(duration={duration_s:.1f}s, sim_time={self.state.simulation_time:.1f}s)"
+            "Heater rotation recorded: %s %s → %s (duration=%.1fs, sim_time=%.1fs)",
+            line, heater_off, heater_on, duration_s, self.state.simulation_time,
         )
 
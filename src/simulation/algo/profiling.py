@@ -0,0 +1,175 @@
+"""Per-stage hot-path timing for the algo main loop."""
+
+from __future__ import annotations
+
+import logging
+from time import perf_counter_ns
+from typing import Callable, Iterator, Optional, TypeVar
+
+from opentelemetry.metrics import CallbackOptions, Observation
+
+LOGGER = logging.getLogger("algo-service.profiling")
+
+F = TypeVar("F", bound=Callable)
+
+# Bucket i holds durations with ns.bit_length() == i, i.e. [2^(i-1), 2^i) ns
+_BUCKETS = 64
+
+# Exported cumulative bucket bounds: below 2^i ns for i in 10..30 (~1µs .. ~1s), then +Inf
+_EXPORT_BOUNDS = range(10, 31)
+
+
+class Log2Histogram:
+    """
+    Preallocated histogram with power-of-two buckets (nanoseconds).
+
+    Recording is one bit_length() plus a list increment - cheap enough to run
+    on every tick. Quantiles are estimated within a factor of 2.
+    """
+
+    __slots__ = ("buckets", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        self.buckets[min(duration_ns.bit_length(), _BUCKETS - 1)] += 1
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def quantile_ns(self, q: float) -> float:
+        """Upper bound of the bucket containing quantile q (0..1)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return float(min(1 << index, self.max_ns))
+        return float(self.max_ns)
+
+
+class StageProfiler:
+    """
+    Times named stages (poll, ws, rc, rn, metrics, display, ...).
+
+    wrap() returns the callable itself when profiling is disabled, so the
+    disabled path has no per-call overhead at all.
+
+    Samples are exported as the series of a Prometheus histogram, read from
+    the bucket counts at collection time (see docs/simulation.md) - the timed
+    stages never touch the OTel SDK and export cost does not grow with the
+    sample count.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        meter=None,
+        metrics_prefix: str = "bogdanka.algo",
+        default_dimensions: Optional[dict[str, str]] = None,
+    ):
+        self.enabled = enabled
+        self.histograms: dict[str, Log2Histogram] = {}
+        self._stage_attrs: dict[str, dict[str, str]] = {}
+        self._bucket_attrs: dict[str, list[dict[str, str]]] = {}  # One per export bound + "+Inf"
+        self._default_dimensions = dict(default_dimensions or {})
+        if enabled and meter is not None:
+            # The OTel API has no weighted/batched record(), so a synchronous histogram would need
+            # one call per sample. Observable gauges named <name>_bucket/_sum/_count map 1:1 onto
+            # a Prometheus histogram (counters would get a _total suffix on conversion).
+            name = f"{metrics_prefix}.stage_duration_ms"
+            meter.create_observable_gauge(
+                f"{name}_bucket",
+                callbacks=[self._observe_buckets],
+                description="Cumulative main loop stage executions with duration below le (ms)",
+            )
+            meter.create_observable_gauge(
+                f"{name}_sum",
+                callbacks=[self._observe_sum],
+                description="Cumulative real time spent in each main loop stage (ms)",
+            )
+            meter.create_observable_gauge(
+                f"{name}_count",
+                callbacks=[self._observe_count],
+                description="Cumulative main loop stage executions",
+            )
+
+    def histogram(self, stage: str) -> Log2Histogram:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            attrs = {**self._default_dimensions, "stage": stage}
+            self._stage_attrs[stage] = attrs
+            self._bucket_attrs[stage] = [{**attrs, "le": repr((1 << i) / 1e6)} for i in _EXPORT_BOUNDS] + [
+                {**attrs, "le": "+Inf"}
+            ]
+            histogram = self.histograms[stage] = Log2Histogram()
+        return histogram
+
+    def wrap(self, stage: str, func: F) -> F:
+        """Return func timed under stage name (or func unchanged when disabled)."""
+        if not self.enabled:
+            return func
+        record = self.histogram(stage).record
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(perf_counter_ns() - start)
+
+        timed.__name__ = getattr(func, "__name__", stage)
+        timed.__doc__ = getattr(func, "__doc__", None)
+        return timed  # type: ignore[return-value]
+
+    def _observe_count(self, options: CallbackOptions) -> Iterator[Observation]:
+        for stage, histogram in list(self.histograms.items()):
+            yield Observation(histogram.count, self._stage_attrs[stage])
+
+    def _observe_sum(self, options: CallbackOptions) -> Iterator[Observation]:
+        for stage, histogram in list(self.histograms.items()):
+            yield Observation(histogram.total_ns / 1e6, self._stage_attrs[stage])
+
+    def _observe_buckets(self, options: CallbackOptions) -> Iterator[Observation]:
+        for stage, histogram in list(self.histograms.items()):
+            buckets = histogram.buckets
+            attrs = self._bucket_attrs[stage]
+            below = sum(buckets[:_EXPORT_BOUNDS.start])
+            for position, index in enumerate(_EXPORT_BOUNDS):
+                below += buckets[index]  # Bucket index holds [2^(index-1), 2^index) ns
+                yield Observation(below, attrs[position])
+            yield Observation(below + sum(buckets[_EXPORT_BOUNDS.stop:]), attrs[-1])
+
+    def summary(self) -> list[str]:
+        """Human-readable per-stage table (one line per stage)."""
+        lines = [f"{'stage':<12}{'count':>10}{'mean':>12}{'p50':>12}{'p99':>12}{'max':>12}{'total':>12}"]
+        for stage, h in sorted(self.histograms.items(), key=lambda item: -item[1].total_ns):
+            lines.append(
+                f"{stage:<12}{h.count:>10}{_fmt_ns(h.mean_ns):>12}{_fmt_ns(h.quantile_ns(0.5)):>12}"
+                f"{_fmt_ns(h.quantile_ns(0.99)):>12}{_fmt_ns(h.max_ns):>12}{_fmt_ns(h.total_ns):>12}"
+            )
+        return lines
+
+
+def _fmt_ns(value: float) -> str:
+    if value >= 1e9:
+        return f"{value / 1e9:.2f}s"
+    if value >= 1e6:
+        return f"{value / 1e6:.2f}ms"
+    if value >= 1e3:
+        return f"{value / 1e3:.1f}µs"
+    return f"{value:.0f}ns"
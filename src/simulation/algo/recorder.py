@@ -0,0 +1,280 @@
+"""Columnar recorder for the per-tick controller trajectory."""
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import struct
+import sys
+import tempfile
+import zipfile
+from array import array
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from common.domain import Heater
+from .algorithm_rn import AlgorithmRN, HeaterState
+from .algorithm_ws import AlgorithmWS
+from .state import AlgoState
+
+LOGGER = logging.getLogger("algo-service.recorder")
+
+# Column name → array typecode. Typecodes map 1:1 to NumPy dtypes (see _NPY_DESCR).
+COLUMNS: dict[str, str] = {
+    "sim_time": "d",       # [s] simulation time of the tick
+    "temperature": "f",    # [°C] raw external temperature
+    "t_filtered": "f",     # [°C] WS filter pipeline output
+    "scenario": "B",       # Scenario value 0-8
+    "config": "B",         # 0 = Primary, 1 = Limited
+    "heaters": "B",        # Bit i set = heater N(i+1) active
+    "locks": "B",          # LOCK_* bit flags
+}
+
+# Bits of the "locks" column
+LOCK_RC = 1 << 0           # config_change_in_progress
+LOCK_RN = 1 << 1           # heater_rotation_in_progress
+LOCK_SENSOR_ALARM = 1 << 2  # sensor_alarm
+
+HEATER_BITS = {heater: 1 << index for index, heater in enumerate(Heater)}
+
+_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+_NPY_DESCR = {
+    "d": f"{_BYTE_ORDER}f8",
+    "f": f"{_BYTE_ORDER}f4",
+    "B": "|u1",
+}
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+class _ChunkedColumn:
+    """
+    Typed column stored as a list of preallocated fixed-size chunks.
+
+    Appending never copies previously recorded data (a full chunk is simply
+    followed by a new one), so each append is O(1) even for long runs.
+    """
+
+    __slots__ = ("typecode", "chunk_size", "_chunks", "_current", "_pos", "_length")
+
+    def __init__(self, typecode: str, chunk_size: int):
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        self._chunks: list[array] = []
+        self._current: Optional[array] = None
+        self._pos = chunk_size  # Forces allocation on first append
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, value: float | int) -> None:
+        if self._pos == self.chunk_size:
+            self._current = array(self.typecode, bytes(array(self.typecode).itemsize * self.chunk_size))
+            self._chunks.append(self._current)
+            self._pos = 0
+        self._current[self._pos] = value
+        self._pos += 1
+        self._length += 1
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Raw native-endian bytes of the recorded values."""
+        for chunk in self._chunks[:-1]:
+            yield chunk.tobytes()
+        if self._chunks:
+            yield self._chunks[-1][: self._pos].tobytes()
+
+    def to_array(self) -> array:
+        result = array(self.typecode)
+        for chunk in self._chunks[:-1]:
+            result.extend(chunk)
+        if self._chunks:
+            result.extend(self._chunks[-1][: self._pos])
+        return result
+
+
+class TrajectoryRecorder:
+    """
+    Records controller state once per tick into typed columns.
+
+    Output formats (both readable by numpy.load, numpy itself is not needed to write):
+        - "npz": single compressed archive (zip of .npy files)
+        - "npy": directory with one .npy file per column - supports
+          numpy.load(..., mmap_mode="r") for memory-mapped analysis
+
+    Nothing is written before save(): all chunks stay in memory for the whole
+    run (20 bytes per tick) and are lost if the process dies first.
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self._columns = {name: _ChunkedColumn(code, chunk_size) for name, code in COLUMNS.items()}
+        # Bound append methods - avoids dict lookups on the hot path
+        self._append_sim_time = self._columns["sim_time"].append
+        self._append_temperature = self._columns["temperature"].append
+        self._append_t_filtered = self._columns["t_filtered"].append
+        self._append_scenario = self._columns["scenario"].append
+        self._append_config = self._columns["config"].append
+        self._append_heaters = self._columns["heaters"].append
+        self._append_locks = self._columns["locks"].append
+
+    def __len__(self) -> int:
+        return len(self._columns["sim_time"])
+
+    def append(
+        self,
+        sim_time: float,
+        temperature: float,
+        t_filtered: float,
+        scenario: int,
+        config: int,
+        heaters: int,
+        locks: int,
+    ) -> None:
+        """Append one row (all columns)."""
+        self._append_sim_time(sim_time)
+        self._append_temperature(temperature)
+        self._append_t_filtered(t_filtered)
+        self._append_scenario(scenario)
+        self._append_config(config)
+        self._append_heaters(heaters)
+        self._append_locks(locks)
+
+    def record_tick(
+        self,
+        sim_time: float,
+        temperature: float,
+        state: AlgoState,
+        algorithm_ws: AlgorithmWS,
+        algorithm_rn: AlgorithmRN,
+    ) -> None:
+        """Append controller state after a tick (WS/RC/RN already processed)."""
+        heaters = 0
+        for heater, bit in HEATER_BITS.items():
+            if algorithm_rn.get_heater_state(heater) is HeaterState.ACTIVE:
+                heaters |= bit
+        locks = (
+            (LOCK_RC if state.config_change_in_progress else 0)
+            | (LOCK_RN if state.heater_rotation_in_progress else 0)
+            | (LOCK_SENSOR_ALARM if state.sensor_alarm else 0)
+        )
+        t_filtered = algorithm_ws.filter.last_output
+        self.append(
+            sim_time,
+            temperature,
+            temperature if t_filtered is None else t_filtered,
+            state.current_scenario.value,
+            0 if state.current_config == "Primary" else 1,
+            heaters,
+            locks,
+        )
+
+    def column(self, name: str) -> array:
+        """Copy of a column's recorded values."""
+        return self._columns[name].to_array()
+
+    def save(self, path: str | Path, fmt: str = "npz") -> Path:
+        """
+        Write all columns.
+
+        Args:
+            path: Target .npz file or .npy directory
+            fmt: "npz" (compressed) or "npy" (directory, memory-mappable)
+
+        Returns:
+            Path that was written
+        """
+        path = Path(path)
+        if fmt == "npz":
+            self._save_npz(path)
+        elif fmt == "npy":
+            self._save_npy_dir(path)
+        else:
+            raise ValueError(f"Unsupported recorder format: {fmt}")
+        LOGGER.info(f"Trajectory recorded: {len(self)} ticks → {path}")
+        return path
+
+    def _save_npz(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_name, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for name, column in self._columns.items():
+                    with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                        _write_npy(member, column)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _save_npy_dir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        for name, column in self._columns.items():
+            target = path / f"{name}.npy"
+            tmp = target.with_suffix(".npy.tmp")
+            with tmp.open("wb") as handle:
+                _write_npy(handle, column)
+            os.replace(tmp, target)
+
+
+def _write_npy(handle, column: _ChunkedColumn) -> None:
+    """Write column in NPY format version 1.0 (header padded to 64 bytes)."""
+    header = f"{{'descr': '{_NPY_DESCR[column.typecode]}', 'fortran_order': False, 'shape': ({len(column)},), }}"
+    total = len(_NPY_MAGIC) + 2 + len(header) + 1
+    header += " " * (-total % 64) + "\n"
+    handle.write(_NPY_MAGIC)
+    handle.write(struct.pack("<H", len(header)))
+    handle.write(header.encode("latin1"))
+    for data in column.iter_bytes():
+        handle.write(data)
+
+
+def load_trajectory(path: str | Path, mmap: bool = True) -> dict[str, Any]:
+    """
+    Load recorded columns.
+
+    Uses NumPy when installed (memory-mapped for "npy" directories when mmap=True);
+    otherwise falls back to stdlib array.array columns.
+
+    Args:
+        path: .npz file or .npy directory written by TrajectoryRecorder.save
+        mmap: Memory-map .npy files instead of reading them (NumPy only)
+
+    Returns:
+        Mapping column name → array
+    """
+    path = Path(path)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if path.is_dir():
+        files = sorted(path.glob("*.npy"))
+        if np is not None:
+            return {f.stem: np.load(f, mmap_mode="r" if mmap else None) for f in files}
+        return {f.stem: _read_npy(f.read_bytes()) for f in files}
+
+    if np is not None:
+        with np.load(path) as archive:
+            return {name: archive[name] for name in archive.files}
+    with zipfile.ZipFile(path) as archive:
+        return {
+            Path(name).stem: _read_npy(archive.read(name))
+            for name in archive.namelist()
+            if name.endswith(".npy")
+        }
+
+
+def _read_npy(data: bytes) -> array:
+    """Parse NPY bytes written by _write_npy (stdlib fallback, 1-D columns only)."""
+    if not data.startswith(_NPY_MAGIC):
+        raise ValueError("Not an NPY file written by TrajectoryRecorder")
+    header_len = struct.unpack("<H", data[8:10])[0]
+    header = ast.literal_eval(data[10:10 + header_len].decode("latin1"))
+    typecode = {descr: code for code, descr in _NPY_DESCR.items()}[header["descr"]]
+    values = array(typecode)
+    values.frombytes(data[10 + header_len:])
+    return values
@@ -0,0 +1,154 @@
+"""Waitable handle for the progress and outcome of one simulation run."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+# Run outcomes
+COMPLETED = "completed"  # Reached the configured duration
+STOPPED = "stopped"  # Finished early (signal, request_stop)
+FAILED = "failed"  # Main loop raised
+
+
+class SimulationStalled(RuntimeError):
+    """Raised when simulation time stopped advancing for longer than the stall timeout."""
+
+
+class RunHandle:
+    """
+    Progress milestones and outcome of a simulation run, published by AlgoService.
+
+    The control loop calls report() with every processed simulation time - a
+    float store and a comparison, waiters are only woken when progress crosses
+    the next milestone (every 1/milestones of the duration) or the run ends.
+    Other threads block in wait_ready()/wait_milestone()/wait() without polling.
+    """
+
+    def __init__(self, duration_s: float, milestones: int = 10):
+        self.duration_s = duration_s
+        self.milestones = milestones
+        self._condition = threading.Condition()
+        self._sim_time = 0.0
+        self._milestone = 0
+        self._ready = False
+        self._next_milestone_time = self._milestone_time(1)
+        self._outcome: Optional[str] = None
+        self._reason = ""
+        self._error: Optional[BaseException] = None
+
+    def _milestone_time(self, milestone: int) -> float:
+        return self.duration_s * milestone / self.milestones
+
+    @property
+    def sim_time(self) -> float:
+        """Last simulation time reported by the control loop [s]."""
+        return self._sim_time
+
+    @property
+    def milestone(self) -> int:
+        """Milestones reached so far (0..milestones)."""
+        return self._milestone
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the duration simulated (0..1)."""
+        if self.duration_s <= 0:
+            return 1.0
+        return min(1.0, self._sim_time / self.duration_s)
+
+    @property
+    def ready(self) -> bool:
+        """True once the service reached its data source and entered the main loop."""
+        return self._ready
+
+    @property
+    def done(self) -> bool:
+        return self._outcome is not None
+
+    @property
+    def outcome(self) -> Optional[str]:
+        """COMPLETED, STOPPED, FAILED or None while running."""
+        return self._outcome
+
+    @property
+    def reason(self) -> str:
+        """Why the run stopped early (STOPPED) or failed (FAILED)."""
+        return self._reason
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """Exception of a FAILED run."""
+        return self._error
+
+    def mark_ready(self) -> None:
+        """Signal that the run has started (readiness handshake)."""
+        with self._condition:
+            self._ready = True
+            self._condition.notify_all()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the run is ready or already ended. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._ready or self._outcome is not None, timeout)
+
+    def report(self, sim_time: float) -> None:
+        """Record processed simulation time (control loop, every iteration)."""
+        self._sim_time = sim_time
+        if sim_time >= self._next_milestone_time and self._milestone < self.milestones:
+            with self._condition:
+                while self._milestone < self.milestones and sim_time >= self._next_milestone_time:
+                    self._milestone += 1
+                    self._next_milestone_time = self._milestone_time(self._milestone + 1)
+                self._condition.notify_all()
+
+    def finish(self, outcome: str, reason: str = "", error: Optional[BaseException] = None) -> None:
+        """Publish the outcome and wake all waiters (first call wins)."""
+        with self._condition:
+            if self._outcome is None:
+                self._outcome = outcome
+                self._reason = reason
+                self._error = error
+            self._condition.notify_all()
+
+    def wait_milestone(self, seen: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until a milestone after `seen` is reached, the run ends or timeout passes.
+
+        Returns:
+            Current milestone (== seen on timeout)
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._milestone > seen or self._outcome is not None, timeout)
+            return self._milestone
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the run ends. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._outcome is not None, timeout)
+
+    def watch(self, stall_timeout_s: float, clock=time.monotonic):
+        """
+        Yield each newly reached milestone until the run ends.
+
+        Raises SimulationStalled when the reported simulation time does not
+        advance for stall_timeout_s real seconds.
+        """
+        seen = self._milestone
+        last_sim_time, last_advance = self._sim_time, clock()
+        while True:
+            remaining = stall_timeout_s - (clock() - last_advance)
+            milestone = self.wait_milestone(seen, timeout=max(remaining, 0.0))
+            if milestone > seen:
+                seen = milestone
+                yield milestone
+            if self.done:
+                return
+            now = clock()
+            if self._sim_time != last_sim_time:
+                last_sim_time, last_advance = self._sim_time, now
+            elif now - last_advance >= stall_timeout_s:
+                raise SimulationStalled(
+                    f"Simulation time stuck at {self._sim_time:.0f}s for {now - last_advance:.0f}s real"
+                )
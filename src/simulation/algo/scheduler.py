@@ -0,0 +1,176 @@
+"""Deterministic multi-rate scheduler keyed on simulation time."""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+LOGGER = logging.getLogger("algo-service.scheduler")
+
+# Missed-tick policies
+COALESCE = "coalesce"  # Run once for all missed ticks (latest tick time)
+CATCH_UP = "catch_up"  # Run once per missed tick, in chronological order
+
+TaskCallback = Callable[[float], None]
+
+
+@dataclass
+class ScheduledTask:
+    """
+    Periodic task registered with SimScheduler.
+
+    Ticks fall at phase_s + k * period_s (simulation seconds), independent of
+    when the scheduler actually gets polled, so cadence never drifts.
+    """
+    name: str
+    period_s: float
+    callback: TaskCallback
+    phase_s: float = 0.0
+    priority: int = 0  # Lower runs first when several tasks share a tick
+    policy: str = COALESCE
+    next_tick: int = 0  # Index k of the next tick that has not run yet
+
+    # Statistics
+    runs: int = 0
+    coalesced_ticks: int = 0  # Ticks merged into a single run (COALESCE)
+    catch_up_runs: int = 0  # Extra runs made to replay missed ticks (CATCH_UP)
+    dropped_ticks: int = 0  # Ticks beyond max_catch_up_ticks that were skipped
+    _order: int = field(default=0, repr=False)
+
+    def tick_time(self, index: int) -> float:
+        return self.phase_s + index * self.period_s
+
+    def last_due_index(self, now: float) -> int:
+        """Index of the latest tick with tick_time <= now (-1 if none yet)."""
+        if now < self.phase_s:
+            return -1
+        # Small epsilon so float sim times landing exactly on a tick count as due
+        return int(math.floor((now - self.phase_s) / self.period_s + 1e-9))
+
+
+class SimScheduler:
+    """
+    Runs periodic tasks (WS, RC, RN, metrics, display) from simulation time.
+
+    The caller feeds the authoritative simulation time into run_due(); every task
+    whose tick has passed is run. Due runs are ordered by tick time, then task
+    priority, then registration order - so the same sequence of simulation times
+    always produces the same sequence of calls.
+
+    If several ticks of a task were missed (slow or failed polls), the task's
+    policy decides what happens:
+        - COALESCE: run once, with the latest missed tick time
+        - CATCH_UP: run once per missed tick (capped by max_catch_up_ticks)
+    """
+
+    def __init__(self, max_catch_up_ticks: int = 100):
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self._tasks: dict[str, ScheduledTask] = {}
+
+    def register(
+        self,
+        name: str,
+        period_s: float,
+        callback: TaskCallback,
+        *,
+        phase_s: float = 0.0,
+        priority: int = 0,
+        policy: str = COALESCE,
+    ) -> ScheduledTask:
+        """
+        Register periodic task.
+
+        Args:
+            name: Unique task name
+            period_s: Interval between ticks [s sim]
+            callback: Called with the tick's simulation time
+            phase_s: Time of the first tick [s sim]
+            priority: Lower runs first within the same tick
+            policy: COALESCE or CATCH_UP
+
+        Returns:
+            The registered task (exposes run statistics)
+        """
+        if period_s <= 0:
+            raise ValueError(f"Task '{name}' period must be positive")
+        if policy not in (COALESCE, CATCH_UP):
+            raise ValueError(f"Task '{name}' has unknown policy '{policy}'")
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' already registered")
+
+        task = ScheduledTask(
+            name=name,
+            period_s=float(period_s),
+            callback=callback,
+            phase_s=float(phase_s),
+            priority=priority,
+            policy=policy,
+            _order=len(self._tasks),
+        )
+        self._tasks[name] = task
+        return task
+
+    def get_task(self, name: str) -> Optional[ScheduledTask]:
+        return self._tasks.get(name)
+
+    @property
+    def tasks(self) -> list[ScheduledTask]:
+        return list(self._tasks.values())
+
+    def resume_at(self, sim_time: float) -> None:
+        """
+        Skip every tick up to sim_time without running it.
+
+        Used after restoring a checkpoint - ticks before the restored time already
+        ran in the previous process and must not be replayed.
+        """
+        for task in self._tasks.values():
+            task.next_tick = max(task.next_tick, task.last_due_index(sim_time) + 1)
+
+    def next_due_time(self) -> Optional[float]:
+        """Earliest simulation time at which some task becomes due."""
+        if not self._tasks:
+            return None
+        return min(task.tick_time(task.next_tick) for task in self._tasks.values())
+
+    def run_due(self, now: float) -> int:
+        """
+        Run every task tick that is due at simulation time `now`.
+
+        Returns:
+            Number of callback invocations
+        """
+        runs: list[tuple[float, int, int, ScheduledTask]] = []
+
+        for task in self._tasks.values():
+            last_due = task.last_due_index(now)
+            if last_due < task.next_tick:
+                continue
+
+            missed = last_due - task.next_tick  # Ticks before the latest due one
+            if task.policy == COALESCE:
+                task.coalesced_ticks += missed
+                runs.append((task.tick_time(last_due), task.priority, task._order, task))
+            else:
+                first = task.next_tick
+                if missed >= self.max_catch_up_ticks:
+                    first = last_due - self.max_catch_up_ticks + 1
+                    task.dropped_ticks += first - task.next_tick
+                    LOGGER.warning(
+                        f"Task '{task.name}' fell {missed + 1} ticks behind - "
+                        f"replaying last {self.max_catch_up_ticks}"
+                    )
+                for index in range(first, last_due + 1):
+                    runs.append((task.tick_time(index), task.priority, task._order, task))
+                task.catch_up_runs += last_due - first
+
+            task.next_tick = last_due + 1
+
+        runs.sort(key=lambda run: run[:3])
+        for tick_time, _, _, task in runs:
+            task.runs += 1
+            task.callback(tick_time)
+
+        return len(runs)
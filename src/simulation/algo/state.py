@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from common.domain import Scenario
+from .filters import MovingAverageFilter
 
 
 @dataclass
@@ -26,7 +27,7 @@ class AlgoState:
     # ALGORITHM WS STATE (Scenario Selection)
     # ═══════════════════════════════════════════════════════════════
     current_scenario: Scenario = Scenario.S0
-    t_zewn_buffer: list[float] = field(default_factory=list)  # Temperature moving average buffer
+    t_zewn_buffer: MovingAverageFilter = field(default_factory=MovingAverageFilter)  # Temperature moving average (ring buffer)
     last_valid_reading: float = 0.0  # Last valid temperature reading
     timestamp_last_scenario_change: float = 0.0  # When scenario last changed
     timestamp_last_reading: float = 0.0  # For detecting sensor failure
@@ -98,12 +99,55 @@ class AlgoState:
         Returns:
             Moving average temperature
         """
-        self.t_zewn_buffer.append(t_zewn)
-        
-        # Keep only last N readings
-        if len(self.t_zewn_buffer) > buffer_size:
-            self.t_zewn_buffer = self.t_zewn_buffer[-buffer_size:]
+        self.resize_temperature_buffer(buffer_size)
+        return self.t_zewn_buffer.process(t_zewn, self.simulation_time)
+    
+    def to_snapshot(self) -> dict:
+        """Serializable (JSON) copy of the global state."""
+        return {
+            "simulation_time": self.simulation_time,
+            "current_scenario": self.current_scenario.name,
+            "t_zewn_buffer": self.t_zewn_buffer.to_snapshot(),
+            "last_valid_reading": self.last_valid_reading,
+            "timestamp_last_scenario_change": self.timestamp_last_scenario_change,
+            "timestamp_last_reading": self.timestamp_last_reading,
+            "sensor_alarm": self.sensor_alarm,
+            "mode": self.mode,
+            "current_config": self.current_config,
+            "config_change_in_progress": self.config_change_in_progress,
+            "config_rotation_end_time": self.config_rotation_end_time,
+            "timestamp_last_config_change": self.timestamp_last_config_change,
+            "heater_rotation_in_progress": self.heater_rotation_in_progress,
+            "heater_rotation_end_time": self.heater_rotation_end_time,
+        }
+    
+    def restore_snapshot(self, data: dict) -> None:
+        """
+        Restore state written by to_snapshot().
         
-        # Return average
-        return sum(self.t_zewn_buffer) / len(self.t_zewn_buffer)
-
+        The temperature buffer is refilled in place - filter pipelines hold a
+        reference to it.
+        """
+        self.simulation_time = data["simulation_time"]
+        self.current_scenario = Scenario[data["current_scenario"]]
+        self.t_zewn_buffer.restore_snapshot(data["t_zewn_buffer"])
+        self.last_valid_reading = data["last_valid_reading"]
+        self.timestamp_last_scenario_change = data["timestamp_last_scenario_change"]
+        self.timestamp_last_reading = data["timestamp_last_reading"]
+        self.sensor_alarm = data["sensor_alarm"]
+        self.mode = data["mode"]
+        self.current_config = data["current_config"]
+        self.config_change_in_progress = data["config_change_in_progress"]
+        self.config_rotation_end_time = data["config_rotation_end_time"]
+        self.timestamp_last_config_change = data["timestamp_last_config_change"]
+        self.heater_rotation_in_progress = data["heater_rotation_in_progress"]
+        self.heater_rotation_end_time = data["heater_rotation_end_time"]
+    
+    def resize_temperature_buffer(self, buffer_size: int) -> None:
+        """Change moving average window, keeping the most recent readings."""
+        if self.t_zewn_buffer.window == buffer_size:
+            return
+        resized = MovingAverageFilter(buffer_size)
+        for value in self.t_zewn_buffer.values()[-buffer_size:]:
+            resized.process(value)
+        self.t_zewn_buffer = resized
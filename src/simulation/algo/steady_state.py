@@ -0,0 +1,300 @@
+"""Steady-state cycle detection and extrapolation for constant-temperature runs."""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from .algorithm_rc import RCConfig
+from .algorithm_rn import RNConfig
+from .algorithm_ws import WSConfig
+from .events import ConfigRotationStarted, EventBus, HeaterRotationStarted, ScenarioChanged
+from .metrics import HEATER_LINE
+
+LOGGER = logging.getLogger("algo-service.steady-state")
+
+# AlgoState fields holding absolute simulation times
+STATE_TIMESTAMPS = (
+    "timestamp_last_scenario_change",
+    "timestamp_last_reading",
+    "config_rotation_end_time",
+    "timestamp_last_config_change",
+    "heater_rotation_end_time",
+)
+
+# Scheduler tasks whose tick phase changes what the controller computes
+STEADY_TASKS = ("ws", "rc", "rn", "metrics")
+
+# Decimal places kept when comparing times (sim times are whole seconds in practice)
+KEY_PRECISION = 6
+
+# Event tally key → number of occurrences, e.g. ("heater", "C1", "N1", "N3")
+EventCounts = Mapping[tuple, int]
+
+
+def steady_state_horizon(ws: WSConfig, rc: RCConfig, rn: RNConfig) -> float:
+    """
+    Longest time span any WS/RC/RN decision looks back [s].
+
+    Ages beyond it can not change a decision, so controller states whose
+    timestamps are all at least this old compare equal.
+    """
+    return float(max(
+        ws.scenario_stabilization_time_s,
+        ws.sensor_failure_timeout_s,
+        rc.rotation_period_hours * 3600,
+        rc.min_operating_time_s,
+        rn.rotation_period_hours * 3600,
+        rn.stabilization_time_s,
+        rn.min_time_since_config_change_s,
+        rn.min_time_between_rotations_s,
+    ))
+
+
+@dataclass
+class SteadyCycle:
+    """
+    Two probes with equal controller state, period_s apart.
+
+    Everything the controller does between start and end repeats in every
+    following period, so whole periods can be added without simulating them.
+    """
+    start: dict[str, Any]  # Checkpoint (+ "metrics" totals) at the first probe
+    end: dict[str, Any]  # Checkpoint at the repeating probe
+    events: Counter  # Event tally of one period
+
+    @property
+    def start_time(self) -> float:
+        return self.start["simulation_time"]
+
+    @property
+    def period_s(self) -> float:
+        return self.end["simulation_time"] - self.start["simulation_time"]
+
+    def event_counts(self, cycles: int) -> dict[tuple, int]:
+        """Events that `cycles` further periods would publish."""
+        return {key: count * cycles for key, count in self.events.items()}
+
+    def advance(self, cycles: int) -> dict[str, Any]:
+        """
+        Checkpoint of the controller `cycles` periods after the end probe.
+
+        Accumulators (operating times, counters, block statistics) grow by
+        their per-period increment. Timestamps that were updated during the
+        period move with the clock; timestamps left untouched keep their
+        value, because nothing in the following periods touches them either.
+
+        Args:
+            cycles: Whole periods to skip
+
+        Returns:
+            Checkpoint document for restore_checkpoint()
+        """
+        span_s = cycles * self.period_s
+        start, data = self.start, copy.deepcopy(self.end)
+
+        def grow(new: dict, old: Mapping, key: str) -> None:
+            new[key] += cycles * (new[key] - old.get(key, 0))
+
+        def grow_all(new: dict, old: Mapping) -> None:
+            for key in new:
+                grow(new, old, key)
+
+        def shift(new: dict, old: Mapping, key: str) -> None:
+            if new[key] != old[key]:
+                new[key] += span_s
+
+        data["simulation_time"] += span_s
+        data["state"]["simulation_time"] += span_s
+        for key in STATE_TIMESTAMPS:
+            shift(data["state"], start["state"], key)
+
+        ws, ws_start = data["ws"], start["ws"]
+        grow_all(ws["scenario_time_s"], ws_start["scenario_time_s"])
+        grow(ws, ws_start, "total_scenario_changes")
+        grow(ws, ws_start, "structural_changes")
+        shift(ws, ws_start, "last_time_update")
+        for (_, stage), (_, stage_start) in zip(ws["filter"]["stages"], ws_start["filter"]["stages"]):
+            if "last_time" in stage:
+                shift(stage, stage_start, "last_time")
+
+        rc, rc_start = data["rc"], start["rc"]
+        for key in ("time_in_primary", "time_in_limited", "rotation_count", "blocked_count"):
+            grow(rc, rc_start, key)
+        grow_all(rc["blocked_by_reason"], rc_start["blocked_by_reason"])
+        shift(rc, rc_start, "last_update_time")
+
+        rn, rn_start = data["rn"], start["rn"]
+        for name, tracking in rn["heater_tracking"].items():
+            tracking_start = rn_start["heater_tracking"][name]
+            grow(tracking, tracking_start, "operating_time_s")
+            grow(tracking, tracking_start, "idle_time_s")
+            shift(tracking, tracking_start, "first_activation_timestamp")
+        for line in rn["last_rotation_per_line"]:
+            shift(rn["last_rotation_per_line"], rn_start["last_rotation_per_line"], line)
+        for key in ("last_rotation_global", "last_update_time"):
+            shift(rn, rn_start, key)
+        grow(rn, rn_start, "rotation_count")
+        grow(rn, rn_start, "blocked_count")
+        grow_all(rn["blocked_by_reason"], rn_start["blocked_by_reason"])
+
+        if "metrics" in data:
+            for name, totals in data["metrics"].items():
+                grow_all(totals, start["metrics"][name])
+        return data
+
+
+def cycle_key(checkpoint: Mapping[str, Any], phases: Mapping[str, float], horizon_s: float) -> str:
+    """
+    Canonical form of controller state modulo time offsets.
+
+    Absolute timestamps become ages capped at horizon_s, per-heater operating
+    and idle times become offsets from the least used heater of the line
+    (only their differences drive RN) and first activations become their
+    order. Pure accumulators that no decision reads are left out.
+
+    Args:
+        checkpoint: Document from capture_checkpoint()
+        phases: Next tick of each STEADY_TASKS task relative to now [s]
+        horizon_s: Age beyond which timestamps compare equal
+
+    Returns:
+        String that is equal for states that evolve identically
+    """
+    now = checkpoint["simulation_time"]
+
+    def age(timestamp: Optional[float]) -> Optional[float]:
+        if timestamp is None:
+            return None
+        return round(min(now - timestamp, horizon_s), KEY_PRECISION)
+
+    state = dict(checkpoint["state"])
+    del state["simulation_time"]
+    for key in STATE_TIMESTAMPS:
+        state[key] = age(state[key])
+
+    ws = checkpoint["ws"]
+    stages = []
+    for name, stage in ws["filter"]["stages"]:
+        if "last_time" in stage and stage.get("last_value") is not None:
+            stage = {**stage, "last_time": age(stage["last_time"])}
+        stages.append([name, stage])
+
+    rc = checkpoint["rc"]
+    rn = checkpoint["rn"]
+    heaters = {}
+    for line in sorted({line.name for line in HEATER_LINE.values()}):
+        names = [heater.name for heater, heater_line in HEATER_LINE.items() if heater_line.name == line]
+        tracking = {name: rn["heater_tracking"][name] for name in names}
+        min_operating = min(t["operating_time_s"] for t in tracking.values())
+        min_idle = min(t["idle_time_s"] for t in tracking.values())
+        # 0.0 = never activated (sorted last by RN)
+        activations = sorted({t["first_activation_timestamp"] for t in tracking.values()} - {0.0})
+        for name, t in tracking.items():
+            heaters[name] = [
+                t["state"],
+                round(t["operating_time_s"] - min_operating, KEY_PRECISION),
+                round(t["idle_time_s"] - min_idle, KEY_PRECISION),
+                t["operating_time_s"] > 0.0,
+                activations.index(t["first_activation_timestamp"]) if t["first_activation_timestamp"] else None,
+            ]
+
+    key = {
+        "state": state,
+        "ws": {
+            "last_time_update": age(ws["last_time_update"]) if ws["last_time_update"] > 0.0 else 0.0,
+            "filter": {"stages": stages, "last_output": ws["filter"]["last_output"]},
+        },
+        "rc": {"last_update_time": age(rc["last_update_time"]), "previous_scenario": rc["previous_scenario"]},
+        "rn": {
+            "heaters": heaters,
+            "last_rotation_per_line": {line: age(t) for line, t in rn["last_rotation_per_line"].items()},
+            "last_rotation_global": age(rn["last_rotation_global"]),
+            "last_update_time": age(rn["last_update_time"]),
+            "previous_scenario": rn["previous_scenario"],
+            "previous_config": rn["previous_config"],
+        },
+        "phases": {name: round(phase, KEY_PRECISION) for name, phase in sorted(phases.items())},
+    }
+    return json.dumps(key, sort_keys=True, separators=(",", ":"))
+
+
+class SteadyStateDetector:
+    """
+    Finds the first repeat of controller state in a run with constant input.
+
+    The state is probed after every RC/RN rotation and at least once per
+    horizon_s (quiet regimes without rotations). A probe whose cycle_key was
+    seen before closes a cycle. Events published between the two probes are
+    tallied so the skipped periods can be added to the counters.
+    """
+
+    def __init__(self, horizon_s: float, max_probes: int = 4096):
+        self.horizon_s = horizon_s
+        self.max_probes = max_probes
+        self._events: Counter = Counter()
+        self._seen: dict[str, tuple[dict[str, Any], Counter]] = {}
+        self._pending = True
+        self._last_probe_time: Optional[float] = None
+
+    @property
+    def probes(self) -> int:
+        """Number of distinct states remembered so far."""
+        return len(self._seen)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once max_probes states were stored without a repeat."""
+        return len(self._seen) >= self.max_probes
+
+    def attach(self, event_bus: EventBus) -> None:
+        """Tally decisions that show up in counters (synchronous subscriber)."""
+        event_bus.subscribe(ScenarioChanged, self._on_scenario_changed)
+        event_bus.subscribe(ConfigRotationStarted, self._on_config_rotation)
+        event_bus.subscribe(HeaterRotationStarted, self._on_heater_rotation)
+
+    def _on_scenario_changed(self, event: ScenarioChanged) -> None:
+        self._events[("scenario", event.old_scenario.name, event.new_scenario.name, event.structural)] += 1
+
+    def _on_config_rotation(self, event: ConfigRotationStarted) -> None:
+        self._events[("config", event.old_config, event.new_config)] += 1
+        self._pending = True
+
+    def _on_heater_rotation(self, event: HeaterRotationStarted) -> None:
+        self._events[("heater", event.line.name, event.heater_off.name, event.heater_on.name)] += 1
+        self._pending = True
+
+    def due(self, sim_time: float) -> bool:
+        """Whether the state at sim_time should be probed."""
+        if self.exhausted:
+            return False
+        if self._pending or self._last_probe_time is None:
+            return True
+        return sim_time - self._last_probe_time >= self.horizon_s
+
+    def observe(self, checkpoint: dict[str, Any], phases: Mapping[str, float]) -> Optional[SteadyCycle]:
+        """
+        Probe controller state.
+
+        Args:
+            checkpoint: capture_checkpoint() document, optionally with "metrics" totals
+            phases: Next tick of each STEADY_TASKS task relative to now [s]
+
+        Returns:
+            The cycle closed by this probe, or None
+        """
+        self._pending = False
+        self._last_probe_time = checkpoint["simulation_time"]
+        key = cycle_key(checkpoint, phases, self.horizon_s)
+        seen = self._seen.get(key)
+        if seen is not None:
+            start, events = seen
+            return SteadyCycle(start=start, end=checkpoint, events=self._events - events)
+        self._seen[key] = (checkpoint, Counter(self._events))
+        if self.exhausted:
+            LOGGER.info(f"Steady state: no repeat within {self.max_probes} probes - simulating in full")
+        return None
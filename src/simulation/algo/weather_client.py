@@ -5,14 +5,13 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Optional
 
 from common.domain import WeatherSnapshot
 
+if TYPE_CHECKING:
+    import requests
+
 LOGGER = logging.getLogger("algo-service.weather-client")
 
 
@@ -26,10 +25,23 @@ class WeatherClient:
     backoff_factor: float = 0.5
     
     def __post_init__(self) -> None:
-        self._session = self._create_session()
+        # requests/urllib3 are imported on first use - fast-forward runs never poll over HTTP
+        self._session: Optional[requests.Session] = None
+        self._request_error: type[Exception] = Exception
+    
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
     
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        self._request_error = requests.exceptions.RequestException
         session = requests.Session()
         retry_strategy = Retry(
             total=self.max_retries,
@@ -50,8 +62,9 @@ class WeatherClient:
             WeatherSnapshot with simulation_time (authoritative), temperature, etc.
             None if connection fails after retries.
         """
+        session = self.session
         try:
-            response = self._session.get(self.endpoint_url, timeout=self.timeout_seconds)
+            response = session.get(self.endpoint_url, timeout=self.timeout_seconds)
             response.raise_for_status()
             data = response.json()
             
@@ -71,7 +84,7 @@ class WeatherClient:
             
             return snapshot
             
-        except requests.exceptions.RequestException as exc:
+        except self._request_error as exc:
             LOGGER.error(f"Failed to poll weather service: {exc}")
             return None
     
@@ -85,16 +98,17 @@ class WeatherClient:
         Returns:
             True if service is available, False if timeout
         """
+        session = self.session
         start_time = time.time()
         retry_count = 0
         
         while (time.time() - start_time) < max_wait_seconds:
             try:
-                response = self._session.get(self.endpoint_url, timeout=2.0)
+                response = session.get(self.endpoint_url, timeout=2.0)
                 response.raise_for_status()
                 LOGGER.info(f"Weather service is available at {self.endpoint_url}")
                 return True
-            except requests.exceptions.RequestException:
+            except self._request_error:
                 retry_count += 1
                 wait_time = min(self.backoff_factor * (2 ** retry_count), 5.0)
                 LOGGER.info(
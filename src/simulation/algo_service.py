@@ -3,23 +3,41 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import signal
 import sys
 import threading
-import time
 from pathlib import Path
+from typing import Callable
 
 from algo.algorithm_rc import AlgorithmRC, RCConfig
 from algo.algorithm_rn import AlgorithmRN, RNConfig
 from algo.algorithm_ws import AlgorithmWS, WSConfig
+from algo.checkpoint import capture_checkpoint, read_checkpoint, restore_checkpoint, write_checkpoint
 from algo.display import StatusDisplay
+from algo.events import (
+    ConfigRotationStarted,
+    EventBus,
+    HeaterRotationStarted,
+    RotationBlocked,
+    ScenarioChanged,
+)
+from algo.journal import EventJournal
+from algo.lag import LagTracker
 from algo.metrics import AlgoMetrics
+from algo.profiling import StageProfiler
+from algo.recorder import TrajectoryRecorder
+from algo.run_handle import COMPLETED, FAILED, STOPPED, RunHandle
+from algo.scheduler import SimScheduler
+from algo.steady_state import STEADY_TASKS, SteadyCycle, SteadyStateDetector, steady_state_horizon
 from algo.state import AlgoState
 from algo.weather_client import WeatherClient
-from common.domain import Heater, Line, Scenario
-from common.config import load_config
+from common.domain import Heater, Line, Scenario, WeatherSnapshot
+from common.config import AppConfig, load_config
+from common.log_queue import configure_logging, stop_queued_logging
 from common.telemetry import TelemetryManager
+from common.time_utils import DeadlinePacer
 
 LOGGER = logging.getLogger("algo-service")
 
@@ -34,17 +52,39 @@ class AlgoService:
     Key Design: Uses simulation_time from weather service - NO independent clock!
     """
     
-    def __init__(self, config_path: Path, display_output_stream=None, test_profile_description=None):
-        # Load configuration
-        self.config = load_config(config_path)
+    def __init__(
+        self,
+        config: AppConfig,
+        display_output_stream=None,
+        test_profile_description=None,
+        fast_forward: bool = False,
+        weather_endpoint: str | None = None,
+    ):
+        # Own copy - the adjustments below must not leak into the caller's config
+        self.config = copy.deepcopy(config)
+        if weather_endpoint is not None:
+            # Weather service bound to a port chosen at run time (test runner)
+            self.config.services.algo.weather_endpoint = weather_endpoint
+        self.fast_forward = fast_forward
+        if fast_forward:
+            # Fast-forward: no external exporters and no real-time display
+            self.config.telemetry.exporter_type = "memory"
+            self.config.services.algo.display.enabled = False
         self._configure_logging()
         
         # Initialize telemetry
-        self.telemetry = TelemetryManager(self.config.telemetry)
+        self.telemetry = TelemetryManager(
+            self.config.telemetry,
+            prometheus_port=self.config.services.algo.metrics_port,
+            metrics_prefix=self.config.services.algo.metrics_prefix,
+        )
         
         # Initialize global state
         self.state = AlgoState()
         
+        # Event bus - algorithms publish decisions, consumers subscribe (metrics, display, recorders)
+        self.event_bus = EventBus()
+        
         # Initialize weather client
         self.weather_client = WeatherClient(
             endpoint_url=self.config.services.algo.weather_endpoint,
@@ -56,8 +96,13 @@ class AlgoService:
             temp_monitoring_cycle_s=self.config.services.algo.algorithms.ws.temp_monitoring_cycle_s,
             scenario_stabilization_time_s=self.config.services.algo.algorithms.ws.scenario_stabilization_time_s,
             hysteresis_delta_c=self.config.services.algo.algorithms.ws.hysteresis_delta_c,
+            filter_averaging=self.config.services.algo.algorithms.ws.filter_averaging,
+            filter_median_window=self.config.services.algo.algorithms.ws.filter_median_window,
+            filter_ema_alpha=self.config.services.algo.algorithms.ws.filter_ema_alpha,
+            filter_max_rate_c_per_min=self.config.services.algo.algorithms.ws.filter_max_rate_c_per_min,
+            filter_spike_max_rejections=self.config.services.algo.algorithms.ws.filter_spike_max_rejections,
         )
-        self.algorithm_ws = AlgorithmWS(config=ws_config, state=self.state)
+        self.algorithm_ws = AlgorithmWS(config=ws_config, state=self.state, event_bus=self.event_bus)
         
         # Initialize Algorithm RC
         rc_config = RCConfig(
@@ -66,7 +111,7 @@ class AlgoService:
             algorithm_loop_cycle_s=self.config.services.algo.algorithms.rc.algorithm_loop_cycle_s,
             min_operating_time_s=self.config.services.algo.algorithms.rc.min_operating_time_s,
         )
-        self.algorithm_rc = AlgorithmRC(config=rc_config, state=self.state)
+        self.algorithm_rc = AlgorithmRC(config=rc_config, state=self.state, event_bus=self.event_bus)
         
         # Initialize Algorithm RN (pass algorithm_rc for coordination)
         rn_config = RNConfig(
@@ -75,7 +120,22 @@ class AlgoService:
             min_delta_time_s=self.config.services.algo.algorithms.rn.min_delta_time_s,
             algorithm_loop_cycle_s=self.config.services.algo.algorithms.rn.algorithm_loop_cycle_s,
         )
-        self.algorithm_rn = AlgorithmRN(config=rn_config, state=self.state, algorithm_rc=self.algorithm_rc)
+        self.algorithm_rn = AlgorithmRN(
+            config=rn_config,
+            state=self.state,
+            algorithm_rc=self.algorithm_rc,
+            event_bus=self.event_bus,
+        )
+        
+        # Simulation lag tracking (achieved acceleration, sim-time gaps between polls)
+        lag_config = self.config.services.algo.lag
+        self.lag_tracker = LagTracker(
+            configured_acceleration=self.config.simulation.acceleration,
+            step_s=self.config.services.algo.algorithms.ws.temp_monitoring_cycle_s,
+            window_real_s=lag_config.window_real_s,
+            warn_acceleration_ratio=lag_config.warn_acceleration_ratio,
+            warn_gap_s=lag_config.warn_gap_s,
+        )
         
         # Initialize metrics (AFTER algorithm_rn, as it needs reference to it)
         self.metrics = AlgoMetrics(
@@ -84,6 +144,9 @@ class AlgoService:
             default_dimensions=dict(self.config.telemetry.default_dimensions),
             state=self.state,
             algorithm_rn=self.algorithm_rn,
+            flush_interval_s=self.config.services.algo.metrics_flush_interval_s,
+            lag_tracker=self.lag_tracker,
+            pacing_stats=self.pacing_stats,
         )
         
         # Initialize recent events buffers (for display) - separate for WS, RC, RN
@@ -108,9 +171,56 @@ class AlgoService:
             duration_seconds=self.config.simulation.duration_days * 24 * 3600,  # Convert days to seconds
         )
         
+        # Subscribe metrics and display buffers to algorithm decisions
+        self.event_bus.subscribe(ScenarioChanged, self._on_scenario_changed)
+        self.event_bus.subscribe(ConfigRotationStarted, self._on_config_rotation_started)
+        self.event_bus.subscribe(HeaterRotationStarted, self._on_heater_rotation_started)
+        self.event_bus.subscribe(RotationBlocked, self._on_rotation_blocked)
+        
+        # Optional per-tick trajectory recorder
+        recorder_config = self.config.services.algo.recorder
+        self.recorder = TrajectoryRecorder(recorder_config.chunk_size) if recorder_config.enabled else None
+        
+        # Optional binary decision journal (sync bus consumer - files are written once per record block)
+        journal_config = self.config.services.algo.journal
+        self.journal: EventJournal | None = None
+        if journal_config.enabled:
+            self.journal = EventJournal(
+                journal_config.path,
+                segment_records=journal_config.segment_records,
+                block_records=journal_config.block_records,
+                compress=journal_config.compress,
+                max_segments=journal_config.max_segments,
+            )
+            self.journal.attach(self.event_bus)
+        
+        # Optional per-stage timers (wrap() is a no-op when disabled)
+        self.profiler = StageProfiler(
+            enabled=self.config.services.algo.profiling.enabled,
+            meter=self.telemetry.meter("bogdanka.algo"),
+            metrics_prefix=self.config.services.algo.metrics_prefix,
+            default_dimensions=dict(self.config.telemetry.default_dimensions),
+        )
+        self._poll = self.profiler.wrap("poll", self.weather_client.poll)
+        
+        # Simulation-time scheduler for WS, RC, RN, metrics and display
+        self.scheduler = self._build_scheduler()
+        self._latest_snapshot: WeatherSnapshot | None = None
+        self._resumed_at: float | None = None  # Checkpoint sim time until weather catches up
+        
+        # Real-time pacing of weather polls (absolute deadlines, drift-free)
+        self.pacer = DeadlinePacer(
+            interval_s=self.config.services.algo.algorithms.ws.temp_monitoring_cycle_s / self.config.simulation.acceleration,
+            max_lag_intervals=self.config.services.algo.scheduler.max_catch_up_ticks,
+        )
+        
         # Control flags
         self._running = False
         self._stop_requested = False
+        self._stop_reason = ""
+        
+        # Progress milestones and outcome for other threads (test runner, embedding apps)
+        self.run_handle = RunHandle(self.config.simulation.duration_seconds)
         
         LOGGER.info("Algo service initialized successfully")
         LOGGER.info(f"Weather endpoint: {self.config.services.algo.weather_endpoint}")
@@ -132,41 +242,20 @@ class AlgoService:
         if display_enabled and log_output == "console":
             log_output = "file"
         
-        if log_output == "file":
-            # Log to file only
-            from pathlib import Path
-            log_file = Path(self.config.telemetry.log_file)
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            logging.basicConfig(
-                level=level,
-                format=log_format,
-                datefmt=date_format,
-                filename=str(log_file),
-                filemode='a',
-            )
-        elif log_output == "both":
-            # Log to both file and console
-            from pathlib import Path
+        handlers: list[logging.Handler] = []
+        if log_output in ("file", "both"):
             log_file = Path(self.config.telemetry.log_file)
             log_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            logging.basicConfig(
-                level=level,
-                format=log_format,
-                datefmt=date_format,
-                handlers=[
-                    logging.FileHandler(str(log_file), mode='a'),
-                    logging.StreamHandler(),
-                ],
-            )
-        else:
-            # Log to console only (default)
-            logging.basicConfig(
-                level=level,
-                format=log_format,
-                datefmt=date_format,
-            )
+            handlers.append(logging.FileHandler(str(log_file), mode='a', delay=True))  # Opened on first record
+        if log_output != "file":
+            # Console only (default) or both
+            handlers.append(logging.StreamHandler())
+        
+        # With log_queue the main loop only enqueues records - formatting and
+        # file/console writes happen on a listener thread (stopped in shutdown())
+        self._log_listener = configure_logging(
+            level, handlers, log_format, date_format, queued=self.config.telemetry.log_queue
+        )
     
     def start(self) -> None:
         """Start the algo service main loop."""
@@ -174,30 +263,67 @@ class AlgoService:
         LOGGER.info("Waiting for weather service to become available...")
         if not self.weather_client.wait_for_service(max_wait_seconds=30.0):
             LOGGER.error("Weather service not available - exiting")
+            self.run_handle.finish(FAILED, "Weather service not available")
             sys.exit(1)
         
         LOGGER.info("Weather service is ready - starting main loop")
         self._running = True
+        self.run_handle.mark_ready()
         
         # Setup signal handlers for graceful shutdown (only if in main thread)
         if threading.current_thread() is threading.main_thread():
             signal.signal(signal.SIGINT, self._signal_handler)
             signal.signal(signal.SIGTERM, self._signal_handler)
         
+        error: BaseException | None = None
         try:
             self._main_loop()
         except KeyboardInterrupt:
             LOGGER.info("Keyboard interrupt received")
+            self._stop_requested = True
+            self._stop_reason = "Keyboard interrupt"
         except Exception as exc:
             LOGGER.exception(f"Fatal error in main loop: {exc}")
+            error = exc
             raise
         finally:
-            self.shutdown()
+            try:
+                self.shutdown()
+            finally:
+                self._finish_run(error)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         LOGGER.info(f"Received signal {signum} - initiating shutdown")
         self._stop_requested = True
+        self._stop_reason = f"Signal {signum}"
+    
+    def request_stop(self, reason: str) -> None:
+        """
+        Ask the main / fast-forward loop to finish after the current iteration.
+        
+        Safe to call from event handlers and other threads; shutdown() runs as usual.
+        
+        Args:
+            reason: Logged with the simulation time of the request
+        """
+        LOGGER.info(f"Stop requested at sim_time={self.state.simulation_time:.0f}s: {reason}")
+        self._stop_reason = reason
+        self._stop_requested = True
+    
+    @property
+    def stop_requested(self) -> bool:
+        """True once a signal or request_stop() asked the loop to finish early."""
+        return self._stop_requested
+    
+    def _finish_run(self, error: BaseException | None = None) -> None:
+        """Publish the run outcome on run_handle (after shutdown, so final metrics are in place)."""
+        if error is not None:
+            self.run_handle.finish(FAILED, f"{type(error).__name__}: {error}", error)
+        elif self._stop_requested and self.state.simulation_time < self.config.simulation.duration_seconds:
+            self.run_handle.finish(STOPPED, self._stop_reason)
+        else:
+            self.run_handle.finish(COMPLETED)
     
     def _add_event(self, event_type: str, event_text: str) -> None:
         """
@@ -229,6 +355,195 @@ class AlgoService:
             while len(self._recent_rn_events) > self._max_recent_events:
                 self._recent_rn_events.pop(0)
     
+    def _on_scenario_changed(self, event: ScenarioChanged) -> None:
+        """Record WS scenario change (metric + display event)."""
+        self.metrics.record_scenario_change(event.old_scenario, event.new_scenario, event.structural)
+        self._add_event('ws', f"{event.old_scenario.name}→{event.new_scenario.name}")
+    
+    def _on_config_rotation_started(self, event: ConfigRotationStarted) -> None:
+        """Record RC configuration change (metric + display event)."""
+        self.metrics.record_config_change(event.old_config, event.new_config)
+        old_config_short = "C1" if event.old_config == "Primary" else "C2"
+        new_config_short = "C1" if event.new_config == "Primary" else "C2"
+        self._add_event('rc', f"{old_config_short}→{new_config_short}")
+    
+    def _on_heater_rotation_started(self, event: HeaterRotationStarted) -> None:
+        """Record RN heater rotation (metric + display event)."""
+        line = event.line.name
+        self.metrics.record_heater_rotation(line, event.heater_off.name, event.heater_on.name)
+        self._add_event('rn', f"{line}: {event.heater_off.name}→{event.heater_on.name}")
+    
+    def _on_rotation_blocked(self, event: RotationBlocked) -> None:
+        """Show RN collisions with an RC rotation in progress."""
+        if event.algorithm == "rn" and event.reason == "rc_rotation_in_progress":
+            line = event.line.name if event.line else "?"
+            self._add_event('rn', f"{line}: ⊗RC lock")
+    
+    def _build_scheduler(self) -> SimScheduler:
+        """
+        Register periodic tasks on simulation-time ticks.
+        
+        Priority within a tick: WS → RC → RN → recorder → metrics → display
+        (scenario must be known before RC/RN decide, metrics/display see final state).
+        """
+        algorithms = self.config.services.algo.algorithms
+        scheduler_config = self.config.services.algo.scheduler
+        scheduler = SimScheduler(max_catch_up_ticks=scheduler_config.max_catch_up_ticks)
+        
+        display_period_sim = self.config.services.algo.display.refresh_rate_s * self.config.simulation.acceleration
+        tasks = [
+            ("ws", algorithms.ws.temp_monitoring_cycle_s, self._run_ws),
+            ("rc", algorithms.rc.algorithm_loop_cycle_s, self._run_rc),
+            ("rn", algorithms.rn.algorithm_loop_cycle_s, self._run_rn),
+            ("recorder", algorithms.ws.temp_monitoring_cycle_s, self._run_recorder),
+            ("metrics", algorithms.ws.temp_monitoring_cycle_s, self._run_metrics),
+            ("display", display_period_sim, self._run_display),
+        ]
+        if self.recorder is None:
+            tasks = [task for task in tasks if task[0] != "recorder"]
+        if self.telemetry.metric_store is not None:
+            # Sample in-memory metric series right after counters are flushed
+            tasks.append(("metric_store", self.config.services.algo.metrics_flush_interval_s, self._run_metric_store))
+        if self.config.services.algo.checkpoint.enabled:
+            tasks.append(("checkpoint", self.config.services.algo.checkpoint.interval_s, self._run_checkpoint))
+        for priority, (name, period_s, callback) in enumerate(tasks):
+            task_config = scheduler_config.task(name)
+            scheduler.register(
+                name,
+                period_s,
+                self.profiler.wrap(name, self._at_tick(callback)),
+                phase_s=task_config.phase_s,
+                priority=priority,
+                policy=task_config.policy,
+            )
+        return scheduler
+    
+    def _at_tick(self, callback: Callable[[float], None]) -> Callable[[float], None]:
+        """Run task with simulation time set to its tick (catch-up ticks see their own time)."""
+        def run(tick_time: float) -> None:
+            self.state.update_simulation_time(tick_time)
+            callback(tick_time)
+        return run
+    
+    def _run_ws(self, tick_time: float) -> None:
+        """Scheduled task: Algorithm WS (scenario selection) on latest reading."""
+        # Scenario changes are published on the event bus (metrics + display subscribe)
+        self.algorithm_ws.process_temperature(self._latest_snapshot.temperature_c)
+    
+    def _run_rc(self, tick_time: float) -> None:
+        """Scheduled task: Algorithm RC (configuration rotation)."""
+        config_changed, _ = self.algorithm_rc.process()
+        if config_changed:
+            # CRITICAL: Immediately run RN to synchronize heater states after RC change
+            # Without this, display shows old heaters until next RN cycle (~60s)
+            LOGGER.debug("RC config changed - triggering immediate RN sync")
+            self.algorithm_rn.process()  # Sync heaters immediately
+    
+    def _run_rn(self, tick_time: float) -> None:
+        """Scheduled task: Algorithm RN (heater rotation)."""
+        # Rotations and coordination blocks are published on the event bus
+        self.algorithm_rn.process()
+    
+    def _run_recorder(self, tick_time: float) -> None:
+        """Scheduled task: append controller state to the trajectory recording."""
+        self.recorder.record_tick(
+            tick_time,
+            self._latest_snapshot.temperature_c,
+            self.state,
+            self.algorithm_ws,
+            self.algorithm_rn,
+        )
+    
+    def _run_metrics(self, tick_time: float) -> None:
+        """Scheduled task: update metric counters."""
+        self.metrics.update()
+    
+    def _run_metric_store(self, tick_time: float) -> None:
+        """Scheduled task: sample all instruments into the in-memory metric store."""
+        self.metrics.flush()
+        self.telemetry.metric_store.sample(tick_time)
+    
+    def _run_display(self, tick_time: float) -> None:
+        """Scheduled task: refresh status display."""
+        self.display.render(temperature_c=self._latest_snapshot.temperature_c)
+    
+    def _run_checkpoint(self, tick_time: float) -> None:
+        """Scheduled task: persist controller state."""
+        self.save_checkpoint()
+    
+    def save_checkpoint(self, path: Path | None = None) -> Path:
+        """
+        Write controller state (AlgoState + WS/RC/RN trackers) atomically.
+        
+        Args:
+            path: Target file (default: checkpoint.path from config)
+            
+        Returns:
+            Path of the written checkpoint
+        """
+        path = Path(path or self.config.services.algo.checkpoint.path)
+        data = capture_checkpoint(self.state, self.algorithm_ws, self.algorithm_rc, self.algorithm_rn)
+        size = write_checkpoint(path, data)
+        LOGGER.info(f"Checkpoint written: {path} ({size} bytes, sim_time={self.state.simulation_time:.0f}s)")
+        return path
+    
+    def restore_checkpoint(self, path: Path) -> None:
+        """
+        Resume from a checkpoint written by save_checkpoint().
+        
+        Scheduler ticks up to the restored simulation time are skipped. The weather
+        service must provide simulation time >= the checkpoint (weather_service --start-time).
+        """
+        data = read_checkpoint(path)
+        restore_checkpoint(data, self.state, self.algorithm_ws, self.algorithm_rc, self.algorithm_rn)
+        self.scheduler.resume_at(self.state.simulation_time)
+        self._resumed_at = self.state.simulation_time
+        LOGGER.info(
+            f"Restored checkpoint {path}: sim_time={self.state.simulation_time:.0f}s, "
+            f"scenario={self.state.current_scenario.name}, config={self.state.current_config}"
+        )
+    
+    def process_snapshot(self, snapshot: WeatherSnapshot) -> int:
+        """
+        Advance algorithms to the snapshot's simulation time.
+        
+        Args:
+            snapshot: Weather reading with authoritative simulation_time
+            
+        Returns:
+            Number of scheduled task runs
+        """
+        if self._resumed_at is not None:
+            if snapshot.simulation_time < self._resumed_at:
+                LOGGER.warning(
+                    f"Weather simulation_time {snapshot.simulation_time:.0f}s is behind restored "
+                    f"checkpoint ({self._resumed_at:.0f}s) - waiting for it to catch up"
+                )
+                return 0
+            self._resumed_at = None
+        
+        self._latest_snapshot = snapshot
+        runs = self.scheduler.run_due(snapshot.simulation_time)
+        # Update simulation time from weather service (CRITICAL!)
+        self.state.update_simulation_time(snapshot.simulation_time)
+        return runs
+    
+    def pacing_stats(self) -> dict[str, float]:
+        """Lag and catch-up counters of the real-time loop."""
+        return {
+            "iterations": self.pacer.iterations,
+            "missed_deadlines": self.pacer.missed_deadlines,
+            "current_lag_s": self.pacer.current_lag_s,
+            "max_lag_s": self.pacer.max_lag_s,
+            "resyncs": self.pacer.resyncs,
+            "catch_up_ticks": sum(task.catch_up_runs for task in self.scheduler.tasks),
+            "coalesced_ticks": sum(task.coalesced_ticks for task in self.scheduler.tasks),
+            "dropped_ticks": sum(task.dropped_ticks for task in self.scheduler.tasks),
+            "achieved_acceleration": self.lag_tracker.achieved_acceleration or 0.0,
+            "max_gap_s": self.lag_tracker.max_gap_s,
+            "skipped_steps": self.lag_tracker.skipped_steps_total,
+        }
+    
     def _main_loop(self) -> None:
         """
         Main simulation loop.
@@ -250,120 +565,36 @@ class AlgoService:
         LOGGER.info(f"Will run until simulation_time >= {duration_sim}s ({self.config.simulation.duration_days} days)")
         
         loop_count = 0
-        rc_check_count = 0
-        rn_check_count = 0
-        rc_check_interval = self.config.services.algo.algorithms.rc.algorithm_loop_cycle_s
-        rn_check_interval = self.config.services.algo.algorithms.rn.algorithm_loop_cycle_s
-        
-        # Display refresh tracking (in real time)
-        display_refresh_interval_real = self.config.services.algo.display.refresh_rate_s
-        last_display_refresh_real = 0.0
+        self.pacer.start()
         
         while self._running and not self._stop_requested:
-            loop_start_real = time.time()
-            
             # STEP 1: Poll weather service (gets temperature + authoritative simulation_time)
-            snapshot = self.weather_client.poll()
+            snapshot = self._poll()
             
             if snapshot is None:
                 LOGGER.warning("Failed to poll weather service - retrying...")
-                time.sleep(poll_interval_real)
+                self.pacer.wait()
                 continue
             
-            # STEP 2: Update simulation time from weather service (CRITICAL!)
-            self.state.update_simulation_time(snapshot.simulation_time)
+            # STEP 2: Track lag against the weather clock (before processing moves algo forward)
+            self.metrics.record_lag_sample(self.lag_tracker.observe(snapshot.simulation_time))
+            for warning in self.lag_tracker.check_thresholds():
+                LOGGER.warning(warning)
+            
+            # STEP 3: Run due tasks (WS, RC, RN, metrics, display) up to the snapshot's simulation time
+            # After an overrun, catch_up tasks replay the missed ticks using this latest reading
+            self.process_snapshot(snapshot)
+            self.run_handle.report(self.state.simulation_time)
             
             # Log progress periodically
             if loop_count % 10 == 0:
                 LOGGER.info(
-                    f"Loop {loop_count}: sim_time={snapshot.simulation_time:.1f}s "
-                    f"({snapshot.simulation_day:.2f} days), "
-                    f"T_zewn={snapshot.temperature_c:.1f}°C, "
-                    f"scenario={self.state.current_scenario.name}"
+                    "Loop %d: sim_time=%.1fs (%.2f days), T_zewn=%.1f°C, scenario=%s",
+                    loop_count, snapshot.simulation_time, snapshot.simulation_day,
+                    snapshot.temperature_c, self.state.current_scenario.name,
                 )
             
-            # STEP 3: Run Algorithm WS (scenario selection)
-            old_scenario = self.state.current_scenario
-            scenario_changed, message = self.algorithm_ws.process_temperature(snapshot.temperature_c)
-            
-            if scenario_changed:
-                # Record metric
-                self.metrics.record_scenario_change(old_scenario, self.state.current_scenario)
-                # Add event for display
-                self._add_event('ws', f"{old_scenario.name}→{self.state.current_scenario.name}")
-            elif loop_count % 60 == 0:  # Every 10 minutes (60 * 10s cycles)
-                # Log current state periodically
-                LOGGER.debug(
-                    f"Status: scenario={self.state.current_scenario.name}, "
-                    f"config={self.state.current_config}, "
-                    f"temp={snapshot.temperature_c:.1f}°C, "
-                    f"sim_day={snapshot.simulation_day:.1f}"
-                )
-            
-            # STEP 4: Run Algorithm RC (configuration rotation)
-            # RC runs less frequently than WS (e.g., every 60s vs 10s)
-            rc_check_count += 1
-            if rc_check_count * poll_interval_sim >= rc_check_interval:
-                rc_check_count = 0
-                old_config = self.state.current_config
-                config_changed, rc_message = self.algorithm_rc.process()
-                
-                if config_changed:
-                    # Record metric
-                    self.metrics.record_config_change(old_config, self.state.current_config)
-                    # Add event for display
-                    old_config_short = "C1" if old_config == "Primary" else "C2"
-                    new_config_short = "C1" if self.state.current_config == "Primary" else "C2"
-                    self._add_event('rc', f"{old_config_short}→{new_config_short}")
-                    
-                    # CRITICAL: Immediately run RN to synchronize heater states after RC change
-                    # Without this, display shows old heaters until next RN cycle (~60s)
-                    LOGGER.debug("RC config changed - triggering immediate RN sync")
-                    self.algorithm_rn.process()  # Sync heaters immediately
-            
-            # STEP 5: Run Algorithm RN (heater rotation)
-            # RN runs at same frequency as RC (e.g., every 60s)
-            rn_check_count += 1
-            if rn_check_count * poll_interval_sim >= rn_check_interval:
-                rn_check_count = 0
-                rotation_occurred, rn_message = self.algorithm_rn.process()
-                
-                if rotation_occurred:
-                    # Record metric
-                    # Parse line and heaters from message (format: "Heater rotated in LINE1: N1 → N2")
-                    if "C1" in rn_message:
-                        line = "C1"
-                    elif "C2" in rn_message:
-                        line = "C2"
-                    else:
-                        line = "UNKNOWN"
-                    
-                    # Extract heaters from message
-                    if ":" in rn_message and "→" in rn_message:
-                        parts = rn_message.split(":")[-1].split("→")
-                        if len(parts) == 2:
-                            heater_off = parts[0].strip()
-                            heater_on = parts[1].strip()
-                            self.metrics.record_heater_rotation(line, heater_off, heater_on)
-                            # Add event for display
-                            self._add_event('rn', f"{line}: {heater_off}→{heater_on}")
-                elif "blocked" in rn_message.lower() or "cannot" in rn_message.lower():
-                    # RN blocked - add as event
-                    if "config change" in rn_message.lower():
-                        self._add_event("RN: ⊗RC lock")
-                    elif "too soon" in rn_message.lower():
-                        self._add_event("RN: ⊗wait")
-            
-            # STEP 6: Update metrics
-            self.metrics.update()
-            
-            # STEP 6.5: Refresh status display (throttled by refresh_rate_s in real time)
-            current_real_time = time.time()
-            if current_real_time - last_display_refresh_real >= display_refresh_interval_real:
-                self.display.render(temperature_c=snapshot.temperature_c)
-                last_display_refresh_real = current_real_time
-            
-            # STEP 7: Check if simulation complete
+            # STEP 4: Check if simulation complete
             if self.state.simulation_time >= duration_sim:
                 LOGGER.info(
                     f"Simulation complete: reached {duration_sim}s "
@@ -371,22 +602,121 @@ class AlgoService:
                 )
                 break
             
-            # STEP 8: Sleep in real time
-            loop_duration_real = time.time() - loop_start_real
-            sleep_time = max(0, poll_interval_real - loop_duration_real)
-            
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            else:
+            # STEP 5: Sleep until the next absolute deadline (no sleep while catching up)
+            was_behind = self.pacer.behind
+            lag_real = self.pacer.wait()
+            if lag_real > 0 and not was_behind:
                 LOGGER.warning(
-                    f"Loop took longer than poll interval: {loop_duration_real:.3f}s "
-                    f"> {poll_interval_real:.3f}s"
+                    f"Loop fell behind schedule by {lag_real:.3f}s real "
+                    f"(> {poll_interval_real:.3f}s poll interval) - catching up"
                 )
             
             loop_count += 1
         
         LOGGER.info(f"Main loop completed after {loop_count} iterations")
     
+    def run_fast_forward(self, weather_source: Callable[[float], WeatherSnapshot]) -> None:
+        """
+        Run the whole simulation without HTTP polling or real-time pacing.
+        
+        Every WS cycle of simulation time is fed straight from weather_source,
+        so the run takes only as long as the algorithms need to compute.
+        
+        Args:
+            weather_source: Maps simulation time [s] to a weather snapshot
+                (e.g. WeatherSimulator.snapshot_at)
+        """
+        step_s = self.config.services.algo.algorithms.ws.temp_monitoring_cycle_s
+        duration_sim = self.config.simulation.duration_seconds
+        sim_time = self.state.simulation_time  # Non-zero after restore_checkpoint()
+        next_progress = sim_time + duration_sim / 10
+        
+        detector = self._build_steady_state_detector()
+        
+        LOGGER.info(
+            f"Starting fast-forward: {duration_sim - sim_time:.0f}s sim in {step_s}s steps"
+        )
+        self._running = True
+        self.run_handle.mark_ready()
+        error: BaseException | None = None
+        try:
+            while self._running and not self._stop_requested:
+                self.process_snapshot(weather_source(sim_time))
+                self.run_handle.report(self.state.simulation_time)
+                if sim_time >= duration_sim:
+                    break
+                if detector is not None and detector.due(sim_time):
+                    checkpoint = capture_checkpoint(self.state, self.algorithm_ws, self.algorithm_rc, self.algorithm_rn)
+                    checkpoint["metrics"] = self.metrics.to_snapshot()
+                    cycle = detector.observe(checkpoint, self._task_phases(sim_time))
+                    if cycle is not None:
+                        sim_time = self._skip_steady_cycles(cycle, duration_sim)
+                        detector = None
+                if sim_time >= next_progress:
+                    LOGGER.info(
+                        f"Fast-forward: {sim_time / duration_sim:.0%} "
+                        f"(scenario={self.state.current_scenario.name})"
+                    )
+                    next_progress += duration_sim / 10
+                sim_time = min(sim_time + step_s, duration_sim)
+            LOGGER.info(f"Fast-forward complete: reached {self.state.simulation_time:.0f}s")
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            try:
+                self.shutdown()
+            finally:
+                self._finish_run(error)
+    
+    def _build_steady_state_detector(self) -> SteadyStateDetector | None:
+        """
+        Cycle detector for fast-forward runs of constant profiles (None when not applicable).
+        
+        Only a constant temperature makes the controller periodic. Runs that record
+        every tick (recorder, journal) are simulated in full.
+        """
+        steady_config = self.config.services.algo.steady_state
+        if not steady_config.enabled or self.config.services.weather.profile_type != "constant":
+            return None
+        if self.recorder is not None or self.journal is not None:
+            LOGGER.info("Steady state: recorder/journal enabled - extrapolation disabled")
+            return None
+        horizon_s = steady_state_horizon(self.algorithm_ws.config, self.algorithm_rc.config, self.algorithm_rn.config)
+        detector = SteadyStateDetector(horizon_s, max_probes=steady_config.max_probes)
+        detector.attach(self.event_bus)
+        return detector
+    
+    def _task_phases(self, sim_time: float) -> dict[str, float]:
+        """Time from sim_time to the next tick of each task that shapes controller state."""
+        return {
+            task.name: task.tick_time(task.next_tick) - sim_time
+            for task in self.scheduler.tasks
+            if task.name in STEADY_TASKS
+        }
+    
+    def _skip_steady_cycles(self, cycle: SteadyCycle, duration_sim: float) -> float:
+        """
+        Add every whole steady-state period that fits before duration_sim.
+        
+        Returns:
+            Simulation time to continue from (the remainder is simulated normally)
+        """
+        now = self.state.simulation_time
+        cycles = int((duration_sim - now) // cycle.period_s)
+        if cycles < 1:
+            return now
+        data = cycle.advance(cycles)
+        restore_checkpoint(data, self.state, self.algorithm_ws, self.algorithm_rc, self.algorithm_rn)
+        self.metrics.skip_ahead(cycles * cycle.period_s, data["metrics"], cycle.event_counts(cycles))
+        self.scheduler.resume_at(self.state.simulation_time)
+        LOGGER.info(
+            f"Steady state: {cycle.period_s:.0f}s cycle from {cycle.start_time:.0f}s repeats at {now:.0f}s "
+            f"- extrapolated {cycles} cycles to {self.state.simulation_time:.0f}s "
+            f"({sum(cycle.events.values()) * cycles} decisions)"
+        )
+        return self.state.simulation_time
+    
     def shutdown(self) -> None:
         """Graceful shutdown."""
         LOGGER.info("Shutting down algo service...")
@@ -441,9 +771,67 @@ class AlgoService:
                 f"{idle_time_h:.1f}h idle, state={state.value}"
             )
         
+        # Pacing statistics (how well this host sustains the configured acceleration)
+        overall_acceleration = self.lag_tracker.overall_acceleration
+        if overall_acceleration is not None:
+            LOGGER.info(
+                f"  Achieved acceleration: {overall_acceleration:.0f}x "
+                f"({overall_acceleration / self.lag_tracker.configured_acceleration:.0%} of configured), "
+                f"max gap {self.lag_tracker.max_gap_s:.0f}s sim, "
+                f"{self.lag_tracker.skipped_steps_total} skipped steps"
+            )
+        stats = self.pacing_stats()
+        LOGGER.info(
+            f"  Pacing: {stats['missed_deadlines']}/{stats['iterations']} deadlines missed, "
+            f"max lag {stats['max_lag_s']:.3f}s real, {stats['resyncs']} resyncs, "
+            f"{stats['catch_up_ticks']} catch-up ticks"
+        )
+        
+        # Scheduler statistics (missed ticks on slow/failed polls)
+        for task in self.scheduler.tasks:
+            LOGGER.info(
+                f"  Task {task.name}: {task.runs} runs, {task.coalesced_ticks} coalesced, "
+                f"{task.catch_up_runs} caught up, {task.dropped_ticks} dropped ticks"
+            )
+        
+        # Write trajectory recording
+        if self.recorder is not None:
+            recorder_config = self.config.services.algo.recorder
+            try:
+                self.recorder.save(recorder_config.path, recorder_config.format)
+            except OSError as exc:
+                LOGGER.error(f"Saving trajectory recording failed: {exc}")
+        
+        # Final checkpoint so the run can be resumed from where it stopped
+        if self.config.services.algo.checkpoint.enabled:
+            try:
+                self.save_checkpoint()
+            except OSError as exc:
+                LOGGER.error(f"Final checkpoint failed: {exc}")
+        
+        # Drain asynchronous event consumers before telemetry goes away
+        self.event_bus.close()
+        if self.event_bus.dropped_events:
+            LOGGER.warning(f"  Event bus: {self.event_bus.dropped_events} events dropped by async consumers (queue full)")
+        if self.journal is not None:
+            self.journal.close()
+            LOGGER.info(f"  Journal: {self.journal.records_written} records in {self.journal.directory}")
+        
+        # Flush locally accumulated counter deltas
+        self.metrics.shutdown()
+        if self.telemetry.metric_store is not None:
+            self.telemetry.metric_store.sample(self.state.simulation_time)
+        
+        # Per-stage timing summary
+        if self.profiler.enabled:
+            LOGGER.info("  Stage timings (real time):")
+            for line in self.profiler.summary():
+                LOGGER.info(f"    {line}")
+        
         # Shutdown telemetry
         self.telemetry.shutdown()
         LOGGER.info("Algo service shutdown complete")
+        stop_queued_logging(self._log_listener)
 
 
 def main() -> None:
@@ -464,79 +852,32 @@ def main() -> None:
         default=None,
         help="Override simulation duration_days from config (useful for testing)",
     )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        help="Restore controller state from checkpoint file before starting",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="Simulate in-process as fast as possible (no weather service, no pacing, metrics kept in memory)",
+    )
     
     args = parser.parse_args()
     
-    # Load and optionally override config
-    if args.days is not None:
-        # Create modified config
-        import tempfile
-        import yaml
-        
-        config = load_config(args.config)
-        config.simulation.duration_days = args.days
-        
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            config_dict = {
-                "simulation": {
-                    "acceleration": config.simulation.acceleration,
-                    "duration_days": config.simulation.duration_days,
-                },
-                "telemetry": {
-                    "exporter_type": config.telemetry.exporter_type,
-                    "endpoints": dict(config.telemetry.endpoints),
-                    "headers": dict(config.telemetry.headers),
-                    "resource_attributes": dict(config.telemetry.resource_attributes),
-                    "default_dimensions": dict(config.telemetry.default_dimensions),
-                    "log_level": config.telemetry.log_level,
-                },
-                "services": {
-                    "algo": {
-                        "service_name": config.services.algo.service_name,
-                        "metrics_prefix": config.services.algo.metrics_prefix,
-                        "weather_endpoint": config.services.algo.weather_endpoint,
-                        "otlp_timeout_ms": config.services.algo.otlp_timeout_ms,
-                        "algorithms": {
-                            "ws": {
-                                "temp_monitoring_cycle_s": config.services.algo.algorithms.ws.temp_monitoring_cycle_s,
-                                "scenario_stabilization_time_s": config.services.algo.algorithms.ws.scenario_stabilization_time_s,
-                                "hysteresis_delta_c": config.services.algo.algorithms.ws.hysteresis_delta_c,
-                            },
-                            "rc": {
-                                "rotation_period_hours": config.services.algo.algorithms.rc.rotation_period_hours,
-                                "algorithm_loop_cycle_s": config.services.algo.algorithms.rc.algorithm_loop_cycle_s,
-                                "min_operating_time_s": config.services.algo.algorithms.rc.min_operating_time_s,
-                            },
-                            "rn": {
-                                "rotation_period_s1_s": config.services.algo.algorithms.rn.rotation_period_s1_s,
-                                "rotation_period_s2_s": config.services.algo.algorithms.rn.rotation_period_s2_s,
-                                "rotation_period_s3_s": config.services.algo.algorithms.rn.rotation_period_s3_s,
-                                "rotation_period_s4_s": config.services.algo.algorithms.rn.rotation_period_s4_s,
-                                "rotation_period_s5_s": config.services.algo.algorithms.rn.rotation_period_s5_s,
-                                "rotation_period_s6_s": config.services.algo.algorithms.rn.rotation_period_s6_s,
-                                "rotation_period_s7_s": config.services.algo.algorithms.rn.rotation_period_s7_s,
-                                "rotation_period_s8_s": config.services.algo.algorithms.rn.rotation_period_s8_s,
-                                "min_delta_time_s": config.services.algo.algorithms.rn.min_delta_time_s,
-                                "algorithm_loop_cycle_s": config.services.algo.algorithms.rn.algorithm_loop_cycle_s,
-                            },
-                        },
-                    },
-                    "weather": {},
-                },
-            }
-            yaml.dump(config_dict, f)
-            temp_config_path = Path(f.name)
-        
-        try:
-            service = AlgoService(temp_config_path)
-            service.start()
-        finally:
-            # Clean up temp file
-            temp_config_path.unlink()
+    overrides = {"simulation.duration_days": args.days} if args.days is not None else None
+    _run_service(AlgoService(load_config(args.config, overrides), fast_forward=args.fast_forward), args)
+
+
+def _run_service(service: AlgoService, args: argparse.Namespace) -> None:
+    """Restore optional checkpoint, then run against the weather service or fast-forward."""
+    if args.resume is not None:
+        service.restore_checkpoint(args.resume)
+    if args.fast_forward:
+        from weather_service import build_weather_source
+        service.run_fast_forward(build_weather_source(service.config))
     else:
-        # Use config as-is
-        service = AlgoService(args.config)
         service.start()
 
 
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Per-tick cost of the control algorithms, with a stored baseline to compare against.
+
+Each fixture (one per scenario S0-S8 as a constant temperature, plus the
+stepped, smooth_step and winter profile types) drives AlgoService.process_snapshot
+over precomputed weather in a fresh interpreter. The scheduled calls of
+    - ws:      AlgorithmWS.process_temperature
+    - rc:      AlgorithmRC.process
+    - rn:      AlgorithmRN.process
+    - metrics: AlgoMetrics.update
+    - display: StatusDisplay.render (into a string buffer)
+are timed individually; "tick" is one call at the component's own cycle.
+A second pass reports allocations per call: memory blocks still allocated
+when the call returns (sys.getallocatedblocks() delta - growth of the live
+heap including the returned value, so 1 for a call that returns a fresh
+tuple and keeps nothing) and, under tracemalloc, the bytes it allocates on
+top of the live heap at its peak (transient allocations).
+
+Usage (from src/simulation):
+    python benchmarks/bench_algorithms.py
+    python benchmarks/bench_algorithms.py --save-baseline
+    python benchmarks/bench_algorithms.py --compare --tolerance 0.2
+    python benchmarks/bench_algorithms.py --fixtures S3 S6 winter --days 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from support import CHILD_REPORT, SIMULATION_DIR, run_child, write_config
+
+COMPONENTS = ("ws", "rc", "rn", "metrics", "display")
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "bench_algorithms.json"
+
+# Constant temperature inside each scenario band of AlgorithmWS
+SCENARIO_TEMPERATURES = {
+    "S0": 5.0,
+    "S1": 0.0,
+    "S2": -3.0,
+    "S3": -5.0,
+    "S4": -9.0,
+    "S5": -13.0,
+    "S6": -16.0,
+    "S7": -19.5,
+    "S8": -23.0,
+}
+
+# Profile types - scenario changes every day, RC/RN decisions on changing line sets
+_UNSTABLE_STEPS = [
+    {"day_start": 0, "day_end": 1, "temperature_c": 0.0},
+    {"day_start": 1, "day_end": 2, "temperature_c": -8.0},
+    {"day_start": 2, "day_end": 3, "temperature_c": -16.0},
+    {"day_start": 3, "day_end": 4, "temperature_c": -5.0},
+]
+FIXTURES: dict[str, dict[str, Any]] = {
+    **{
+        name: {"profile_type": "constant", "constant_profile": {"temperature_c": temperature}}
+        for name, temperature in SCENARIO_TEMPERATURES.items()
+    },
+    "stepped": {"profile_type": "stepped", "stepped_profile": {"steps": _UNSTABLE_STEPS}},
+    "smooth_step": {"profile_type": "smooth_step", "stepped_profile": {"steps": _UNSTABLE_STEPS}},
+    "winter": {"profile_type": "winter"},
+}
+
+# Child program - one fixture, one pass ("time" or "alloc"); config path in argv[1]
+_CHILD = """
+import json, os, sys, time
+sys.path.insert(0, "benchmarks")
+from bench_algorithms import measure_fixture
+result = measure_fixture(sys.argv[1], sys.argv[2])
+""" + CHILD_REPORT
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Child side
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _Probe:
+    """Replaces a component method on its instance and accumulates per-call cost."""
+
+    active = False  # Calls nested in another probe are charged to the outer one
+
+    def __init__(self, func, trace_memory: bool):
+        self.func = func
+        self.trace_memory = trace_memory
+        self.calls = 0
+        self.ns = 0
+        self.alloc_bytes = 0
+        self.alloc_blocks = 0
+
+    def __call__(self, *args, **kwargs):
+        if _Probe.active:
+            return self.func(*args, **kwargs)
+        _Probe.active = True
+        try:
+            if self.trace_memory:
+                import tracemalloc
+
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                blocks_before = sys.getallocatedblocks()
+                result = self.func(*args, **kwargs)
+                self.alloc_blocks += sys.getallocatedblocks() - blocks_before
+                _, peak = tracemalloc.get_traced_memory()
+                self.alloc_bytes += peak - before
+            else:
+                start = time.perf_counter_ns()
+                result = self.func(*args, **kwargs)
+                self.ns += time.perf_counter_ns() - start
+            self.calls += 1
+            return result
+        finally:
+            _Probe.active = False
+
+
+def _timer_overhead_ns(samples: int = 20000) -> float:
+    """Cost of a probe around a no-op call (subtracted from the timed calls)."""
+    probe = _Probe(lambda: None, trace_memory=False)
+    for _ in range(samples):
+        probe()
+    return probe.ns / samples
+
+
+def _block_overhead(samples: int = 20000) -> float:
+    """Blocks a memory probe itself leaves per no-op call (the block counts are ints too)."""
+    probe = _Probe(lambda: None, trace_memory=True)
+    for _ in range(samples):
+        probe()
+    return probe.alloc_blocks / samples
+
+
+def measure_fixture(config_path: str, mode: str) -> dict[str, Any]:
+    """
+    Drive one fixture config through the algo service and measure the components.
+
+    Args:
+        config_path: Patched config.yaml of the fixture
+        mode: "time" (ns per call) or "alloc" (blocks and tracemalloc bytes per call)
+
+    Returns:
+        Per component: calls plus ns_per_tick or alloc_blocks_per_tick and alloc_bytes_per_tick
+    """
+    import io
+
+    from algo_service import AlgoService, load_config
+    from weather_service import build_weather_source
+
+    service = AlgoService(load_config(config_path), display_output_stream=io.StringIO())
+    source = build_weather_source(service.config)
+    step_s = service.config.services.algo.algorithms.ws.temp_monitoring_cycle_s
+    duration_s = int(service.config.simulation.duration_seconds)
+    snapshots = [source(float(t)) for t in range(0, duration_s + 1, step_s)]
+
+    trace_memory = mode == "alloc"
+    targets = {
+        "ws": (service.algorithm_ws, "process_temperature"),
+        "rc": (service.algorithm_rc, "process"),
+        "rn": (service.algorithm_rn, "process"),
+        "metrics": (service.metrics, "update"),
+        "display": (service.display, "render"),
+    }
+    probes = {}
+    for name, (instance, method) in targets.items():
+        probes[name] = _Probe(getattr(instance, method), trace_memory)
+        setattr(instance, method, probes[name])
+
+    if trace_memory:
+        import tracemalloc
+
+        tracemalloc.start()
+    loop_start = time.perf_counter_ns()
+    for snapshot in snapshots:
+        service.process_snapshot(snapshot)
+    loop_ns = time.perf_counter_ns() - loop_start
+
+    overhead_ns = 0.0 if trace_memory else _timer_overhead_ns()
+    overhead_blocks = _block_overhead() if trace_memory else 0.0
+    result: dict[str, Any] = {"ticks": len(snapshots), "loop_ns_per_tick": loop_ns / len(snapshots)}
+    for name, probe in probes.items():
+        calls = max(probe.calls, 1)
+        entry: dict[str, Any] = {"calls": probe.calls}
+        if trace_memory:
+            entry["alloc_blocks_per_tick"] = probe.alloc_blocks / calls - overhead_blocks
+            entry["alloc_bytes_per_tick"] = probe.alloc_bytes / calls
+        else:
+            entry["ns_per_tick"] = max(probe.ns / calls - overhead_ns, 0.0)
+        result[name] = entry
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Parent side
+# ═══════════════════════════════════════════════════════════════════════════
+
+def run_fixture(base_config: Path, name: str, days: int, repeat: int, tmp: Path) -> dict[str, dict[str, float]]:
+    """Median timing of `repeat` fresh processes plus one tracemalloc pass."""
+    weather = FIXTURES[name]
+    overrides = {f"services.weather.{key}": value for key, value in weather.items()}
+    config_path = write_config(
+        base_config,
+        {
+            **overrides,
+            "simulation.duration_days": days,
+            "telemetry.exporter_type": "memory",
+            "telemetry.log_output": "file",
+            "telemetry.log_file": str(tmp / f"{name}.log"),
+            "services.algo.display.enabled": True,  # Rendered into a string buffer
+            "services.algo.checkpoint.enabled": False,
+        },
+        tmp / f"config_{name}.yaml",
+    )
+    timed = [run_child(_CHILD, str(config_path), "time") for _ in range(repeat)]
+    alloc = run_child(_CHILD, str(config_path), "alloc")
+
+    results = {}
+    for component in COMPONENTS:
+        results[component] = {
+            "calls": alloc[component]["calls"],
+            "ns_per_tick": statistics.median(run[component]["ns_per_tick"] for run in timed),
+            "alloc_blocks_per_tick": alloc[component]["alloc_blocks_per_tick"],
+            "alloc_bytes_per_tick": alloc[component]["alloc_bytes_per_tick"],
+        }
+    results["loop"] = {
+        "calls": timed[0]["ticks"],
+        "ns_per_tick": statistics.median(run["loop_ns_per_tick"] for run in timed),
+    }
+    return results
+
+
+def compare(
+    current: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    tolerance: float,
+    min_alloc_delta_bytes: float = 64.0,
+    min_alloc_delta_blocks: float = 1.0,
+) -> list[str]:
+    """
+    Regressions of current against baseline results.
+
+    A component regresses when its ns/tick exceeds the baseline by more than
+    tolerance (fraction), or its allocated bytes/tick or blocks/tick do so and
+    by at least min_alloc_delta_bytes / min_alloc_delta_blocks (small absolute
+    changes are noise from interning/caches).
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for fixture, components in current.items():
+        for component, values in components.items():
+            reference = baseline.get(fixture, {}).get(component)
+            if reference is None:
+                continue
+            ns, ns_ref = values["ns_per_tick"], reference["ns_per_tick"]
+            if ns_ref > 0 and ns > ns_ref * (1.0 + tolerance):
+                regressions.append(
+                    f"{fixture}/{component}: {ns:.0f} ns/tick vs {ns_ref:.0f} baseline (+{(ns / ns_ref - 1) * 100:.0f}%)"
+                )
+            if "alloc_bytes_per_tick" in values and "alloc_bytes_per_tick" in reference:
+                alloc, alloc_ref = values["alloc_bytes_per_tick"], reference["alloc_bytes_per_tick"]
+                if alloc > alloc_ref * (1.0 + tolerance) and alloc - alloc_ref >= min_alloc_delta_bytes:
+                    regressions.append(
+                        f"{fixture}/{component}: {alloc:.0f} B/tick allocated vs {alloc_ref:.0f} baseline"
+                    )
+            if "alloc_blocks_per_tick" in values and "alloc_blocks_per_tick" in reference:
+                blocks, blocks_ref = values["alloc_blocks_per_tick"], reference["alloc_blocks_per_tick"]
+                if blocks > max(blocks_ref, 0.0) * (1.0 + tolerance) and blocks - blocks_ref >= min_alloc_delta_blocks:
+                    regressions.append(
+                        f"{fixture}/{component}: {blocks:.2f} blocks/tick kept vs {blocks_ref:.2f} baseline"
+                    )
+    return regressions
+
+
+def _print_results(results: dict[str, dict[str, dict[str, float]]], baseline: dict | None) -> None:
+    print(
+        f"{'fixture':<13}{'component':<10}{'calls':>7}{'ns/tick':>10}{'ticks/s':>11}"
+        f"{'blocks':>9}{'alloc B':>9}{'vs baseline':>13}"
+    )
+    for fixture, components in results.items():
+        for component, values in components.items():
+            ns = values["ns_per_tick"]
+            ticks_per_s = 1e9 / ns if ns > 0 else float("inf")
+            alloc = values.get("alloc_bytes_per_tick")
+            blocks = values.get("alloc_blocks_per_tick")
+            delta = ""
+            reference = (baseline or {}).get(fixture, {}).get(component)
+            if reference and reference["ns_per_tick"] > 0:
+                delta = f"{(ns / reference['ns_per_tick'] - 1) * 100:+.0f}%"
+            print(
+                f"{fixture:<13}{component:<10}{values['calls']:>7}{ns:>10.0f}{ticks_per_s:>11.0f}"
+                f"{'' if blocks is None else f'{blocks:.2f}':>9}"
+                f"{'' if alloc is None else f'{alloc:.0f}':>9}"
+                f"{delta:>13}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-tick cost of WS/RC/RN/metrics/display per scenario")
+    parser.add_argument("--config", type=Path, default=SIMULATION_DIR / "config.yaml", help="Base config")
+    parser.add_argument("--days", type=int, default=4, help="Simulated days per fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per fixture (median)")
+    parser.add_argument("--fixtures", nargs="+", choices=list(FIXTURES), default=list(FIXTURES), help="Fixtures to run")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit with 1 when a component regressed")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown / allocation growth as a fraction of the baseline (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    baseline_data = None
+    comparable = False
+    if args.compare or args.baseline.exists():
+        if not args.baseline.exists():
+            parser.error(f"Baseline not found: {args.baseline} (create it with --save-baseline)")
+        baseline_data = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparable = baseline_data["days"] == args.days and baseline_data["python"] == platform.python_version()
+        if not comparable:
+            print(
+                f"Note: baseline was taken with --days {baseline_data['days']} on python "
+                f"{baseline_data['python']} - figures are not strictly comparable"
+            )
+
+    print(
+        f"Algorithm benchmark - {args.days} days per fixture, median of {args.repeat} runs "
+        f"(python {platform.python_version()})"
+    )
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_algorithms_") as tmp:
+        for name in args.fixtures:
+            results[name] = run_fixture(args.config, name, args.days, args.repeat, Path(tmp))
+    _print_results(results, baseline_data["results"] if baseline_data else None)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(),
+            "days": args.days,
+            # Fixtures not run this time are kept from a comparable baseline
+            "results": {**(baseline_data["results"] if comparable else {}), **results},
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare:
+        regressions = compare(results, baseline_data["results"], args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
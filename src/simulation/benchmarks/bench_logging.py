@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Logging cost in the algo main loop.
+
+Runs the algorithms over precomputed weather snapshots (winter profile, file
+logging) in a fresh interpreter per variant and reports the loop cost per
+tick for log level INFO vs WARNING, with the queue listener (log_queue: true)
+and with synchronous writes (log_queue: false). Weather generation is done
+before timing starts; "drain" is the time to flush the log queue afterwards.
+
+Usage (from src/simulation):
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --days 30 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+from support import CHILD_REPORT, SIMULATION_DIR, run_child, write_config
+
+_CHILD = """
+import json, os, sys, time
+from algo_service import AlgoService, load_config
+from common.log_queue import stop_queued_logging
+from weather_service import build_weather_source
+
+service = AlgoService(load_config(sys.argv[1]), fast_forward=True)
+source = build_weather_source(service.config)
+step_s = service.config.services.algo.algorithms.ws.temp_monitoring_cycle_s
+snapshots = [source(float(t)) for t in range(0, int(service.config.simulation.duration_seconds) + 1, step_s)]
+
+start = time.perf_counter_ns()
+for snapshot in snapshots:
+    service.process_snapshot(snapshot)
+loop_ns = time.perf_counter_ns() - start
+
+start = time.perf_counter_ns()
+stop_queued_logging(service._log_listener)
+drain_ns = time.perf_counter_ns() - start
+
+log_file = service.config.telemetry.log_file
+result = {
+    "ticks": len(snapshots),
+    "loop_ns": loop_ns,
+    "drain_ns": drain_ns,
+    "log_bytes": os.path.getsize(log_file) if os.path.exists(log_file) else 0,
+}
+""" + CHILD_REPORT
+
+VARIANTS = [
+    # (log_level, log_queue)
+    ("INFO", False),
+    ("INFO", True),
+    ("WARNING", False),
+    ("WARNING", True),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Main loop cost with logging at INFO vs WARNING")
+    parser.add_argument("--config", type=Path, default=SIMULATION_DIR / "config.yaml", help="Base config")
+    parser.add_argument("--days", type=int, default=7, help="Simulated days per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per variant (median)")
+    args = parser.parse_args()
+
+    print(
+        f"Logging benchmark - {args.days} days winter profile, median of {args.repeat} runs "
+        f"(python {sys.version.split()[0]})"
+    )
+    print(f"{'level':<10}{'log_queue':<11}{'per tick':>10}{'loop':>10}{'drain':>10}{'log size':>11}")
+    baseline_ns = None
+    with tempfile.TemporaryDirectory(prefix="bench_logging_") as tmp:
+        for log_level, log_queue in VARIANTS:
+            name = f"{log_level.lower()}_{'queued' if log_queue else 'sync'}"
+            log_file = Path(tmp) / f"{name}.log"
+            config_path = write_config(
+                args.config,
+                {
+                    "simulation.duration_days": args.days,
+                    "services.weather.profile_type": "winter",
+                    "telemetry.log_level": log_level,
+                    "telemetry.log_output": "file",
+                    "telemetry.log_file": str(log_file),
+                    "telemetry.log_queue": log_queue,
+                    "services.algo.checkpoint.enabled": False,
+                },
+                Path(tmp) / f"config_{name}.yaml",
+            )
+            runs = []
+            for _ in range(args.repeat):
+                log_file.unlink(missing_ok=True)
+                runs.append(run_child(_CHILD, str(config_path)))
+            per_tick_ns = statistics.median(run["loop_ns"] / run["ticks"] for run in runs)
+            loop_ms = statistics.median(run["loop_ns"] for run in runs) / 1e6
+            drain_ms = statistics.median(run["drain_ns"] for run in runs) / 1e6
+            baseline_ns = baseline_ns or per_tick_ns
+            print(
+                f"{log_level:<10}{str(log_queue).lower():<11}{per_tick_ns / 1000:>8.1f}µs{loop_ms:>8.0f}ms"
+                f"{drain_ms:>8.1f}ms{runs[-1]['log_bytes'] / 1024:>9.0f}kB"
+                f"  ({per_tick_ns / baseline_ns:.2f}x of INFO sync)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the service entry points.
+
+Every measurement runs in a fresh interpreter (nothing cached in sys.modules)
+and reports, per entry point and telemetry exporter_type:
+    - import: time to import the entry point module
+    - first tick: time from before the import until the first unit of work is
+      done (algo: first snapshot processed, weather: first /temperature served)
+    - process: wall time of the whole child process as seen by the parent
+    - heavy modules loaded by then (flask, requests, OTLP exporter, ...)
+
+Usage (from src/simulation):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10 --exporters console memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+from support import CHILD_REPORT, SIMULATION_DIR, run_child, write_config
+
+HEAVY_MODULES = (
+    "flask",
+    "requests",
+    "urllib3",
+    "yaml",
+    "google.protobuf",
+    "opentelemetry.exporter.otlp.proto.http.metric_exporter",
+    "http.server",
+)
+
+# Child programs - executed with -c in a fresh interpreter, config path in argv[1].
+# CHILD_REPORT exits without exporter shutdown (an unreachable OTLP endpoint
+# would otherwise add its timeout to the process time).
+_CHILD_PROLOGUE = """
+import json, os, sys, time
+start = time.perf_counter()
+"""
+
+_CHILD_EPILOGUE = """
+first_tick = time.perf_counter()
+result = {{
+    "import_s": imported - start,
+    "first_tick_s": first_tick - start,
+    "heavy_modules": [name for name in {heavy!r} if name in sys.modules],
+}}
+""".format(heavy=HEAVY_MODULES) + CHILD_REPORT
+
+ENTRY_POINTS = {
+    # Real-time algo service: construct, then process one snapshot (weather from the simulator)
+    "algo_service": """
+import algo_service
+imported = time.perf_counter()
+service = algo_service.AlgoService(algo_service.load_config(sys.argv[1]))
+from weather_service import build_weather_source
+service.process_snapshot(build_weather_source(service.config)(0.0))
+""",
+    # Fast-forward algo run (memory exporter forced): construct, then one in-process step
+    "algo_service --fast-forward": """
+import algo_service
+imported = time.perf_counter()
+service = algo_service.AlgoService(algo_service.load_config(sys.argv[1]), fast_forward=True)
+from weather_service import build_weather_source
+service.process_snapshot(build_weather_source(service.config)(0.0))
+""",
+    # Weather HTTP service: construct the Flask app, then serve one /temperature request
+    "weather_service": """
+import weather_service
+imported = time.perf_counter()
+application = weather_service.WeatherApplication(
+    weather_service.load_config(sys.argv[1]), enable_background=False
+)
+response = application.app.test_client().get("/temperature")
+assert response.status_code == 200, response.status_code
+""",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import time and time-to-first-tick of the services")
+    parser.add_argument("--config", type=Path, default=SIMULATION_DIR / "config.yaml", help="Base config")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes per measurement (median)")
+    parser.add_argument(
+        "--exporters",
+        nargs="+",
+        default=["console", "otlp", "prometheus", "memory"],
+        help="Telemetry exporter types to measure",
+    )
+    args = parser.parse_args()
+
+    print(f"Startup benchmark - median of {args.repeat} fresh processes (python {sys.version.split()[0]})")
+    print(f"{'entry point':<30}{'exporter':<12}{'import':>10}{'first tick':>12}{'process':>10}  heavy modules")
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as tmp:
+        for entry_point, program in ENTRY_POINTS.items():
+            exporters = ["memory"] if entry_point.endswith("--fast-forward") else args.exporters
+            for exporter_type in exporters:
+                config_path = write_config(
+                    args.config,
+                    {"telemetry.exporter_type": exporter_type},
+                    Path(tmp) / f"config_{exporter_type}.yaml",
+                )
+                source = _CHILD_PROLOGUE + program + _CHILD_EPILOGUE
+                runs = [run_child(source, str(config_path), timeout_s=120) for _ in range(args.repeat)]
+                import_ms = statistics.median(run["import_s"] for run in runs) * 1000
+                first_tick_ms = statistics.median(run["first_tick_s"] for run in runs) * 1000
+                process_ms = statistics.median(run["process_s"] for run in runs) * 1000
+                heavy = ", ".join(runs[-1]["heavy_modules"]) or "-"
+                print(
+                    f"{entry_point:<30}{exporter_type:<12}{import_ms:>8.0f}ms{first_tick_ms:>10.0f}ms"
+                    f"{process_ms:>8.0f}ms  {heavy}"
+                )
+
+
+if __name__ == "__main__":
+    main()
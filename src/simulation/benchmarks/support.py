@@ -0,0 +1,85 @@
+"""Shared helpers for the benchmark scripts (fresh-interpreter runs with patched configs)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+import yaml
+
+SIMULATION_DIR = Path(__file__).resolve().parent.parent
+RESULT_MARKER = "BENCH_RESULT "
+
+# Appended to child programs: print the result dict as one marked JSON line and
+# leave without running exporter/atexit shutdown (not part of what is measured)
+CHILD_REPORT = """
+sys.stdout.flush()
+print({marker!r} + json.dumps(result), flush=True)
+os._exit(0)
+""".format(marker=RESULT_MARKER)
+
+
+def write_config(base_config: Path, overrides: Mapping[str, Any], path: Path) -> Path:
+    """
+    Copy of base_config with dotted-path overrides and everything interactive turned off.
+
+    Args:
+        base_config: config.yaml to start from
+        overrides: e.g. {"telemetry.exporter_type": "memory"}
+        path: Where to write the patched config
+
+    Returns:
+        path
+    """
+    with base_config.open("r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle)
+    settings = {
+        "telemetry.log_output": "console",
+        "telemetry.log_level": "WARNING",
+        "services.algo.display.enabled": False,
+        "services.algo.metrics_port": 0,  # prometheus: any free port
+        "services.weather.metrics_port": 0,
+        **overrides,
+    }
+    for dotted, value in settings.items():
+        section = data
+        *parents, key = dotted.split(".")
+        for name in parents:
+            section = section.setdefault(name, {})
+        section[key] = value
+    with path.open("w", encoding="utf-8") as handle:
+        yaml.safe_dump(data, handle)
+    return path
+
+
+def run_child(source: str, *argv: str, timeout_s: float = 600.0) -> dict:
+    """
+    Run source in a fresh interpreter (cwd and import path = src/simulation).
+
+    The program must set a `result` dict and end with CHILD_REPORT.
+
+    Returns:
+        result dict plus process_s (wall time seen by the parent)
+    """
+    env = {**os.environ, "PYTHONPATH": str(SIMULATION_DIR)}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", source, *argv],
+        cwd=SIMULATION_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout_s,
+    )
+    process_s = time.perf_counter() - started
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            result["process_s"] = process_s
+            return result
+    raise RuntimeError(f"Benchmark child failed (exit {completed.returncode}):\n{completed.stderr[-2000:]}")
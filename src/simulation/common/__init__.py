@@ -8,7 +8,10 @@ from .config import (
     TelemetryConfig,
     WeatherServiceConfig,
     WinterProfileConfig,
+    apply_overrides,
+    build_config,
     load_config,
+    read_config_data,
 )
 from .domain import Heater, Line, Scenario
 from .time_utils import AcceleratedClock
@@ -25,7 +28,10 @@ __all__ = [
     "Heater",
     "Line",
     "Scenario",
+    "apply_overrides",
+    "build_config",
     "load_config",
+    "read_config_data",
 ]
 
 
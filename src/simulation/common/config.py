@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping, MutableMapping
-
-import yaml
+from typing import Any, Dict, Mapping
 
 
 class ConfigError(RuntimeError):
@@ -23,6 +21,15 @@ class SimulationSettings:
         return float(self.duration_days) * 24 * 3600
 
 
+@dataclass
+class ExportQueueConfig:
+    enabled: bool = True  # Export on a dedicated worker - control loop never waits for the endpoint
+    max_batches: int = 8  # Bounded queue of pending export batches
+    drop_policy: str = "drop_oldest"  # "drop_oldest" or "drop_newest" when the queue is full
+    failure_threshold: int = 3  # Consecutive failures that open the circuit breaker
+    cooldown_s: float = 30.0  # [s real] drop batches without export attempts while the circuit is open
+
+
 @dataclass
 class TelemetryConfig:
     exporter_type: str
@@ -33,6 +40,11 @@ class TelemetryConfig:
     log_level: str = "INFO"
     log_output: str = "console"  # "console", "file", or "both"
     log_file: str = "logs/algo_service.log"
+    log_queue: bool = True  # Write logs from a background listener thread (callers only enqueue)
+    prometheus_host: str = "127.0.0.1"  # Bind address of the pull endpoint (exporter_type "prometheus")
+    memory_max_samples: int = 4096  # Ring buffer length per series (exporter_type "memory")
+    export_timeout_s: float = 5.0  # [s real] OTLP request timeout
+    export_queue: ExportQueueConfig = field(default_factory=ExportQueueConfig)
 
 
 @dataclass
@@ -40,6 +52,11 @@ class WSConfig:
     temp_monitoring_cycle_s: int
     scenario_stabilization_time_s: int
     hysteresis_delta_c: float
+    filter_averaging: int = 3
+    filter_median_window: int = 0
+    filter_ema_alpha: float = 0.0
+    filter_max_rate_c_per_min: float = 0.0
+    filter_spike_max_rejections: int = 3
 
 
 @dataclass
@@ -65,6 +82,65 @@ class DisplayConfig:
     refresh_rate_s: float = 1.0
 
 
+@dataclass
+class TaskScheduleConfig:
+    """Per-task overrides for the simulation-time scheduler."""
+    phase_s: float = 0.0           # [s sim] time of the first tick
+    policy: str = "coalesce"       # "coalesce" or "catch_up" for missed ticks
+
+
+@dataclass
+class SchedulerConfig:
+    max_catch_up_ticks: int = 100
+    tasks: Mapping[str, TaskScheduleConfig] = field(default_factory=dict)
+
+    def task(self, name: str) -> TaskScheduleConfig:
+        return self.tasks.get(name, TaskScheduleConfig())
+
+
+@dataclass
+class CheckpointConfig:
+    enabled: bool = False
+    path: str = "checkpoints/algo_state.json.gz"
+    interval_s: float = 21600.0  # [s sim] how often controller state is written
+
+
+@dataclass
+class RecorderConfig:
+    enabled: bool = False
+    path: str = "recordings/trajectory.npz"
+    format: str = "npz"  # "npz" (compressed) or "npy" (directory, memory-mappable)
+    chunk_size: int = 65536  # [ticks] rows preallocated per chunk
+
+
+@dataclass
+class JournalConfig:
+    enabled: bool = False
+    path: str = "journal"  # Directory of segment files + sparse index
+    segment_records: int = 65536  # Records per segment before rotation (multiple of block_records)
+    block_records: int = 1024  # Records per compression block / sparse index entry
+    compress: bool = True  # Compress finished segments on a background thread
+    max_segments: int = 0  # Oldest segments removed beyond this count (0 = keep all)
+
+
+@dataclass
+class SteadyStateConfig:
+    enabled: bool = True  # Extrapolate periodic constant-profile fast-forward runs
+    max_probes: int = 4096  # Controller states remembered while looking for a repeat
+
+
+@dataclass
+class ProfilingConfig:
+    enabled: bool = False  # Per-stage timers (poll, ws, rc, rn, ...) - no overhead when disabled
+
+
+@dataclass
+class LagMonitoringConfig:
+    window_real_s: float = 5.0  # [s real] window for achieved acceleration
+    warn_acceleration_ratio: float = 0.9  # Warn when achieved/configured acceleration drops below
+    warn_gap_s: float = 600.0  # [s sim] warn when algo falls this far behind the weather clock
+
+
 @dataclass
 class AlgoAlgorithmsConfig:
     ws: WSConfig
@@ -80,6 +156,15 @@ class AlgoServiceConfig:
     otlp_timeout_ms: int
     display: DisplayConfig
     algorithms: AlgoAlgorithmsConfig
+    metrics_flush_interval_s: float = 300.0
+    metrics_port: int = 9464  # Prometheus pull endpoint (exporter_type "prometheus")
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
+    checkpoint: CheckpointConfig = field(default_factory=CheckpointConfig)
+    recorder: RecorderConfig = field(default_factory=RecorderConfig)
+    journal: JournalConfig = field(default_factory=JournalConfig)
+    steady_state: SteadyStateConfig = field(default_factory=SteadyStateConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    lag: LagMonitoringConfig = field(default_factory=LagMonitoringConfig)
 
 
 @dataclass
@@ -113,6 +198,7 @@ class WeatherServiceConfig:
     winter_profile: WinterProfileConfig
     constant_profile: ConstantProfileConfig | None = None
     stepped_profile: SteppedProfileConfig | None = None
+    metrics_port: int = 9465  # Prometheus pull endpoint (exporter_type "prometheus")
 
 
 @dataclass
@@ -128,14 +214,78 @@ class AppConfig:
     services: ServicesConfig
 
 
-def load_config(path: str | Path) -> AppConfig:
-    """Load and validate configuration from YAML."""
+def load_config(path: str | Path, overrides: Mapping[str, Any] | None = None) -> AppConfig:
+    """
+    Load and validate configuration from YAML.
+
+    Args:
+        path: config.yaml
+        overrides: Applied on top of the file, see apply_overrides()
+
+    Returns:
+        Typed configuration
+    """
+    return build_config(read_config_data(path), overrides)
+
+
+def read_config_data(path: str | Path) -> Dict[str, Any]:
+    """Parse the YAML file into a plain mapping (parse once, build many configs from it)."""
     path = Path(path)
     if not path.exists():
         raise ConfigError(f"Configuration file not found: {path}")
 
+    import yaml  # Only needed when a file is loaded (config dataclasses are imported widely)
+
     with path.open("r", encoding="utf-8") as handle:
-        data: MutableMapping[str, Any] = yaml.safe_load(handle) or {}
+        return yaml.safe_load(handle) or {}
+
+
+def apply_overrides(data: Mapping[str, Any], overrides: Mapping[str, Any] | None) -> Dict[str, Any]:
+    """
+    Copy of config data with overrides merged in (data itself is not modified).
+
+    Keys are dotted paths ("simulation.duration_days") or section names; mapping
+    values are merged recursively, anything else (scalars, lists) replaces the value.
+    Missing intermediate sections are created.
+
+    Args:
+        data: Config mapping in config.yaml layout
+        overrides: e.g. {"simulation.duration_days": 3, "services": {"weather": {"port": 0}}}
+
+    Returns:
+        Merged config mapping
+    """
+    merged = dict(data)
+    for key, value in (overrides or {}).items():
+        *parents, leaf = str(key).split(".")
+        section = merged
+        for name in parents:
+            child = section.get(name, {})
+            if not isinstance(child, Mapping):
+                raise ConfigError(f"Cannot override {key}: {name} is not a section")
+            child = dict(child)  # Copy on the way down - data stays untouched
+            section[name] = child
+            section = child
+        if isinstance(value, Mapping) and isinstance(section.get(leaf), Mapping):
+            section[leaf] = apply_overrides(section[leaf], value)
+        else:
+            section[leaf] = value
+    return merged
+
+
+def build_config(data: Mapping[str, Any], overrides: Mapping[str, Any] | None = None) -> AppConfig:
+    """
+    Typed configuration from already parsed config data (no file access).
+
+    Args:
+        data: Config mapping in config.yaml layout (e.g. from read_config_data())
+        overrides: Applied on top of data, see apply_overrides()
+
+    Returns:
+        Typed configuration
+    """
+    if overrides:
+        data = apply_overrides(data, overrides)
 
     simulation_section = data.get("simulation", {})
     simulation = SimulationSettings(
@@ -144,6 +294,7 @@ def load_config(path: str | Path) -> AppConfig:
     )
 
     telemetry_data = data.get("telemetry", {})
+    export_queue_data = telemetry_data.get("export_queue", {})
     telemetry = TelemetryConfig(
         exporter_type=str(telemetry_data.get("exporter_type", "otlp")),
         endpoints=_require_mapping(telemetry_data, "endpoints"),
@@ -153,6 +304,17 @@ def load_config(path: str | Path) -> AppConfig:
         log_level=str(telemetry_data.get("log_level", "INFO")),
         log_output=str(telemetry_data.get("log_output", "console")),
         log_file=str(telemetry_data.get("log_file", "logs/algo_service.log")),
+        log_queue=bool(telemetry_data.get("log_queue", True)),
+        prometheus_host=str(telemetry_data.get("prometheus_host", "127.0.0.1")),
+        memory_max_samples=int(telemetry_data.get("memory_max_samples", 4096)),
+        export_timeout_s=float(telemetry_data.get("export_timeout_s", 5.0)),
+        export_queue=ExportQueueConfig(
+            enabled=bool(export_queue_data.get("enabled", True)),
+            max_batches=int(export_queue_data.get("max_batches", 8)),
+            drop_policy=str(export_queue_data.get("drop_policy", "drop_oldest")),
+            failure_threshold=int(export_queue_data.get("failure_threshold", 3)),
+            cooldown_s=float(export_queue_data.get("cooldown_s", 30.0)),
+        ),
     )
 
     services_data = data.get("services", {})
@@ -166,6 +328,13 @@ def load_config(path: str | Path) -> AppConfig:
 def _load_algo_service(data: Mapping[str, Any]) -> AlgoServiceConfig:
     algorithms = data.get("algorithms", {})
     display_data = data.get("display", {})
+    scheduler_data = data.get("scheduler", {})
+    checkpoint_data = data.get("checkpoint", {})
+    recorder_data = data.get("recorder", {})
+    journal_data = data.get("journal", {})
+    steady_state_data = data.get("steady_state", {})
+    profiling_data = data.get("profiling", {})
+    lag_data = data.get("lag", {})
 
     ws = algorithms.get("ws", {})
     rc = algorithms.get("rc", {})
@@ -176,6 +345,8 @@ def _load_algo_service(data: Mapping[str, Any]) -> AlgoServiceConfig:
         metrics_prefix=str(data.get("metrics_prefix", "bogdanka.algo")),
         weather_endpoint=str(data.get("weather_endpoint", "http://localhost:8080/temperature")),
         otlp_timeout_ms=int(data.get("otlp_timeout_ms", 1000)),
+        metrics_flush_interval_s=float(data.get("metrics_flush_interval_s", 300.0)),
+        metrics_port=int(data.get("metrics_port", 9464)),
         display=DisplayConfig(
             enabled=bool(display_data.get("enabled", True)),
             refresh_rate_s=float(display_data.get("refresh_rate_s", 1.0)),
@@ -185,6 +356,11 @@ def _load_algo_service(data: Mapping[str, Any]) -> AlgoServiceConfig:
                 temp_monitoring_cycle_s=int(ws.get("temp_monitoring_cycle_s", 10)),
                 scenario_stabilization_time_s=int(ws.get("scenario_stabilization_time_s", 60)),
                 hysteresis_delta_c=float(ws.get("hysteresis_delta_c", 1.0)),
+                filter_averaging=int(ws.get("filter_averaging", 3)),
+                filter_median_window=int(ws.get("filter_median_window", 0)),
+                filter_ema_alpha=float(ws.get("filter_ema_alpha", 0.0)),
+                filter_max_rate_c_per_min=float(ws.get("filter_max_rate_c_per_min", 0.0)),
+                filter_spike_max_rejections=int(ws.get("filter_spike_max_rejections", 3)),
             ),
             rc=RCConfig(
                 rotation_period_hours=int(rc.get("rotation_period_hours", 168)),
@@ -199,6 +375,47 @@ def _load_algo_service(data: Mapping[str, Any]) -> AlgoServiceConfig:
                 algorithm_loop_cycle_s=int(rn.get("algorithm_loop_cycle_s", 60)),
             ),
         ),
+        scheduler=SchedulerConfig(
+            max_catch_up_ticks=int(scheduler_data.get("max_catch_up_ticks", 100)),
+            tasks={
+                str(name): TaskScheduleConfig(
+                    phase_s=float((task or {}).get("phase_s", 0.0)),
+                    policy=str((task or {}).get("policy", "coalesce")),
+                )
+                for name, task in (scheduler_data.get("tasks") or {}).items()
+            },
+        ),
+        checkpoint=CheckpointConfig(
+            enabled=bool(checkpoint_data.get("enabled", False)),
+            path=str(checkpoint_data.get("path", "checkpoints/algo_state.json.gz")),
+            interval_s=float(checkpoint_data.get("interval_s", 21600.0)),
+        ),
+        recorder=RecorderConfig(
+            enabled=bool(recorder_data.get("enabled", False)),
+            path=str(recorder_data.get("path", "recordings/trajectory.npz")),
+            format=str(recorder_data.get("format", "npz")),
+            chunk_size=int(recorder_data.get("chunk_size", 65536)),
+        ),
+        journal=JournalConfig(
+            enabled=bool(journal_data.get("enabled", False)),
+            path=str(journal_data.get("path", "journal")),
+            segment_records=int(journal_data.get("segment_records", 65536)),
+            block_records=int(journal_data.get("block_records", 1024)),
+            compress=bool(journal_data.get("compress", True)),
+            max_segments=int(journal_data.get("max_segments", 0)),
+        ),
+        steady_state=SteadyStateConfig(
+            enabled=bool(steady_state_data.get("enabled", True)),
+            max_probes=int(steady_state_data.get("max_probes", 4096)),
+        ),
+        profiling=ProfilingConfig(
+            enabled=bool(profiling_data.get("enabled", False)),
+        ),
+        lag=LagMonitoringConfig(
+            window_real_s=float(lag_data.get("window_real_s", 5.0)),
+            warn_acceleration_ratio=float(lag_data.get("warn_acceleration_ratio", 0.9)),
+            warn_gap_s=float(lag_data.get("warn_gap_s", 600.0)),
+        ),
     )
 
 
@@ -226,6 +443,7 @@ def _load_weather_service(data: Mapping[str, Any]) -> WeatherServiceConfig:
         port=int(data.get("port", 8080)),
         service_name=str(data.get("service_name", "bogdanka-weather")),
         metrics_prefix=str(data.get("metrics_prefix", "bogdanka.weather")),
+        metrics_port=int(data.get("metrics_port", 9465)),
         profile_type=str(data.get("profile_type", "winter")),
         winter_profile=WinterProfileConfig(
             initial_temp_c=float(winter_profile.get("initial_temp_c", 5.0)),
@@ -0,0 +1,219 @@
+"""Bounded, off-thread metric export with drop accounting and a circuit breaker."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    MetricExporter,
+    MetricExportResult,
+    MetricsData,
+)
+from opentelemetry.sdk.metrics.view import Aggregation
+
+LOGGER = logging.getLogger("telemetry.export")
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST)
+
+# Circuit breaker states
+CLOSED = "closed"        # Exporting normally
+OPEN = "open"            # Endpoint considered down - batches dropped without export attempts
+HALF_OPEN = "half_open"  # Cooldown elapsed - next batch is a trial export
+
+
+class QueuedMetricExporter(MetricExporter):
+    """
+    Wraps a push exporter so that export() never blocks on I/O.
+
+    export() only appends the batch to a bounded queue and returns; a dedicated
+    worker thread performs the real export (including the inner exporter's
+    retries and timeouts). When the queue is full the drop policy decides
+    which batch is discarded. After failure_threshold consecutive failures the
+    circuit opens: batches are dropped without contacting the endpoint until
+    cooldown_s has elapsed, then one trial export decides whether to close it.
+
+    With cumulative temporality (SDK default) a dropped batch loses no totals -
+    the next exported batch carries them.
+
+    Stats (read by TelemetryManager observable counters):
+        exported_batches, failed_batches, late_batches,
+        dropped_batches[reason] for reason in ("queue_full", "circuit_open", "shutdown")
+    """
+
+    def __init__(
+        self,
+        exporter: MetricExporter,
+        max_batches: int = 8,
+        drop_policy: str = DROP_OLDEST,
+        failure_threshold: int = 3,
+        cooldown_s: float = 30.0,
+        late_after_s: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, Aggregation] | None = None,
+    ):
+        if max_batches < 1:
+            raise ValueError("max_batches must be >= 1")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unsupported drop_policy: {drop_policy} (use one of {DROP_POLICIES})")
+        # Reader asks the exporter for temporality/aggregation - by default keep the inner exporter's
+        # preferences. MetricExporter has no public getter for them; the private attributes are set by
+        # MetricExporter.__init__ in every SDK release since 1.12 (pinned: opentelemetry-sdk>=1.23).
+        super().__init__(
+            preferred_temporality=(
+                preferred_temporality if preferred_temporality is not None
+                else getattr(exporter, "_preferred_temporality", None)
+            ),
+            preferred_aggregation=(
+                preferred_aggregation if preferred_aggregation is not None
+                else getattr(exporter, "_preferred_aggregation", None)
+            ),
+        )
+        self.exporter = exporter
+        self.max_batches = max_batches
+        self.drop_policy = drop_policy
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.late_after_s = late_after_s
+        self._clock = clock
+
+        self._queue: deque[tuple[float, MetricsData, float]] = deque()  # (enqueued_at, batch, timeout_millis)
+        self._condition = threading.Condition()
+        self._busy = False  # Worker is exporting a batch taken from the queue
+        self._stopping = False
+
+        self.state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+
+        self.exported_batches = 0
+        self.failed_batches = 0
+        self.late_batches = 0
+        self.dropped_batches = {"queue_full": 0, "circuit_open": 0, "shutdown": 0}
+
+        self._worker = threading.Thread(target=self._run, name="metric-export", daemon=True)
+        self._worker.start()
+
+    # ═══════════════════════════════════════════════════════════════
+    # PRODUCER SIDE (SDK reader thread)
+    # ═══════════════════════════════════════════════════════════════
+
+    def export(self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs) -> MetricExportResult:
+        """Enqueue batch (never blocks on the endpoint)."""
+        with self._condition:
+            if self._stopping:
+                self.dropped_batches["shutdown"] += 1
+                return MetricExportResult.FAILURE
+            if len(self._queue) >= self.max_batches:
+                self.dropped_batches["queue_full"] += 1
+                if self.drop_policy == DROP_NEWEST:
+                    return MetricExportResult.FAILURE
+                self._queue.popleft()
+            self._queue.append((self._clock(), metrics_data, timeout_millis))
+            self._condition.notify()
+        return MetricExportResult.SUCCESS
+
+    @property
+    def queued_batches(self) -> int:
+        return len(self._queue)
+
+    # ═══════════════════════════════════════════════════════════════
+    # WORKER SIDE
+    # ═══════════════════════════════════════════════════════════════
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopping:
+                    self._condition.wait()
+                if not self._queue:
+                    return  # Stopping and drained
+                enqueued_at, batch, timeout_millis = self._queue.popleft()
+                self._busy = True
+                self._condition.notify_all()  # Queue space freed
+            try:
+                self._export_one(enqueued_at, batch, timeout_millis)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _export_one(self, enqueued_at: float, batch: MetricsData, timeout_millis: float) -> None:
+        now = self._clock()
+        if self.state == OPEN:
+            if now - self._opened_at < self.cooldown_s:
+                self.dropped_batches["circuit_open"] += 1
+                return
+            self.state = HALF_OPEN
+
+        try:
+            result = self.exporter.export(batch, timeout_millis=timeout_millis)
+        except Exception as exc:  # Exporter bugs must not kill the worker
+            LOGGER.debug(f"Metric export raised: {exc}")
+            result = MetricExportResult.FAILURE
+
+        if result is MetricExportResult.SUCCESS:
+            self.exported_batches += 1
+            if self._clock() - enqueued_at > self.late_after_s:
+                self.late_batches += 1
+            if self.state != CLOSED:
+                LOGGER.info("Metric export recovered - circuit closed")
+            self.state = CLOSED
+            self._consecutive_failures = 0
+            return
+
+        self.failed_batches += 1
+        self._consecutive_failures += 1
+        if self.state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                LOGGER.warning(
+                    f"Metric export failed {self._consecutive_failures} times - "
+                    f"dropping batches for {self.cooldown_s:.0f}s"
+                )
+            self.state = OPEN
+            self._opened_at = self._clock()
+
+    # ═══════════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════════
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Wait until queued batches were handed to the inner exporter."""
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return self.exporter.force_flush(timeout_millis=max(0.0, (deadline - time.monotonic()) * 1000))
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """Drain the queue (bounded by timeout), then shut the inner exporter down."""
+        timeout_millis = kwargs.get("timeout", timeout_millis)  # Reader passes timeout=
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._worker.join(timeout=max(0.0, deadline - time.monotonic()))
+        with self._condition:
+            if self._queue:
+                self.dropped_batches["shutdown"] += len(self._queue)
+                self._queue.clear()
+        self.exporter.shutdown(timeout_millis=max(0.0, (deadline - time.monotonic()) * 1000))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "exported_batches": self.exported_batches,
+            "failed_batches": self.failed_batches,
+            "late_batches": self.late_batches,
+            "queued_batches": self.queued_batches,
+            **{f"dropped_{reason}": count for reason, count in self.dropped_batches.items()},
+        }
@@ -0,0 +1,99 @@
+"""Queue-based logging: the control thread only enqueues records, a listener thread formats and writes them."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Sequence
+
+# Record arguments that cannot change between the log call and the listener formatting them
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), bytes)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+
+    The stock prepare() formats the message on the calling thread (it has to
+    be picklable for multiprocessing queues). Records here stay in-process, so
+    msg/args are passed through unformatted when every argument is immutable;
+    records carrying mutable arguments are formatted eagerly so they log the
+    value at call time.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if isinstance(args, dict):
+            args = tuple(args.values())
+        if args and not all(isinstance(arg, _IMMUTABLE_ARGS) for arg in args):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # Render the traceback now - frames may be gone by the time the listener runs
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(
+    level: int,
+    handlers: Sequence[logging.Handler],
+    log_format: str,
+    date_format: Optional[str] = None,
+    queued: bool = True,
+) -> Optional[QueueListener]:
+    """
+    Configure the root logger once per process (same rule as logging.basicConfig).
+
+    Args:
+        level: Root logger level
+        handlers: Target handlers (console/file); formatter is set on each
+        log_format: Format string for all handlers
+        date_format: asctime format
+        queued: Attach handlers behind a queue + background listener thread
+
+    Returns:
+        Running listener (pass to stop_queued_logging at shutdown), None when
+        logging was already configured or queued is False
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None  # First configuration in the process wins (several services in one test run)
+
+    formatter = logging.Formatter(log_format, date_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    root.setLevel(level)
+
+    if not queued:
+        for handler in handlers:
+            root.addHandler(handler)
+        return None
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    listener.start()
+    atexit.register(stop_queued_logging, listener)  # Paths that never reach service shutdown
+    return listener
+
+
+def stop_queued_logging(listener: Optional[QueueListener]) -> None:
+    """
+    Drain the queue and write synchronously from now on.
+
+    The queue handler on the root logger is replaced by the listener's target
+    handlers, so records logged after shutdown still reach the same outputs.
+    Safe to call more than once.
+    """
+    if listener is None or listener._thread is None:
+        return
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+            for target in listener.handlers:
+                root.addHandler(target)
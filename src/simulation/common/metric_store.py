@@ -0,0 +1,268 @@
+"""In-memory metric reader with bounded time series and a small query API."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Mapping, NamedTuple, Optional
+
+from opentelemetry.sdk.metrics.export import (
+    Gauge,
+    Histogram,
+    MetricReader,
+    MetricsData,
+    Sum,
+)
+
+LOGGER = logging.getLogger("telemetry.memory")
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+
+class HistogramSample(NamedTuple):
+    """Cumulative histogram state at one sample time."""
+    count: int
+    sum: float
+    bounds: tuple[float, ...]
+    bucket_counts: tuple[int, ...]
+
+
+@dataclass
+class MetricSeries:
+    """One instrument + attribute set, sampled into a ring buffer of (time, value)."""
+    name: str
+    attributes: Mapping[str, str]
+    kind: str  # COUNTER, GAUGE or HISTOGRAM
+    samples: deque = field(default_factory=deque)
+    truncated: bool = False  # Older samples were dropped (ring buffer full)
+
+    def append(self, timestamp: float, value) -> None:
+        if self.samples and self.samples[-1][0] == timestamp:
+            self.samples[-1] = (timestamp, value)  # Re-sample of the same time replaces
+            return
+        if len(self.samples) == self.samples.maxlen:
+            self.truncated = True
+        self.samples.append((timestamp, value))
+
+    def value_at(self, timestamp: float):
+        """Last sampled value at or before timestamp (cumulative series)."""
+        for sample_time, value in reversed(self.samples):
+            if sample_time <= timestamp:
+                return value
+        if self.truncated and self.samples:
+            return self.samples[0][1]  # Range starts before retention - clip to oldest sample
+        return None
+
+    def baseline(self, start: float):
+        """Cumulative value a range starting at start is measured from (None = from zero)."""
+        if not self.samples or (self.samples[0][0] > start and not self.truncated):
+            return None
+        return self.value_at(start)
+
+    def values_between(self, start: float, end: float) -> list:
+        return [value for sample_time, value in self.samples if start <= sample_time <= end]
+
+
+class InMemoryMetricStore(MetricReader):
+    """
+    Metric reader that keeps the sampled values in memory instead of exporting.
+
+    Nothing runs in the background: the owner calls sample(timestamp) when a
+    data point is wanted (e.g. every metrics flush in simulation time), which
+    collects all instruments once and appends their values to per-series ring
+    buffers of max_samples entries. Counters and histograms are stored
+    cumulatively, so ranges are answered from two samples.
+
+    Query API:
+        - latest(name, attributes): most recent value
+        - sum_over_range(name, start, end, attributes): counter increase or sum of gauge samples
+        - percentile(name, q, attributes, start, end): histogram or gauge percentile
+
+    attributes selects series whose attributes contain the given items; values
+    of all matching series are added together (e.g. all scenario transitions).
+    """
+
+    def __init__(self, max_samples: int = 4096) -> None:
+        super().__init__()
+        if max_samples < 1:
+            raise ValueError("max_samples must be >= 1")
+        self.max_samples = max_samples
+        self._series: dict[tuple[str, frozenset], MetricSeries] = {}
+        self._metrics_data: Optional[MetricsData] = None
+
+    def _receive_metrics(self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs) -> None:
+        self._metrics_data = metrics_data
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        pass  # Samples stay queryable after the meter provider is shut down
+
+    # ═══════════════════════════════════════════════════════════════
+    # SAMPLING
+    # ═══════════════════════════════════════════════════════════════
+
+    def sample(self, timestamp: float) -> None:
+        """Collect all instruments and append their current values at timestamp."""
+        self._metrics_data = None
+        self.collect()
+        if self._metrics_data is None:
+            return
+        for resource_metrics in self._metrics_data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    self._store_metric(metric, timestamp)
+
+    def _store_metric(self, metric, timestamp: float) -> None:
+        data = metric.data
+        if isinstance(data, Sum):
+            kind = COUNTER if data.is_monotonic else GAUGE
+        elif isinstance(data, Gauge):
+            kind = GAUGE
+        elif isinstance(data, Histogram):
+            kind = HISTOGRAM
+        else:
+            return
+        for point in data.data_points:
+            attributes = dict(point.attributes or {})
+            key = (metric.name, frozenset(attributes.items()))
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = MetricSeries(
+                    metric.name, attributes, kind, deque(maxlen=self.max_samples)
+                )
+            if kind == HISTOGRAM:
+                value = HistogramSample(
+                    point.count, point.sum, tuple(point.explicit_bounds), tuple(point.bucket_counts)
+                )
+            else:
+                value = point.value
+            series.append(timestamp, value)
+
+    # ═══════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════
+
+    def names(self) -> list[str]:
+        """Names of all sampled instruments."""
+        return sorted({name for name, _ in self._series})
+
+    def series(self, name: str, attributes: Optional[Mapping[str, str]] = None) -> list[MetricSeries]:
+        """Series of an instrument whose attributes contain all given items."""
+        wanted = (attributes or {}).items()
+        return [
+            series for (series_name, _), series in self._series.items()
+            if series_name == name and all(item in series.attributes.items() for item in wanted)
+        ]
+
+    def latest(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, str]] = None,
+        default: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Most recent value (histograms: sum of observations).
+
+        Returns:
+            Sum of the latest values of all matching series, default when none matched
+        """
+        values = [
+            _scalar(series.samples[-1][1]) for series in self.series(name, attributes) if series.samples
+        ]
+        return sum(values) if values else default
+
+    def sum_over_range(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        attributes: Optional[Mapping[str, str]] = None,
+    ) -> float:
+        """
+        Total over [start, end] sample time.
+
+        Counters and histograms: increase between the last samples at or before
+        start and end. Gauges: sum of the values sampled within the range.
+        """
+        total = 0.0
+        for series in self.series(name, attributes):
+            if series.kind == GAUGE:
+                total += sum(series.values_between(start, end))
+                continue
+            at_end = series.value_at(end)
+            if at_end is None:
+                continue
+            at_start = series.baseline(start)
+            total += _scalar(at_end) - (_scalar(at_start) if at_start is not None else 0.0)
+        return total
+
+    def percentile(
+        self,
+        name: str,
+        q: float,
+        attributes: Optional[Mapping[str, str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Percentile q (0..100).
+
+        Histograms: estimated from bucket counts (linear within the bucket) of
+        the observations recorded in [start, end] (whole run when omitted).
+        Gauges and counters: nearest-rank percentile of sampled values.
+
+        Returns:
+            Percentile value, None when there is no data
+        """
+        if not 0.0 <= q <= 100.0:
+            raise ValueError("q must be within [0, 100]")
+        matching = [series for series in self.series(name, attributes) if series.samples]
+        if not matching:
+            return None
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+
+        if matching[0].kind == HISTOGRAM:
+            return _histogram_percentile(matching, q, start, end)
+
+        values = sorted(value for series in matching for value in series.values_between(start, end))
+        if not values:
+            return None
+        rank = max(1, -(-len(values) * q // 100))  # ceil(n * q / 100), at least the first value
+        return float(values[int(rank) - 1])
+
+
+def _scalar(value) -> float:
+    return value.sum if isinstance(value, HistogramSample) else float(value)
+
+
+def _histogram_percentile(matching: list[MetricSeries], q: float, start: float, end: float) -> Optional[float]:
+    bounds: tuple[float, ...] = ()
+    counts: list[int] = []
+    for series in matching:
+        at_end = series.value_at(end)
+        if at_end is None:
+            continue
+        at_start = series.baseline(start)
+        if not counts:
+            bounds, counts = at_end.bounds, [0] * len(at_end.bucket_counts)
+        elif at_end.bounds != bounds:
+            raise ValueError(f"Histogram series of {series.name} use different bucket boundaries")
+        for index, count in enumerate(at_end.bucket_counts):
+            counts[index] += count - (at_start.bucket_counts[index] if at_start else 0)
+
+    total = sum(counts)
+    if total == 0:
+        return None
+    rank = total * q / 100
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= rank:
+            lower = bounds[index - 1] if index > 0 else 0.0
+            if index >= len(bounds):  # +Inf bucket - best estimate is its lower bound
+                return lower
+            return lower + (bounds[index] - lower) * (rank - seen) / count
+        seen += count
+    return bounds[-1] if bounds else None
@@ -0,0 +1,186 @@
+"""Pull-based metric export: Prometheus text format served over local HTTP."""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from opentelemetry.sdk.metrics.export import (
+    Gauge,
+    Histogram,
+    MetricReader,
+    MetricsData,
+    Sum,
+)
+
+LOGGER = logging.getLogger("telemetry.prometheus")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+_INVALID_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class PrometheusMetricReader(MetricReader):
+    """
+    Metric reader collected on demand (scrape) instead of on a timer.
+
+    Nothing is aggregated into export payloads between scrapes - instruments
+    only update their in-SDK aggregations, and render() walks them when an
+    HTTP client asks for /metrics.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()  # One collection at a time (concurrent scrapes)
+        self._metrics_data: Optional[MetricsData] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _receive_metrics(self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs) -> None:
+        self._metrics_data = metrics_data
+
+    def render(self) -> str:
+        """Collect current values and render them in Prometheus text exposition format."""
+        with self._lock:
+            self._metrics_data = None
+            self.collect()
+            return render_prometheus_text(self._metrics_data)
+
+    def start_server(self, host: str = "127.0.0.1", port: int = 9464) -> tuple[str, int]:
+        """
+        Serve GET /metrics on a daemon thread.
+
+        Args:
+            host: Bind address (keep local - the endpoint has no authentication)
+            port: Bind port (0 = pick a free port)
+
+        Returns:
+            Bound (host, port)
+        """
+        reader = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 - http.server API
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = reader.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # Keep scrapes out of service logs
+                LOGGER.debug("scrape %s - %s", self.client_address[0], format % args)
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="prometheus-endpoint", daemon=True)
+        self._thread.start()
+        address = self._server.server_address[:2]
+        LOGGER.info(f"Prometheus endpoint: http://{address[0]}:{address[1]}/metrics")
+        return address
+
+    @property
+    def server_address(self) -> Optional[tuple[str, int]]:
+        return self._server.server_address[:2] if self._server else None
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# ═══════════════════════════════════════════════════════════════
+# TEXT FORMAT RENDERING
+# ═══════════════════════════════════════════════════════════════
+
+def render_prometheus_text(metrics_data: Optional[MetricsData]) -> str:
+    """
+    Render OTel metrics data as Prometheus text exposition format 0.0.4.
+
+    Monotonic sums become counters (suffix _total), other sums and gauges
+    become gauges, histograms become _bucket/_sum/_count series.
+    """
+    lines: list[str] = []
+    seen: set[str] = set()
+    for resource_metrics in metrics_data.resource_metrics if metrics_data else []:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                _render_metric(metric, lines, seen)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _render_metric(metric, lines: list[str], seen: set[str]) -> None:
+    name = _metric_name(metric.name)
+    data = metric.data
+    if isinstance(data, Sum) and data.is_monotonic:
+        if not name.endswith("_total"):
+            name += "_total"
+        kind = "counter"
+    elif isinstance(data, (Sum, Gauge)):
+        kind = "gauge"
+    elif isinstance(data, Histogram):
+        kind = "histogram"
+    else:
+        return
+
+    if name not in seen:  # Same instrument may come from several scopes
+        seen.add(name)
+        if metric.description:
+            lines.append(f"# HELP {name} {_escape_help(metric.description)}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for point in data.data_points:
+        labels = dict(point.attributes or {})
+        if kind != "histogram":
+            lines.append(f"{name}{_labels(labels)} {_number(point.value)}")
+            continue
+        cumulative = 0
+        for bound, count in zip(point.explicit_bounds, point.bucket_counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}")
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {point.count}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(point.sum)}")
+        lines.append(f"{name}_count{_labels(labels)} {point.count}")
+
+
+def _metric_name(name: str) -> str:
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _labels(attributes: dict) -> str:
+    if not attributes:
+        return ""
+    parts = [
+        f'{_INVALID_LABEL_CHARS.sub("_", str(key))}="{_escape_label(str(value))}"'
+        for key, value in attributes.items()
+    ]
+    return "{" + ",".join(parts) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
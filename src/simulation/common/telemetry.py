@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from opentelemetry import metrics
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.metrics import Meter
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import (
-    ConsoleMetricExporter,
-    PeriodicExportingMetricReader,
-)
 from opentelemetry.sdk.resources import Resource
 
 from .config import TelemetryConfig
 
+if TYPE_CHECKING:
+    from .export_queue import QueuedMetricExporter
+    from .metric_store import InMemoryMetricStore
+    from .prometheus import PrometheusMetricReader
+
+LOGGER = logging.getLogger("telemetry")
+
 
 @dataclass
 class TelemetryManager:
@@ -24,28 +27,123 @@ class TelemetryManager:
 
     config: TelemetryConfig
     reader_interval_s: float = 10.0
+    prometheus_port: int = 9464  # Pull endpoint port (exporter_type "prometheus", 0 = any free port)
+    metrics_prefix: str = "bogdanka"  # Prefix of the exporter's own health metrics
     _meter_provider: Optional[MeterProvider] = None
+    _export_queue: Optional[QueuedMetricExporter] = None
+    _prometheus_reader: Optional[PrometheusMetricReader] = None
+    _metric_store: Optional[InMemoryMetricStore] = None
 
     def __post_init__(self) -> None:
         resource = Resource.create(attributes=dict(self.config.resource_attributes))
+        reader = self._build_reader()
+        self._meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
+        metrics.set_meter_provider(self._meter_provider)
+        if self._export_queue is not None:
+            self._register_export_metrics()
+        if self._prometheus_reader is not None:
+            self._prometheus_reader.start_server(self.config.prometheus_host, self.prometheus_port)
+
+    def _build_reader(self):
+        # Reader/exporter modules are imported only for the configured exporter_type -
+        # the OTLP exporter alone pulls in protobuf and requests (~0.15s at startup)
+        if self.config.exporter_type.lower() == "prometheus":
+            from .prometheus import PrometheusMetricReader
+
+            # Pull: collected only when /metrics is scraped, no background export thread
+            self._prometheus_reader = PrometheusMetricReader()
+            return self._prometheus_reader
+        if self.config.exporter_type.lower() == "memory":
+            from .metric_store import InMemoryMetricStore
+
+            # No export at all: values are sampled into an in-memory store (tests, fast-forward)
+            self._metric_store = InMemoryMetricStore(max_samples=self.config.memory_max_samples)
+            return self._metric_store
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
         exporter = self._build_exporter()
-        reader = PeriodicExportingMetricReader(
+        queue_config = self.config.export_queue
+        if queue_config.enabled:
+            from .export_queue import QueuedMetricExporter
+
+            # Export I/O, retries and timeouts happen on a dedicated worker behind a bounded queue
+            exporter = self._export_queue = QueuedMetricExporter(
+                exporter,
+                max_batches=queue_config.max_batches,
+                drop_policy=queue_config.drop_policy,
+                failure_threshold=queue_config.failure_threshold,
+                cooldown_s=queue_config.cooldown_s,
+                late_after_s=self.reader_interval_s,
+            )
+        return PeriodicExportingMetricReader(
             exporter=exporter, export_interval_millis=int(self.reader_interval_s * 1000)
         )
-        self._meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
-        metrics.set_meter_provider(self._meter_provider)
 
     def _build_exporter(self):
         exporter_type = self.config.exporter_type.lower()
         if exporter_type == "otlp":
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+
             return OTLPMetricExporter(
                 endpoint=self.config.endpoints.get("metrics"),
                 headers=dict(self.config.headers),
+                timeout=self.config.export_timeout_s,
             )
         if exporter_type == "console":
+            from opentelemetry.sdk.metrics.export import ConsoleMetricExporter
+
             return ConsoleMetricExporter()
         raise ValueError(f"Unsupported telemetry exporter_type: {self.config.exporter_type}")
 
+    def _register_export_metrics(self) -> None:
+        """Observable counters of the export queue (reported with the next exported batch)."""
+        meter = self.meter("bogdanka.telemetry")
+        dimensions = dict(self.config.default_dimensions)
+        reason_attrs = {
+            reason: {**dimensions, "reason": reason} for reason in self._export_queue.dropped_batches
+        }
+
+        def observe_dropped(options: CallbackOptions):
+            for reason, count in self._export_queue.dropped_batches.items():
+                yield Observation(count, reason_attrs[reason])
+
+        def observe_late(options: CallbackOptions):
+            yield Observation(self._export_queue.late_batches, dimensions)
+
+        def observe_failed(options: CallbackOptions):
+            yield Observation(self._export_queue.failed_batches, dimensions)
+
+        meter.create_observable_counter(
+            f"{self.metrics_prefix}.telemetry.dropped_batches",
+            callbacks=[observe_dropped],
+            description="Metric export batches dropped (queue_full, circuit_open, shutdown)",
+        )
+        meter.create_observable_counter(
+            f"{self.metrics_prefix}.telemetry.late_batches",
+            callbacks=[observe_late],
+            description="Metric export batches delivered later than one export interval",
+        )
+        meter.create_observable_counter(
+            f"{self.metrics_prefix}.telemetry.failed_batches",
+            callbacks=[observe_failed],
+            description="Metric export attempts that failed",
+        )
+
+    @property
+    def export_stats(self) -> Optional[dict[str, int]]:
+        """Export queue counters, None when exporting without a queue."""
+        return self._export_queue.stats() if self._export_queue else None
+
+    @property
+    def prometheus_address(self) -> Optional[tuple[str, int]]:
+        """Bound (host, port) of the pull endpoint, None for push exporters."""
+        return self._prometheus_reader.server_address if self._prometheus_reader else None
+
+    @property
+    def metric_store(self) -> Optional[InMemoryMetricStore]:
+        """Queryable sampled values (exporter_type "memory"), None for other exporters."""
+        return self._metric_store
+
     def meter(self, instrumentation_name: str) -> Meter:
         if not self._meter_provider:
             raise RuntimeError("TelemetryManager not initialized")
@@ -54,5 +152,8 @@ class TelemetryManager:
     def shutdown(self) -> None:
         if self._meter_provider:
             self._meter_provider.shutdown()
+        stats = self.export_stats
+        if stats and (stats["failed_batches"] or any(v for k, v in stats.items() if k.startswith("dropped_"))):
+            LOGGER.warning(f"Metric export: {stats}")
 
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Protocol
+from typing import Callable, Protocol
 
 
 class Clock(Protocol):
@@ -17,12 +17,13 @@ class Clock(Protocol):
 class AcceleratedClock:
     """Maps real time to accelerated simulation time."""
 
-    def __init__(self, acceleration: float = 1.0) -> None:
+    def __init__(self, acceleration: float = 1.0, start_sim: float = 0.0) -> None:
         if acceleration <= 0:
             raise ValueError("Acceleration must be positive")
         self._acceleration = acceleration
         self._start_real = time.time()
-        self._start_sim = 0.0
+        self._initial_sim = start_sim  # Non-zero when resuming from a checkpoint
+        self._start_sim = start_sim
 
     @property
     def acceleration(self) -> float:
@@ -39,6 +40,80 @@ class AcceleratedClock:
 
     def reset(self) -> None:
         self._start_real = time.time()
-        self._start_sim = 0.0
+        self._start_sim = self._initial_sim
 
 
+class DeadlinePacer:
+    """
+    Paces a periodic loop against absolute deadlines.
+
+    Deadline k is start + k * interval_s, so sleeping never accumulates drift
+    (a late iteration does not push back the following ones). When an
+    iteration overruns, wait() returns immediately until the loop is back on
+    schedule - the caller catches up with back-to-back iterations. If the lag
+    exceeds max_lag_intervals, the schedule is re-anchored at the current time
+    instead of trying to replay an unbounded backlog.
+    """
+
+    def __init__(
+        self,
+        interval_s: float,
+        max_lag_intervals: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if interval_s <= 0:
+            raise ValueError("Interval must be positive")
+        self.interval_s = interval_s
+        self.max_lag_intervals = max_lag_intervals
+        self._clock = clock
+        self._sleep = sleep
+        self._next_deadline: float | None = None
+
+        # Statistics
+        self.iterations = 0
+        self.missed_deadlines = 0  # Iterations that finished after their deadline
+        self.resyncs = 0  # Times the schedule was re-anchored (lag too large)
+        self.current_lag_s = 0.0
+        self.max_lag_s = 0.0
+
+    @property
+    def behind(self) -> bool:
+        """True while the loop is running late and catching up."""
+        return self.current_lag_s > 0.0
+
+    def start(self) -> None:
+        """Anchor deadlines at the current time."""
+        self._next_deadline = self._clock() + self.interval_s
+
+    def wait(self) -> float:
+        """
+        Sleep until the next deadline (no sleep when late).
+
+        Returns:
+            Lag behind the deadline in seconds (0.0 when on time)
+        """
+        if self._next_deadline is None:
+            self.start()
+        assert self._next_deadline is not None
+
+        self.iterations += 1
+        now = self._clock()
+        lag = now - self._next_deadline
+
+        if lag <= 0:
+            self._sleep(-lag)
+            self.current_lag_s = 0.0
+            self._next_deadline += self.interval_s
+            return 0.0
+
+        self.missed_deadlines += 1
+        self.current_lag_s = lag
+        self.max_lag_s = max(self.max_lag_s, lag)
+        if lag > self.max_lag_intervals * self.interval_s:
+            # Too far behind to catch up - drop the backlog
+            self.resyncs += 1
+            self._next_deadline = now + self.interval_s
+        else:
+            self._next_deadline += self.interval_s
+        return lag
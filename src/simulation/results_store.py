@@ -0,0 +1,396 @@
+"""
+Local SQLite warehouse of test suite results.
+
+Every test_results_<timestamp>.yaml written by run_test_scenarios.py becomes
+one row in `runs`; its profiles, their numeric metrics and their validations
+go to indexed child tables, so history queries ("heater_balance_c2 for
+TEST_S6 over the last 50 runs") never re-read the YAML files. Each run keeps
+its run mode (--days, --acceleration, --fast-forward, --early-stop); trends
+and regressions only compare runs of the same mode.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+RESULTS_GLOB = "test_results_*.yaml"
+RESULTS_DB_NAME = "results.db"  # Next to the results files
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,        -- results file name (ingestion key)
+    timestamp TEXT NOT NULL,            -- ISO 8601, sorts chronologically
+    total_tests INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    duration_override INTEGER,          -- --days (NULL = profile durations)
+    acceleration_override REAL,         -- --acceleration (NULL = profile accelerations)
+    fast_forward INTEGER NOT NULL DEFAULT 0,
+    early_stop INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    profile_id TEXT NOT NULL,
+    profile_name TEXT NOT NULL,
+    priority TEXT,
+    status TEXT NOT NULL,               -- PASSED / FAILED / ERROR
+    duration_s REAL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    profile_row INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,                 -- dotted path in actual_metrics, or a validated metric
+    value REAL NOT NULL,
+    PRIMARY KEY (profile_row, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS validations (
+    profile_row INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    metric TEXT NOT NULL,
+    expected TEXT,                      -- JSON
+    actual TEXT,                        -- JSON
+    passed INTEGER NOT NULL,
+    message TEXT,
+    PRIMARY KEY (profile_row, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS profiles_name_run ON profiles(profile_name, run_id);
+CREATE INDEX IF NOT EXISTS profiles_id_run ON profiles(profile_id, run_id);
+CREATE INDEX IF NOT EXISTS metrics_name ON metrics(name, profile_row);
+"""
+
+# Run mode columns added after the first schema version (ALTER TABLE on older databases)
+_MODE_COLUMNS = {
+    "duration_override": "INTEGER",
+    "acceleration_override": "REAL",
+    "fast_forward": "INTEGER NOT NULL DEFAULT 0",
+    "early_stop": "INTEGER NOT NULL DEFAULT 0",
+}
+_MODE_FILTER = (
+    "r.duration_override IS ? AND r.acceleration_override IS ? AND r.fast_forward = ? AND r.early_stop = ?"
+)
+
+
+@dataclass(frozen=True)
+class RunMode:
+    """How a suite run was started - results are only comparable within one mode."""
+
+    duration_override: int | None = None
+    acceleration_override: float | None = None
+    fast_forward: bool = False
+    early_stop: bool = False
+
+    @classmethod
+    def from_results(cls, data: Mapping[str, Any]) -> "RunMode":
+        """Mode of a results mapping (files written before run_mode existed count as the default mode)."""
+        mode = data.get("run_mode") or {}
+        duration = mode.get("duration_override")
+        acceleration = mode.get("acceleration_override")
+        return cls(
+            duration_override=int(duration) if duration is not None else None,
+            acceleration_override=float(acceleration) if acceleration is not None else None,
+            fast_forward=bool(mode.get("fast_forward", False)),
+            early_stop=bool(mode.get("early_stop", False)),
+        )
+
+    def params(self) -> tuple:
+        """Query parameters for _MODE_FILTER."""
+        return (self.duration_override, self.acceleration_override, int(self.fast_forward), int(self.early_stop))
+
+    def describe(self) -> str:
+        """Command-line style summary ("default" for full-length real-time runs)."""
+        parts = []
+        if self.duration_override is not None:
+            parts.append(f"--days {self.duration_override}")
+        if self.acceleration_override is not None:
+            parts.append(f"--acceleration {self.acceleration_override:g}")
+        if self.fast_forward:
+            parts.append("--fast-forward")
+        if self.early_stop:
+            parts.append("--early-stop")
+        return " ".join(parts) or "default"
+
+
+@dataclass
+class MetricPoint:
+    """One value of a metric in one run."""
+
+    run_id: int
+    timestamp: str
+    value: float
+    status: str
+
+
+@dataclass
+class Regression:
+    """A profile or validated metric that passed in the previous run and not in the latest."""
+
+    profile_name: str
+    metric: str | None  # None - whole profile status changed
+    previous: str
+    latest: str
+    message: str = ""
+    mode: RunMode = RunMode()  # Mode of both compared runs
+
+
+def flatten_metrics(metrics: Mapping[str, Any], prefix: str = "") -> Iterator[tuple[str, float]]:
+    """
+    Numeric leaves of actual_metrics as (dotted name, value).
+
+    Strings and lists are skipped; booleans count as 0/1.
+    """
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            yield from flatten_metrics(value, f"{name}.")
+        elif isinstance(value, (int, float)):
+            yield name, float(value)
+
+
+def _iso(timestamp: Any) -> str:
+    """ISO 8601 text (YAML may already have parsed the timestamp into a datetime)."""
+    return timestamp.isoformat() if hasattr(timestamp, "isoformat") else str(timestamp)
+
+
+class ResultsStore:
+    """Indexed history of test suite runs (stdlib sqlite3, one local file)."""
+
+    def __init__(self, path: Path | str):
+        """
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(SCHEMA)
+        existing = {row[1] for row in self._db.execute("PRAGMA table_info(runs)")}
+        with self._db:
+            for column, declaration in _MODE_COLUMNS.items():
+                if column not in existing:
+                    self._db.execute(f"ALTER TABLE runs ADD COLUMN {column} {declaration}")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ═══════════════════════════════════════════════════════════════════
+    # Ingestion
+    # ═══════════════════════════════════════════════════════════════════
+
+    def has_run(self, source: str) -> bool:
+        return self._db.execute("SELECT 1 FROM runs WHERE source = ?", (source,)).fetchone() is not None
+
+    def ingest_results(self, data: Mapping[str, Any], source: str) -> int | None:
+        """
+        Store one suite run (the mapping save_results() writes as YAML).
+
+        Args:
+            data: Results with timestamp, counters, run_mode and per-profile results
+            source: Unique name of the run, normally the results file name
+
+        Returns:
+            Run id, or None if source was ingested before
+        """
+        if self.has_run(source):
+            return None
+        with self._db:  # One transaction per run
+            cursor = self._db.execute(
+                "INSERT INTO runs (source, timestamp, total_tests, passed, failed, errors, "
+                "duration_override, acceleration_override, fast_forward, early_stop) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source,
+                    _iso(data["timestamp"]),
+                    int(data.get("total_tests", len(data.get("results", [])))),
+                    int(data.get("passed", 0)),
+                    int(data.get("failed", 0)),
+                    int(data.get("errors", 0)),
+                    *RunMode.from_results(data).params(),
+                ),
+            )
+            run_id = cursor.lastrowid
+            for result in data.get("results", []):
+                self._insert_profile(run_id, result)
+        return run_id
+
+    def _insert_profile(self, run_id: int, result: Mapping[str, Any]) -> None:
+        cursor = self._db.execute(
+            "INSERT INTO profiles (run_id, profile_id, profile_name, priority, status, duration_s, cached, error_message) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                result["profile_id"],
+                result["profile_name"],
+                result.get("priority"),
+                result["status"],
+                result.get("duration_s"),
+                int(bool(result.get("cached", False))),
+                result.get("error_message"),
+            ),
+        )
+        profile_row = cursor.lastrowid
+        metrics = dict(flatten_metrics(result.get("actual_metrics") or {}))
+        validations = result.get("validation_results") or []
+        for validation in validations:
+            # Derived metrics (heater balance, ...) exist only in the validations
+            actual = validation.get("actual")
+            if isinstance(actual, (int, float)) and validation["metric"] not in metrics:
+                metrics[validation["metric"]] = float(actual)
+        self._db.executemany(
+            "INSERT INTO metrics (profile_row, name, value) VALUES (?, ?, ?)",
+            [(profile_row, name, value) for name, value in metrics.items()],
+        )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO validations (profile_row, metric, expected, actual, passed, message) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    profile_row,
+                    v["metric"],
+                    json.dumps(v.get("expected"), default=str),
+                    json.dumps(v.get("actual"), default=str),
+                    int(bool(v.get("passed"))),
+                    v.get("message"),
+                )
+                for v in validations
+            ],
+        )
+
+    def ingest_directory(self, directory: Path) -> list[int]:
+        """
+        Ingest results files not seen before (file name is the key - only new files are parsed).
+
+        Returns:
+            Ids of the newly stored runs
+        """
+        import yaml  # Parsing is only needed for files not yet in the store
+
+        run_ids = []
+        for path in sorted(Path(directory).glob(RESULTS_GLOB)):
+            if path.stem.endswith("_report") or self.has_run(path.name):
+                continue
+            with path.open("r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+            if not isinstance(data, Mapping) or "results" not in data:
+                continue
+            run_id = self.ingest_results(data, path.name)
+            if run_id is not None:
+                run_ids.append(run_id)
+        return run_ids
+
+    # ═══════════════════════════════════════════════════════════════════
+    # Queries
+    # ═══════════════════════════════════════════════════════════════════
+
+    def run_count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def profile_names(self) -> list[str]:
+        """Profiles with at least one stored result, alphabetically."""
+        rows = self._db.execute("SELECT DISTINCT profile_name FROM profiles ORDER BY profile_name")
+        return [name for (name,) in rows]
+
+    def latest_mode(self, profile: str) -> RunMode | None:
+        """Run mode of the profile's most recent run (None if it was never stored)."""
+        row = self._db.execute(
+            "SELECT r.duration_override, r.acceleration_override, r.fast_forward, r.early_stop "
+            "FROM profiles p JOIN runs r ON r.id = p.run_id WHERE p.profile_name = ? OR p.profile_id = ? "
+            "ORDER BY r.timestamp DESC, r.id DESC LIMIT 1",
+            (profile, profile),
+        ).fetchone()
+        if row is None:
+            return None
+        duration, acceleration, fast_forward, early_stop = row
+        return RunMode(duration, acceleration, bool(fast_forward), bool(early_stop))
+
+    def metric_history(
+        self, profile: str, metric: str, last: int = 50, mode: RunMode | None = None
+    ) -> list[MetricPoint]:
+        """
+        Values of one metric for one profile over the latest runs of one mode, oldest first.
+
+        Args:
+            profile: Profile name or id (e.g. "TEST_S6" or "profile_s6")
+            metric: Dotted metric name (e.g. "heater_balance_c2", "heater_operating_times.N1.operating_h")
+            last: Number of most recent runs containing the metric
+            mode: Run mode to include (default: mode of the profile's latest run)
+        """
+        mode = mode or self.latest_mode(profile)
+        if mode is None:
+            return []
+        rows = self._db.execute(
+            "SELECT r.id, r.timestamp, m.value, p.status FROM metrics m "
+            "JOIN profiles p ON p.id = m.profile_row JOIN runs r ON r.id = p.run_id "
+            f"WHERE m.name = ? AND (p.profile_name = ? OR p.profile_id = ?) AND {_MODE_FILTER} "
+            "ORDER BY r.timestamp DESC, r.id DESC LIMIT ?",
+            (metric, profile, profile, *mode.params(), last),
+        ).fetchall()
+        return [MetricPoint(*row) for row in reversed(rows)]
+
+    def status_history(self, profile: str, last: int = 50, mode: RunMode | None = None) -> list[tuple[str, str]]:
+        """(timestamp, status) of one profile over the latest runs of one mode (default: latest), oldest first."""
+        mode = mode or self.latest_mode(profile)
+        if mode is None:
+            return []
+        rows = self._db.execute(
+            "SELECT r.timestamp, p.status FROM profiles p JOIN runs r ON r.id = p.run_id "
+            f"WHERE (p.profile_name = ? OR p.profile_id = ?) AND {_MODE_FILTER} "
+            "ORDER BY r.timestamp DESC, r.id DESC LIMIT ?",
+            (profile, profile, *mode.params(), last),
+        ).fetchall()
+        return list(reversed(rows))
+
+    def validated_metrics(self, profile: str) -> list[str]:
+        """Metrics validated for the profile in any stored run."""
+        rows = self._db.execute(
+            "SELECT DISTINCT v.metric FROM validations v JOIN profiles p ON p.id = v.profile_row "
+            "WHERE p.profile_name = ? OR p.profile_id = ? ORDER BY v.metric",
+            (profile, profile),
+        )
+        return [metric for (metric,) in rows]
+
+    def regressions(self) -> list[Regression]:
+        """
+        Profiles and validations that passed in their previous run but not in their latest.
+
+        Each profile's latest run is compared with its previous run of the same
+        mode, so partial suites (--profiles) are compared with the last run that
+        included them and --smoke/--days/--early-stop runs only with each other.
+        """
+        regressions = []
+        for profile in self.profile_names():
+            mode = self.latest_mode(profile)
+            rows = self._db.execute(
+                "SELECT p.id, p.status FROM profiles p JOIN runs r ON r.id = p.run_id "
+                f"WHERE p.profile_name = ? AND {_MODE_FILTER} ORDER BY r.timestamp DESC, r.id DESC LIMIT 2",
+                (profile, *mode.params()),
+            ).fetchall()
+            if len(rows) < 2:
+                continue
+            (latest_row, latest_status), (previous_row, previous_status) = rows
+            if previous_status == "PASSED" and latest_status != "PASSED":
+                regressions.append(Regression(profile, None, previous_status, latest_status, mode=mode))
+            flipped = self._db.execute(
+                "SELECT l.metric, l.message FROM validations l JOIN validations p "
+                "ON p.metric = l.metric AND p.profile_row = ? "
+                "WHERE l.profile_row = ? AND p.passed = 1 AND l.passed = 0 ORDER BY l.metric",
+                (previous_row, latest_row),
+            )
+            for metric, message in flipped:
+                regressions.append(Regression(profile, metric, "passed", "failed", message or "", mode))
+        return regressions
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Property-based scenario generation and invariant checking at scale.
+
+Generates random but valid weather profiles (stepped and smooth_step, in the
+test_profiles.yaml format), runs each one in-process through the fast-forward
+path and checks the controller invariants (algo/invariants.py) after every
+WS tick. A share of the profiles are adversarial: short steps oscillating
+around the WS hysteresis boundaries, where scenarios, configurations and
+heater sets change most often.
+
+A failing profile is shrunk to a minimal reproduction (shorter run, fewer
+steps, rounder temperatures, stepped instead of smooth_step) and written to
+scenarios/test_results/property_failures_<timestamp>.yaml - ready to be
+pasted into test_profiles.yaml as a regression profile.
+
+Usage:
+    uv run python run_property_scenarios.py --count 200 --parallel 8
+    uv run python run_property_scenarios.py --count 50 --seed 7 --max-days 3
+"""
+import argparse
+import functools
+import logging
+import math
+import multiprocessing
+import random
+import sys
+import time
+import yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from algo.invariants import InvariantChecker, Violation
+from algo_service import AlgoService
+from common.config import build_config, read_config_data
+from weather_service import build_weather_source
+
+LOGGER = logging.getLogger("property-suite")
+LOGGER.setLevel(logging.INFO)
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s"))
+LOGGER.addHandler(_handler)
+
+# Step boundaries lie on this grid, so contiguous steps compare exactly
+GRID_DAYS = 1 / 48  # 30 min
+TEMPERATURE_RANGE_C = (-25.0, 6.0)
+
+# AlgorithmWS switching temperatures - (enter colder scenario, return to warmer one)
+HYSTERESIS_BOUNDARIES = {
+    "S0/S1": (2.0, 3.0),
+    "S1/S2": (-1.0, 0.0),
+    "S2/S3": (-4.0, -3.0),
+    "S3/S4": (-8.0, -6.0),
+    "S4/S5": (-11.0, -10.0),
+    "S5/S6": (-15.0, -13.0),
+    "S6/S7": (-18.0, -15.0),
+    "S7/S8": (-21.0, -20.0),
+}
+
+SHRINK_BUDGET_RUNS = 200  # Simulations allowed per failing profile while shrinking
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Generation
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _day(grid_units: int) -> float:
+    return round(grid_units * GRID_DAYS, 6)
+
+
+def _steps_from_units(units: list[tuple[int, float]]) -> list[dict[str, float]]:
+    """(length in grid units, temperature) pairs → contiguous steps from day 0."""
+    steps, start = [], 0
+    for length, temperature in units:
+        steps.append({"day_start": _day(start), "day_end": _day(start + length), "temperature_c": temperature})
+        start += length
+    return steps
+
+
+def generate_profile(rng: random.Random, index: int, max_days: int = 2) -> dict[str, Any]:
+    """
+    One random profile in test_profiles.yaml format.
+
+    Random profiles draw step lengths (30 min - 1 day) and temperatures
+    uniformly; adversarial ones alternate just below / just above one or two
+    hysteresis boundaries in short steps.
+
+    Args:
+        rng: Source of randomness (seeded by the caller - runs are reproducible)
+        index: Sequence number, used in the profile id
+        max_days: Upper bound of duration_days
+
+    Returns:
+        Profile dict with id, name, duration_days, profile_type and steps
+    """
+    duration_days = rng.randint(1, max_days)
+    total_units = round(duration_days / GRID_DAYS)
+    adversarial = rng.random() < 0.5
+    boundaries = rng.sample(sorted(HYSTERESIS_BOUNDARIES), k=rng.randint(1, 2))
+
+    units: list[tuple[int, float]] = []
+    used = 0
+    while used < total_units:
+        if adversarial:
+            length = min(rng.choice([1, 1, 2, 3, 6]), total_units - used)
+            enter_c, exit_c = HYSTERESIS_BOUNDARIES[rng.choice(boundaries)]
+            # Alternate sides, sometimes stopping inside the hysteresis band
+            side = len(units) % 2
+            temperature = (enter_c - rng.uniform(0.1, 1.0)) if side == 0 else rng.choice(
+                [exit_c + rng.uniform(0.0, 1.0), rng.uniform(enter_c, exit_c)]
+            )
+        else:
+            length = min(rng.choice([1, 2, 4, 8, 12, 24, 48]), total_units - used)
+            temperature = rng.uniform(*TEMPERATURE_RANGE_C)
+        units.append((length, round(temperature, 1)))
+        used += length
+
+    kind = "adversarial" if adversarial else "random"
+    return {
+        "id": f"property_{index:05d}",
+        "name": f"PROPERTY_{index:05d}",
+        "priority": "LOW",
+        "description": f"{kind} ({', '.join(boundaries) if adversarial else 'uniform'})",
+        "duration_days": duration_days,
+        "profile_type": rng.choice(["stepped", "smooth_step"]),
+        "steps": _steps_from_units(units),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Checking
+# ═══════════════════════════════════════════════════════════════════════════
+
+def profile_overrides(profile: dict[str, Any], log_file: str = "logs/property_scenarios.log") -> dict[str, Any]:
+    """Config overrides running the profile quietly in fast-forward."""
+    return {
+        "simulation.duration_days": profile["duration_days"],
+        "telemetry.exporter_type": "memory",
+        "telemetry.log_level": "WARNING",
+        "telemetry.log_output": "file",
+        "telemetry.log_file": log_file,
+        "telemetry.log_queue": False,
+        "services.algo.display.enabled": False,
+        "services.algo.checkpoint.enabled": False,
+        "services.weather.profile_type": profile["profile_type"],
+        "services.weather.stepped_profile": {"steps": profile["steps"]},
+    }
+
+
+def check_profile(profile: dict[str, Any], config_data: dict[str, Any]) -> Optional[Violation]:
+    """
+    Simulate the profile tick by tick and check the invariants after each WS cycle.
+
+    Steady-state extrapolation is not used - every tick is checked.
+
+    Args:
+        profile: Profile in test_profiles.yaml format
+        config_data: Parsed config.yaml
+
+    Returns:
+        First violation, or None when all invariants held for the whole run
+        (an exception in the controller is reported as an "exception" violation)
+    """
+    service = AlgoService(build_config(config_data, profile_overrides(profile)), fast_forward=True)
+    weather_source = build_weather_source(service.config)
+    algorithms = service.config.services.algo.algorithms
+    checker = InvariantChecker(
+        service.state,
+        service.algorithm_rn,
+        settle_s=max(algorithms.rc.algorithm_loop_cycle_s, algorithms.rn.algorithm_loop_cycle_s),
+    )
+    step_s = algorithms.ws.temp_monitoring_cycle_s
+    duration_s = service.config.simulation.duration_seconds
+
+    sim_time = 0.0
+    try:
+        while True:
+            service.process_snapshot(weather_source(sim_time))
+            violations = checker.check()
+            if violations:
+                return violations[0]
+            if sim_time >= duration_s:
+                return None
+            sim_time = min(sim_time + step_s, duration_s)
+    except Exception as exc:
+        return Violation("exception", sim_time, service.state.current_scenario.name,
+                         service.state.current_config, f"{type(exc).__name__}: {exc}")
+    finally:
+        service.shutdown()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Shrinking
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _with_steps(profile: dict[str, Any], steps: list[dict[str, float]], **changes: Any) -> dict[str, Any]:
+    return {**profile, **changes, "steps": steps}
+
+
+def _truncated(profile: dict[str, Any], end_day: float) -> dict[str, Any]:
+    """Profile cut at end_day (grid-aligned), duration rounded up to whole days."""
+    steps = [dict(step) for step in profile["steps"] if step["day_start"] < end_day]
+    steps[-1]["day_end"] = end_day
+    return _with_steps(profile, steps, duration_days=max(1, math.ceil(end_day - 1e-9)))
+
+
+def _merged(profile: dict[str, Any], index: int) -> dict[str, Any]:
+    """Profile with step `index` absorbed by its left neighbour (or right one for the first step)."""
+    steps = [dict(step) for step in profile["steps"]]
+    if index > 0:
+        steps[index - 1]["day_end"] = steps[index]["day_end"]
+    else:
+        steps[1]["day_start"] = steps[0]["day_start"]
+    del steps[index]
+    return _with_steps(profile, steps)
+
+
+def _candidates(profile: dict[str, Any], violation: Violation) -> list[dict[str, Any]]:
+    """Smaller variants of a failing profile, most aggressive first."""
+    candidates = []
+    end_day = _day(math.floor(violation.sim_time / 86400 / GRID_DAYS) + 1)
+    if end_day < profile["steps"][-1]["day_end"]:
+        candidates.append(_truncated(profile, end_day))
+    if profile["profile_type"] != "stepped":
+        candidates.append({**profile, "profile_type": "stepped"})
+    for index in reversed(range(len(profile["steps"]))):
+        if len(profile["steps"]) > 1:
+            candidates.append(_merged(profile, index))
+    for index, step in enumerate(profile["steps"]):
+        for rounded in (float(round(step["temperature_c"])), round(step["temperature_c"] * 2) / 2):
+            if rounded != step["temperature_c"]:
+                steps = [dict(s) for s in profile["steps"]]
+                steps[index]["temperature_c"] = rounded
+                candidates.append(_with_steps(profile, steps))
+                break
+    return candidates
+
+
+def shrink_profile(
+    profile: dict[str, Any],
+    violation: Violation,
+    check: Callable[[dict[str, Any]], Optional[Violation]],
+    max_runs: int = SHRINK_BUDGET_RUNS,
+) -> tuple[dict[str, Any], Violation, int]:
+    """
+    Greedily reduce a failing profile while it still breaks the same invariant.
+
+    Candidates: cut the run just after the violation, smooth_step → stepped,
+    merge a step into its neighbour, round a temperature. The first candidate
+    that still fails is kept and shrinking restarts from it.
+
+    Args:
+        profile: Failing profile
+        violation: Its violation (only the same invariant counts as still failing)
+        check: Runs a profile, returns its first violation or None
+        max_runs: Budget of check() calls
+
+    Returns:
+        (minimal profile, its violation, check() calls made)
+    """
+    runs = 0
+    improved = True
+    while improved and runs < max_runs:
+        improved = False
+        for candidate in _candidates(profile, violation):
+            if runs >= max_runs:
+                break
+            runs += 1
+            result = check(candidate)
+            if result is not None and result.invariant == violation.invariant:
+                profile, violation, improved = candidate, result, True
+                break
+    return profile, violation, runs
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Suite
+# ═══════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class PropertyFailure:
+    """A generated profile that broke an invariant, with its shrunk reproduction."""
+
+    profile: dict[str, Any]
+    violation: Violation
+    minimal_profile: dict[str, Any] = field(default_factory=dict)
+    minimal_violation: Optional[Violation] = None
+    shrink_runs: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        minimal = dict(self.minimal_profile or self.profile)
+        violation = self.minimal_violation or self.violation
+        minimal["description"] = (
+            f"{violation.invariant} at day {violation.sim_day:.3f}: {violation.message}"
+        )
+        return {
+            "profile": minimal,
+            "violation": violation.to_dict(),
+            "original": {"profile": self.profile, "violation": self.violation.to_dict()},
+            "shrink_runs": self.shrink_runs,
+        }
+
+
+_WORKER_CONFIG: dict[str, Any] = {}
+
+
+def _init_property_worker(config_path: str) -> None:
+    """ProcessPoolExecutor initializer - config.yaml parsed once per worker."""
+    _WORKER_CONFIG.update(read_config_data(Path(config_path)))
+
+
+def _check_in_worker(profile: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Run one profile in a worker process; the violation comes back as plain data."""
+    violation = check_profile(profile, _WORKER_CONFIG)
+    return violation.to_dict() if violation is not None else None
+
+
+class PropertyRunner:
+    """Generates profiles, checks them in parallel and shrinks the failures."""
+
+    def __init__(
+        self,
+        config_path: Path,
+        output_dir: Path,
+        seed: int = 0,
+        max_days: int = 2,
+        parallel_workers: int = 1,
+        shrink_budget: int = SHRINK_BUDGET_RUNS,
+    ):
+        self.config_path = config_path
+        self.output_dir = output_dir
+        self.seed = seed
+        self.max_days = max_days
+        self.parallel_workers = parallel_workers
+        self.shrink_budget = shrink_budget
+        self.config_data = read_config_data(config_path)
+        self.failures: list[PropertyFailure] = []
+
+    def generate(self, count: int) -> list[dict[str, Any]]:
+        rng = random.Random(self.seed)
+        return [generate_profile(rng, index, self.max_days) for index in range(count)]
+
+    def run(self, count: int) -> list[PropertyFailure]:
+        """Check `count` generated profiles; failures are shrunk in this process."""
+        profiles = self.generate(count)
+        LOGGER.info(
+            f"Checking {count} generated profiles (seed={self.seed}, max_days={self.max_days}, "
+            f"workers={self.parallel_workers})"
+        )
+        started = time.perf_counter()
+        failed: list[tuple[dict[str, Any], Violation]] = []
+        for done, (profile, violation) in enumerate(self._check_all(profiles), start=1):
+            if violation is not None:
+                LOGGER.info(f"❌ {profile['id']}: {violation.invariant} at {violation.sim_time:.0f}s - {violation.message}")
+                failed.append((profile, violation))
+            if done % max(1, count // 10) == 0:
+                LOGGER.info(f"[{done}/{count}] checked, {len(failed)} failing ({time.perf_counter() - started:.0f}s)")
+
+        check = functools.partial(check_profile, config_data=self.config_data)
+        for profile, violation in sorted(failed, key=lambda item: item[0]["id"]):
+            minimal, minimal_violation, runs = shrink_profile(profile, violation, check, self.shrink_budget)
+            LOGGER.info(
+                f"🔎 {profile['id']}: shrunk to {len(minimal['steps'])} steps, "
+                f"{minimal['duration_days']} days ({runs} runs)"
+            )
+            self.failures.append(PropertyFailure(profile, violation, minimal, minimal_violation, runs))
+        return self.failures
+
+    def _check_all(self, profiles: list[dict[str, Any]]):
+        """Yield (profile, violation or None) as the checks complete."""
+        if self.parallel_workers <= 1:
+            for profile in profiles:
+                yield profile, check_profile(profile, self.config_data)
+            return
+        # spawn, not fork: no inherited locks or logging handlers (as in run_test_scenarios.py)
+        with ProcessPoolExecutor(
+            max_workers=self.parallel_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_property_worker,
+            initargs=(str(self.config_path),),
+        ) as executor:
+            futures = {executor.submit(_check_in_worker, profile): profile for profile in profiles}
+            for future in as_completed(futures):
+                result = future.result()
+                yield futures[future], Violation(**result) if result is not None else None
+
+    def save_failures(self) -> Path:
+        """Write the shrunk failing profiles to property_failures_<timestamp>.yaml."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"property_failures_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml"
+        data = {
+            "timestamp": datetime.now().isoformat(),
+            "seed": self.seed,
+            "max_days": self.max_days,
+            "failures": [failure.to_dict() for failure in self.failures],
+        }
+        with path.open("w", encoding="utf-8") as f:
+            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        return path
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="BOGDANKA property-based invariant checks")
+    parser.add_argument("--count", type=int, default=100, help="Number of generated profiles (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed - same seed, same profiles (default: 0)")
+    parser.add_argument("--max-days", type=int, default=2, help="Longest generated profile in days (default: 2)")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N", help="Worker processes (default: 1)")
+    parser.add_argument(
+        "--shrink-budget",
+        type=int,
+        default=SHRINK_BUDGET_RUNS,
+        metavar="RUNS",
+        help=f"Simulations per failing profile while shrinking (default: {SHRINK_BUDGET_RUNS})",
+    )
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    runner = PropertyRunner(
+        script_dir / "config.yaml",
+        script_dir / "scenarios" / "test_results",
+        seed=args.seed,
+        max_days=args.max_days,
+        parallel_workers=args.parallel,
+        shrink_budget=args.shrink_budget,
+    )
+    failures = runner.run(args.count)
+    if not failures:
+        LOGGER.info(f"✅ All invariants held for {args.count} profiles")
+        sys.exit(0)
+
+    path = runner.save_failures()
+    LOGGER.error(f"❌ {len(failures)}/{args.count} profiles broke invariants - minimal profiles in {path}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,20 +6,29 @@ Runs all 7 test profiles defined in test_profiles.yaml and generates
 a detailed report with pass/fail status for each test.
 """
 import argparse
+import hashlib
+import json
 import logging
+import math
+import multiprocessing
 import os
+import sqlite3
 import sys
 import threading
 import time
 import yaml
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from common.config import load_config
+from common.config import AppConfig, apply_overrides, build_config, read_config_data
+from algo.events import AlgoEvent, ConfigRotationStarted, EventBus, HeaterRotationStarted, ScenarioChanged
+from algo.metrics import HEATER_STATE_VALUE
+from algo.run_handle import FAILED, STOPPED, SimulationStalled
 from algo_service import AlgoService
-from weather_service import WeatherApplication
+from results_store import RESULTS_DB_NAME, ResultsStore
+from weather_service import WeatherApplication, build_weather_source
 
 # Configure logging for test-suite logger only (not root)
 test_suite_logger = logging.getLogger("test-suite")
@@ -47,6 +56,8 @@ class TestResult:
         self.expected_results: dict[str, Any] = profile["expected_results"]
         self.validation_results: list[dict[str, Any]] = []
         self.error_message: str | None = None
+        self.cached = False  # actual_metrics reused from the result cache
+        self.early_stop: dict[str, Any] | None = None  # IncrementalValidator.decision
 
     @property
     def duration_s(self) -> float:
@@ -70,8 +81,267 @@ class TestResult:
             "expected_results": self.expected_results,
             "validation_results": self.validation_results,
             "error_message": self.error_message,
+            "cached": self.cached,
+            "early_stop": self.early_stop,
         }
 
+    @classmethod
+    def from_dict(
+        cls,
+        profile: dict[str, Any],
+        data: dict[str, Any],
+        start_time: float | None,
+        end_time: float | None,
+    ) -> "TestResult":
+        """Rebuild a result sent back by a worker process (see to_dict)."""
+        result = cls(profile)
+        result.start_time = start_time
+        result.end_time = end_time
+        result.status = data["status"]
+        result.actual_metrics = data["actual_metrics"]
+        result.validation_results = data["validation_results"]
+        result.error_message = data["error_message"]
+        result.cached = data["cached"]
+        result.early_stop = data["early_stop"]
+        return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Content-addressed result cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+class ResultCache:
+    """
+    actual_metrics of earlier runs, keyed by sha256 of everything that decides them.
+
+    The key covers the profile inputs, the merged per-profile config, the run
+    mode and the source of the simulation code. Expectations are not part of
+    the key - cached metrics are validated again on every run, so editing
+    expected_results never forces a re-simulation.
+    """
+
+    # Simulation code whose source is hashed (relative to src/simulation) - includes this
+    # runner, since _collect_metrics decides the names and values of the cached metrics
+    SOURCE_PATHS = ("algo", "weather", "common", "algo_service.py", "weather_service.py", "run_test_scenarios.py")
+
+    # Profile fields that do not influence the simulation
+    PROFILE_IGNORED = ("id", "name", "description", "priority", "expected_results")
+
+    # Merged config entries that differ per run/slot but not in outcome
+    CONFIG_IGNORED = (
+        "services.weather.port",
+        "services.algo.weather_endpoint",
+        "services.algo.display",
+        "telemetry.log_file",
+        "telemetry.log_output",
+        "telemetry.log_level",
+        "telemetry.log_queue",
+    )
+
+    def __init__(self, directory: Path, source_root: Path | None = None):
+        """
+        Args:
+            directory: Cache directory (one JSON file per key)
+            source_root: Directory containing SOURCE_PATHS (default: this script's)
+        """
+        self.directory = directory
+        self.source_root = source_root or Path(__file__).parent
+        self._source_digest: str | None = None
+
+    @property
+    def source_digest(self) -> str:
+        """sha256 over the relative paths and contents of all *.py in SOURCE_PATHS."""
+        if self._source_digest is None:
+            digest = hashlib.sha256()
+            for name in self.SOURCE_PATHS:
+                path = self.source_root / name
+                if path.is_dir():
+                    files = sorted(path.rglob("*.py"))
+                else:
+                    files = [path] if path.exists() else []
+                for file in files:
+                    digest.update(file.relative_to(self.source_root).as_posix().encode())
+                    digest.update(b"\0")
+                    digest.update(file.read_bytes())
+                    digest.update(b"\0")
+            self._source_digest = digest.hexdigest()
+        return self._source_digest
+
+    def key(self, profile: dict[str, Any], config_data: dict[str, Any], fast_forward: bool) -> str:
+        """
+        Cache key for one profile run.
+
+        Args:
+            profile: Test profile (as in test_profiles.yaml)
+            config_data: Merged config dict the simulation runs with
+            fast_forward: Run mode (in-process vs real-time HTTP)
+
+        Returns:
+            Hex sha256
+        """
+        config = json.loads(json.dumps(config_data, default=str))  # Deep copy
+        for dotted in self.CONFIG_IGNORED:
+            section = config
+            *parents, name = dotted.split(".")
+            for parent in parents:
+                section = section.get(parent) or {}
+            section.pop(name, None)
+        material = {
+            "profile": {k: v for k, v in profile.items() if k not in self.PROFILE_IGNORED},
+            "config": config,
+            "fast_forward": fast_forward,
+            "source": self.source_digest,
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Cached actual_metrics for key, or None on miss (or unreadable entry)."""
+        try:
+            with self._path(key).open("r", encoding="utf-8") as f:
+                return json.load(f)["actual_metrics"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def contains(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def store(self, key: str, profile: dict[str, Any], actual_metrics: dict[str, Any]) -> None:
+        """Write an entry atomically (parallel workers may store concurrently)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "profile_id": profile["id"],
+            "created": datetime.now().isoformat(),
+            "actual_metrics": actual_metrics,
+        }
+        temp_path = self.directory / f".{key}.{os.getpid()}.tmp"
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2, default=str)
+        os.replace(temp_path, self._path(key))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Incremental validation (early stop)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _always(event: AlgoEvent) -> bool:
+    return True
+
+
+def _structural(event: ScenarioChanged) -> bool:
+    return event.structural
+
+
+def scaled_max(bound_max: float, duration_scale: float) -> float:
+    """
+    Counter max bound for a run duration_scale times longer than the profile duration.
+
+    Counter bounds are absolute counts sized for the profile's duration_days, so
+    they only grow with longer runs (--days) - shorter runs keep the bound.
+    """
+    return math.ceil(bound_max * duration_scale) if duration_scale > 1.0 else bound_max
+
+
+class IncrementalValidator:
+    """
+    Decides monotone expectations from algorithm events while the simulation runs.
+
+    Counters (scenario changes, RC/RN rotations) never decrease, so a count
+    above "max" fails the profile for good and a count that reached "min"
+    stays satisfied. As soon as the overall verdict cannot change any more
+    (one bound failed, or every expectation is a satisfied minimum) the
+    on_decided callback given to attach() is called - the runner uses it to
+    stop the simulation.
+    """
+
+    # Expectation key -> (event that increments the counter, filter)
+    COUNTERS: dict[str, tuple[type[AlgoEvent], Callable[[Any], bool]]] = {
+        "scenario_changes": (ScenarioChanged, _always),
+        "structural_changes": (ScenarioChanged, _structural),
+        "rc_rotations": (ConfigRotationStarted, _always),
+        "rc_line_changes": (ConfigRotationStarted, _always),
+        "rn_rotations": (HeaterRotationStarted, _always),
+        "rn_rotations_total": (HeaterRotationStarted, _always),
+        "rn_heater_rotations": (HeaterRotationStarted, _always),
+    }
+
+    def __init__(self, expected: dict[str, Any], duration_scale: float = 1.0):
+        """
+        Args:
+            expected: Profile expected_results
+            duration_scale: Run duration / profile duration_days (scales max bounds, see scaled_max)
+        """
+        self.bounds: dict[str, dict[str, float]] = {}
+        for key, spec in expected.items():
+            if key not in self.COUNTERS:
+                continue
+            if isinstance(spec, dict) and ("min" in spec or "max" in spec):
+                self.bounds[key] = {k: spec[k] for k in ("min", "max") if k in spec}
+                if "max" in spec:
+                    self.bounds[key]["max"] = scaled_max(spec["max"], duration_scale)
+            elif isinstance(spec, (int, float)) and not isinstance(spec, bool):
+                self.bounds[key] = {"min": spec, "max": spec}  # Exact count
+        self.counts = dict.fromkeys(self.bounds, 0)
+        self._satisfied: set[str] = set()
+        # A pass is only final if nothing can still fail: all expectations are counter minimums
+        self._pass_decidable = len(self.bounds) == len(expected) and all(
+            "max" not in bound for bound in self.bounds.values()
+        )
+        self._on_decided: Callable[[dict[str, Any]], None] | None = None
+        # {"verdict", "metric", "actual", "bound", "sim_time_s", "message"} once decided
+        self.decision: dict[str, Any] | None = None
+
+    @property
+    def active(self) -> bool:
+        """False if no expectation can be decided early (nothing to watch)."""
+        return bool(self.bounds)
+
+    def attach(self, bus: EventBus, on_decided: Callable[[dict[str, Any]], None] | None = None) -> None:
+        """
+        Subscribe (synchronously, so the stop lands on the deciding tick).
+
+        Args:
+            bus: Event bus of the running algo service
+            on_decided: Called once with the decision (see decision)
+        """
+        self._on_decided = on_decided
+        for event_type in {self.COUNTERS[key][0] for key in self.bounds}:
+            bus.subscribe(event_type, self._on_event)
+
+    def _on_event(self, event: AlgoEvent) -> None:
+        if self.decision is not None:
+            return
+        reached = None  # Key whose minimum this event met
+        for key, bound in self.bounds.items():
+            event_type, counts = self.COUNTERS[key]
+            if not isinstance(event, event_type) or not counts(event):
+                continue
+            self.counts[key] += 1
+            count = self.counts[key]
+            if "max" in bound and count > bound["max"]:
+                self._decide("FAILED", key, bound, event.sim_time, f"Above max: {count} > {bound['max']}")
+                return
+            if "min" in bound and count >= bound["min"] and key not in self._satisfied:
+                self._satisfied.add(key)
+                reached = key
+        if reached is not None and self._pass_decidable and len(self._satisfied) == len(self.bounds):
+            self._decide("PASSED", reached, self.bounds[reached], event.sim_time, "All minimum counts reached")
+
+    def _decide(self, verdict: str, key: str, bound: dict[str, float], sim_time: float, message: str) -> None:
+        self.decision = {
+            "verdict": verdict,
+            "metric": key,
+            "actual": self.counts[key],
+            "bound": bound,
+            "sim_time_s": sim_time,
+            "message": message,
+        }
+        if self._on_decided is not None:
+            self._on_decided(self.decision)
+
 
 class TestRunner:
     """Runs test profiles and validates results."""
@@ -85,6 +355,13 @@ class TestRunner:
         acceleration_override: float | None = None,
         profile_filter: list[str] | None = None,
         parallel_workers: int = 1,
+        fast_forward: bool = False,
+        isolation: str = "process",
+        max_tasks_per_child: int | None = 4,
+        use_cache: bool = True,
+        force_rerun: bool = False,
+        early_stop: bool = False,
+        stall_timeout_s: float = 60.0,
     ):
         self.profiles_path = profiles_path
         self.config_path = config_path
@@ -94,6 +371,19 @@ class TestRunner:
         self.acceleration_override = acceleration_override
         self.profile_filter = profile_filter
         self.parallel_workers = parallel_workers
+        self.fast_forward = fast_forward
+        # Parallel runs: "process" = one interpreter per worker, "thread" = shared process
+        self.isolation = isolation
+        self.max_tasks_per_child = max_tasks_per_child
+        # Result cache: reuse actual_metrics when profile, config and code are unchanged
+        self.cache = ResultCache(output_dir / "cache") if use_cache else None
+        self.force_rerun = force_rerun
+        # Stop a simulation as soon as its monotone expectations fix the verdict
+        self.early_stop = early_stop
+        # Real seconds without simulation time progress before a run counts as stalled
+        self.stall_timeout_s = stall_timeout_s
+        # config.yaml parsed once - every profile config is built from it in memory
+        self.base_config_data = read_config_data(config_path)
 
         # Load test profiles
         with profiles_path.open("r") as f:
@@ -119,22 +409,14 @@ class TestRunner:
         self._completed_tests = 0
         self._progress_lock = threading.Lock()
 
-        # Display mode detection (single test = display enabled)
-        self._display_mode = len(self.profiles) == 1 and parallel_workers == 1
+        # Display mode detection (single test = display enabled, never in fast-forward)
+        self._display_mode = len(self.profiles) == 1 and parallel_workers == 1 and not fast_forward
 
     def _calculate_total_estimated_time(self) -> float:
         """Calculate total estimated time for all test profiles in seconds."""
         total_time_s = 0.0
 
-        # Load base config to get default acceleration
-        try:
-            with self.config_path.open("r") as f:
-                config_data = yaml.safe_load(f)
-                default_acceleration = config_data.get("simulation", {}).get(
-                    "acceleration", 1000.0
-                )
-        except Exception:
-            default_acceleration = 1000.0  # Fallback
+        default_acceleration = self.base_config_data.get("simulation", {}).get("acceleration", 1000.0)
 
         for profile in self.profiles:
             # Get duration (apply override if set)
@@ -196,7 +478,8 @@ class TestRunner:
                 )
 
             # Calculate and display estimated completion time
-            total_estimated_time_s = self._calculate_total_estimated_time()
+            # Fast-forward runs are bounded by compute, not by acceleration
+            total_estimated_time_s = 0.0 if self.fast_forward else self._calculate_total_estimated_time()
             if total_estimated_time_s > 0:
                 from datetime import datetime, timedelta
 
@@ -277,48 +560,114 @@ class TestRunner:
                 )
 
     def _run_tests_parallel(self) -> None:
-        """Run tests in parallel using ThreadPoolExecutor."""
-        total_tests = len(self.profiles)
-
-        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-            # Submit all tests
-            future_to_profile = {
-                executor.submit(self._run_test_wrapper, profile, idx): (profile, idx)
-                for idx, profile in enumerate(self.profiles)
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_profile):
-                profile, idx = future_to_profile[future]
-
-                try:
-                    result = future.result()
-                    self.results.append(result)
-
-                    # Update progress
-                    with self._progress_lock:
-                        self._completed_tests += 1
-                        completed = self._completed_tests
+        """
+        Run tests in parallel.
 
-                    # Log completion
-                    status_symbol = "✅" if result.passed else "❌"
-                    LOGGER.info(
-                        f"{status_symbol} [{completed}/{total_tests}] {result.profile_name}: "
-                        f"{result.status} ({result.duration_s:.1f}s)"
-                    )
+        isolation="process": every worker is a fresh (spawned) interpreter with
+        its own GIL, logging config, OTel meter provider and module state; it
+        builds its own services and sends back only the result dict. Workers
+        are recycled after max_tasks_per_child runs each, so memory stays
+        bounded on long suites. isolation="thread": all tests share this process.
+        """
+        total_tests = len(self.profiles)
+        if self.isolation == "process":
+            task = _run_test_in_worker
+        else:
+            task = self._run_test_wrapper
+
+        for batch in self._parallel_batches():
+            with self._create_executor(len(batch)) as executor:
+                # Submit all tests of this batch
+                future_to_profile = {
+                    executor.submit(task, profile, idx): (profile, idx)
+                    for idx, profile in batch
+                }
+
+                # Collect results as they complete
+                for future in as_completed(future_to_profile):
+                    profile, idx = future_to_profile[future]
+
+                    try:
+                        result = future.result()
+                        if isinstance(result, tuple):
+                            # From a worker process: (to_dict(), start_time, end_time)
+                            result = TestResult.from_dict(profile, *result)
+                        self.results.append(result)
+
+                        # Update progress
+                        with self._progress_lock:
+                            self._completed_tests += 1
+                            completed = self._completed_tests
+
+                        # Log completion
+                        status_symbol = "✅" if result.passed else "❌"
+                        LOGGER.info(
+                            f"{status_symbol} [{completed}/{total_tests}] {result.profile_name}: "
+                            f"{result.status} ({result.duration_s:.1f}s)"
+                        )
 
-                except Exception as e:
-                    LOGGER.error(
-                        f"Exception in test {profile['name']}: {e}", exc_info=True
-                    )
+                    except Exception as e:
+                        # Worker crash (e.g. BrokenProcessPool) - record as ERROR, keep the suite going
+                        LOGGER.error(
+                            f"Exception in test {profile['name']}: {e}", exc_info=True
+                        )
+                        result = TestResult(profile)
+                        result.status = "ERROR"
+                        result.error_message = str(e)
+                        self.results.append(result)
 
         # Sort results by original order (futures complete out-of-order)
         profile_order = {p["id"]: i for i, p in enumerate(self.profiles)}
         self.results.sort(key=lambda r: profile_order.get(r.profile_id, 999))
 
+    def _parallel_batches(self) -> list[list[tuple[int, dict[str, Any]]]]:
+        """
+        Split (test_index, profile) pairs into executor lifetimes.
+
+        Worker recycling is done by running at most parallel_workers *
+        max_tasks_per_child tests per process pool and starting a fresh pool for
+        the next batch (ProcessPoolExecutor(max_tasks_per_child=...) can hang
+        on Python 3.11 when a worker retires while work is still queued).
+        """
+        indexed = list(enumerate(self.profiles))
+        if self.isolation != "process" or not self.max_tasks_per_child:
+            return [indexed]
+        size = self.parallel_workers * self.max_tasks_per_child
+        return [indexed[i:i + size] for i in range(0, len(indexed), size)]
+
+    def _create_executor(self, batch_size: int) -> Executor:
+        """Pool for one batch of _run_tests_parallel according to isolation."""
+        workers = min(self.parallel_workers, batch_size)
+        if self.isolation == "thread":
+            return ThreadPoolExecutor(max_workers=workers)
+        # spawn, not fork: no inherited locks, logging handlers or meter provider
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_test_worker,
+            initargs=(self._worker_settings(),),
+        )
+
+    def _worker_settings(self) -> dict[str, Any]:
+        """Constructor arguments for the TestRunner living in each worker process."""
+        return {
+            "profiles_path": self.profiles_path,
+            "config_path": self.config_path,
+            "output_dir": self.output_dir,
+            "duration_override": self.duration_override,
+            "acceleration_override": self.acceleration_override,
+            "parallel_workers": self.parallel_workers,
+            "fast_forward": self.fast_forward,
+            "isolation": "thread",
+            "use_cache": self.cache is not None,
+            "force_rerun": self.force_rerun,
+            "early_stop": self.early_stop,
+            "stall_timeout_s": self.stall_timeout_s,
+        }
+
     def _run_test_wrapper(self, profile: dict[str, Any], test_index: int) -> TestResult:
         """Wrapper for parallel execution - logs test start."""
-        LOGGER.info(f"▶️  Starting: {profile['name']} (port {8080 + test_index})")
+        LOGGER.info(f"▶️  Starting: {profile['name']}")
         result = self.run_single_test(profile, test_index=test_index)
         return result
 
@@ -332,22 +681,55 @@ class TestRunner:
 
         try:
             # Configure simulation for this profile
-            temp_config_path = self._configure_for_profile(
-                profile, test_index=test_index
-            )
-
-            # Run simulation
-            actual_metrics = self._run_simulation(temp_config_path, profile)
+            config_data = self._build_profile_config(profile)
+
+            cache_key = None
+            actual_metrics = None
+            if self.cache is not None:
+                cache_key = self.cache.key(profile, config_data, self.fast_forward)
+                if not self.force_rerun:
+                    actual_metrics = self.cache.load(cache_key)
+
+            if actual_metrics is not None:
+                result.cached = True
+                if not self._display_mode:
+                    LOGGER.info(f"  ♻️  {profile['name']}: cached result {cache_key[:12]}")
+            else:
+                validator = None
+                if self.early_stop:
+                    validator = IncrementalValidator(profile["expected_results"], self._duration_scale(profile))
+                    validator = validator if validator.active else None
+
+                app_config = build_config(config_data)
+                if validator is not None:
+                    # Extrapolated cycles add rotations through metrics.skip_ahead without publishing
+                    # events - a max bound crossed inside the skipped span would not stop the run
+                    app_config.services.algo.steady_state.enabled = False
+
+                # Run simulation
+                actual_metrics = self._run_simulation(app_config, profile, validator)
+                if validator is not None and validator.decision is not None:
+                    # Partial run - metrics are not cached
+                    result.early_stop = validator.decision
+                    LOGGER.info(
+                        f"  ⏹️  {profile['name']}: {validator.decision['verdict']} decided by "
+                        f"{validator.decision['metric']} at sim {validator.decision['sim_time_s'] / 3600:.1f}h "
+                        f"({validator.decision['message']})"
+                    )
+                elif cache_key is not None:
+                    self.cache.store(cache_key, profile, actual_metrics)
             result.actual_metrics = actual_metrics
 
             # Validate results
             validation_results = self._validate_results(
-                actual_metrics, profile["expected_results"]
+                actual_metrics, profile["expected_results"], self._duration_scale(profile)
             )
             result.validation_results = validation_results
 
-            # Determine pass/fail
+            # Determine pass/fail (an early decision is final - the run stopped there)
             all_passed = all(v["passed"] for v in validation_results)
+            if result.early_stop is not None:
+                all_passed = result.early_stop["verdict"] == "PASSED"
             result.status = "PASSED" if all_passed else "FAILED"
 
         except Exception as e:
@@ -360,118 +742,99 @@ class TestRunner:
 
         return result
 
-    def _configure_for_profile(
-        self, profile: dict[str, Any], test_index: int = 0
-    ) -> Path:
+    def cache_status(self) -> list[tuple[dict[str, Any], str, bool]]:
         """
-        Configure simulation for the given test profile.
-        Creates a temporary config YAML file.
+        Cache state of every selected profile (nothing is simulated).
+
+        Returns:
+            (profile, cache key, up to date) per profile
+        """
+        if self.cache is None:
+            raise RuntimeError("Result cache is disabled")
+        status = []
+        for profile in self.profiles:
+            config_data = self._build_profile_config(profile)
+            key = self.cache.key(profile, config_data, self.fast_forward)
+            status.append((profile, key, self.cache.contains(key)))
+        return status
+
+    def _build_profile_config(self, profile: dict[str, Any]) -> dict[str, Any]:
+        """
+        Merged config for the given test profile (config.yaml + profile + overrides).
 
         Args:
             profile: Test profile configuration
-            test_index: Index of test (0-based) - used for unique ports in parallel mode
 
         Returns:
-            Path to temporary config file
+            Config dict in config.yaml layout
         """
-        # Load base config as dict
-        with self.config_path.open("r") as f:
-            config_data = yaml.safe_load(f)
-
-        # Override simulation duration
-        if "simulation" not in config_data:
-            config_data["simulation"] = {}
-
         # Apply duration override (command-line takes precedence)
         duration_days = (
             self.duration_override
             if self.duration_override is not None
             else profile["duration_days"]
         )
-        config_data["simulation"]["duration_days"] = duration_days
+        overrides: dict[str, Any] = {"simulation.duration_days": duration_days}
 
         # Apply acceleration (priority: command-line > profile > config default)
         if self.acceleration_override is not None:
             # Command-line override has highest priority
-            config_data["simulation"]["acceleration"] = self.acceleration_override
+            overrides["simulation.acceleration"] = self.acceleration_override
             if self.parallel_workers <= 1:  # Only log in sequential mode to avoid spam
                 LOGGER.info(
                     f"  Overriding acceleration to {self.acceleration_override}x (command-line)"
                 )
         elif "acceleration" in profile:
             # Use profile-specific acceleration
-            config_data["simulation"]["acceleration"] = profile["acceleration"]
+            overrides["simulation.acceleration"] = profile["acceleration"]
             if self.parallel_workers <= 1:
                 LOGGER.info(f"  Using profile acceleration: {profile['acceleration']}x")
         # Otherwise keep default from config.yaml
 
-        # Configure unique ports for parallel execution
-        if "services" not in config_data:
-            config_data["services"] = {}
-        if "weather" not in config_data["services"]:
-            config_data["services"]["weather"] = {}
-        if "algo" not in config_data["services"]:
-            config_data["services"]["algo"] = {}
-
-        # Set unique port for weather service (8080, 8081, 8082, ...)
-        base_port = 8080
-        weather_port = base_port + test_index
-        config_data["services"]["weather"]["port"] = weather_port
-        config_data["services"]["algo"][
-            "weather_endpoint"
-        ] = f"http://localhost:{weather_port}/temperature"
-
-        # Configure display and logging
-        if "telemetry" not in config_data:
-            config_data["telemetry"] = {}
+        # Metrics stay in memory for validation - no external export from test runs
+        overrides["telemetry.exporter_type"] = "memory"
 
         # Set unique log file per test (always to file)
-        config_data["telemetry"]["log_file"] = f"logs/test_{profile['id']}.log"
-        config_data["telemetry"][
-            "log_output"
-        ] = "file"  # Logs always to file in test mode
+        overrides["telemetry.log_file"] = f"logs/test_{profile['id']}.log"
+        overrides["telemetry.log_output"] = "file"  # Logs always to file in test mode
 
         # Display logic: Enable for SINGLE test, disable for multiple tests
-        if "display" not in config_data["services"]["algo"]:
-            config_data["services"]["algo"]["display"] = {}
-
-        if len(self.profiles) == 1 and self.parallel_workers == 1:
+        if self._display_mode:
             # Single test in sequential mode - ENABLE display (developer testing single profile)
-            config_data["services"]["algo"]["display"]["enabled"] = True
+            overrides["services.algo.display.enabled"] = True
             LOGGER.info(f"  Display: ENABLED (single test mode)")
         else:
             # Multiple tests or parallel mode - DISABLE display (test suite mode)
-            config_data["services"]["algo"]["display"]["enabled"] = False
+            overrides["services.algo.display.enabled"] = False
 
         # Configure weather profile
         profile_type = profile["profile_type"]
-        config_data["services"]["weather"]["profile_type"] = profile_type
+        overrides["services.weather.profile_type"] = profile_type
 
         if profile_type == "constant":
-            config_data["services"]["weather"]["constant_profile"] = {
+            overrides["services.weather.constant_profile"] = {
                 "temperature_c": profile["temperature_c"]
             }
         elif profile_type == "stepped" or profile_type == "smooth_step":
             # Both stepped and smooth_step use the same configuration structure
             # The difference is only in the calculator algorithm (instant jump vs linear ramp)
-            config_data["services"]["weather"]["stepped_profile"] = {
+            overrides["services.weather.stepped_profile"] = {
                 "steps": profile["steps"]
             }
 
-        # Save to temporary file
-        temp_config_path = self.output_dir / f"temp_config_{profile['id']}.yaml"
-        with temp_config_path.open("w") as f:
-            yaml.dump(config_data, f, default_flow_style=False)
-
-        return temp_config_path
+        return apply_overrides(self.base_config_data, overrides)
 
     def _run_simulation(
-        self, config_path: Path, profile: dict[str, Any]
+        self,
+        app_config: AppConfig,
+        profile: dict[str, Any],
+        validator: IncrementalValidator | None = None,
     ) -> dict[str, Any]:
-        """Run simulation and collect metrics."""
-        # Load config to get simulation parameters
-        app_config = load_config(config_path)
+        """
+        Run simulation and collect metrics.
 
+        With a validator the run stops as soon as it has decided the verdict.
+        """
         # Calculate and display timing information
         duration_days = app_config.simulation.duration_days
         sim_duration_s = app_config.simulation.duration_seconds
@@ -494,8 +857,18 @@ class TestRunner:
             )
             LOGGER.info(f"  ⏱️  Estimated real time: ~{duration_str}")
 
-        # Initialize services
-        weather_app = WeatherApplication(app_config, enable_background=True)
+        if self.fast_forward:
+            # In-process weather, no HTTP and no pacing - runs as fast as the algorithms compute
+            algo_app = AlgoService(app_config, fast_forward=True)
+            self._attach_validator(algo_app, validator)
+            algo_app.run_fast_forward(build_weather_source(app_config))
+            return self._collect_metrics(algo_app)
+
+        # Initialize services - weather listens on a free port chosen by the OS, and its
+        # clock and background loop are started just before the algo service connects
+        weather_app = WeatherApplication(app_config, enable_background=False)
+        weather_port = weather_app.bind(app_config.services.weather.host, 0)
+        weather_endpoint = f"http://localhost:{weather_port}/temperature"
 
         # In display mode, pass original stdout to algo service
         if self._display_mode:
@@ -507,175 +880,126 @@ class TestRunner:
                 sys_module, "_original_stdout_for_display", sys_module.__stdout__
             )
             algo_app = AlgoService(
-                config_path, 
+                app_config,
                 display_output_stream=original_stdout,
-                test_profile_description=profile.get("description")
+                test_profile_description=profile.get("description"),
+                weather_endpoint=weather_endpoint,
             )
         else:
-            algo_app = AlgoService(config_path)
-
-        # Start weather service Flask server in background thread
-        weather_host = app_config.services.weather.host
-        weather_port = app_config.services.weather.port
-        weather_thread = threading.Thread(
-            target=lambda: weather_app.app.run(
-                host=weather_host, port=weather_port, use_reloader=False
-            ),
-            daemon=True,
-        )
+            algo_app = AlgoService(app_config, weather_endpoint=weather_endpoint)
+        self._attach_validator(algo_app, validator)
+
+        # Serve weather requests in background thread (the socket already accepts connections)
+        weather_thread = threading.Thread(target=weather_app.serve_forever, daemon=True)
         weather_thread.start()
 
+        # Simulation time starts now - not when the application objects were built
+        weather_app.simulator.restart_clock()
+        weather_app.simulator.start()
+
         # Start algo service in background thread
         algo_thread = threading.Thread(target=algo_app.start, daemon=True)
         algo_thread.start()
 
         try:
-            # Wait for services to initialize (weather Flask + algo startup)
-            time.sleep(2.0)
+            # Readiness handshake: the service reached the weather endpoint and entered its loop
+            if not algo_app.run_handle.wait_ready(timeout=self.stall_timeout_s):
+                raise SimulationStalled(
+                    f"Algo service not ready after {self.stall_timeout_s:.0f}s (weather port {weather_port})"
+                )
 
             # Monitor progress (only if not in display mode - display handles its own output)
             if not self._display_mode and self.parallel_workers <= 1:
                 LOGGER.info(f"  🚀 Simulation running...")
-                self._monitor_progress(algo_app, sim_duration_s, real_duration_s)
+                self._monitor_progress(algo_app, real_duration_s)
             else:
                 # In display mode or parallel mode, use silent monitoring
-                self._wait_for_completion(algo_app, sim_duration_s, real_duration_s)
+                self._wait_for_completion(algo_app)
+            if algo_app.run_handle.outcome == FAILED:
+                raise RuntimeError(f"Algo service failed: {algo_app.run_handle.reason}")
 
             # Collect metrics (only log if not in display mode)
             if not self._display_mode and self.parallel_workers <= 1:
                 LOGGER.info(f"  ✅ Simulation complete, collecting metrics...")
-            metrics = self._collect_metrics(algo_app)
-
-            return metrics
 
         finally:
-            # Shutdown services
-            algo_app.shutdown()
-            weather_app.shutdown()
-
-            # Wait for thread to finish
+            # The service shuts itself down when its loop ends; a stalled or
+            # interrupted wait asks it to stop and only forces shutdown if it won't
+            if not algo_app.run_handle.done:
+                algo_app.request_stop("test runner stopped waiting")
             algo_thread.join(timeout=5.0)
+            if algo_thread.is_alive():
+                algo_app.shutdown()
+            weather_app.shutdown()
 
-            # Clean up temp config
-            if config_path.exists() and config_path.name.startswith("temp_config_"):
-                config_path.unlink()
+        # Shutdown flushed counters and took the final metric sample
+        return self._collect_metrics(algo_app)
+
+    def _attach_validator(self, algo_app: Any, validator: IncrementalValidator | None) -> None:
+        """Feed the validator from the service's event bus; a decision stops the run."""
+        if validator is None:
+            return
+        validator.attach(
+            algo_app.event_bus,
+            on_decided=lambda decision: algo_app.request_stop(
+                f"{decision['metric']} decided {decision['verdict']} ({decision['message']})"
+            ),
+        )
 
-    def _wait_for_completion(
-        self, algo_app: Any, sim_duration_s: float, real_duration_s: float
-    ) -> None:
+    def _wait_for_completion(self, algo_app: Any) -> None:
         """
         Wait for simulation to complete (parallel mode - no progress bar).
-        Similar to _monitor_progress but without logging.
+        Same as _monitor_progress but without logging.
         """
-        start_time = time.time()
-        check_interval = 0.5
-        timeout = real_duration_s + 5.0
-
-        while True:
-            elapsed_real = time.time() - start_time
+        for _ in algo_app.run_handle.watch(self.stall_timeout_s):
+            pass
 
-            # Check if timed out
-            if elapsed_real >= timeout:
-                break
-
-            # Check if simulation completed
-            try:
-                sim_time = algo_app.state.simulation_time
-                if sim_time >= sim_duration_s:
-                    break
-            except (AttributeError, ZeroDivisionError):
-                pass
-
-            time.sleep(check_interval)
-
-    def _monitor_progress(
-        self, algo_app: Any, sim_duration_s: float, real_duration_s: float
-    ) -> None:
-        """Monitor simulation progress and display updates."""
+    def _monitor_progress(self, algo_app: Any, real_duration_s: float) -> None:
+        """Log a progress bar at every 10% milestone published by the service."""
+        handle = algo_app.run_handle
         start_time = time.time()
-        last_progress = -1
+        bar_length = 20
 
-        # Check progress every 0.5 seconds for better responsiveness
-        check_interval = 0.5
+        for milestone in handle.watch(self.stall_timeout_s):
+            progress_pct = milestone * 100 // handle.milestones
+            if progress_pct < 10:
+                continue
+            filled = bar_length * milestone // handle.milestones
+            bar = "█" * filled + "░" * (bar_length - filled)
 
-        # Calculate when to stop (add buffer for shutdown)
-        timeout = real_duration_s + 3.0
-
-        while True:
+            # ETA from the real time per simulated fraction so far
             elapsed_real = time.time() - start_time
+            if handle.progress < 1.0 and real_duration_s > 0:
+                eta_s = elapsed_real / handle.progress * (1.0 - handle.progress)
+                eta_str = f"{eta_s:.0f}s" if eta_s < 60 else f"{eta_s/60:.1f}m"
+                LOGGER.info(f"     [{bar}] {progress_pct}% | ETA: ~{eta_str}")
+            else:
+                LOGGER.info(f"     [{bar}] {progress_pct}%")
 
-            # Check if simulation is complete (timeout)
-            if elapsed_real >= timeout:
-                break
-
-            # Try to get simulation time for accurate progress
-            progress = None
-            try:
-                sim_time = algo_app.state.simulation_time
-
-                # Calculate progress from simulation time
-                if sim_time > 0 and sim_duration_s > 0:
-                    progress = sim_time / sim_duration_s * 100
-
-                    # Check if simulation completed early
-                    if sim_time >= sim_duration_s:
-                        if last_progress < 100:
-                            LOGGER.info(f"     Progress: 100% complete")
-                        break
-
-            except (AttributeError, ZeroDivisionError):
-                # Service not ready yet or state not accessible
-                pass
-
-            # Fallback: estimate progress from elapsed real time
-            if progress is None or progress <= 0:
-                if real_duration_s > 0 and elapsed_real > 0:
-                    progress = min(99, (elapsed_real / real_duration_s * 100))
-
-            # Display progress every 10%
-            if progress is not None and progress > 0:
-                progress_milestone = int(progress / 10) * 10
-                if progress_milestone > last_progress and progress_milestone >= 10:
-                    # Create progress bar
-                    bar_length = 20
-                    filled = int(bar_length * progress_milestone / 100)
-                    bar = "█" * filled + "░" * (bar_length - filled)
-
-                    # Calculate ETA
-                    if progress > 5 and real_duration_s > 0:
-                        time_per_percent = elapsed_real / progress
-                        remaining_percent = 100 - progress
-                        eta_s = time_per_percent * remaining_percent
-
-                        if eta_s < 60:
-                            eta_str = f"{eta_s:.0f}s"
-                        else:
-                            eta_str = f"{eta_s/60:.1f}m"
-
-                        LOGGER.info(
-                            f"     [{bar}] {progress_milestone}% | ETA: ~{eta_str}"
-                        )
-                    else:
-                        LOGGER.info(f"     [{bar}] {progress_milestone}%")
-
-                    last_progress = progress_milestone
-
-            time.sleep(check_interval)
+        if handle.outcome == STOPPED:
+            LOGGER.info(f"     Stopped at {handle.progress:.0%} - {handle.reason}")
 
     def _collect_metrics(self, algo_app: Any) -> dict[str, Any]:
-        """Collect final metrics from algo service."""
+        """
+        Collect final metrics of a finished (shut down) algo service.
+
+        Values come from the in-memory metric store sampled by the service,
+        i.e. the same instruments that are exported in production.
+        """
         from common.domain import Heater, Scenario
 
-        # Force final update to capture last scenario's time
-        algo_app.algorithm_ws._update_scenario_time()
+        store = algo_app.telemetry.metric_store
+        prefix = algo_app.config.services.algo.metrics_prefix
+
+        def metric(name: str, **attributes: str) -> float:
+            return store.latest(f"{prefix}.{name}", attributes, default=0.0)
 
         # Collect scenario distribution
-        scenario_times = algo_app.algorithm_ws.get_all_scenario_times()
-        total_sim_time = algo_app.state.simulation_time
+        total_sim_time = metric("simulation_time_s")
 
         scenario_distribution = {}
         for scenario in Scenario:
-            time_s = scenario_times.get(scenario, 0.0)
+            time_s = metric("ws.scenario_time_s", scenario=scenario.name)
             time_h = time_s / 3600
             percentage = (time_s / total_sim_time * 100) if total_sim_time > 0 else 0
             scenario_distribution[scenario.name] = {
@@ -684,34 +1008,38 @@ class TestRunner:
             }
 
         # Collect WS metrics (scenario changes)
-        scenario_changes = algo_app.algorithm_ws.get_scenario_changes_count()
-        structural_changes = algo_app.algorithm_ws.get_structural_changes_count()
+        scenario_changes = int(metric("ws.scenario_changes"))
+        structural_changes = int(metric("ws.structural_changes"))
 
         # Collect RC metrics
-        time_primary_h = algo_app.algorithm_rc.get_time_in_primary() / 3600
-        time_limited_h = algo_app.algorithm_rc.get_time_in_limited() / 3600
-        rc_rotation_count = algo_app.algorithm_rc.get_rotation_count()
-        balance_ratio = algo_app.algorithm_rc.get_balance_ratio()
+        time_primary_s = metric("rc.config_time_s", config="Primary")
+        time_limited_s = metric("rc.config_time_s", config="Limited")
+        time_primary_h = time_primary_s / 3600
+        time_limited_h = time_limited_s / 3600
+        rc_rotation_count = int(metric("rc.rotation_count"))
+        if time_limited_s == 0:
+            balance_ratio = 0.0 if time_primary_s == 0 else float("inf")
+        else:
+            balance_ratio = time_primary_s / time_limited_s
 
         # Collect RN metrics
-        rn_rotation_count = algo_app.algorithm_rn.get_rotation_count()
+        rn_rotation_count = int(metric("rn.rotation_count"))
 
         # Collect heater operating times
-        sim_time_s = algo_app.state.simulation_time
+        heater_state_names = {value: name for name, value in HEATER_STATE_VALUE.items()}
         heater_operating_times = {}
         for heater in Heater:
-            op_time_s = algo_app.algorithm_rn.get_heater_operating_time(heater)
+            op_time_s = metric("rn.heater_operating_time_s", heater=heater.name)
             op_time_h = op_time_s / 3600
-            idle_time_s = algo_app.algorithm_rn.get_heater_idle_time(heater)
-            idle_time_h = idle_time_s / 3600
-            state = algo_app.algorithm_rn.get_heater_state(heater)
+            idle_time_h = metric("rn.heater_idle_time_s", heater=heater.name) / 3600
+            state = heater_state_names[int(metric("rn.heater_state", heater=heater.name))]
             # Percentage = (heater operating time / simulation time) * 100
-            percentage = (op_time_s / sim_time_s * 100) if sim_time_s > 0 else 0
+            percentage = (op_time_s / total_sim_time * 100) if total_sim_time > 0 else 0
             heater_operating_times[heater.name] = {
                 "operating_h": op_time_h,
                 "operating_percentage": percentage,
                 "idle_h": idle_time_h,
-                "state": state.value,
+                "state": state,
             }
 
         return {
@@ -728,10 +1056,20 @@ class TestRunner:
             "heater_operating_times": heater_operating_times,
         }
 
+    def _duration_scale(self, profile: dict[str, Any]) -> float:
+        """Simulated days of this run relative to the profile's duration_days."""
+        if self.duration_override is None:
+            return 1.0
+        return self.duration_override / profile["duration_days"]
+
     def _validate_results(
-        self, actual: dict[str, Any], expected: dict[str, Any]
+        self, actual: dict[str, Any], expected: dict[str, Any], duration_scale: float = 1.0
     ) -> list[dict[str, Any]]:
-        """Validate actual results against expected results."""
+        """
+        Validate actual results against expected results.
+
+        Max bounds of counters (IncrementalValidator.COUNTERS) grow with duration_scale.
+        """
         validations = []
 
         for key, expected_value in expected.items():
@@ -750,7 +1088,10 @@ class TestRunner:
             # Validate based on expected value type
             if isinstance(expected_value, dict):
                 # Range validation (min/max/target)
-                passed, message = self._validate_range(actual_value, expected_value)
+                if key in IncrementalValidator.COUNTERS:
+                    passed, message = self._validate_range(actual_value, expected_value, duration_scale)
+                else:
+                    passed, message = self._validate_range(actual_value, expected_value)
                 validation["passed"] = passed
                 validation["message"] = message
             elif isinstance(expected_value, bool):
@@ -881,9 +1222,9 @@ class TestRunner:
         return data.get(key)
 
     def _validate_range(
-        self, actual: Any, expected: dict[str, Any]
+        self, actual: Any, expected: dict[str, Any], duration_scale: float = 1.0
     ) -> tuple[bool, str]:
-        """Validate that actual value is within expected range."""
+        """Validate that actual value is within expected range (max scaled by duration_scale)."""
         if actual is None:
             return False, "No actual value"
 
@@ -914,9 +1255,10 @@ class TestRunner:
                 messages.append(f"Below min: {actual} < {expected['min']}")
 
         if "max" in expected:
-            if actual > expected["max"]:
+            bound_max = scaled_max(expected["max"], duration_scale)
+            if actual > bound_max:
                 passed = False
-                messages.append(f"Above max: {actual} > {expected['max']}")
+                messages.append(f"Above max: {actual} > {bound_max}")
 
         if "target" in expected:
             diff = abs(actual - expected["target"])
@@ -940,6 +1282,13 @@ class TestRunner:
             "passed": sum(1 for r in self.results if r.passed),
             "failed": sum(1 for r in self.results if r.status == "FAILED"),
             "errors": sum(1 for r in self.results if r.status == "ERROR"),
+            # Results are only comparable between runs of the same mode (results warehouse)
+            "run_mode": {
+                "duration_override": self.duration_override,
+                "acceleration_override": self.acceleration_override,
+                "fast_forward": self.fast_forward,
+                "early_stop": self.early_stop,
+            },
             "results": [r.to_dict() for r in self.results],
         }
 
@@ -947,8 +1296,52 @@ class TestRunner:
             yaml.dump(results_data, f, default_flow_style=False, sort_keys=False)
 
         LOGGER.info(f"Results saved to: {output_file}")
+        self._store_results(results_data, output_file.name)
         return output_file
 
+    def _store_results(self, results_data: dict[str, Any], source: str) -> None:
+        """Add the run (and any older results files not stored yet) to the results warehouse."""
+        try:
+            with ResultsStore(self.output_dir / RESULTS_DB_NAME) as store:
+                store.ingest_results(results_data, source)
+                store.ingest_directory(self.output_dir)  # Files from before the warehouse existed
+        except sqlite3.Error as exc:
+            # The YAML file is the record of the run - a broken warehouse must not fail the suite
+            LOGGER.warning(f"Results warehouse not updated: {exc}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Worker process side (isolation="process")
+# ═══════════════════════════════════════════════════════════════════════════
+
+_WORKER_RUNNER: TestRunner | None = None
+
+
+def _init_test_worker(settings: dict[str, Any]) -> None:
+    """ProcessPoolExecutor initializer - one TestRunner per worker process."""
+    global _WORKER_RUNNER
+    _WORKER_RUNNER = TestRunner(**settings)
+
+
+def _run_test_in_worker(
+    profile: dict[str, Any], test_index: int
+) -> tuple[dict[str, Any], float | None, float | None]:
+    """
+    Run one profile in a worker process.
+
+    Returns:
+        (TestResult.to_dict(), start_time, end_time) - plain data, cheap to pickle
+    """
+    # Logging config is per process and the first configuration wins; drop the
+    # previous test's handlers so this test's AlgoService logs to its own file
+    root = logging.getLogger()
+    for root_handler in list(root.handlers):
+        root.removeHandler(root_handler)
+        root_handler.close()
+
+    result = _WORKER_RUNNER._run_test_wrapper(profile, test_index)
+    return result.to_dict(), result.start_time, result.end_time
+
 
 def generate_summary_report(results: list[TestResult]) -> str:
     """Generate human-readable summary report."""
@@ -965,6 +1358,7 @@ def generate_summary_report(results: list[TestResult]) -> str:
     lines.append(f"Passed: {passed}")
     lines.append(f"Failed: {failed}")
     lines.append(f"Errors: {errors}")
+    lines.append(f"Cached: {sum(1 for r in results if r.cached)}")
     lines.append(f"Success Rate: {passed/len(results)*100:.1f}%")
 
     lines.append("\n" + "-" * 80)
@@ -977,7 +1371,15 @@ def generate_summary_report(results: list[TestResult]) -> str:
         )
         lines.append(f"\n{status_symbol} {result.profile_name} ({result.priority})")
         lines.append(f"   Status: {result.status}")
-        lines.append(f"   Duration: {result.duration_s:.1f}s")
+        lines.append(
+            f"   Duration: {result.duration_s:.1f}s" + (" (cached metrics)" if result.cached else "")
+        )
+        if result.early_stop is not None:
+            decision = result.early_stop
+            lines.append(
+                f"   Decided early: {decision['metric']} at sim {decision['sim_time_s'] / 3600:.1f}h "
+                f"- {decision['message']}"
+            )
 
         if result.status == "ERROR":
             lines.append(f"   Error: {result.error_message}")
@@ -1015,6 +1417,18 @@ Examples:
   
   # Run all tests in parallel (4 workers, ~1.5 minutes instead of 5 minutes)
   uv run python run_test_scenarios.py --parallel 4
+
+  # Which profiles would be re-simulated (cache miss) - nothing is run
+  uv run python run_test_scenarios.py --fast-forward --show-stale
+
+  # Ignore cached results (e.g. after changing something outside algo/, weather/, common/)
+  uv run python run_test_scenarios.py --force-rerun
+
+  # Parallel in threads of one process instead of isolated worker processes
+  uv run python run_test_scenarios.py --parallel 4 --isolation thread
+  
+  # Full-length profiles without real-time pacing (in-process weather, no HTTP)
+  uv run python run_test_scenarios.py --fast-forward
         """,
     )
 
@@ -1047,6 +1461,12 @@ Examples:
         help="Run only specific profiles (by id or name, e.g., --profiles profile_1_s3_baseline TEST_S6_DUAL_LINE)",
     )
 
+    parser.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="Simulate in-process without weather HTTP service or real-time pacing (acceleration is ignored)",
+    )
+
     parser.add_argument(
         "--parallel",
         type=int,
@@ -1055,6 +1475,54 @@ Examples:
         help="Run N tests in parallel (default: 1, sequential). Use --parallel 4 or --parallel 7 for max speed.",
     )
 
+    parser.add_argument(
+        "--force-rerun",
+        action="store_true",
+        help="Simulate every profile even if a cached result matches (cache is refreshed)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the result cache",
+    )
+
+    parser.add_argument(
+        "--show-stale",
+        action="store_true",
+        help="List which profiles have no cached result for the current profile/config/code and exit",
+    )
+
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        help="Stop a profile as soon as counter expectations (rotations, scenario changes) decide the verdict "
+        "- a max bound exceeded fails it at once; passing profiles with other expectations still run to the end",
+    )
+
+    parser.add_argument(
+        "--stall-timeout",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="Fail a real-time run when its simulation time does not advance for this long (default: 60)",
+    )
+
+    parser.add_argument(
+        "--isolation",
+        choices=["process", "thread"],
+        default="process",
+        help="Parallel runs: separate worker processes (default) or threads in this process",
+    )
+
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Replace a worker process after N tests to bound memory (default: 4, 0 = never)",
+    )
+
     args = parser.parse_args()
 
     # Apply smoke test defaults
@@ -1087,7 +1555,24 @@ Examples:
         acceleration_override=args.acceleration,
         profile_filter=args.profiles,
         parallel_workers=args.parallel,
+        fast_forward=args.fast_forward,
+        isolation=args.isolation,
+        max_tasks_per_child=args.max_tasks_per_child or None,
+        use_cache=not args.no_cache,
+        force_rerun=args.force_rerun,
+        early_stop=args.early_stop,
+        stall_timeout_s=args.stall_timeout,
     )
+
+    if args.show_stale:
+        status = runner.cache_status()
+        for profile, key, up_to_date in status:
+            state = "cached" if up_to_date else "STALE"
+            print(f"{state:<8}{profile['id']:<40}{key[:12]}")
+        stale = sum(1 for _, _, up_to_date in status if not up_to_date)
+        print(f"{stale}/{len(status)} profiles stale (code {runner.cache.source_digest[:12]})")
+        sys.exit(0)
+
     results = runner.run_all_tests()
 
     # Save results
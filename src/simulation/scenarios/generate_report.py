@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """
-Generate detailed markdown report from test results YAML.
+Generate detailed markdown report from test results YAML,
+or a trend / regression report from the results warehouse.
 """
 
+import argparse
 import sys
 import yaml
 from datetime import datetime
 from pathlib import Path
 
+# results_store lives next to run_test_scenarios.py (src/simulation)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from results_store import RESULTS_DB_NAME, ResultsStore  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "test_results"
+
 
 def generate_markdown_report(results_file: Path) -> str:
     """Generate markdown report from test results YAML."""
@@ -191,32 +199,136 @@ def _format_actual(actual: any) -> str:
         return str(actual)
 
 
+def generate_trend_report(store: ResultsStore, last: int = 50, profiles: list[str] | None = None) -> str:
+    """
+    Generate markdown trend / regression report from the results warehouse.
+
+    Args:
+        store: Results warehouse with ingested runs
+        last: Runs per profile to include
+        profiles: Profile names or ids (default: all stored profiles)
+
+    Returns:
+        Markdown text
+    """
+    lines = []
+    lines.append("# Test Trends Report - BOGDANKA Simulation")
+    lines.append("")
+    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"**Runs in warehouse:** {store.run_count()} (last {last} per profile shown)")
+    lines.append("")
+
+    # Regressions first - latest run vs the previous run of the same profile and run mode
+    lines.append("## Regressions")
+    lines.append("")
+    regressions = store.regressions()
+    if not regressions:
+        lines.append("✅ **No regressions** against the previous run of each profile in the same run mode.")
+    for regression in regressions:
+        mode = f" [{regression.mode.describe()}]"
+        if regression.metric is None:
+            lines.append(f"- ❌ **{regression.profile_name}**{mode}: {regression.previous} → {regression.latest}")
+        else:
+            message = f" ({regression.message})" if regression.message else ""
+            lines.append(f"- ❌ **{regression.profile_name}**{mode} `{regression.metric}`: passed → failed{message}")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+
+    lines.append("## Trends")
+    lines.append("")
+    for profile in profiles or store.profile_names():
+        statuses = store.status_history(profile, last)
+        if not statuses:
+            continue
+        history = "".join(_status_symbol(status) for _, status in statuses)
+        lines.append(f"### {profile}")
+        lines.append("")
+        lines.append(f"**Run mode:** `{store.latest_mode(profile).describe()}` (runs of other modes are not shown)")
+        lines.append("")
+        lines.append(f"**Status history (oldest → latest, {len(statuses)} run(s)):** {history}")
+        lines.append("")
+        lines.append("| Metric | Latest | Previous | Δ | Mean | Min | Max | Trend |")
+        lines.append("|--------|--------|----------|---|------|-----|-----|-------|")
+        for metric in store.validated_metrics(profile):
+            points = store.metric_history(profile, metric, last)
+            if not points:
+                continue
+            values = [point.value for point in points]
+            latest = values[-1]
+            previous = values[-2] if len(values) > 1 else None
+            previous_str = f"{previous:.3f}" if previous is not None else "N/A"
+            delta = f"{latest - previous:+.3f}" if previous is not None else "N/A"
+            lines.append(
+                f"| {metric} | {latest:.3f} | {previous_str} | {delta} | "
+                f"{sum(values) / len(values):.3f} | {min(values):.3f} | {max(values):.3f} | {_sparkline(values)} |"
+            )
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _status_symbol(status: str) -> str:
+    return "✅" if status == "PASSED" else "❌" if status == "FAILED" else "⚠️"
+
+
+def _sparkline(values: list[float]) -> str:
+    """Unicode block sparkline of the values (flat line when all are equal)."""
+    blocks = "▁▂▃▄▅▆▇█"
+    low, high = min(values), max(values)
+    if high - low < 1e-12:
+        return blocks[0] * len(values)
+    return "".join(blocks[round((v - low) / (high - low) * (len(blocks) - 1))] for v in values)
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python generate_report.py <results_json_file>")
-        sys.exit(1)
-    
-    results_file = Path(sys.argv[1])
-    
-    if not results_file.exists():
-        print(f"Error: Results file not found: {results_file}")
-        sys.exit(1)
-    
-    # Generate markdown report
-    markdown = generate_markdown_report(results_file)
-    
+    parser = argparse.ArgumentParser(description="BOGDANKA test report generator")
+    parser.add_argument("results_file", type=Path, nargs="?", help="test_results_<timestamp>.yaml to report on")
+    parser.add_argument(
+        "--trends",
+        action="store_true",
+        help="Report trends and regressions across stored runs (new results files are ingested first)",
+    )
+    parser.add_argument("--last", type=int, default=50, help="Runs per profile in the trend report (default: 50)")
+    parser.add_argument("--profiles", nargs="+", help="Limit the trend report to these profiles (name or id)")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=RESULTS_DIR / RESULTS_DB_NAME,
+        help="Results warehouse (default: test_results/results.db)",
+    )
+    args = parser.parse_args()
+
+    if args.trends:
+        with ResultsStore(args.db) as store:
+            new_runs = store.ingest_directory(args.db.parent)
+            print(f"Ingested {len(new_runs)} new result file(s) into {args.db}")
+            markdown = generate_trend_report(store, last=args.last, profiles=args.profiles)
+        output_file = args.db.parent / "trends_report.md"
+    else:
+        if args.results_file is None:
+            parser.print_usage()
+            sys.exit(1)
+        results_file = args.results_file
+
+        if not results_file.exists():
+            print(f"Error: Results file not found: {results_file}")
+            sys.exit(1)
+
+        # Generate markdown report
+        markdown = generate_markdown_report(results_file)
+        output_file = results_file.parent / f"{results_file.stem}_report.md"
+
     # Save to file
-    output_file = results_file.parent / f"{results_file.stem}_report.md"
     with output_file.open("w") as f:
         f.write(markdown)
-    
+
     print(f"Report generated: {output_file}")
-    
+
     # Also print to stdout
     print("\n" + markdown)
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,48 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+from algo.algorithm_rc import AlgorithmRC, RCConfig
+from algo.algorithm_rn import AlgorithmRN, RNConfig
+from algo.algorithm_ws import AlgorithmWS, WSConfig
+from algo.state import AlgoState
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand (set .now)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_controller():
+    """
+    Factory for WS/RC/RN sharing one state, with short periods for testing.
+
+    make_controller(event_bus=None, ws_config=None) -> (state, ws, rc, rn)
+    """
+
+    def make(event_bus=None, ws_config=None):
+        state = AlgoState()
+        ws = AlgorithmWS(config=ws_config or WSConfig(), state=state, event_bus=event_bus)
+        rc = AlgorithmRC(
+            config=RCConfig(rotation_period_hours=2, rotation_duration_s=300), state=state, event_bus=event_bus
+        )
+        rn = AlgorithmRN(
+            config=RNConfig(rotation_period_hours=1, rotation_duration_s=60, min_delta_time_s=600),
+            state=state,
+            algorithm_rc=rc,
+            event_bus=event_bus,
+        )
+        return state, ws, rc, rn
+
+    return make
@@ -0,0 +1,98 @@
+"""Tests for controller state checkpoint and restore."""
+
+import math
+
+import pytest
+
+from algo.algorithm_ws import WSConfig
+from algo.checkpoint import (
+    CheckpointError,
+    capture_checkpoint,
+    read_checkpoint,
+    restore_checkpoint,
+    write_checkpoint,
+)
+
+
+@pytest.fixture
+def new_controller(make_controller):
+    """Factory for controllers with a short WS median window."""
+    return lambda: make_controller(ws_config=WSConfig(filter_median_window=3))
+
+
+def _run(controller, start_s, end_s):
+    """Drive controller with a slow temperature wave, 60s steps."""
+    state, ws, rc, rn = controller
+    for t in range(start_s, end_s, 60):
+        state.update_simulation_time(float(t))
+        ws.process_temperature(-5.0 + 10.0 * math.sin(t / 20000.0))
+        rc.process()
+        rn.process()
+
+
+def test_restore_reproduces_snapshot(tmp_path, new_controller):
+    """Test that write → read → restore yields identical controller memory."""
+    original = new_controller()
+    _run(original, 0, 6 * 3600)
+
+    path = tmp_path / "state.json.gz"
+    write_checkpoint(path, capture_checkpoint(*original))
+
+    restored = new_controller()
+    restore_checkpoint(read_checkpoint(path), *restored)
+
+    assert capture_checkpoint(*restored)["state"] == capture_checkpoint(*original)["state"]
+    for index in (1, 2, 3):
+        assert restored[index].to_snapshot() == original[index].to_snapshot()
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path, new_controller):
+    """Test that resuming mid-run ends in the same state as never stopping."""
+    uninterrupted = new_controller()
+    _run(uninterrupted, 0, 12 * 3600)
+
+    first_half = new_controller()
+    _run(first_half, 0, 6 * 3600)
+    path = tmp_path / "state.json.gz"
+    write_checkpoint(path, capture_checkpoint(*first_half))
+
+    resumed = new_controller()
+    restore_checkpoint(read_checkpoint(path), *resumed)
+    _run(resumed, 6 * 3600, 12 * 3600)
+
+    expected = capture_checkpoint(*uninterrupted)
+    actual = capture_checkpoint(*resumed)
+    for section in ("state", "ws", "rc", "rn"):
+        assert actual[section] == expected[section]
+
+
+def test_write_is_atomic_and_leaves_no_temp_files(tmp_path, new_controller):
+    """Test that overwriting a checkpoint leaves only the final file."""
+    controller = new_controller()
+    path = tmp_path / "state.json.gz"
+
+    write_checkpoint(path, capture_checkpoint(*controller))
+    _run(controller, 0, 3600)
+    write_checkpoint(path, capture_checkpoint(*controller))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json.gz"]
+    assert read_checkpoint(path)["simulation_time"] == controller[0].simulation_time
+
+
+def test_unsupported_version_rejected(tmp_path, new_controller):
+    """Test that a checkpoint with another format version is refused."""
+    controller = new_controller()
+    data = capture_checkpoint(*controller)
+    data["version"] = 999
+
+    with pytest.raises(CheckpointError):
+        restore_checkpoint(data, *new_controller())
+
+
+def test_corrupt_file_rejected(tmp_path):
+    """Test that a non-gzip file raises CheckpointError."""
+    path = tmp_path / "state.json.gz"
+    path.write_bytes(b"not a checkpoint")
+
+    with pytest.raises(CheckpointError):
+        read_checkpoint(path)
@@ -11,7 +11,10 @@ from common.config import (
     ConfigError,
     SimulationSettings,
     TelemetryConfig,
+    apply_overrides,
+    build_config,
     load_config,
+    read_config_data,
 )
 
 
@@ -125,3 +128,43 @@ def test_config_with_defaults(tmp_path):
     assert config.services.weather.port == 8080
     assert config.services.algo.algorithms.ws.temp_monitoring_cycle_s == 10
 
+
+
+def test_apply_overrides_dotted_and_nested():
+    """Test dotted paths and nested mappings merge into a copy of the data."""
+    data = {
+        "simulation": {"duration_days": 90, "acceleration": 1000.0},
+        "services": {"weather": {"port": 8080, "constant_profile": {"temperature_c": -5.0}}},
+    }
+
+    merged = apply_overrides(
+        data,
+        {
+            "simulation.duration_days": 3,
+            "services": {"weather": {"constant_profile": {"temperature_c": 2.0}}},
+            "services.algo.display.enabled": False,
+        },
+    )
+
+    assert merged["simulation"] == {"duration_days": 3, "acceleration": 1000.0}
+    assert merged["services"]["weather"] == {"port": 8080, "constant_profile": {"temperature_c": 2.0}}
+    assert merged["services"]["algo"] == {"display": {"enabled": False}}
+    assert data["simulation"]["duration_days"] == 90  # Source untouched
+    assert data["services"]["weather"]["constant_profile"]["temperature_c"] == -5.0
+    assert "algo" not in data["services"]
+
+    with pytest.raises(ConfigError, match="not a section"):
+        apply_overrides(data, {"simulation.duration_days.value": 1})
+
+
+def test_build_config_matches_load_config_with_overrides():
+    """Test that configs built from parsed data equal configs loaded from the file."""
+    overrides = {"simulation.duration_days": 2, "services.weather.profile_type": "constant"}
+    data = read_config_data("config.yaml")
+
+    built = build_config(data, overrides)
+
+    assert built == load_config("config.yaml", overrides)
+    assert built.simulation.duration_days == 2
+    assert built.services.weather.profile_type == "constant"
+    assert build_config(data).simulation.duration_days == load_config("config.yaml").simulation.duration_days
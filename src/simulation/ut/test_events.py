@@ -0,0 +1,147 @@
+"""Tests for the algorithm event bus."""
+
+import threading
+
+import pytest
+
+from algo.algorithm_rc import AlgorithmRC, RCConfig
+from algo.algorithm_ws import AlgorithmWS, WSConfig
+from algo.events import (
+    AlgoEvent,
+    ConfigRotationStarted,
+    EventBus,
+    HeaterRotationCompleted,
+    ScenarioChanged,
+)
+from algo.state import AlgoState
+from common.domain import Scenario
+
+
+@pytest.fixture
+def bus():
+    """Create event bus and close it after the test."""
+    event_bus = EventBus()
+    yield event_bus
+    event_bus.close()
+
+
+def test_sync_handler_receives_event(bus):
+    """Test that synchronous handlers run on publish."""
+    received = []
+    bus.subscribe(HeaterRotationCompleted, received.append)
+
+    event = HeaterRotationCompleted(sim_time=10.0)
+    bus.publish(event)
+
+    assert received == [event]
+
+
+def test_base_class_subscription_receives_all_events(bus):
+    """Test that subscribing to AlgoEvent receives every event type."""
+    received = []
+    bus.subscribe(AlgoEvent, received.append)
+
+    bus.publish(HeaterRotationCompleted(sim_time=1.0))
+    bus.publish(ScenarioChanged(
+        sim_time=2.0,
+        old_scenario=Scenario.S0,
+        new_scenario=Scenario.S1,
+        temperature_c=1.0,
+        structural=False,
+    ))
+
+    assert [type(e) for e in received] == [HeaterRotationCompleted, ScenarioChanged]
+
+
+def test_unrelated_handler_not_called(bus):
+    """Test that handlers only receive their event type."""
+    received = []
+    bus.subscribe(ScenarioChanged, received.append)
+
+    bus.publish(HeaterRotationCompleted(sim_time=1.0))
+
+    assert received == []
+
+
+def test_failing_handler_does_not_stop_dispatch(bus):
+    """Test that an exception in one handler does not affect others."""
+    received = []
+
+    def failing(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(HeaterRotationCompleted, failing)
+    bus.subscribe(HeaterRotationCompleted, received.append)
+
+    bus.publish(HeaterRotationCompleted(sim_time=1.0))
+
+    assert len(received) == 1
+
+
+def test_async_handler_runs_off_publisher_thread():
+    """Test that async handlers run on the worker and are drained on close."""
+    bus = EventBus()
+    threads = []
+    bus.subscribe(AlgoEvent, lambda event: threads.append(threading.current_thread()), asynchronous=True)
+
+    for i in range(100):
+        bus.publish(HeaterRotationCompleted(sim_time=float(i)))
+    bus.close()
+
+    assert len(threads) == 100
+    assert all(t is not threading.current_thread() for t in threads)
+
+
+def test_async_queue_overflow_is_counted():
+    """Test that events are dropped (not blocking) when async queue is full."""
+    bus = EventBus(async_queue_size=1)
+    release = threading.Event()
+    bus.subscribe(AlgoEvent, lambda event: release.wait(), asynchronous=True)
+
+    for i in range(10):
+        bus.publish(HeaterRotationCompleted(sim_time=float(i)))
+
+    assert bus.dropped_events > 0
+    release.set()
+    bus.close()
+
+
+def test_ws_publishes_scenario_change(bus):
+    """Test that WS publishes ScenarioChanged when scenario switches."""
+    state = AlgoState()
+    state.simulation_time = 100.0
+    ws = AlgorithmWS(config=WSConfig(), state=state, event_bus=bus)
+    received = []
+    bus.subscribe(ScenarioChanged, received.append)
+
+    changed, _ = ws.process_temperature(-5.0)
+
+    assert changed
+    assert len(received) == 1
+    assert received[0].old_scenario == Scenario.S0
+    assert received[0].new_scenario == Scenario.S3
+    assert received[0].sim_time == 100.0
+
+
+def test_rc_publishes_config_rotation(bus):
+    """Test that RC publishes ConfigRotationStarted with lock end time."""
+    state = AlgoState()
+    state.current_scenario = Scenario.S3
+    rc = AlgorithmRC(
+        config=RCConfig(rotation_period_hours=1, rotation_duration_s=300),
+        state=state,
+        event_bus=bus,
+    )
+    received = []
+    bus.subscribe(ConfigRotationStarted, received.append)
+
+    state.simulation_time = 0.0
+    rc.process()
+    state.simulation_time = 4000.0
+    changed, _ = rc.process()
+
+    assert changed
+    assert len(received) == 1
+    assert received[0].old_config == "Primary"
+    assert received[0].new_config == "Limited"
+    assert received[0].end_time == 4300.0
@@ -0,0 +1,142 @@
+"""Tests for the bounded off-thread metric export queue."""
+
+import threading
+
+import pytest
+from opentelemetry.sdk.metrics import Counter
+from opentelemetry.sdk.metrics.export import AggregationTemporality, MetricExporter, MetricExportResult
+
+from common.export_queue import CLOSED, DROP_NEWEST, OPEN, QueuedMetricExporter
+
+
+class _FakeExporter(MetricExporter):
+    """Records batches; can block on a gate or fail on demand."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+        self.shut_down = False
+
+    def export(self, metrics_data, timeout_millis=10_000, **kwargs):
+        self.gate.wait(5)
+        if self.fail:
+            return MetricExportResult.FAILURE
+        self.batches.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=10_000):
+        return True
+
+    def shutdown(self, timeout_millis=30_000, **kwargs):
+        self.shut_down = True
+
+
+def _wait_in_flight(queued):
+    """Block until the worker has taken the queued batch (and is stuck on the gate)."""
+    with queued._condition:
+        assert queued._condition.wait_for(lambda: queued._busy and not queued._queue, timeout=5)
+
+
+def test_export_returns_while_endpoint_blocks():
+    """Test that export() only enqueues while the worker is stuck on I/O."""
+    inner = _FakeExporter()
+    inner.gate.clear()
+    queued = QueuedMetricExporter(inner, max_batches=2)
+    queued.export("batch-0")
+    _wait_in_flight(queued)
+
+    results = [queued.export(f"batch-{i}") for i in range(1, 5)]
+
+    assert results == [MetricExportResult.SUCCESS] * 4
+    inner.gate.set()
+    assert queued.force_flush(5000)
+    # One batch was in flight, the two newest stayed queued, the rest were dropped
+    assert inner.batches == ["batch-0", "batch-3", "batch-4"]
+    assert queued.dropped_batches["queue_full"] == 2
+    queued.shutdown()
+
+
+@pytest.mark.parametrize("policy, expected", [("drop_oldest", ["b", "c"]), (DROP_NEWEST, ["a", "b"])])
+def test_drop_policy(policy, expected):
+    """Test which batch is discarded when the queue is full."""
+    inner = _FakeExporter()
+    inner.gate.clear()
+    queued = QueuedMetricExporter(inner, max_batches=2, drop_policy=policy)
+    queued.export("in-flight")
+    _wait_in_flight(queued)
+
+    for batch in ("a", "b", "c"):
+        queued.export(batch)
+    inner.gate.set()
+    queued.force_flush(5000)
+
+    assert inner.batches == ["in-flight", *expected]
+    assert queued.dropped_batches["queue_full"] == 1
+    queued.shutdown()
+
+
+def test_circuit_breaker_opens_and_recovers(fake_clock):
+    """Test failures open the circuit, cooldown allows one trial export."""
+    inner = _FakeExporter()
+    inner.fail = True
+    queued = QueuedMetricExporter(inner, failure_threshold=2, cooldown_s=30.0, clock=fake_clock)
+
+    for batch in ("a", "b", "c"):
+        queued.export(batch)
+        queued.force_flush(5000)
+
+    assert queued.state == OPEN
+    assert queued.failed_batches == 2
+    assert queued.dropped_batches["circuit_open"] == 1
+
+    inner.fail = False
+    fake_clock.now = 31.0
+    queued.export("d")
+    queued.force_flush(5000)
+
+    assert queued.state == CLOSED
+    assert inner.batches == ["d"]
+    queued.shutdown()
+
+
+def test_late_batches_counted(fake_clock):
+    """Test batches delivered after late_after_s are counted as late."""
+    inner = _FakeExporter()
+    inner.gate.clear()
+    queued = QueuedMetricExporter(inner, late_after_s=10.0, clock=fake_clock)
+
+    queued.export("a")
+    fake_clock.now = 15.0
+    inner.gate.set()
+    queued.force_flush(5000)
+
+    assert queued.late_batches == 1
+    queued.shutdown()
+
+
+def test_shutdown_drains_and_closes_inner():
+    """Test pending batches are exported before the inner exporter shuts down."""
+    inner = _FakeExporter()
+    queued = QueuedMetricExporter(inner)
+    queued.export("a")
+    queued.shutdown(timeout_millis=5000)
+
+    assert inner.batches == ["a"]
+    assert inner.shut_down
+    assert queued.export("late") is MetricExportResult.FAILURE
+    assert queued.dropped_batches["shutdown"] == 1
+
+
+def test_preferences_default_to_inner_exporter():
+    """Test that the reader sees the inner exporter's temporality unless overridden."""
+    inner = _FakeExporter(preferred_temporality={Counter: AggregationTemporality.DELTA})
+    inherited = QueuedMetricExporter(inner)
+    overridden = QueuedMetricExporter(inner, preferred_temporality={Counter: AggregationTemporality.CUMULATIVE})
+
+    assert inherited._preferred_temporality[Counter] is AggregationTemporality.DELTA
+    assert overridden._preferred_temporality[Counter] is AggregationTemporality.CUMULATIVE
+    inherited.shutdown()
+    overridden.shutdown()
@@ -0,0 +1,95 @@
+"""Tests for streaming temperature filters."""
+
+import pytest
+
+from algo.algorithm_ws import AlgorithmWS, WSConfig
+from algo.filters import (
+    ExponentialSmoothingFilter,
+    MovingAverageFilter,
+    RingBuffer,
+    RunningMedianFilter,
+    SpikeRejectionFilter,
+    TemperatureFilterPipeline,
+)
+from algo.state import AlgoState
+
+
+def test_ring_buffer_wraps_and_evicts_oldest():
+    """Test that ring buffer keeps the newest values and returns evicted ones."""
+    buffer = RingBuffer(3)
+
+    assert buffer.append(1.0) is None
+    assert buffer.append(2.0) is None
+    assert buffer.append(3.0) is None
+    assert buffer.is_full()
+    assert buffer.append(4.0) == 1.0
+
+    assert list(buffer) == [2.0, 3.0, 4.0]
+    assert buffer.newest() == 4.0
+
+
+def test_moving_average_matches_naive_average():
+    """Test running-sum average against a recomputed window average."""
+    readings = [float(i % 7) - 3.3 for i in range(50)]
+    ma = MovingAverageFilter(window=4)
+
+    for i, value in enumerate(readings):
+        window = readings[max(0, i - 3):i + 1]
+        assert ma.process(value) == pytest.approx(sum(window) / len(window))
+
+
+def test_running_median_ignores_single_outlier():
+    """Test that the median window suppresses a single spike."""
+    median = RunningMedianFilter(window=3)
+
+    outputs = [median.process(v) for v in [1.0, 1.0, 50.0, 1.0]]
+
+    assert outputs[-2:] == [1.0, 1.0]
+
+
+def test_exponential_smoothing_validates_alpha():
+    """Test EMA output and alpha range validation."""
+    ema = ExponentialSmoothingFilter(alpha=0.5)
+    assert ema.process(0.0) == 0.0
+    assert ema.process(10.0) == 5.0
+
+    with pytest.raises(ValueError):
+        ExponentialSmoothingFilter(alpha=0.0)
+
+
+def test_spike_rejection_holds_then_accepts_new_level():
+    """Test that spikes are held back but a persistent step is eventually accepted."""
+    spike = SpikeRejectionFilter(max_rate_c_per_s=0.01, max_rejections=2)
+
+    assert spike.process(0.0, sim_time=0.0) == 0.0
+    assert spike.process(20.0, sim_time=60.0) == 0.0  # 0.33°C/s - rejected
+    assert spike.process(20.0, sim_time=120.0) == 0.0  # still rejected
+    assert spike.process(20.0, sim_time=180.0) == 20.0  # limit reached - accepted
+    assert spike.rejections == 0
+
+
+def test_pipeline_chains_stages():
+    """Test that pipeline feeds each stage's output into the next."""
+    pipeline = TemperatureFilterPipeline([RunningMedianFilter(3), MovingAverageFilter(2)])
+
+    for value in [1.0, 1.0, 50.0, 1.0]:
+        pipeline.process(value)
+
+    assert pipeline.last_output == 1.0
+
+    pipeline.reset()
+    assert pipeline.last_output is None
+    assert pipeline.process(4.0) == 4.0
+
+
+def test_ws_uses_state_buffer_as_average_stage():
+    """Test that WS pipeline shares the moving average buffer with AlgoState."""
+    state = AlgoState()
+    ws = AlgorithmWS(config=WSConfig(filter_averaging=2, filter_ema_alpha=0.5), state=state)
+
+    ws.process_temperature(2.0)
+    ws.process_temperature(4.0)
+
+    assert state.t_zewn_buffer.window == 2
+    assert state.t_zewn_buffer.values() == [2.0, 4.0]
+    assert ws.filter.last_output == pytest.approx(2.5)  # EMA(2.0, 3.0)
@@ -0,0 +1,109 @@
+"""Tests for early-stop validation of monotone expectations."""
+
+from pathlib import Path
+
+import yaml
+
+from algo.events import ConfigRotationStarted, EventBus, HeaterRotationStarted, ScenarioChanged
+from common.domain import Heater, Line, Scenario
+import run_test_scenarios
+from run_test_scenarios import IncrementalValidator
+
+
+def _heater_rotation(sim_time):
+    return HeaterRotationStarted(sim_time, Line.C1, Heater.N1, Heater.N2, end_time=sim_time + 60.0)
+
+
+def _scenario_change(sim_time, structural=False):
+    return ScenarioChanged(sim_time, Scenario.S3, Scenario.S4, -9.0, structural=structural)
+
+
+def _attached(expected):
+    bus = EventBus()
+    decisions = []
+    validator = IncrementalValidator(expected)
+    validator.attach(bus, on_decided=decisions.append)
+    return validator, bus, decisions
+
+
+def test_max_exceeded_fails_immediately():
+    """Test that the first count above max decides FAILED with metric and sim time."""
+    validator, bus, decisions = _attached({"rn_rotations": {"max": 2}, "heater_balance_c1": {"max": 1.5}})
+
+    for sim_time in (600.0, 1200.0, 1800.0, 2400.0):
+        bus.publish(_heater_rotation(sim_time))
+
+    assert decisions == [validator.decision]
+    assert validator.decision["verdict"] == "FAILED"
+    assert validator.decision["metric"] == "rn_rotations"
+    assert validator.decision["sim_time_s"] == 1800.0
+    assert validator.decision["actual"] == 3
+
+
+def test_pass_needs_every_expectation_decided():
+    """Test that reached minimums only decide PASSED when nothing else can still fail."""
+    validator, bus, decisions = _attached({"scenario_changes": {"min": 2}, "structural_changes": {"min": 1}})
+    bus.publish(_scenario_change(60.0))
+    bus.publish(_scenario_change(120.0))
+    assert validator.decision is None
+
+    bus.publish(_scenario_change(180.0, structural=True))
+    assert validator.decision["verdict"] == "PASSED"
+    assert validator.decision["sim_time_s"] == 180.0
+    assert validator.decision["metric"] == "structural_changes"  # Met last, not the largest count
+
+    blocked, bus, _ = _attached({"rc_rotations": {"min": 1}, "heater_balance_c2": {"max": 1.3}})
+    bus.publish(ConfigRotationStarted(60.0, "Primary", "Limited", Scenario.S2, end_time=360.0))
+    assert blocked.decision is None  # Balance is only known at the end
+
+
+def test_exact_count_and_inactive():
+    """Test exact expected counts and profiles without decidable expectations."""
+    validator, bus, _ = _attached({"rc_rotations": 1})
+    bus.publish(ConfigRotationStarted(60.0, "Primary", "Limited", Scenario.S2, end_time=360.0))
+    assert validator.decision is None  # Could still stay at exactly 1
+    bus.publish(ConfigRotationStarted(7200.0, "Limited", "Primary", Scenario.S2, end_time=7500.0))
+    assert validator.decision["verdict"] == "FAILED"
+
+    assert not IncrementalValidator({"heater_balance_c1": {"max": 1.5}}).active
+
+
+def test_counter_max_scales_with_duration_override(tmp_path, monkeypatch):
+    """Test that --days longer than the profile scales counter max bounds (early stop and final validation)."""
+    profile = {
+        "id": "profile_s1",
+        "name": "TEST_S1",
+        "priority": "MEDIUM",
+        "description": "S1 - minimalne ogrzewanie",
+        "duration_days": 1,
+        "profile_type": "constant",
+        "temperature_c": 0.0,
+        "expected_results": {"rn_heater_rotations": {"max": 27}, "scenario_changes": {"max": 1}},
+    }
+    profiles_path = tmp_path / "profiles.yaml"
+    profiles_path.write_text(yaml.safe_dump({"test_profiles": [profile]}))
+    runner = run_test_scenarios.TestRunner(
+        profiles_path,
+        Path(__file__).parent.parent / "config.yaml",
+        tmp_path / "results",
+        duration_override=3,
+        fast_forward=True,
+        use_cache=False,
+        early_stop=True,
+    )
+    validators = []
+
+    def simulate(app_config, profile, validator):
+        validators.append(validator)
+        return {"rn_heater_rotations": 54, "scenario_changes": 1}
+
+    monkeypatch.setattr(runner, "_run_simulation", simulate)
+    result = runner.run_single_test(runner.profiles[0])
+
+    assert result.status == "PASSED"
+    assert validators[0].bounds["rn_heater_rotations"] == {"max": 81}
+    assert validators[0].bounds["scenario_changes"] == {"max": 3}
+
+    # Shorter runs keep the profile's bound
+    runner.duration_override = None
+    assert runner._validate_results({"rn_heater_rotations": 54}, profile["expected_results"])[0]["passed"] is False
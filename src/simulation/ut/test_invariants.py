@@ -0,0 +1,85 @@
+"""Tests for controller invariants and property-based profile generation/shrinking."""
+
+import random
+
+from algo.algorithm_rn import AlgorithmRN, HeaterState, RNConfig
+from algo.invariants import InvariantChecker, Violation
+from algo.state import AlgoState
+from common.domain import Heater, Scenario
+from run_property_scenarios import generate_profile, shrink_profile
+from weather.profile import SmoothSteppedProfileCalculator, SteppedProfileCalculator
+
+
+def test_generated_profiles_are_valid_and_reproducible():
+    """Test that generated steps are contiguous, cover the run and are accepted by the weather profiles."""
+    rng, replay = random.Random(5), random.Random(5)
+    profiles = [generate_profile(rng, index, max_days=3) for index in range(40)]
+    assert profiles == [generate_profile(replay, index, max_days=3) for index in range(40)]
+    assert {profile["description"].split()[0] for profile in profiles} == {"adversarial", "random"}
+
+    for profile in profiles:
+        steps = profile["steps"]
+        assert steps[0]["day_start"] == 0
+        assert steps[-1]["day_end"] == profile["duration_days"] <= 3
+        assert all(prev["day_end"] == step["day_start"] for prev, step in zip(steps, steps[1:]))
+        assert all(-26.0 <= step["temperature_c"] <= 7.0 for step in steps)
+        calculator = SteppedProfileCalculator if profile["profile_type"] == "stepped" else SmoothSteppedProfileCalculator
+        calculator(steps=steps, simulation_days=profile["duration_days"])
+
+
+def test_checker_reports_each_broken_invariant():
+    """Test heater count/line, Primary-only and lock overlap checks, and the settle window."""
+    state = AlgoState()
+    algorithm_rn = AlgorithmRN(RNConfig(rotation_period_hours=1, algorithm_loop_cycle_s=60), state)
+    checker = InvariantChecker(state, algorithm_rn, settle_s=60)
+    state.current_scenario = Scenario.S6
+    state.current_config = "Limited"
+    state.timestamp_last_scenario_change = 1000.0
+    state.simulation_time = 1030.0
+    assert checker.check() == []  # Still settling
+
+    state.simulation_time = 1060.0
+    state.config_change_in_progress, state.config_rotation_end_time = True, 1300.0
+    state.heater_rotation_in_progress, state.heater_rotation_end_time = True, 1200.0
+    assert {v.invariant for v in checker.check()} == {"lock_overlap", "heater_count", "heater_line", "primary_config"}
+
+    state.current_config = "Primary"
+    state.heater_rotation_end_time = 1060.0  # Lock released at this tick
+    for heater in (Heater.N1, Heater.N2, Heater.N3, Heater.N4, Heater.N5, Heater.N7):
+        algorithm_rn._heater_tracking[heater].state = HeaterState.ACTIVE
+    assert checker.check() == []
+
+    state.current_scenario = Scenario.S2
+    violations = checker.check()
+    assert [v.invariant for v in violations] == ["heater_count", "heater_line"]
+    assert violations[1].message == "2 heaters of C2 active in S2/Primary"
+
+
+def test_shrink_keeps_the_same_invariant_failing():
+    """Test that shrinking cuts the run, merges steps and rounds temperatures while the failure persists."""
+    profile = {
+        "id": "property_00000",
+        "duration_days": 2,
+        "profile_type": "smooth_step",
+        "steps": [
+            {"day_start": 0, "day_end": 0.25, "temperature_c": 1.3},
+            {"day_start": 0.25, "day_end": 0.5, "temperature_c": -22.4},
+            {"day_start": 0.5, "day_end": 1.5, "temperature_c": -3.7},
+            {"day_start": 1.5, "day_end": 2, "temperature_c": 4.1},
+        ],
+    }
+
+    def check(candidate):
+        # Fake controller: fails when any step is below -20°C (violation at that step's start)
+        cold = [step for step in candidate["steps"] if step["temperature_c"] < -20]
+        if not cold:
+            return None
+        return Violation("heater_count", cold[0]["day_start"] * 86400, "S8", "Primary", "fake")
+
+    minimal, violation, runs = shrink_profile(profile, check(profile), check)
+
+    assert minimal["profile_type"] == "stepped"
+    assert minimal["duration_days"] == 1
+    assert minimal["steps"] == [{"day_start": 0, "day_end": 0.020833, "temperature_c": -22.0}]
+    assert violation.invariant == "heater_count"
+    assert runs < 50
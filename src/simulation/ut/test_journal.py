@@ -0,0 +1,206 @@
+"""Tests for the binary decision journal."""
+
+import pytest
+
+from algo.events import (
+    ConfigRotationCompleted,
+    ConfigRotationStarted,
+    EventBus,
+    HeaterRotationCompleted,
+    HeaterRotationStarted,
+    RotationBlocked,
+    ScenarioChanged,
+)
+from algo.journal import RECORD, EventJournal, JournalReader, decode_record, encode_event
+from algo.recorder import LOCK_RC, LOCK_RN
+from common.domain import Heater, Line, Scenario
+
+
+def _scenario_events(count, step_s=60.0):
+    """Alternating S1/S2 scenario changes at increasing sim times."""
+    return [
+        ScenarioChanged(i * step_s, Scenario.S1 if i % 2 else Scenario.S2, Scenario.S2 if i % 2 else Scenario.S1,
+                        -float(i % 10), structural=False)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("event", [
+    ScenarioChanged(60.0, Scenario.S4, Scenario.S5, -11.2, structural=True),
+    ConfigRotationStarted(120.0, "Primary", "Limited", Scenario.S2, end_time=420.0),
+    ConfigRotationCompleted(420.0, "Limited"),
+    HeaterRotationStarted(600.0, Line.C1, Heater.N1, Heater.N3, end_time=780.0),
+    HeaterRotationCompleted(780.0),
+    RotationBlocked(840.0, "rn", "too_soon_after_rc", Line.C2),
+    RotationBlocked(900.0, "rc", "rn_rotation_in_progress"),
+])
+def test_encode_decode_roundtrip(event):
+    """Test that every journaled event type survives a fixed-size record."""
+    data = encode_event(event, LOCK_RN)
+
+    assert len(data) == RECORD.size
+    record = decode_record(data)
+    assert record.event == event
+    assert record.locks == LOCK_RN
+
+
+def test_lock_transitions_tracked(tmp_path):
+    """Test that records carry the RC/RN locks held after each event."""
+    journal = EventJournal(tmp_path)
+    journal.append(ConfigRotationStarted(0.0, "Primary", "Limited", Scenario.S2, end_time=300.0))
+    journal.append(HeaterRotationStarted(60.0, Line.C1, Heater.N1, Heater.N2, end_time=240.0))
+    journal.append(HeaterRotationCompleted(240.0))
+    journal.append(ConfigRotationCompleted(300.0, "Limited"))
+    journal.close()
+
+    assert [record.locks for record in JournalReader(tmp_path).records()] == [
+        LOCK_RC, LOCK_RC | LOCK_RN, LOCK_RC, 0,
+    ]
+
+
+def test_rotation_and_background_compression(tmp_path):
+    """Test that full segments rotate, get compressed and still replay in order."""
+    events = _scenario_events(100)
+    journal = EventJournal(tmp_path, segment_records=32, block_records=8)
+    for event in events:
+        journal.append(event)
+    journal.close()
+
+    assert sorted(path.name for path in tmp_path.glob("segment-*")) == [
+        "segment-000001.jrnz", "segment-000002.jrnz", "segment-000003.jrnz", "segment-000004.jrn",
+    ]
+    assert list(JournalReader(tmp_path).events()) == events
+
+
+def test_window_replay_reads_only_needed_blocks(tmp_path, monkeypatch):
+    """Test that a sim-time window is located through the sparse index."""
+    events = _scenario_events(200)
+    journal = EventJournal(tmp_path, segment_records=64, block_records=16)
+    for event in events:
+        journal.append(event)
+    journal.close()
+
+    reader = JournalReader(tmp_path)
+    blocks_read = []
+    read_block = reader._read_block
+    monkeypatch.setattr(reader, "_read_block", lambda segment, block: blocks_read.append((segment, block))
+                        or read_block(segment, block))
+
+    window = list(reader.events(start=100 * 60.0, end=110 * 60.0))
+
+    assert window == events[100:111]
+    assert blocks_read == [(2, 2)]  # Records 96..111 - second segment, third block
+
+
+def test_replay_publishes_on_bus(tmp_path):
+    """Test that replayed events reach bus subscribers like live ones."""
+    events = _scenario_events(10)
+    journal = EventJournal(tmp_path)
+    bus = EventBus()
+    journal.attach(bus)
+    for event in events:
+        bus.publish(event)
+    bus.close()
+    journal.close()
+
+    received = []
+    replay_bus = EventBus()
+    replay_bus.subscribe(ScenarioChanged, received.append)
+
+    assert JournalReader(tmp_path).replay(replay_bus, start=120.0, end=300.0) == 4
+    assert received == events[2:6]
+
+
+def test_reopen_continues_in_new_segment(tmp_path):
+    """Test that a second run appends a new segment and keeps earlier records."""
+    first = EventJournal(tmp_path)
+    first.append(ScenarioChanged(0.0, Scenario.S0, Scenario.S1, 1.0, structural=False))
+    first.close()
+    second = EventJournal(tmp_path)
+    second.append(ScenarioChanged(60.0, Scenario.S1, Scenario.S2, -1.0, structural=False))
+    second.close()
+
+    assert (tmp_path / "segment-000002.jrn").exists()
+    assert [record.sim_time for record in JournalReader(tmp_path).records()] == [0.0, 60.0]
+
+
+def test_window_spans_runs_restarting_sim_time(tmp_path):
+    """Test that two runs in one directory are both searched for a window."""
+    events = _scenario_events(20, step_s=2.0)
+    for _ in range(2):
+        journal = EventJournal(tmp_path, segment_records=8, block_records=4)
+        for event in events:
+            journal.append(event)
+        journal.close()
+
+    reader = JournalReader(tmp_path)
+
+    assert len(reader.runs) == 2
+    assert [record.sim_time for record in reader.records(10.0, 14.0)] == [10.0, 12.0, 14.0] * 2
+    assert list(reader.events()) == events + events
+
+
+def test_retention_removes_oldest_segments(tmp_path):
+    """Test max_segments retention - removed segments are skipped on replay."""
+    events = _scenario_events(40)
+    journal = EventJournal(tmp_path, segment_records=8, block_records=8, compress=False, max_segments=2)
+    for event in events:
+        journal.append(event)
+    journal.close()
+
+    assert len(list(tmp_path.glob("segment-*"))) == 2
+    assert list(JournalReader(tmp_path).events()) == events[24:]
+
+
+def test_retention_trims_index_and_runs(tmp_path):
+    """Test that retention drops index entries of removed segments and keeps run boundaries."""
+    events = _scenario_events(24)
+    for run in range(3):  # One segment per run, the third run removes the first segment
+        journal = EventJournal(tmp_path, segment_records=8, block_records=4, compress=False, max_segments=2)
+        for event in events[run * 8:(run + 1) * 8]:
+            journal.append(event)
+        journal.close()
+
+    reader = JournalReader(tmp_path)
+
+    assert (tmp_path / "index.bin").stat().st_size == 4 * 16  # 2 segments x 2 blocks
+    assert {segment for _, segment, _ in reader._index} == {2, 3}
+    assert reader.runs == [(0, 2), (2, 4)]
+    assert list(reader.events()) == events[8:]
+
+
+def test_reopen_compresses_raw_segments_of_crashed_run(tmp_path):
+    """Test that segments left raw by a crashed run are compressed on reopen."""
+    events = _scenario_events(8)
+    crashed = EventJournal(tmp_path, segment_records=8, block_records=4)
+    for event in events:
+        crashed.append(event)
+    crashed.flush()  # Crash - never closed, so the segment is never finished
+
+    EventJournal(tmp_path).close()
+
+    assert not (tmp_path / "segment-000001.jrn").exists()
+    assert (tmp_path / "segment-000001.jrnz").exists()
+    assert list(JournalReader(tmp_path).events()) == events
+
+
+def test_attach_never_drops_events(tmp_path):
+    """Test that the journal is a sync consumer - a full async queue does not lose records."""
+    events = _scenario_events(50)
+    journal = EventJournal(tmp_path)
+    bus = EventBus(async_queue_size=1)
+    journal.attach(bus)
+    bus.subscribe(ScenarioChanged, lambda event: None, asynchronous=True)
+    for event in events:
+        bus.publish(event)
+    bus.close()
+    journal.close()
+
+    assert journal.records_written == 50
+    assert list(JournalReader(tmp_path).events()) == events
+
+
+def test_invalid_block_size():
+    """Test that segments must hold whole blocks."""
+    with pytest.raises(ValueError):
+        EventJournal("unused", segment_records=100, block_records=64)
@@ -0,0 +1,70 @@
+"""Tests for simulation lag tracking."""
+
+from algo.lag import LagSample, LagTracker
+
+
+def _tracker(clock, **kwargs):
+    return LagTracker(configured_acceleration=100.0, step_s=60.0, window_real_s=1.0, clock=clock, **kwargs)
+
+
+def test_first_poll_has_no_gap(fake_clock):
+    """Test that the first poll only establishes the baseline."""
+    tracker = _tracker(fake_clock)
+
+    assert tracker.observe(1000.0) == LagSample(gap_s=0.0, skipped_steps=0)
+    assert tracker.achieved_acceleration is None
+    assert tracker.check_thresholds() == []
+
+
+def test_gap_and_skipped_steps(fake_clock):
+    """Test sim-time gap and WS steps that got no reading of their own."""
+    tracker = _tracker(fake_clock)
+    tracker.observe(0.0)
+
+    assert tracker.observe(60.0).skipped_steps == 0
+    sample = tracker.observe(300.0)
+
+    assert sample.gap_s == 240.0
+    assert sample.skipped_steps == 3
+    assert tracker.max_gap_s == 240.0
+    assert tracker.skipped_steps_total == 3
+
+
+def test_achieved_acceleration_over_window(fake_clock):
+    """Test achieved acceleration is measured once the real-time window elapses."""
+    tracker = _tracker(fake_clock)
+    tracker.observe(0.0)
+
+    fake_clock.now = 0.5
+    tracker.observe(40.0)
+    assert tracker.achieved_acceleration is None
+
+    fake_clock.now = 1.0
+    tracker.observe(80.0)
+    assert tracker.achieved_acceleration == 80.0
+    assert tracker.acceleration_ratio == 0.8
+    assert tracker.overall_acceleration == 80.0
+
+
+def test_threshold_warnings_reported_once(fake_clock):
+    """Test that a threshold crossing warns on entry only and re-arms after recovery."""
+    tracker = _tracker(fake_clock, warn_acceleration_ratio=0.9, warn_gap_s=500.0)
+    tracker.observe(0.0)
+
+    fake_clock.now = 1.0
+    tracker.observe(50.0)
+    assert len(tracker.check_thresholds()) == 1
+    assert tracker.check_thresholds() == []
+
+    fake_clock.now = 2.0
+    tracker.observe(650.0)  # 600x over the window, 600s gap
+    (warning,) = tracker.check_thresholds()
+    assert "behind weather service" in warning
+
+    fake_clock.now = 3.0
+    tracker.observe(750.0)
+    assert tracker.check_thresholds() == []
+    fake_clock.now = 4.0
+    tracker.observe(1350.0)
+    assert len(tracker.check_thresholds()) == 1
+
@@ -0,0 +1,110 @@
+"""Tests for queue-based logging with deferred formatting."""
+
+import logging
+import sys
+
+from common.log_queue import DeferredQueueHandler, configure_logging, stop_queued_logging
+
+
+class _ListHandler(logging.Handler):
+    """Keeps formatted lines."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def _bare_root(monkeypatch):
+    """Root logger without handlers (pytest's capture handlers are put back after the test)."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    return root
+
+
+def test_records_written_by_listener(monkeypatch):
+    """Test that records reach the target handler through the queue."""
+    root = _bare_root(monkeypatch)
+    target = _ListHandler()
+    listener = configure_logging(logging.INFO, [target], "%(levelname)s %(message)s")
+    assert listener is not None
+    assert isinstance(root.handlers[0], DeferredQueueHandler)
+
+    logging.getLogger("algo-service.rn").info("RN: %s in %s", "C1", "S5")
+    logging.getLogger("algo-service.rn").debug("RN: %s rotation not ready", "C2")  # Below level
+    stop_queued_logging(listener)
+
+    assert target.lines == ["INFO RN: C1 in S5"]
+
+
+def test_stop_reattaches_targets(monkeypatch):
+    """Test that logging after shutdown is written synchronously to the same handlers."""
+    root = _bare_root(monkeypatch)
+    target = _ListHandler()
+    listener = configure_logging(logging.INFO, [target], "%(message)s")
+    stop_queued_logging(listener)
+    stop_queued_logging(listener)  # Second call is a no-op
+
+    assert root.handlers == [target]
+    logging.getLogger("test").warning("after %d", 1)
+    assert target.lines == ["after 1"]
+
+
+def test_first_configuration_wins(monkeypatch):
+    """Test that a second service in the same process keeps the existing outputs."""
+    _bare_root(monkeypatch)
+    first = _ListHandler()
+    listener = configure_logging(logging.INFO, [first], "%(message)s")
+
+    assert configure_logging(logging.DEBUG, [_ListHandler()], "%(message)s") is None
+    stop_queued_logging(listener)
+
+
+def test_unqueued_attaches_handlers_directly(monkeypatch):
+    """Test log_queue: false (synchronous writes)."""
+    root = _bare_root(monkeypatch)
+    target = _ListHandler()
+
+    assert configure_logging(logging.INFO, [target], "%(message)s", queued=False) is None
+    assert root.handlers == [target]
+
+
+def test_prepare_defers_immutable_arguments():
+    """Test that formatting is left to the listener when arguments cannot change."""
+    handler = DeferredQueueHandler(None)
+    record = logging.LogRecord("rn", logging.INFO, __file__, 1, "%s: %.1f", ("C1", 2.5), None)
+
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "%s: %.1f"
+    assert prepared.args == ("C1", 2.5)
+    assert prepared.getMessage() == "C1: 2.5"
+
+
+def test_prepare_formats_mutable_arguments_eagerly():
+    """Test that mutable arguments are rendered with their value at call time."""
+    handler = DeferredQueueHandler(None)
+    heaters = ["N1"]
+    record = logging.LogRecord("rn", logging.INFO, __file__, 1, "active=%s", (heaters,), None)
+
+    prepared = handler.prepare(record)
+    heaters.append("N2")
+
+    assert prepared.getMessage() == "active=['N1']"
+
+
+def test_prepare_renders_exception_text():
+    """Test that tracebacks are rendered before the frames go away."""
+    handler = DeferredQueueHandler(None)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("rn", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+    prepared = handler.prepare(record)
+
+    assert prepared.exc_info is None
+    assert "ValueError: boom" in prepared.exc_text
@@ -0,0 +1,88 @@
+"""Tests for the in-memory metric store and its query API."""
+
+import pytest
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk.metrics import MeterProvider
+
+from common.metric_store import InMemoryMetricStore
+
+
+@pytest.fixture
+def store():
+    store = InMemoryMetricStore(max_samples=100)
+    store.meter = MeterProvider(metric_readers=[store]).get_meter("test")
+    return store
+
+
+def test_latest_sums_matching_series(store):
+    """Test latest value per attribute filter and across series."""
+    counter = store.meter.create_counter("test.changes")
+    counter.add(2, {"site": "A", "from": "S1"})
+    counter.add(3, {"site": "A", "from": "S2"})
+    store.sample(60.0)
+
+    assert store.latest("test.changes", {"from": "S1"}) == 2
+    assert store.latest("test.changes") == 5
+    assert store.latest("test.changes", {"from": "S8"}, default=0.0) == 0.0
+    assert store.latest("test.missing") is None
+
+
+def test_counter_sum_over_range_is_increase(store):
+    """Test that cumulative counters answer ranges from two samples."""
+    counter = store.meter.create_counter("test.time_s")
+    for t in range(1, 11):
+        counter.add(100)
+        store.sample(t * 100.0)
+
+    assert store.sum_over_range("test.time_s", 0.0, 1000.0) == 1000
+    assert store.sum_over_range("test.time_s", 300.0, 600.0) == 300
+    assert store.sum_over_range("test.time_s", 950.0, 2000.0) == 100  # Sampled at 1000 vs 900
+    assert store.sum_over_range("test.time_s", 1000.0, 2000.0) == 0
+
+
+def test_gauge_sum_and_percentile_over_samples(store):
+    """Test gauge ranges use the sampled values."""
+    value = [0.0]
+    store.meter.create_observable_gauge(
+        "test.temperature",
+        callbacks=[lambda options: [Observation(value[0])]],
+    )
+    for t in range(10):
+        value[0] = float(t)
+        store.sample(float(t))
+
+    assert store.latest("test.temperature") == 9.0
+    assert store.sum_over_range("test.temperature", 2.0, 4.0) == 9.0
+    assert store.percentile("test.temperature", 50) == 4.0
+    assert store.percentile("test.temperature", 100, start=0.0, end=5.0) == 5.0
+
+
+def test_histogram_percentile_within_range(store):
+    """Test bucket-interpolated percentiles of histogram deltas."""
+    histogram = store.meter.create_histogram("test.gap_s", explicit_bucket_boundaries_advisory=[10.0, 20.0, 40.0])
+    for _ in range(10):
+        histogram.record(5.0)
+    store.sample(1.0)
+    for _ in range(10):
+        histogram.record(30.0)
+    store.sample(2.0)
+
+    assert store.percentile("test.gap_s", 50, start=0.0, end=1.0) == pytest.approx(5.0)
+    assert store.percentile("test.gap_s", 50, start=1.0, end=2.0) == pytest.approx(30.0)
+    assert store.percentile("test.gap_s", 100) == pytest.approx(40.0)
+    assert store.latest("test.gap_s") == pytest.approx(350.0)
+
+
+def test_ring_buffer_is_bounded():
+    """Test old samples are dropped and ranges clip to retention."""
+    small = InMemoryMetricStore(max_samples=3)
+    counter = MeterProvider(metric_readers=[small]).get_meter("test").create_counter("test.c")
+    for t in range(10):
+        counter.add(1)
+        small.sample(float(t))
+
+    (series,) = small.series("test.c")
+    assert len(series.samples) == 3
+    assert series.truncated
+    assert small.latest("test.c") == 10
+    assert small.sum_over_range("test.c", 0.0, 9.0) == 2  # Only increase within retained samples
@@ -0,0 +1,137 @@
+"""Tests for algo service metrics (attribute sets and batched flushes)."""
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from algo.algorithm_rn import AlgorithmRN, RNConfig
+from algo.lag import LagTracker
+from algo.metrics import AlgoMetrics
+from algo.state import AlgoState
+from common.domain import Scenario
+
+
+class _InMemoryTelemetry:
+    """Minimal TelemetryManager stand-in backed by the SDK in-memory reader."""
+
+    def __init__(self):
+        self.reader = InMemoryMetricReader()
+        self._provider = MeterProvider(metric_readers=[self.reader])
+
+    def meter(self, name):
+        return self._provider.get_meter(name)
+
+    def points(self, metric_name):
+        """Return {frozenset(attributes): value} for a metric."""
+        data = self.reader.get_metrics_data()
+        result = {}
+        for resource_metrics in data.resource_metrics if data else []:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    if metric.name == metric_name:
+                        for point in metric.data.data_points:
+                            value = getattr(point, "value", None)
+                            result[frozenset(point.attributes.items())] = point.sum if value is None else value
+        return result
+
+
+@pytest.fixture
+def telemetry():
+    return _InMemoryTelemetry()
+
+
+@pytest.fixture
+def state():
+    return AlgoState()
+
+
+@pytest.fixture
+def metrics(telemetry, state):
+    rn = AlgorithmRN(config=RNConfig(rotation_period_hours=1), state=state)
+    return AlgoMetrics(
+        telemetry=telemetry,
+        metrics_prefix="test",
+        default_dimensions={"env": "ut"},
+        state=state,
+        algorithm_rn=rn,
+        flush_interval_s=100.0,
+    )
+
+
+def _scenario_time(telemetry, scenario):
+    return telemetry.points("test.ws.scenario_time_s").get(
+        frozenset({"env": "ut", "scenario": scenario.name}.items())
+    )
+
+
+def test_time_deltas_batched_until_flush_interval(metrics, telemetry, state):
+    """Test that counters only receive accumulated time on flush."""
+    state.current_scenario = Scenario.S2
+    for t in range(10, 100, 10):
+        state.simulation_time = float(t)
+        metrics.update()
+
+    assert _scenario_time(telemetry, Scenario.S2) is None
+
+    state.simulation_time = 110.0
+    metrics.update()
+
+    assert _scenario_time(telemetry, Scenario.S2) == pytest.approx(100.0)
+
+
+def test_shutdown_flushes_pending_time(metrics, telemetry, state):
+    """Test that shutdown pushes time accumulated since the last flush."""
+    state.current_scenario = Scenario.S1
+    state.simulation_time = 10.0
+    metrics.update()
+    state.simulation_time = 40.0
+    metrics.update()
+
+    metrics.shutdown()
+
+    assert _scenario_time(telemetry, Scenario.S1) == pytest.approx(30.0)
+    config_points = telemetry.points("test.rc.config_time_s")
+    assert config_points[frozenset({"env": "ut", "config": "Primary"}.items())] == pytest.approx(30.0)
+
+
+def test_scenario_change_uses_prebuilt_attributes(metrics, telemetry):
+    """Test that transition counters carry default dimensions plus from/to."""
+    metrics.record_scenario_change(Scenario.S0, Scenario.S3)
+    metrics.record_scenario_change(Scenario.S0, Scenario.S3)
+
+    points = telemetry.points("test.ws.scenario_changes")
+    key = frozenset({"env": "ut", "from_scenario": "S0", "to_scenario": "S3"}.items())
+    assert points == {key: 2}
+
+
+def test_heater_gauges_include_line(metrics, telemetry):
+    """Test heater observable gauges report per-heater attributes with line."""
+    points = telemetry.points("test.rn.heater_state")
+
+    assert frozenset({"env": "ut", "heater": "N5", "line": "C2"}.items()) in points
+    assert len(points) == 8
+
+
+def test_loop_lag_metrics(telemetry, state):
+    """Test lag histograms, skipped steps and pacing counters."""
+    clock_now = [0.0]
+    tracker = LagTracker(configured_acceleration=100.0, step_s=60.0, window_real_s=1.0, clock=lambda: clock_now[0])
+    metrics = AlgoMetrics(
+        telemetry=telemetry,
+        metrics_prefix="test",
+        default_dimensions={"env": "ut"},
+        state=state,
+        algorithm_rn=AlgorithmRN(config=RNConfig(rotation_period_hours=1), state=state),
+        lag_tracker=tracker,
+        pacing_stats=lambda: {"missed_deadlines": 2, "current_lag_s": 0.25},
+    )
+    tracker.observe(0.0)
+    clock_now[0] = 1.0
+    metrics.record_lag_sample(tracker.observe(300.0))
+
+    attrs = frozenset({"env": "ut"}.items())
+    assert telemetry.points("test.loop.achieved_acceleration")[attrs] == 300.0
+    assert telemetry.points("test.loop.acceleration_ratio")[attrs] == 3.0
+    assert telemetry.points("test.loop.processing_gap_s")[attrs] == 300.0
+    assert telemetry.points("test.loop.skipped_steps")[attrs] == 4
+    assert telemetry.points("test.loop.missed_deadlines")[attrs] == 2
@@ -0,0 +1,72 @@
+"""Tests for per-stage timing instrumentation."""
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from algo.profiling import Log2Histogram, StageProfiler
+from common.prometheus import render_prometheus_text
+
+
+def test_disabled_profiler_returns_callable_unchanged():
+    """Test that disabled profiling adds no wrapper at all."""
+    profiler = StageProfiler(enabled=False)
+
+    def stage():
+        return 42
+
+    assert profiler.wrap("ws", stage) is stage
+    assert profiler.histograms == {}
+
+
+def test_wrapped_stage_records_duration_and_result():
+    """Test that timed stages keep return values and count calls."""
+    profiler = StageProfiler(enabled=True)
+    wrapped = profiler.wrap("ws", lambda x: x * 2)
+
+    assert [wrapped(i) for i in range(5)] == [0, 2, 4, 6, 8]
+    histogram = profiler.histograms["ws"]
+    assert histogram.count == 5
+    assert histogram.total_ns >= histogram.max_ns >= histogram.min_ns > 0
+
+
+def test_log2_histogram_quantiles():
+    """Test bucket placement and quantile upper bounds."""
+    histogram = Log2Histogram()
+    for duration in [1000] * 99 + [1_000_000]:
+        histogram.record(duration)
+
+    assert histogram.buckets[(1000).bit_length()] == 99
+    assert 1000 <= histogram.quantile_ns(0.5) < 2048
+    assert histogram.quantile_ns(1.0) == 1_000_000
+    assert histogram.mean_ns == (99 * 1000 + 1_000_000) / 100
+
+
+def test_export_maps_to_prometheus_histogram():
+    """Test that collection reports bucket/sum/count series without replaying samples."""
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+    profiler = StageProfiler(enabled=True, meter=meter, metrics_prefix="test")
+    histogram = profiler.histogram("rc")
+    for duration in [1500] * 3 + [3_000_000]:
+        histogram.record(duration)
+
+    reader.get_metrics_data()  # Collecting twice must not double-count cumulative values
+    data = reader.get_metrics_data()
+    metrics = {metric.name: metric.data.data_points for metric in data.resource_metrics[0].scope_metrics[0].metrics}
+
+    (count,) = metrics["test.stage_duration_ms_count"]
+    assert count.value == 4
+    assert count.attributes["stage"] == "rc"
+    (total,) = metrics["test.stage_duration_ms_sum"]
+    assert total.value == (3 * 1500 + 3_000_000) / 1e6
+    buckets = {point.attributes["le"]: point.value for point in metrics["test.stage_duration_ms_bucket"]}
+    assert buckets["0.001024"] == 0
+    assert buckets["0.002048"] == 3  # 1500 ns < 2^11 ns
+    assert buckets["2.097152"] == 3
+    assert buckets["4.194304"] == 4  # 3 ms < 2^22 ns
+    assert buckets["+Inf"] == 4
+
+    text = render_prometheus_text(data)
+    assert 'test_stage_duration_ms_bucket{stage="rc",le="+Inf"} 4' in text
+    assert 'test_stage_duration_ms_count{stage="rc"} 4' in text
+    assert "_total" not in text
@@ -0,0 +1,74 @@
+"""Tests for the Prometheus pull endpoint."""
+
+from urllib.request import urlopen
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+
+from common.prometheus import PrometheusMetricReader
+
+
+@pytest.fixture
+def reader():
+    reader = PrometheusMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    reader.meter = provider.get_meter("test")
+    yield reader
+    provider.shutdown()
+
+
+def test_render_counter_gauge_and_histogram(reader):
+    """Test text format of each instrument kind."""
+    counter = reader.meter.create_counter("bogdanka.algo.rc.config_changes", description="Config changes")
+    counter.add(3, {"site": "Szyb-2", "config": "Primary"})
+    reader.meter.create_up_down_counter("bogdanka.algo.line.active").add(2)
+    histogram = reader.meter.create_histogram("test.gap_s", explicit_bucket_boundaries_advisory=[1.0, 10.0])
+    for value in (0.5, 5.0, 50.0):
+        histogram.record(value)
+
+    text = reader.render()
+
+    assert "# HELP bogdanka_algo_rc_config_changes_total Config changes" in text
+    assert "# TYPE bogdanka_algo_rc_config_changes_total counter" in text
+    assert 'bogdanka_algo_rc_config_changes_total{site="Szyb-2",config="Primary"} 3' in text
+    assert "# TYPE bogdanka_algo_line_active gauge" in text
+    assert 'test_gap_s_bucket{le="1"} 1' in text
+    assert 'test_gap_s_bucket{le="10"} 2' in text
+    assert 'test_gap_s_bucket{le="+Inf"} 3' in text
+    assert "test_gap_s_sum 55.5" in text
+    assert "test_gap_s_count 3" in text
+
+
+def test_observable_callbacks_run_only_on_scrape(reader):
+    """Test that observable instruments cost nothing until rendered."""
+    calls = []
+
+    def callback(options):
+        calls.append(1)
+        return []
+
+    reader.meter.create_observable_gauge("test.gauge", callbacks=[callback])
+    assert calls == []
+
+    reader.render()
+    reader.render()
+    assert len(calls) == 2
+
+
+def test_label_values_escaped(reader):
+    """Test quotes, backslashes and newlines in label values."""
+    reader.meter.create_counter("test.c").add(1, {"path": 'a\\b"c\nd'})
+
+    assert 'test_c_total{path="a\\\\b\\"c\\nd"} 1' in reader.render()
+
+
+def test_http_endpoint_serves_metrics(reader):
+    """Test GET /metrics on an ephemeral port."""
+    reader.meter.create_counter("test.requests").add(5)
+    host, port = reader.start_server("127.0.0.1", 0)
+
+    with urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.read().decode()
+
+    assert "test_requests_total 5" in body
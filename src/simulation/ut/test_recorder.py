@@ -0,0 +1,78 @@
+"""Tests for the columnar trajectory recorder."""
+
+import pytest
+
+from algo.algorithm_rn import AlgorithmRN, RNConfig
+from algo.algorithm_ws import AlgorithmWS, WSConfig
+from algo.recorder import HEATER_BITS, LOCK_RC, TrajectoryRecorder, load_trajectory
+from algo.state import AlgoState
+from common.domain import Heater, Scenario
+
+
+def _filled_recorder(rows=10, chunk_size=4):
+    """Recorder spanning several chunks with predictable values."""
+    recorder = TrajectoryRecorder(chunk_size=chunk_size)
+    for i in range(rows):
+        recorder.append(
+            sim_time=i * 10.0,
+            temperature=-float(i),
+            t_filtered=-float(i) + 0.5,
+            scenario=i % 9,
+            config=i % 2,
+            heaters=i,
+            locks=LOCK_RC if i % 3 == 0 else 0,
+        )
+    return recorder
+
+
+def test_append_spans_chunks():
+    """Test that values survive chunk boundaries in order."""
+    recorder = _filled_recorder(rows=10, chunk_size=4)
+
+    assert len(recorder) == 10
+    assert list(recorder.column("sim_time")) == [i * 10.0 for i in range(10)]
+    assert list(recorder.column("scenario")) == [i % 9 for i in range(10)]
+
+
+@pytest.mark.parametrize("fmt, name", [("npz", "trajectory.npz"), ("npy", "trajectory")])
+def test_save_and_load_roundtrip(tmp_path, fmt, name):
+    """Test that both output formats load back identical columns."""
+    recorder = _filled_recorder()
+    path = recorder.save(tmp_path / name, fmt)
+
+    columns = load_trajectory(path)
+
+    assert set(columns) == {"sim_time", "temperature", "t_filtered", "scenario", "config", "heaters", "locks"}
+    assert list(columns["sim_time"]) == [i * 10.0 for i in range(10)]
+    assert list(columns["t_filtered"]) == [-float(i) + 0.5 for i in range(10)]
+    assert list(columns["locks"]) == [LOCK_RC if i % 3 == 0 else 0 for i in range(10)]
+
+
+def test_npy_directory_is_memory_mappable(tmp_path):
+    """Test that numpy can memory-map the npy output (analysis dependency)."""
+    np = pytest.importorskip("numpy")
+    path = _filled_recorder().save(tmp_path / "trajectory", "npy")
+
+    sim_time = np.load(path / "sim_time.npy", mmap_mode="r")
+
+    assert isinstance(sim_time, np.memmap)
+    assert sim_time.dtype == np.float64
+    assert sim_time[-1] == 90.0
+
+
+def test_record_tick_captures_controller_state():
+    """Test heater bitmask, scenario and filtered temperature of one tick."""
+    state = AlgoState()
+    ws = AlgorithmWS(config=WSConfig(), state=state)
+    rn = AlgorithmRN(config=RNConfig(rotation_period_hours=1), state=state)
+    state.simulation_time = 100.0
+    ws.process_temperature(-5.0)
+    rn.process()
+
+    recorder = TrajectoryRecorder(chunk_size=8)
+    recorder.record_tick(100.0, -5.0, state, ws, rn)
+
+    assert recorder.column("scenario")[0] == Scenario.S3.value
+    assert recorder.column("t_filtered")[0] == -5.0
+    expected = HEATER_BITS[Heater.N1] | HEATER_BITS[Heater.N2] | HEATER_BITS[Heater.N3]
+    assert recorder.column("heaters")[0] == expected
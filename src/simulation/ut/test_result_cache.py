@@ -0,0 +1,75 @@
+"""Tests for the content-addressed test result cache."""
+
+from run_test_scenarios import ResultCache
+
+PROFILE = {
+    "id": "profile_s3",
+    "name": "TEST_S3",
+    "priority": "HIGH",
+    "description": "S3",
+    "profile_type": "constant",
+    "temperature_c": -5.0,
+    "duration_days": 2,
+    "expected_results": {"scenario": "S3"},
+}
+
+
+def _config(port=8080):
+    return {
+        "simulation": {"duration_days": 2, "acceleration": 1000.0},
+        "services": {
+            "weather": {"port": port, "profile_type": "constant"},
+            "algo": {"weather_endpoint": f"http://localhost:{port}/temperature", "display": {"enabled": False}},
+        },
+        "telemetry": {"exporter_type": "memory", "log_file": "logs/test_profile_s3.log"},
+    }
+
+
+def _cache(tmp_path):
+    source = tmp_path / "src"
+    (source / "algo").mkdir(parents=True)
+    (source / "algo" / "rules.py").write_text("LIMIT = 1\n")
+    return ResultCache(tmp_path / "cache", source_root=source), source
+
+
+def test_key_ignores_slot_and_expectations(tmp_path):
+    """Test that ports, log paths and expected_results do not change the key."""
+    cache, _ = _cache(tmp_path)
+    key = cache.key(PROFILE, _config(), fast_forward=True)
+
+    relabeled = {**PROFILE, "id": "other", "expected_results": {"scenario": "S4"}}
+    assert cache.key(relabeled, _config(port=8085), fast_forward=True) == key
+
+
+def test_key_tracks_inputs(tmp_path):
+    """Test that profile inputs, config, run mode and source all invalidate the key."""
+    cache, source = _cache(tmp_path)
+    key = cache.key(PROFILE, _config(), fast_forward=True)
+
+    config = _config()
+    config["simulation"]["duration_days"] = 1
+    assert cache.key({**PROFILE, "temperature_c": -6.0}, _config(), fast_forward=True) != key
+    assert cache.key(PROFILE, config, fast_forward=True) != key
+    assert cache.key(PROFILE, _config(), fast_forward=False) != key
+
+    (source / "algo" / "rules.py").write_text("LIMIT = 2\n")
+    key = ResultCache(cache.directory, source_root=source).key(PROFILE, _config(), fast_forward=True)
+    assert key != cache.key(PROFILE, _config(), fast_forward=True)
+
+    # Metric collection lives in the runner - changing it must not hit stale results
+    (source / "run_test_scenarios.py").write_text("def _collect_metrics(): ...\n")
+    assert ResultCache(cache.directory, source_root=source).key(PROFILE, _config(), fast_forward=True) != key
+
+
+def test_store_and_load(tmp_path):
+    """Test that stored metrics come back and misses return None."""
+    cache, _ = _cache(tmp_path)
+    key = cache.key(PROFILE, _config(), fast_forward=True)
+    assert cache.load(key) is None
+    assert not cache.contains(key)
+
+    cache.store(key, PROFILE, {"rn_heater_rotations": 12, "scenario": "S3"})
+
+    assert cache.contains(key)
+    assert cache.load(key) == {"rn_heater_rotations": 12, "scenario": "S3"}
+    assert list(cache.directory.glob("*.tmp")) == []
@@ -0,0 +1,120 @@
+"""Tests for the SQLite results warehouse."""
+
+import sqlite3
+
+import yaml
+
+from results_store import ResultsStore, RunMode, flatten_metrics
+
+
+def _run(timestamp, status="PASSED", balance_c2=1.01, passed=True, run_mode=None):
+    return {
+        "timestamp": timestamp,
+        "run_mode": run_mode or {},
+        "total_tests": 1,
+        "passed": int(status == "PASSED"),
+        "failed": int(status == "FAILED"),
+        "errors": 0,
+        "results": [
+            {
+                "profile_id": "profile_s6",
+                "profile_name": "TEST_S6",
+                "priority": "HIGH",
+                "status": status,
+                "duration_s": 1.5,
+                "actual_metrics": {
+                    "rc_line_changes": 4,
+                    "heater_operating_times": {"N1": {"operating_h": 12.0, "state": "active"}},
+                },
+                "validation_results": [
+                    {
+                        "metric": "heater_balance_c2",
+                        "expected": {"min": 1.0, "max": 1.2},
+                        "actual": balance_c2,
+                        "passed": passed,
+                        "message": "In range" if passed else "Above max",
+                    }
+                ],
+                "error_message": None,
+            }
+        ],
+    }
+
+
+def test_flatten_metrics_keeps_numeric_leaves():
+    """Test that nested metrics become dotted names and non-numeric leaves are skipped."""
+    flat = dict(flatten_metrics(_run("2026-01-01T00:00:00")["results"][0]["actual_metrics"]))
+    assert flat == {"rc_line_changes": 4.0, "heater_operating_times.N1.operating_h": 12.0}
+
+
+def test_metric_history_over_last_runs(tmp_path):
+    """Test ordering, limit and derived (validation-only) metrics in history queries."""
+    with ResultsStore(tmp_path / "results.db") as store:
+        for day in range(1, 6):
+            store.ingest_results(_run(f"2026-01-0{day}T00:00:00", balance_c2=1.0 + day / 100), f"run_{day}.yaml")
+        assert store.ingest_results(_run("2026-01-09T00:00:00"), "run_1.yaml") is None  # Already stored
+
+        history = store.metric_history("TEST_S6", "heater_balance_c2", last=3)
+        assert [point.value for point in history] == [1.03, 1.04, 1.05]
+        assert [point.timestamp[:10] for point in history] == ["2026-01-03", "2026-01-04", "2026-01-05"]
+        assert store.metric_history("profile_s6", "heater_operating_times.N1.operating_h", last=50)[0].value == 12.0
+        assert store.run_count() == 5
+
+
+def test_incremental_directory_ingest_and_regressions(tmp_path):
+    """Test that only new files are ingested and a pass -> fail flip is reported."""
+    for index, run in enumerate([_run("2026-01-01T00:00:00"), _run("2026-01-02T00:00:00")]):
+        with (tmp_path / f"test_results_2026010{index + 1}_000000.yaml").open("w") as f:
+            yaml.dump(run, f)
+
+    with ResultsStore(tmp_path / "results.db") as store:
+        assert len(store.ingest_directory(tmp_path)) == 2
+        assert store.regressions() == []
+
+        with (tmp_path / "test_results_20260103_000000.yaml").open("w") as f:
+            yaml.dump(_run("2026-01-03T00:00:00", status="FAILED", balance_c2=1.3, passed=False), f)
+        assert len(store.ingest_directory(tmp_path)) == 1
+        assert store.ingest_directory(tmp_path) == []
+
+        regressions = store.regressions()
+        assert [(r.profile_name, r.metric, r.latest) for r in regressions] == [
+            ("TEST_S6", None, "FAILED"),
+            ("TEST_S6", "heater_balance_c2", "failed"),
+        ]
+
+
+def test_trends_and_regressions_compare_one_run_mode(tmp_path):
+    """Test that short/early-stopped runs are neither trended nor compared with full-length runs."""
+    short = {"duration_override": 3, "fast_forward": True, "early_stop": True}
+    with ResultsStore(tmp_path / "results.db") as store:
+        store.ingest_results(_run("2026-01-01T00:00:00", balance_c2=1.01), "full_1.yaml")
+        store.ingest_results(_run("2026-01-02T00:00:00", balance_c2=1.02), "full_2.yaml")
+        store.ingest_results(
+            _run("2026-01-03T00:00:00", status="FAILED", balance_c2=1.5, passed=False, run_mode=short), "short_1.yaml"
+        )
+
+        assert store.latest_mode("TEST_S6") == RunMode(duration_override=3, fast_forward=True, early_stop=True)
+        assert store.regressions() == []  # First run of its mode - nothing to compare with
+        assert [p.value for p in store.metric_history("TEST_S6", "heater_balance_c2")] == [1.5]
+        assert [p.value for p in store.metric_history("TEST_S6", "heater_balance_c2", mode=RunMode())] == [1.01, 1.02]
+        assert [status for _, status in store.status_history("TEST_S6", mode=RunMode())] == ["PASSED", "PASSED"]
+
+        store.ingest_results(_run("2026-01-04T00:00:00", status="FAILED", balance_c2=1.3, passed=False), "full_3.yaml")
+        regressions = store.regressions()
+        assert [(r.metric, r.mode) for r in regressions] == [(None, RunMode()), ("heater_balance_c2", RunMode())]
+        assert RunMode(3, None, True, True).describe() == "--days 3 --fast-forward --early-stop"
+
+
+def test_run_mode_columns_added_to_older_database(tmp_path):
+    """Test that a warehouse created before run modes gets the columns on open."""
+    path = tmp_path / "results.db"
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE runs (id INTEGER PRIMARY KEY, source TEXT NOT NULL UNIQUE, timestamp TEXT NOT NULL, "
+        "total_tests INTEGER NOT NULL, passed INTEGER NOT NULL, failed INTEGER NOT NULL, errors INTEGER NOT NULL)"
+    )
+    db.close()
+
+    with ResultsStore(path) as store:
+        store.ingest_results(_run("2026-01-01T00:00:00"), "old.yaml")
+        assert store.latest_mode("TEST_S6") == RunMode()
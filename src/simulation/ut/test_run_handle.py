@@ -0,0 +1,63 @@
+"""Tests for the run progress / outcome handle."""
+
+import threading
+
+import pytest
+
+from algo.run_handle import COMPLETED, FAILED, STOPPED, RunHandle, SimulationStalled
+
+
+def test_milestones_wake_waiters():
+    """Test that reports crossing milestones are seen by a blocked waiter in order."""
+    handle = RunHandle(duration_s=1000.0, milestones=4)
+    seen = []
+    waiter = threading.Thread(target=lambda: seen.extend(handle.watch(stall_timeout_s=5.0)))
+    waiter.start()
+
+    for sim_time in range(0, 1001, 50):
+        handle.report(float(sim_time))
+    handle.finish(COMPLETED)
+    waiter.join(timeout=5.0)
+
+    assert not waiter.is_alive()
+    assert seen[-1] == 4
+    assert seen == sorted(set(seen))
+    assert handle.progress == 1.0
+
+
+def test_first_outcome_wins():
+    """Test that finish() keeps the first outcome and releases wait()."""
+    handle = RunHandle(duration_s=100.0)
+    assert not handle.wait(timeout=0.01)
+
+    handle.finish(STOPPED, "verdict decided")
+    handle.finish(FAILED, "late error", RuntimeError("late"))
+
+    assert handle.wait(timeout=0.01)
+    assert handle.outcome == STOPPED
+    assert handle.reason == "verdict decided"
+    assert handle.error is None
+
+
+def test_watch_raises_on_stalled_sim_time():
+    """Test the watchdog - no sim-time progress within the timeout raises."""
+    handle = RunHandle(duration_s=100.0)
+    handle.report(5.0)
+
+    with pytest.raises(SimulationStalled, match="stuck at 5s"):
+        list(handle.watch(stall_timeout_s=0.05))
+
+
+def test_wait_ready_handshake():
+    """Test that wait_ready() returns once the service is ready or the run already ended."""
+    handle = RunHandle(duration_s=100.0)
+    assert not handle.wait_ready(timeout=0.01)
+
+    threading.Timer(0.02, handle.mark_ready).start()
+    assert handle.wait_ready(timeout=5.0)
+    assert handle.ready
+
+    failed = RunHandle(duration_s=100.0)
+    failed.finish(FAILED, "Weather service not available")
+    assert failed.wait_ready(timeout=0.01)
+    assert not failed.ready
@@ -0,0 +1,91 @@
+"""Tests for TestRunner result transport and worker batching."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+import run_test_scenarios
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
+
+def _profile(number):
+    return {
+        "id": f"profile_{number}",
+        "name": f"TEST_{number}",
+        "priority": "HIGH",
+        "description": f"Profil {number}",
+        "duration_days": 1,
+        "profile_type": "constant",
+        "temperature_c": -5.0,
+        "expected_results": {"scenario": "S3", "rn_rotations": {"max": 4}},
+    }
+
+
+def _runner(tmp_path, count, **kwargs):
+    profiles_path = tmp_path / "profiles.yaml"
+    profiles_path.write_text(yaml.safe_dump({"test_profiles": [_profile(i) for i in range(count)]}))
+    return run_test_scenarios.TestRunner(profiles_path, CONFIG_PATH, tmp_path / "results", use_cache=False, **kwargs)
+
+
+@pytest.mark.parametrize("cached, early_stop", [
+    (False, None),
+    (True, None),
+    (False, {"verdict": "PASSED", "metric": "rn_rotations", "sim_time_s": 3600.0, "actual": 2}),
+])
+def test_result_roundtrip_through_dict(cached, early_stop):
+    """Test that a worker result rebuilt with from_dict equals the original."""
+    profile = _profile(1)
+    result = run_test_scenarios.TestResult(profile)
+    result.start_time, result.end_time = 100.0, 112.5
+    result.status = "PASSED"
+    result.actual_metrics = {"scenario": "S3", "rn_rotations": 2, "heater_balance_c1": 0.25}
+    result.validation_results = [{"metric": "rn_rotations", "passed": True, "expected": {"max": 4}, "actual": 2}]
+    result.cached = cached
+    result.early_stop = early_stop
+
+    rebuilt = run_test_scenarios.TestResult.from_dict(profile, result.to_dict(), result.start_time, result.end_time)
+
+    assert rebuilt.to_dict() == result.to_dict()
+    assert rebuilt.status == "PASSED"
+    assert rebuilt.actual_metrics == result.actual_metrics
+    assert rebuilt.cached is cached
+    assert rebuilt.early_stop == early_stop
+    assert rebuilt.duration_s == 12.5
+
+
+def test_error_result_roundtrip():
+    """Test that an ERROR result keeps its message."""
+    profile = _profile(1)
+    result = run_test_scenarios.TestResult(profile)
+    result.status = "ERROR"
+    result.error_message = "Weather service did not start"
+
+    rebuilt = run_test_scenarios.TestResult.from_dict(profile, result.to_dict(), None, None)
+
+    assert rebuilt.status == "ERROR"
+    assert rebuilt.error_message == "Weather service did not start"
+    assert not rebuilt.passed
+
+
+def test_parallel_batches_recycle_workers(tmp_path):
+    """Test that process pools run at most parallel_workers * max_tasks_per_child tests each."""
+    runner = _runner(tmp_path, 7, parallel_workers=2, max_tasks_per_child=2)
+
+    batches = runner._parallel_batches()
+
+    assert [[index for index, _ in batch] for batch in batches] == [[0, 1, 2, 3], [4, 5, 6]]
+    assert [profile["id"] for batch in batches for _, profile in batch] == [f"profile_{i}" for i in range(7)]
+
+
+@pytest.mark.parametrize("settings", [
+    {"max_tasks_per_child": None},
+    {"max_tasks_per_child": 0},
+    {"max_tasks_per_child": 2, "isolation": "thread"},
+])
+def test_parallel_batches_single_pool(tmp_path, settings):
+    """Test that without worker recycling (or with threads) all tests share one pool."""
+    runner = _runner(tmp_path, 7, parallel_workers=2, **settings)
+
+    assert [[index for index, _ in batch] for batch in runner._parallel_batches()] == [list(range(7))]
@@ -0,0 +1,102 @@
+"""Tests for the simulation-time scheduler."""
+
+import pytest
+
+from algo.scheduler import CATCH_UP, COALESCE, SimScheduler
+
+
+def _recorder(calls, name):
+    return lambda tick_time: calls.append((name, tick_time))
+
+
+def test_tasks_run_on_their_own_period():
+    """Test that tasks fire on sim-time ticks regardless of poll spacing."""
+    scheduler = SimScheduler()
+    calls = []
+    scheduler.register("ws", 10, _recorder(calls, "ws"))
+    scheduler.register("rc", 60, _recorder(calls, "rc"), priority=1)
+
+    for now in [0, 7, 13, 25, 31, 59, 61]:
+        scheduler.run_due(now)
+
+    assert [t for name, t in calls if name == "rc"] == [0.0, 60.0]
+    assert [t for name, t in calls if name == "ws"] == [0.0, 10.0, 20.0, 30.0, 50.0, 60.0]
+
+
+def test_priority_orders_tasks_within_tick():
+    """Test that lower priority value runs first on a shared tick."""
+    scheduler = SimScheduler()
+    calls = []
+    scheduler.register("display", 10, _recorder(calls, "display"), priority=5)
+    scheduler.register("ws", 10, _recorder(calls, "ws"), priority=0)
+    scheduler.register("rn", 10, _recorder(calls, "rn"), priority=2)
+
+    scheduler.run_due(0)
+
+    assert [name for name, _ in calls] == ["ws", "rn", "display"]
+
+
+def test_phase_delays_first_tick():
+    """Test that phase_s offsets all ticks of a task."""
+    scheduler = SimScheduler()
+    calls = []
+    scheduler.register("rn", 60, _recorder(calls, "rn"), phase_s=30)
+
+    for now in [0, 29, 30, 89, 90]:
+        scheduler.run_due(now)
+
+    assert [t for _, t in calls] == [30.0, 90.0]
+
+
+def test_coalesce_runs_once_for_missed_ticks():
+    """Test that a coalescing task runs once with the latest missed tick."""
+    scheduler = SimScheduler()
+    calls = []
+    task = scheduler.register("rc", 60, _recorder(calls, "rc"), policy=COALESCE)
+
+    scheduler.run_due(0)
+    scheduler.run_due(250)  # Ticks 60, 120, 180, 240 missed
+
+    assert calls == [("rc", 0.0), ("rc", 240.0)]
+    assert task.coalesced_ticks == 3
+
+
+def test_catch_up_replays_missed_ticks_in_order():
+    """Test chronological interleaving of catch-up ticks with other tasks."""
+    scheduler = SimScheduler()
+    calls = []
+    scheduler.register("ws", 10, _recorder(calls, "ws"), policy=CATCH_UP)
+    scheduler.register("rc", 20, _recorder(calls, "rc"), priority=1, policy=CATCH_UP)
+
+    scheduler.run_due(0)
+    calls.clear()
+    scheduler.run_due(20)
+
+    assert calls == [("ws", 10.0), ("ws", 20.0), ("rc", 20.0)]
+
+
+def test_catch_up_is_capped():
+    """Test that replay is bounded by max_catch_up_ticks."""
+    scheduler = SimScheduler(max_catch_up_ticks=3)
+    calls = []
+    task = scheduler.register("ws", 10, _recorder(calls, "ws"), policy=CATCH_UP)
+
+    scheduler.run_due(0)
+    calls.clear()
+    scheduler.run_due(100)
+
+    assert [t for _, t in calls] == [80.0, 90.0, 100.0]
+    assert task.dropped_ticks == 7
+
+
+def test_register_validation():
+    """Test invalid registrations are rejected."""
+    scheduler = SimScheduler()
+    scheduler.register("ws", 10, lambda t: None)
+
+    with pytest.raises(ValueError):
+        scheduler.register("ws", 10, lambda t: None)
+    with pytest.raises(ValueError):
+        scheduler.register("rc", 0, lambda t: None)
+    with pytest.raises(ValueError):
+        scheduler.register("rn", 10, lambda t: None, policy="skip")
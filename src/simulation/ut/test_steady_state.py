@@ -0,0 +1,93 @@
+"""Tests for steady-state cycle detection and extrapolation."""
+
+from algo.checkpoint import capture_checkpoint, restore_checkpoint
+from algo.events import EventBus
+from algo.steady_state import SteadyStateDetector, cycle_key, steady_state_horizon
+
+STEP_S = 60
+
+
+def _step(controller, t):
+    state, ws, rc, rn = controller
+    state.update_simulation_time(float(t))
+    ws.process_temperature(-5.0)  # S3: single line, RC and RN both rotate
+    rc.process()
+    rn.process()
+
+
+def _horizon(controller):
+    _, ws, rc, rn = controller
+    return steady_state_horizon(ws.config, rc.config, rn.config)
+
+
+def test_key_ignores_time_offsets_and_accumulators(make_controller):
+    """Test that shifting all timestamps and growing totals keeps the key."""
+    controller = make_controller()
+    for t in range(0, 6 * 3600, STEP_S):
+        _step(controller, t)
+    checkpoint = capture_checkpoint(*controller)
+    horizon = _horizon(controller)
+
+    shifted = capture_checkpoint(*controller)
+    shifted["simulation_time"] += 3600.0
+    shifted["state"]["timestamp_last_config_change"] += 3600.0
+    shifted["rn"]["last_update_time"] += 3600.0
+    shifted["rc"]["last_update_time"] += 3600.0
+    shifted["ws"]["last_time_update"] += 3600.0
+    shifted["state"]["timestamp_last_reading"] += 3600.0
+    shifted["state"]["config_rotation_end_time"] += 3600.0
+    shifted["state"]["heater_rotation_end_time"] += 3600.0
+    for line in shifted["rn"]["last_rotation_per_line"]:
+        shifted["rn"]["last_rotation_per_line"][line] += 3600.0
+    shifted["rn"]["last_rotation_global"] += 3600.0
+    shifted["rc"]["rotation_count"] += 10
+    for tracking in shifted["rn"]["heater_tracking"].values():
+        tracking["operating_time_s"] += 1800.0
+    assert cycle_key(shifted, {}, horizon) == cycle_key(checkpoint, {}, horizon)
+
+    unbalanced = capture_checkpoint(*controller)
+    unbalanced["rn"]["heater_tracking"]["N1"]["operating_time_s"] += 60.0
+    assert cycle_key(unbalanced, {}, horizon) != cycle_key(checkpoint, {}, horizon)
+    assert cycle_key(checkpoint, {"rn": 30.0}, horizon) != cycle_key(checkpoint, {"rn": 0.0}, horizon)
+
+
+def test_extrapolation_matches_full_run(make_controller):
+    """Test that skipping detected cycles ends in the state of an uninterrupted run."""
+    end_s = 10 * 24 * 3600
+    full = make_controller()
+    for t in range(0, end_s + STEP_S, STEP_S):
+        _step(full, t)
+
+    bus = EventBus()
+    fast = make_controller(event_bus=bus)
+    detector = SteadyStateDetector(_horizon(fast))
+    detector.attach(bus)
+    t = 0
+    cycle = None
+    while cycle is None:
+        _step(fast, t)
+        if detector.due(t):
+            cycle = detector.observe(capture_checkpoint(*fast), {})
+        t += STEP_S
+
+    cycles = (end_s - cycle.end["simulation_time"]) // cycle.period_s
+    restore_checkpoint(cycle.advance(int(cycles)), *fast)
+    for t in range(int(fast[0].simulation_time) + STEP_S, end_s + STEP_S, STEP_S):
+        _step(fast, t)
+
+    assert sum(cycle.events.values()) > 0  # The cycle contains RC/RN rotations
+    assert capture_checkpoint(*fast)["state"] == capture_checkpoint(*full)["state"]
+    for index in (1, 2, 3):
+        assert fast[index].to_snapshot() == full[index].to_snapshot()
+
+
+def test_detector_gives_up_after_max_probes(make_controller):
+    """Test that probing stops once max_probes distinct states were stored."""
+    controller = make_controller()
+    detector = SteadyStateDetector(_horizon(controller), max_probes=2)
+    for t in (0, STEP_S):
+        _step(controller, t)
+        assert detector.observe(capture_checkpoint(*controller), {}) is None
+
+    assert detector.exhausted
+    assert not detector.due(3600.0)
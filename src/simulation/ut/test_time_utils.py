@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from common.time_utils import AcceleratedClock
+from common.time_utils import AcceleratedClock, DeadlinePacer
 
 
 def test_accelerated_clock_initialization():
@@ -86,3 +86,67 @@ def test_accelerated_clock_different_accelerations():
     # 1000x should be ~1000 times faster than 1x
     assert 900 <= time_1000x / time_1x <= 1100
 
+
+class _FakeTime:
+    """Manual clock for deterministic pacing tests."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_deadline_pacer_sleeps_to_absolute_deadline():
+    """Test that iteration work time is absorbed - no drift across iterations."""
+    fake = _FakeTime()
+    pacer = DeadlinePacer(interval_s=1.0, clock=fake.clock, sleep=fake.sleep)
+    pacer.start()
+
+    for work in [0.2, 0.5, 0.9]:
+        fake.now += work
+        assert pacer.wait() == 0.0
+
+    assert fake.now == pytest.approx(3.0)
+    assert pacer.missed_deadlines == 0
+
+
+def test_deadline_pacer_catches_up_after_overrun():
+    """Test that after an overrun the loop runs without sleeping until on schedule."""
+    fake = _FakeTime()
+    pacer = DeadlinePacer(interval_s=1.0, clock=fake.clock, sleep=fake.sleep)
+    pacer.start()
+
+    fake.now += 2.5  # Overrun: deadline 1.0 missed by 1.5s
+    assert pacer.wait() == pytest.approx(1.5)
+    assert pacer.behind
+
+    fake.now += 0.1  # Deadline 2.0 also missed
+    assert pacer.wait() == pytest.approx(0.6)
+
+    fake.now += 0.1  # 2.7 < deadline 3.0 - back on schedule
+    assert pacer.wait() == 0.0
+    assert not pacer.behind
+    assert fake.now == pytest.approx(3.0)
+    assert pacer.missed_deadlines == 2
+    assert pacer.max_lag_s == pytest.approx(1.5)
+
+
+def test_deadline_pacer_resyncs_when_too_far_behind():
+    """Test that a huge lag re-anchors the schedule instead of replaying it."""
+    fake = _FakeTime()
+    pacer = DeadlinePacer(interval_s=1.0, max_lag_intervals=5, clock=fake.clock, sleep=fake.sleep)
+    pacer.start()
+
+    fake.now += 20.0
+    pacer.wait()
+    fake.now += 0.1
+    pacer.wait()
+
+    assert pacer.resyncs == 1
+    assert fake.now == pytest.approx(21.0)  # Next deadline anchored at 20.0 + 1.0
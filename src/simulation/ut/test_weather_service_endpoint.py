@@ -1,3 +1,6 @@
+import json
+import threading
+import urllib.request
 from dataclasses import replace
 
 import pytest
@@ -45,3 +48,22 @@ def test_temperature_endpoint_returns_snapshot(app_config):
     assert payload["simulation_time"] == pytest.approx(12 * 3600, rel=1e-3)
     application.shutdown()
 
+
+
+def test_bind_ephemeral_port_serves_requests(app_config):
+    clock = FakeClock()
+    application = WeatherApplication(app_config, clock=clock, enable_background=False)
+    port = application.bind("localhost", 0)
+    server = threading.Thread(target=application.serve_forever, daemon=True)
+    server.start()
+
+    clock.set_time(3600)
+    application.simulator.restart_clock()  # FakeClock has no reset() - keeps its time
+    with urllib.request.urlopen(f"http://localhost:{port}/temperature", timeout=5.0) as response:
+        payload = json.load(response)
+
+    assert port > 0
+    assert payload["simulation_time"] == pytest.approx(3600)
+    application.shutdown()
+    server.join(timeout=5.0)
+    assert not server.is_alive()
@@ -7,13 +7,13 @@ import logging
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from flask import Flask, jsonify
 from opentelemetry.metrics import CallbackOptions, Observation
 
 from common.config import AppConfig, SimulationSettings, WeatherServiceConfig, load_config
 from common.domain import WeatherSnapshot
+from common.log_queue import configure_logging as configure_queued_logging
 from common.telemetry import TelemetryManager
 from common.time_utils import AcceleratedClock, Clock
 from weather.profile import (
@@ -72,7 +72,7 @@ class WeatherSimulator:
         self,
         simulation: SimulationSettings,
         config: WeatherServiceConfig,
-        metrics: WeatherMetrics,
+        metrics: Optional[WeatherMetrics],
         clock: Optional[Clock] = None,
         profile = None,  # Can be WinterProfileCalculator or ConstantProfileCalculator
         poll_interval_sim_s: float = 60.0,
@@ -121,7 +121,7 @@ class WeatherSimulator:
             )
         
         self._poll_interval = poll_interval_sim_s
-        self._latest = self._build_snapshot(0.0)
+        self._latest = self._build_snapshot(min(self._clock.now(), simulation.duration_seconds))
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
@@ -139,6 +139,13 @@ class WeatherSimulator:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
 
+    def restart_clock(self) -> None:
+        """Re-anchor simulation time to its start at this real-time instant (clocks with reset())."""
+        reset = getattr(self._clock, "reset", None)
+        if reset is not None:
+            reset()
+        self.update_state()
+
     def get_snapshot(self) -> WeatherSnapshot:
         with self._lock:
             snapshot = self._latest
@@ -148,17 +155,15 @@ class WeatherSimulator:
         return snapshot
 
     def update_state(self) -> WeatherSnapshot:
-        sim_time = min(self._clock.now(), self._simulation.duration_seconds)
-        temperature = self._profile.temperature_at(sim_time)
-        snapshot = WeatherSnapshot(
-            simulation_time=sim_time,
-            temperature_c=temperature,
-            simulation_day=sim_time / SECONDS_PER_DAY,
-            profile=self._profile.profile_metadata(),
-        )
+        return self.snapshot_at(self._clock.now())
+
+    def snapshot_at(self, sim_time: float) -> WeatherSnapshot:
+        """Compute weather at sim_time (clamped to the simulation duration) and make it the latest."""
+        snapshot = self._build_snapshot(min(sim_time, self._simulation.duration_seconds))
         with self._lock:
             self._latest = snapshot
-        self._metrics.record_snapshot(snapshot)
+        if self._metrics is not None:
+            self._metrics.record_snapshot(snapshot)
         return snapshot
 
     def _run_loop(self) -> None:
@@ -186,9 +191,14 @@ class WeatherApplication:
         *,
         clock: Optional[Clock] = None,
         enable_background: bool = True,
+        start_time_s: float = 0.0,
     ) -> None:
         self.config = app_config
-        self.telemetry = TelemetryManager(app_config.telemetry)
+        self.telemetry = TelemetryManager(
+            app_config.telemetry,
+            prometheus_port=app_config.services.weather.metrics_port,
+            metrics_prefix=app_config.services.weather.metrics_prefix,
+        )
         self.metrics = WeatherMetrics(
             self.telemetry,
             metrics_prefix=app_config.services.weather.metrics_prefix,
@@ -198,13 +208,20 @@ class WeatherApplication:
             simulation=app_config.simulation,
             config=app_config.services.weather,
             metrics=self.metrics,
-            clock=clock,
+            clock=clock or AcceleratedClock(app_config.simulation.acceleration, start_sim=start_time_s),
             enable_background=enable_background,
         )
+        # Flask (and werkzeug) only for the HTTP service - in-process weather sources never import it
+        from flask import Flask
+
         self.app = Flask("bogdanka-weather")
         self._register_routes()
+        self._server = None
+        self._serving = False
 
     def _register_routes(self) -> None:
+        from flask import jsonify
+
         @self.app.route("/temperature", methods=["GET"])
         def temperature():
             try:
@@ -216,22 +233,68 @@ class WeatherApplication:
                 self.metrics.record_error()
                 return jsonify({"error": "internal_error"}), 500
 
+    def bind(self, host: str, port: int = 0) -> int:
+        """
+        Open the HTTP listening socket (port 0 - any free port chosen by the OS).
+
+        Requests are accepted as soon as this returns; serve_forever() handles them.
+
+        Returns:
+            Bound port
+        """
+        from werkzeug.serving import make_server
+
+        self._server = make_server(host, port, self.app, threaded=True)
+        return self._server.server_port
+
+    def serve_forever(self) -> None:
+        """Handle requests on the socket opened by bind() until shutdown()."""
+        self._serving = True
+        self._server.serve_forever()
+
     def shutdown(self) -> None:
+        if self._server is not None:
+            if self._serving:  # shutdown() blocks until the serve_forever() loop exits
+                self._server.shutdown()
+            self._server.server_close()
         self.simulator.stop()
         self.telemetry.shutdown()
 
 
-def configure_logging(level: str) -> None:
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+def build_weather_source(app_config: AppConfig) -> Callable[[float], WeatherSnapshot]:
+    """
+    In-process weather for fast-forward runs (no HTTP server, clock thread or telemetry).
+
+    Returns:
+        Function mapping simulation time [s] to a weather snapshot
+    """
+    simulator = WeatherSimulator(
+        simulation=app_config.simulation,
+        config=app_config.services.weather,
+        metrics=None,
+        enable_background=False,
     )
+    return simulator.snapshot_at
+
 
+def configure_logging(level: str, queued: bool = True) -> None:
+    # Listener thread is stopped at interpreter exit (registered by the helper)
+    configure_queued_logging(
+        getattr(logging, level.upper(), logging.INFO),
+        [logging.StreamHandler()],
+        "%(asctime)s %(levelname)s %(name)s - %(message)s",
+        queued=queued,
+    )
 
-def build_application(config_path: Path, *, enable_background: bool = True) -> WeatherApplication:
-    app_config = load_config(config_path)
-    configure_logging(app_config.telemetry.log_level)
-    return WeatherApplication(app_config, enable_background=enable_background)
+
+def build_application(
+    app_config: AppConfig,
+    *,
+    enable_background: bool = True,
+    start_time_s: float = 0.0,
+) -> WeatherApplication:
+    configure_logging(app_config.telemetry.log_level, queued=app_config.telemetry.log_queue)
+    return WeatherApplication(app_config, enable_background=enable_background, start_time_s=start_time_s)
 
 
 def main() -> None:
@@ -240,9 +303,15 @@ def main() -> None:
     parser.add_argument("--config", type=Path, default=default_config, help="Path to config.yaml")
     parser.add_argument("--host", type=str, default=None, help="Override host from config")
     parser.add_argument("--port", type=int, default=None, help="Override port from config")
+    parser.add_argument(
+        "--start-time",
+        type=float,
+        default=0.0,
+        help="Simulation time [s] to start from (match the checkpoint passed to algo_service --resume)",
+    )
     args = parser.parse_args()
 
-    application = build_application(args.config)
+    application = build_application(load_config(args.config), start_time_s=args.start_time)
     weather_cfg = application.config.services.weather
     host = args.host or weather_cfg.host
     port = args.port or weather_cfg.port